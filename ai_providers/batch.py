@@ -0,0 +1,428 @@
+"""
+Provider Batch APIs
+AI Publisher Pro
+
+Overnight jobs do not need an answer in seconds. OpenAI (``/v1/batches``)
+and Anthropic (``/v1/messages/batches``) accept a whole job of chat
+requests at once, process it within 24 hours at about half the price, and
+count it against separate, much higher rate limits. A BatchClient submits
+the requests, polls with exponential backoff until the batch ends, and
+returns one BatchResult per custom_id.
+
+A request the batch did not answer (errored, expired, cancelled) is simply
+missing or has ``error`` set; callers translate those interactively.
+
+A batch outlives the process that submitted it. Callers persist the id
+passed to ``on_submitted`` with their job and hand it back as ``batch_id``
+after a restart, so the batch is polled again instead of paid for twice.
+Custom ids must therefore be stable across runs of the same job.
+
+Base URLs follow the SDK conventions (``OPENAI_BASE_URL``,
+``ANTHROPIC_BASE_URL``), so a local stub server can stand in for the
+provider. Polling is tunable via env: LLM_BATCH_POLL_SECONDS (default 30),
+LLM_BATCH_MAX_POLL_SECONDS (default 300), LLM_BATCH_MAX_WAIT_SECONDS
+(default 86400).
+
+Example:
+    client = get_batch_client("openai", api_key, "gpt-4o-mini")
+    results = await client.run([BatchRequest("chunk-0", messages)])
+    results["chunk-0"].content
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class BatchError(Exception):
+    """A batch could not be submitted, failed as a whole, or timed out"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status  # HTTP status of the failed request, if any
+
+
+@dataclass
+class BatchRequest:
+    """
+    One chat request of a batch (OpenAI message format)
+
+    `body` is a complete provider request body, as a caller builds it for
+    its interactive calls; when given, the other fields are not used.
+    """
+    custom_id: str
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    max_tokens: int = 4096
+    temperature: Optional[float] = None
+    body: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one BatchRequest"""
+    custom_id: str
+    content: Optional[str] = None
+    error: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    truncated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.content is not None
+
+
+def max_batch_wait() -> float:
+    """Seconds a batch may take before it is given up (LLM_BATCH_MAX_WAIT_SECONDS)"""
+    return float(os.environ.get("LLM_BATCH_MAX_WAIT_SECONDS", "86400"))
+
+
+def _parse_jsonl(text: str) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class BatchClient(ABC):
+    """Submit / poll / collect cycle shared by the provider clients."""
+
+    provider = ""
+    base_url_env = ""
+    default_base_url = ""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        max_poll_interval: Optional[float] = None,
+        max_wait: Optional[float] = None,
+        timeout: float = 120.0,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = (base_url or os.environ.get(self.base_url_env) or self.default_base_url).rstrip("/")
+        self.poll_interval = poll_interval if poll_interval is not None else float(
+            os.environ.get("LLM_BATCH_POLL_SECONDS", "30"))
+        self.max_poll_interval = max_poll_interval if max_poll_interval is not None else float(
+            os.environ.get("LLM_BATCH_MAX_POLL_SECONDS", "300"))
+        self.max_wait = max_wait if max_wait is not None else max_batch_wait()
+        self.timeout = timeout
+
+    async def run(
+        self,
+        requests: List[BatchRequest],
+        batch_id: Optional[str] = None,
+        on_submitted: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, BatchResult]:
+        """
+        Run `requests` as one batch and wait for it to end.
+
+        Args:
+            requests: Requests of the batch
+            batch_id: A batch submitted earlier for the same requests (e.g.
+                before a restart): poll it instead of submitting again
+            on_submitted: Called with the id of a newly submitted batch,
+                before waiting, so the caller can persist it
+
+        Returns:
+            Results by custom_id; requests the batch did not answer are missing
+
+        Raises:
+            BatchError: Submission failed, the batch failed or timed out
+        """
+        if not requests:
+            return {}
+        async with httpx.AsyncClient(
+            base_url=self.base_url, headers=self._headers(), timeout=self.timeout
+        ) as http:
+            if batch_id:
+                logger.info(f"📦 {self.provider} batch {batch_id}: resuming")
+            else:
+                batch_id = await self._submit(http, requests)
+                logger.info(f"📦 {self.provider} batch {batch_id}: {len(requests)} request(s) submitted")
+                if on_submitted is not None:
+                    on_submitted(batch_id)
+            try:
+                batch = await self._wait(http, batch_id)
+            except BaseException:
+                # Timed out or the job was cancelled: stop paying for it
+                await self._cancel(http, batch_id)
+                raise
+            results = await self._results(http, batch)
+        answered = sum(1 for r in results.values() if r.ok)
+        logger.info(f"📦 {self.provider} batch {batch_id}: {answered}/{len(requests)} answered")
+        return results
+
+    async def _wait(self, http: httpx.AsyncClient, batch_id: str) -> Dict[str, Any]:
+        """Poll with exponential backoff until the batch ends."""
+        deadline = time.monotonic() + self.max_wait
+        delay = self.poll_interval
+        while True:
+            try:
+                batch = await self._request(http, "GET", self._batch_path(batch_id))
+            except BatchError as e:
+                # Polling is idempotent: ride out network errors, 429s and
+                # 5xx until the deadline
+                if e.status is not None and e.status < 500 and e.status != 429:
+                    raise
+                logger.warning(f"{self.provider} batch {batch_id}: poll failed ({e})")
+                batch = None
+            if batch is not None:
+                state = self._state(batch)
+                if state == "ended":
+                    return batch
+                if state == "failed":
+                    raise BatchError(f"{self.provider} batch {batch_id} failed: {self._describe(batch)}")
+            if time.monotonic() + delay > deadline:
+                raise BatchError(f"{self.provider} batch {batch_id} did not end within {self.max_wait:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+
+    async def _cancel(self, http: httpx.AsyncClient, batch_id: str) -> None:
+        try:
+            await self._request(http, "POST", self._batch_path(batch_id) + "/cancel")
+        except Exception as e:
+            logger.warning(f"{self.provider} batch {batch_id}: cancel failed ({e})")
+
+    async def _request(self, http: httpx.AsyncClient, method: str, url: str, **kwargs) -> Any:
+        """JSON request; any transport or HTTP error becomes BatchError."""
+        try:
+            response = await http.request(method, url, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            raise BatchError(f"HTTP {status}: {e.response.text[:200]}", status) from e
+        except httpx.HTTPError as e:
+            raise BatchError(str(e) or type(e).__name__) from e
+        return response.json()
+
+    async def _get_text(self, http: httpx.AsyncClient, url: str) -> str:
+        """Download a results file (JSONL)."""
+        try:
+            response = await http.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise BatchError(f"could not download batch results: {e}") from e
+        return response.text
+
+    # Provider specifics
+
+    @abstractmethod
+    def _headers(self) -> Dict[str, str]:
+        """Authentication headers."""
+
+    @abstractmethod
+    def _batch_path(self, batch_id: str) -> str:
+        """URL path of a batch."""
+
+    @abstractmethod
+    async def _submit(self, http: httpx.AsyncClient, requests: List[BatchRequest]) -> str:
+        """Create the batch; returns its id."""
+
+    @abstractmethod
+    def _state(self, batch: Dict[str, Any]) -> str:
+        """One of "running", "ended" (results available) or "failed"."""
+
+    def _describe(self, batch: Dict[str, Any]) -> str:
+        return str(batch.get("errors") or batch.get("status") or batch)[:200]
+
+    @abstractmethod
+    async def _results(self, http: httpx.AsyncClient, batch: Dict[str, Any]) -> Dict[str, BatchResult]:
+        """Download and parse the results of an ended batch."""
+
+
+class OpenAIBatchClient(BatchClient):
+    """OpenAI Batch API: JSONL input file -> /v1/batches -> output file."""
+
+    provider = "openai"
+    base_url_env = "OPENAI_BASE_URL"
+    default_base_url = "https://api.openai.com/v1"
+
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def _batch_path(self, batch_id: str) -> str:
+        return f"/batches/{batch_id}"
+
+    async def _submit(self, http: httpx.AsyncClient, requests: List[BatchRequest]) -> str:
+        lines = []
+        for request in requests:
+            if request.body is not None:
+                body: Dict[str, Any] = {"model": self.model, **request.body}
+            else:
+                body = {
+                    "model": self.model,
+                    "messages": request.messages,
+                    "max_tokens": request.max_tokens,
+                }
+                if request.temperature is not None:
+                    body["temperature"] = request.temperature
+            lines.append(json.dumps({
+                "custom_id": request.custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }, ensure_ascii=False))
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        uploaded = await self._request(
+            http, "POST", "/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", payload, "application/jsonl")},
+        )
+        batch = await self._request(http, "POST", "/batches", json={
+            "input_file_id": uploaded["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+        return batch["id"]
+
+    def _state(self, batch: Dict[str, Any]) -> str:
+        status = batch.get("status")
+        # Expired / cancelled batches still return what they finished
+        if status in ("completed", "expired", "cancelled"):
+            return "ended"
+        if status == "failed":
+            return "failed"
+        return "running"
+
+    async def _results(self, http: httpx.AsyncClient, batch: Dict[str, Any]) -> Dict[str, BatchResult]:
+        results: Dict[str, BatchResult] = {}
+        for file_key in ("output_file_id", "error_file_id"):
+            file_id = batch.get(file_key)
+            if not file_id:
+                continue
+            for line in _parse_jsonl(await self._get_text(http, f"/files/{file_id}/content")):
+                results[line["custom_id"]] = self._parse_line(line)
+        return results
+
+    @staticmethod
+    def _parse_line(line: Dict[str, Any]) -> BatchResult:
+        custom_id = line["custom_id"]
+        response = line.get("response") or {}
+        body = response.get("body") or {}
+        if line.get("error") or response.get("status_code") != 200:
+            error = line.get("error") or body.get("error") or {}
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            return BatchResult(custom_id, error=message or f"HTTP {response.get('status_code')}")
+        try:
+            choice = body["choices"][0]
+            content = choice["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            return BatchResult(custom_id, error="malformed response")
+        usage = body.get("usage") or {}
+        return BatchResult(
+            custom_id,
+            content=content,
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            truncated=choice.get("finish_reason") == "length",
+        )
+
+
+class AnthropicBatchClient(BatchClient):
+    """Anthropic Message Batches API: /v1/messages/batches -> results_url."""
+
+    provider = "anthropic"
+    base_url_env = "ANTHROPIC_BASE_URL"
+    default_base_url = "https://api.anthropic.com"
+
+    def _headers(self) -> Dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+
+    def _batch_path(self, batch_id: str) -> str:
+        return f"/v1/messages/batches/{batch_id}"
+
+    @staticmethod
+    def _split_system(messages: List[Dict[str, Any]]) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        system = None
+        rest = []
+        for msg in messages:
+            if msg["role"] == "system":
+                system = msg["content"]
+            else:
+                rest.append({"role": msg["role"], "content": msg["content"]})
+        return system, rest
+
+    async def _submit(self, http: httpx.AsyncClient, requests: List[BatchRequest]) -> str:
+        entries = []
+        for request in requests:
+            if request.body is not None:
+                entries.append({"custom_id": request.custom_id, "params": {"model": self.model, **request.body}})
+                continue
+            system, messages = self._split_system(request.messages)
+            params: Dict[str, Any] = {
+                "model": self.model,
+                "max_tokens": request.max_tokens,
+                "messages": messages,
+            }
+            if system:
+                params["system"] = system
+            if request.temperature is not None:
+                params["temperature"] = request.temperature
+            entries.append({"custom_id": request.custom_id, "params": params})
+
+        batch = await self._request(http, "POST", "/v1/messages/batches", json={"requests": entries})
+        return batch["id"]
+
+    def _state(self, batch: Dict[str, Any]) -> str:
+        # Anthropic batches always end; failures are reported per request
+        return "ended" if batch.get("processing_status") == "ended" else "running"
+
+    async def _results(self, http: httpx.AsyncClient, batch: Dict[str, Any]) -> Dict[str, BatchResult]:
+        url = batch.get("results_url") or self._batch_path(batch["id"]) + "/results"
+        results: Dict[str, BatchResult] = {}
+        for line in _parse_jsonl(await self._get_text(http, url)):
+            results[line["custom_id"]] = self._parse_line(line)
+        return results
+
+    @staticmethod
+    def _parse_line(line: Dict[str, Any]) -> BatchResult:
+        custom_id = line["custom_id"]
+        result = line.get("result") or {}
+        if result.get("type") != "succeeded":
+            error = (result.get("error") or {}).get("error") or {}
+            return BatchResult(custom_id, error=error.get("message") or result.get("type") or "no result")
+        message = result.get("message") or {}
+        text = "".join(
+            block.get("text", "") for block in message.get("content") or ()
+            if block.get("type") == "text"
+        )
+        usage = message.get("usage") or {}
+        return BatchResult(
+            custom_id,
+            content=text,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            truncated=message.get("stop_reason") == "max_tokens",
+        )
+
+
+BATCH_CLIENTS = {
+    "openai": OpenAIBatchClient,
+    "anthropic": AnthropicBatchClient,
+}
+
+
+def get_batch_client(provider: str, api_key: str, model: str, **kwargs) -> BatchClient:
+    """
+    Batch client for `provider`.
+
+    Raises:
+        ValueError: The provider has no batch API (DeepSeek, Gemini)
+    """
+    cls = BATCH_CLIENTS.get(provider)
+    if cls is None:
+        raise ValueError(f"{provider} has no batch API")
+    if not api_key:
+        raise ValueError(f"{provider} API key not configured")
+    return cls(api_key, model, **kwargs)
@@ -0,0 +1,383 @@
+"""
+Adaptive Provider Concurrency
+AI Publisher Pro
+
+Every caller used to pick its own fixed concurrency (PUBLISHER_CONCURRENCY,
+the book writer agents, ParallelProcessor) and found out about provider
+limits only from 429s. Several jobs in one process then hit the same
+provider together. Here every request to a (provider, model) pair goes
+through one process-wide AdaptiveLimiter:
+
+- AIMD: the concurrency limit grows by ~1 per window of successful
+  requests and halves on a rate-limit error (at most once per window —
+  only requests started after the last decrease can trigger another).
+- Response headers: remaining requests/tokens reported by OpenAI
+  (``x-ratelimit-*``) and Anthropic (``anthropic-ratelimit-*``) cap what is
+  admitted until their reset time; ``retry-after`` pauses all callers.
+- Token budget: each request reserves its estimated tokens; tokens still
+  in flight count against the remaining-tokens budget.
+
+Waiting is lock-free across awaits (a threading.Lock guards only the
+counters and waiters are woken with call_soon_threadsafe), so jobs on
+different event loops share one budget.
+
+Tunable via env: LLM_CONCURRENCY_INITIAL (default 4), LLM_CONCURRENCY_MAX
+(default 64).
+
+Example:
+    limiter = get_limiter("openai", "gpt-4o-mini")
+    async with limiter.slot(estimated_tokens) as slot:
+        response, headers = ...
+        slot.observe(headers)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Longest single wait before a waiter re-checks pauses and budget expiry
+_MAX_WAIT = 1.0
+
+
+@dataclass
+class RateLimitInfo:
+    """Rate-limit state reported by a provider response"""
+    remaining_requests: Optional[int] = None
+    remaining_tokens: Optional[int] = None
+    reset_requests: Optional[float] = None  # seconds from now
+    reset_tokens: Optional[float] = None    # seconds from now
+    retry_after: Optional[float] = None     # seconds from now
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """OpenAI reset durations: ``1s``, ``6m0s``, ``20ms``, ``1h2m3.5s``"""
+    total, number = 0.0, ""
+    i = 0
+    try:
+        while i < len(value):
+            ch = value[i]
+            if ch.isdigit() or ch == ".":
+                number += ch
+            elif value.startswith("ms", i):
+                total += float(number) / 1000.0
+                number = ""
+                i += 1
+            elif ch in "hms":
+                total += float(number) * {"h": 3600.0, "m": 60.0, "s": 1.0}[ch]
+                number = ""
+            else:
+                return None
+            i += 1
+        return total + (float(number) if number else 0.0)
+    except ValueError:
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds until a reset given as a duration, plain seconds or a timestamp"""
+    if not value:
+        return None
+    value = value.strip()
+    seconds = _parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        # Anthropic: RFC 3339 timestamp
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            # retry-after: HTTP date
+            reset_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, str]]) -> RateLimitInfo:
+    """Read OpenAI-style and Anthropic-style rate-limit headers."""
+    if not headers:
+        return RateLimitInfo()
+    h = {str(k).lower(): str(v) for k, v in headers.items()}
+    info = RateLimitInfo(
+        remaining_requests=_parse_int(
+            h.get("x-ratelimit-remaining-requests", h.get("anthropic-ratelimit-requests-remaining"))
+        ),
+        remaining_tokens=_parse_int(
+            h.get("x-ratelimit-remaining-tokens", h.get("anthropic-ratelimit-tokens-remaining"))
+        ),
+        reset_requests=_parse_reset(
+            h.get("x-ratelimit-reset-requests", h.get("anthropic-ratelimit-requests-reset"))
+        ),
+        reset_tokens=_parse_reset(
+            h.get("x-ratelimit-reset-tokens", h.get("anthropic-ratelimit-tokens-reset"))
+        ),
+    )
+    if "retry-after-ms" in h:
+        ms = _parse_int(h["retry-after-ms"])
+        info.retry_after = ms / 1000.0 if ms is not None else None
+    elif "retry-after" in h:
+        info.retry_after = _parse_reset(h["retry-after"])
+    return info
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    429 from an SDK or httpx error, or an SDK RateLimitError
+
+    Only the status code and the error type count: message text is not
+    inspected, since "429" can appear in any id, count or echoed prompt.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    # openai.RateLimitError / anthropic.RateLimitError, without importing the SDKs
+    return any(cls.__name__ == "RateLimitError" for cls in type(error).__mro__)
+
+
+def error_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+    """Response headers carried by an SDK/httpx error, if any"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    return headers if hasattr(headers, "items") else None
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit plus header-driven budget for one (provider, model)."""
+
+    def __init__(self, name: str, initial: int = 4, minimum: int = 1, maximum: int = 64):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.in_flight_tokens = 0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        # Header budgets: (remaining at snapshot, admitted since, valid until)
+        self._request_budget: Optional[Tuple[int, int, float]] = None
+        self._token_budget: Optional[Tuple[int, int, float]] = None
+        # Stats
+        self.requests = 0
+        self.rate_limited = 0
+        self.peak_in_flight = 0
+
+    # -- admission -----------------------------------------------------------
+
+    def _admit(self, tokens: int, now: float) -> Optional[float]:
+        """Admit one request (lock held). Returns None when admitted, else
+        the longest time worth waiting before checking again."""
+        if now < self._paused_until:
+            return min(self._paused_until - now, _MAX_WAIT)
+        if self.in_flight >= int(self.limit):
+            return _MAX_WAIT
+        if self._request_budget and now >= self._request_budget[2]:
+            self._request_budget = None
+        if self._token_budget and now >= self._token_budget[2]:
+            self._token_budget = None
+        # One request may always run so a stale budget gets refreshed
+        if self.in_flight:
+            if self._request_budget and self._request_budget[1] + 1 > self._request_budget[0]:
+                return min(self._request_budget[2] - now, _MAX_WAIT)
+            if self._token_budget and self._token_budget[1] + tokens > self._token_budget[0]:
+                return min(self._token_budget[2] - now, _MAX_WAIT)
+        if self._request_budget:
+            remaining, spent, until = self._request_budget
+            self._request_budget = (remaining, spent + 1, until)
+        if self._token_budget:
+            remaining, spent, until = self._token_budget
+            self._token_budget = (remaining, spent + tokens, until)
+        self.in_flight += 1
+        self.in_flight_tokens += tokens
+        self.requests += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return None
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait for a slot carrying ``tokens`` estimated tokens.
+
+        Returns:
+            Monotonic admission time (pass to release())
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._admit(tokens, now)
+                if wait is None:
+                    return now
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, timeout=max(wait, 0.001))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        pass
+
+    def _wake_all(self) -> None:
+        """Let every waiter re-check admission (lock held)."""
+        for loop, waiter in self._waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                pass  # Loop already closed
+        self._waiters.clear()
+
+    # -- feedback ------------------------------------------------------------
+
+    def observe(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Take the budgets reported by a response (or error) into account."""
+        info = parse_rate_limit_headers(headers)
+        now = time.monotonic()
+        with self._lock:
+            if info.remaining_requests is not None:
+                self._request_budget = (
+                    info.remaining_requests, 0, now + (info.reset_requests or 1.0)
+                )
+            if info.remaining_tokens is not None:
+                self._token_budget = (
+                    info.remaining_tokens, 0, now + (info.reset_tokens or 1.0)
+                )
+            if info.retry_after:
+                self._paused_until = max(self._paused_until, now + info.retry_after)
+            self._wake_all()
+
+    def release(self, tokens: int, started: float, ok: bool = True, rate_limited: bool = False) -> None:
+        """Return a slot and adjust the limit.
+
+        Args:
+            tokens: Tokens reserved by acquire()
+            started: Value returned by acquire()
+            ok: The request succeeded (additive increase)
+            rate_limited: The provider rejected it with a rate limit
+                          (multiplicative decrease)
+        """
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self.in_flight_tokens = max(0, self.in_flight_tokens - tokens)
+            if rate_limited:
+                self.rate_limited += 1
+                # Requests started before the last decrease saw the old limit
+                if started >= self._last_decrease:
+                    old = self.limit
+                    self.limit = max(float(self.minimum), self.limit / 2.0)
+                    self._last_decrease = time.monotonic()
+                    logger.warning(f"⏬ {self.name}: rate limited, concurrency {old:.1f} → {self.limit:.1f}")
+            elif ok:
+                self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self._wake_all()
+
+    def slot(self, tokens: int = 0) -> "_Slot":
+        """Async context manager around one request (see module docstring)."""
+        return _Slot(self, tokens)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limit, load and counters."""
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "in_flight_tokens": self.in_flight_tokens,
+                "peak_in_flight": self.peak_in_flight,
+                "requests": self.requests,
+                "rate_limited": self.rate_limited,
+            }
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _Slot:
+    """One admitted request: releases on exit, classifying any error."""
+
+    def __init__(self, limiter: AdaptiveLimiter, tokens: int):
+        self.limiter = limiter
+        self.tokens = tokens
+        self._started = 0.0
+
+    async def __aenter__(self) -> "_Slot":
+        self._started = await self.limiter.acquire(self.tokens)
+        return self
+
+    def observe(self, headers: Optional[Mapping[str, str]]) -> None:
+        self.limiter.observe(headers)
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        rate_limited = exc is not None and is_rate_limit_error(exc)
+        if rate_limited:
+            self.limiter.observe(error_headers(exc))
+        self.limiter.release(self.tokens, self._started, ok=exc is None, rate_limited=rate_limited)
+        return False
+
+
+def estimate_tokens(messages: List[Dict], max_tokens: int = 0) -> int:
+    """Rough request size: text chars / 4 plus the output allowance (which
+    providers count against tokens-per-minute)."""
+    chars = 0
+    for msg in messages:
+        content = msg.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for item in content:
+                if isinstance(item, dict) and isinstance(item.get("text"), str):
+                    chars += len(item["text"])
+    return chars // 4 + max_tokens
+
+
+# Process-wide registry: one limiter per (provider, model)
+_limiters: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str, model: Optional[str] = None) -> AdaptiveLimiter:
+    """The shared limiter for ``provider``/``model`` (created on first use)."""
+    key = (provider, model or "")
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = AdaptiveLimiter(
+                f"{provider}/{model}" if model else provider,
+                initial=int(os.environ.get("LLM_CONCURRENCY_INITIAL", "4")),
+                maximum=int(os.environ.get("LLM_CONCURRENCY_MAX", "64")),
+            )
+        return limiter
+
+
+def limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every limiter, keyed by ``provider/model``."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.snapshot() for limiter in limiters}
+
+
+def reset_limiters() -> None:
+    """Forget all limiters (tests, or after changing the env settings)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,107 @@
+"""
+Provider Latency Tracking
+AI Publisher Pro
+
+Rolling per-provider latency histograms shared by every client in the
+process. UnifiedLLMClient records each successful call and uses the
+percentiles to hedge slow requests (fire a backup after the primary's p95)
+and to prefer the faster of the healthy fallback providers.
+
+Only the last ``window`` samples of a provider count, so a provider that
+recovers from a slow spell is trusted again after a few hundred calls; no
+percentile is reported until ``min_samples`` calls have been seen.
+
+Example:
+    tracker = get_latency_tracker()
+    tracker.record("openai", 3.2)
+    tracker.percentile("openai", 0.95)   # None until enough samples
+"""
+
+import bisect
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """Latencies (seconds) of the last ``window`` calls, kept sorted."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._order: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def add(self, seconds: float) -> None:
+        if len(self._order) >= self.window:
+            oldest = self._order.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._order.append(seconds)
+        bisect.insort(self._sorted, seconds)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile (q in 0..1), None when empty."""
+        if not self._sorted:
+            return None
+        rank = min(len(self._sorted) - 1, max(0, int(round(q * len(self._sorted))) - 1))
+        return self._sorted[rank]
+
+
+class LatencyTracker:
+    """One LatencyHistogram per provider."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(provider)
+            if histogram is None:
+                histogram = self._histograms[provider] = LatencyHistogram(self.window)
+            histogram.add(seconds)
+
+    def percentile(self, provider: str, q: float) -> Optional[float]:
+        """Latency percentile of `provider`, or None with too few samples"""
+        with self._lock:
+            histogram = self._histograms.get(provider)
+            if histogram is None or len(histogram) < self.min_samples:
+                return None
+            return histogram.percentile(q)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95/p99 and sample count per provider."""
+        with self._lock:
+            return {
+                provider: {
+                    "samples": len(h),
+                    "p50": round(h.percentile(0.50), 3),
+                    "p95": round(h.percentile(0.95), 3),
+                    "p99": round(h.percentile(0.99), 3),
+                }
+                for provider, h in self._histograms.items() if len(h)
+            }
+
+
+_tracker: Optional[LatencyTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """The process-wide latency tracker."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = LatencyTracker()
+        return _tracker
+
+
+def reset_latency_tracker() -> None:
+    """Forget all samples (tests)."""
+    global _tracker
+    with _tracker_lock:
+        _tracker = None
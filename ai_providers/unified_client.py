@@ -8,16 +8,26 @@ Features:
 - Pre-validation: Tests API before starting jobs
 - Vision support: Converts between Anthropic and OpenAI vision formats
 - Unified interface: Works with all pipelines
+- Shared concurrency: every call acquires from the process-wide adaptive
+  limiter of its provider/model (see concurrency.py)
+- Hedging: optionally fires a backup request on the next healthy provider
+  once the primary exceeds its p95 latency (see latency.py)
+- Batch mode: chat_batch() sends many text requests through the provider's
+  asynchronous batch API (see batch.py)
 """
 
 import os
 import logging
 import asyncio
 import time
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Optional, Dict, List, Any, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .batch import BatchRequest, BatchResult, get_batch_client
+from .concurrency import estimate_tokens, get_limiter, limiter_stats
+from .latency import get_latency_tracker
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,6 +106,13 @@ class CumulativeStats:
     total_elapsed_seconds: float = 0.0
     total_calls: int = 0
     calls_by_provider: Dict[str, int] = field(default_factory=dict)
+    # Hedged requests: backups fired, backups that won, and the tokens spent
+    # on the losing request (estimated when it was cancelled)
+    hedged_calls: int = 0
+    hedge_wins: int = 0
+    hedge_extra_tokens: int = 0
+    # Requests answered through a provider batch API (also in total_calls)
+    batched_calls: int = 0
 
     def add(self, stats: UsageStats):
         """Add stats from a single call"""
@@ -122,6 +139,10 @@ class CumulativeStats:
             "total_calls": self.total_calls,
             "calls_by_provider": self.calls_by_provider,
             "estimated_cost_usd": self.estimate_cost(),
+            "hedged_calls": self.hedged_calls,
+            "hedge_wins": self.hedge_wins,
+            "hedge_extra_tokens": self.hedge_extra_tokens,
+            "batched_calls": self.batched_calls,
         }
 
 
@@ -576,6 +597,7 @@ class UnifiedLLMClient:
         response_format: Optional[Dict] = None,
         temperature: Optional[float] = None,
         cache_system: bool = False,
+        hedge: bool = False,
         **kwargs
     ) -> Any:
         """
@@ -590,6 +612,9 @@ class UnifiedLLMClient:
                 translation path passes a low value for faithful output.
             cache_system: When True, mark the system prompt as cacheable
                 (Anthropic prompt caching). No-op for other providers.
+            hedge: Text requests only — once the call outlives the provider's
+                p95 latency, also send it to the next healthy provider and
+                take whichever answers first (see _call_hedged).
 
         Returns:
             Response object with .content attribute
@@ -625,6 +650,11 @@ class UnifiedLLMClient:
             providers_tried.append(self._current_provider)
 
             try:
+                if hedge and not has_vision:
+                    return await self._call_hedged(
+                        messages, max_tokens, response_format,
+                        temperature=temperature, cache_system=cache_system, **kwargs
+                    )
                 return await self._call_provider(
                     messages, max_tokens, response_format, has_vision,
                     temperature=temperature, cache_system=cache_system, **kwargs
@@ -657,17 +687,8 @@ class UnifiedLLMClient:
                     self._bench_provider(self._current_provider)
 
                     # Find next available provider (use vision order for vision requests)
-                    next_provider = None
-                    search_order = self.VISION_PROVIDER_ORDER if has_vision else self.PROVIDER_ORDER
-                    for p in search_order:
-                        if not self._is_benched(p):
-                            # For vision, skip providers that don't support it
-                            if has_vision and not self.PROVIDER_CONFIG[p].get("vision_model"):
-                                continue
-                            # Check if API key is available
-                            if self._get_api_key(p):
-                                next_provider = p
-                                break
+                    candidates = self._healthy_providers(has_vision)
+                    next_provider = candidates[0] if candidates else None
 
                     if next_provider:
                         logger.warning(f"🔄 Switching from {self._current_provider} to {next_provider}")
@@ -680,6 +701,116 @@ class UnifiedLLMClient:
                     # Non-retryable, non-rate-limit error
                     raise
 
+    def _healthy_providers(self, has_vision: bool = False, exclude: Tuple[str, ...] = ()) -> List[str]:
+        """Configured, unbenched providers in fallback order.
+
+        Follows PROVIDER_ORDER (VISION_PROVIDER_ORDER for vision) unless every
+        candidate has enough latency samples — then the fastest p95 first.
+        """
+        search_order = self.VISION_PROVIDER_ORDER if has_vision else self.PROVIDER_ORDER
+        candidates = [
+            p for p in search_order
+            if p not in exclude
+            and not self._is_benched(p)
+            # For vision, skip providers that don't support it
+            and (not has_vision or self.PROVIDER_CONFIG[p].get("vision_model"))
+            and self._get_api_key(p)
+        ]
+        tracker = get_latency_tracker()
+        p95 = {p: tracker.percentile(p, 0.95) for p in candidates}
+        if len(candidates) > 1 and all(v is not None for v in p95.values()):
+            candidates.sort(key=lambda p: p95[p])
+        return candidates
+
+    async def _call_hedged(
+        self,
+        messages: List[Dict],
+        max_tokens: int,
+        response_format: Optional[Dict],
+        **kwargs
+    ) -> Any:
+        """Call the current provider; past its p95 latency, race a backup.
+
+        The delay counts from the primary's admission by the concurrency
+        limiter, so time queued for a slot doesn't trigger a hedge (the
+        latency samples exclude it too). The backup goes to the next healthy
+        provider. Whichever succeeds first
+        wins and the other is cancelled; its tokens (actual if it finished,
+        else estimated input) are counted as hedge_extra_tokens. Without
+        enough latency samples or a backup provider this is a plain call.
+        """
+        primary = self._current_provider
+        quantile = float(os.environ.get("LLM_HEDGE_PERCENTILE", "0.95"))
+        delay = get_latency_tracker().percentile(primary, quantile)
+        backups = self._healthy_providers(exclude=(primary,))
+        if delay is None or not backups:
+            return await self._call_provider(messages, max_tokens, response_format, False, **kwargs)
+
+        admitted = asyncio.Event()
+        first = asyncio.ensure_future(
+            self._call_provider(messages, max_tokens, response_format, False,
+                                provider=primary, admitted=admitted, **kwargs)
+        )
+        admission = asyncio.ensure_future(admitted.wait())
+        try:
+            # The hedge clock starts once the primary holds a limiter slot
+            await asyncio.wait({first, admission}, return_when=asyncio.FIRST_COMPLETED)
+            if not first.done():
+                await asyncio.wait({first}, timeout=delay)
+        except asyncio.CancelledError:
+            first.cancel()
+            raise
+        finally:
+            admission.cancel()
+        if first.done():
+            return first.result()
+
+        backup = backups[0]
+        logger.info(f"⏱️ {primary} slower than p{int(quantile * 100)} ({delay:.1f}s); hedging on {backup}")
+        self._cumulative_stats.hedged_calls += 1
+        second = asyncio.ensure_future(
+            self._call_provider(messages, max_tokens, response_format, False, provider=backup, **kwargs)
+        )
+        pending = {first, second}
+        errors: Dict[Any, BaseException] = {}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((t for t in done if t.exception() is None), None)
+                for task in done:
+                    if task.exception() is not None:
+                        errors[task] = task.exception()
+                if winner is None:
+                    continue
+                loser = second if winner is first else first
+                if winner is second:
+                    self._cumulative_stats.hedge_wins += 1
+                if loser.done() and loser.exception() is None:
+                    usage = getattr(loser.result(), "usage", None)
+                    self._cumulative_stats.hedge_extra_tokens += usage.total_tokens if usage else 0
+                elif not loser.done():
+                    self._cumulative_stats.hedge_extra_tokens += estimate_tokens(messages)
+                return winner.result()
+        finally:
+            for task in (first, second):
+                if not task.done():
+                    task.cancel()
+        # Both failed: surface the primary's error to the fallback logic
+        raise errors.get(first) or errors[second]
+
+    @staticmethod
+    async def _create_with_headers(endpoint: Any, **call_kwargs) -> Tuple[Any, Optional[Dict]]:
+        """Call ``endpoint.create`` and also return the HTTP response headers
+        (rate-limit budgets) when the SDK exposes ``with_raw_response``."""
+        raw_endpoint = getattr(endpoint, "with_raw_response", None)
+        if raw_endpoint is None:
+            return await endpoint.create(**call_kwargs), None
+        raw = await raw_endpoint.create(**call_kwargs)
+        parsed = raw.parse()
+        if asyncio.iscoroutine(parsed):
+            parsed = await parsed
+        return parsed, raw.headers
+
     async def _call_provider(
         self,
         messages: List[Dict],
@@ -688,10 +819,16 @@ class UnifiedLLMClient:
         has_vision: bool,
         temperature: Optional[float] = None,
         cache_system: bool = False,
+        provider: Optional[str] = None,
+        admitted: Optional[asyncio.Event] = None,
         **kwargs
     ) -> Any:
-        """Make actual API call to current provider."""
-        provider = self._current_provider
+        """Make actual API call to `provider` (default: the current one).
+
+        `admitted` is set once the concurrency limiter grants the call a
+        slot; latency is measured from that point.
+        """
+        provider = provider or self._current_provider
         config = self.PROVIDER_CONFIG[provider]
         client = await self._get_client(provider)
 
@@ -704,9 +841,6 @@ class UnifiedLLMClient:
                 self.truncated = truncated
                 self.finish_reason = finish_reason
 
-        # Track time
-        start_time = time.time()
-
         if provider == "anthropic":
             # Convert to Anthropic format
             system_msg = None
@@ -744,7 +878,12 @@ class UnifiedLLMClient:
             if temperature is not None:
                 call_kwargs["temperature"] = temperature
 
-            response = await client.messages.create(**call_kwargs)
+            async with get_limiter(provider, model).slot(estimate_tokens(messages, max_tokens)) as slot:
+                start_time = time.time()
+                if admitted is not None:
+                    admitted.set()
+                response, headers = await self._create_with_headers(client.messages, **call_kwargs)
+                slot.observe(headers)
 
             # Extract usage from Anthropic response
             elapsed = time.time() - start_time
@@ -757,6 +896,7 @@ class UnifiedLLMClient:
                 model=model,
             )
             self._cumulative_stats.add(usage)
+            get_latency_tracker().record(provider, elapsed)
 
             stop_reason = getattr(response, "stop_reason", None)
             truncated = stop_reason == "max_tokens"
@@ -799,7 +939,12 @@ class UnifiedLLMClient:
             if response_format and not has_vision:
                 call_kwargs["response_format"] = response_format
 
-            response = await client.chat.completions.create(**call_kwargs)
+            async with get_limiter(provider, model).slot(estimate_tokens(messages, max_tokens)) as slot:
+                start_time = time.time()
+                if admitted is not None:
+                    admitted.set()
+                response, headers = await self._create_with_headers(client.chat.completions, **call_kwargs)
+                slot.observe(headers)
 
             # Extract usage from OpenAI response
             elapsed = time.time() - start_time
@@ -812,6 +957,7 @@ class UnifiedLLMClient:
                 model=model,
             )
             self._cumulative_stats.add(usage)
+            get_latency_tracker().record(provider, elapsed)
 
             finish_reason = None
             try:
@@ -828,6 +974,63 @@ class UnifiedLLMClient:
             return Response(response.choices[0].message.content, usage,
                             truncated=truncated, finish_reason=finish_reason)
 
+    async def chat_batch(
+        self,
+        requests: Dict[str, List[Dict]],
+        max_tokens: int = 4096,
+        temperature: Optional[float] = None,
+        batch_id: Optional[str] = None,
+        on_submitted: Optional[Callable[[str], None]] = None,
+        **batch_options
+    ) -> Dict[str, BatchResult]:
+        """
+        Send text requests through the current provider's batch API.
+
+        Waits until the batch ends (up to LLM_BATCH_MAX_WAIT_SECONDS). There
+        is no fallback here: requests that are missing from the result or
+        have ``error`` set should be retried with chat().
+
+        Args:
+            requests: Messages per request id (ids: letters, digits, - and _)
+            max_tokens: Maximum tokens per response
+            temperature: Sampling temperature (provider default if None)
+            batch_id: Resume this earlier batch of the same requests
+            on_submitted: Called with a new batch's id (persist it to resume)
+            **batch_options: Passed to the BatchClient (base_url, poll_interval, ...)
+
+        Returns:
+            BatchResult by request id
+
+        Raises:
+            ValueError: The current provider has no batch API
+            BatchError: The batch could not be submitted, failed or timed out
+        """
+        if not self._validated:
+            await self.auto_select_provider()
+        provider = self._current_provider
+        model = self.PROVIDER_CONFIG[provider]["text_model"]
+        client = get_batch_client(provider, self._get_api_key(provider), model, **batch_options)
+
+        start_time = time.time()
+        results = await client.run([
+            BatchRequest(custom_id, messages, max_tokens=max_tokens, temperature=temperature)
+            for custom_id, messages in requests.items()
+        ], batch_id=batch_id, on_submitted=on_submitted)
+        elapsed = time.time() - start_time
+
+        for result in results.values():
+            if result.ok:
+                self._cumulative_stats.add(UsageStats(
+                    input_tokens=result.input_tokens,
+                    output_tokens=result.output_tokens,
+                    total_tokens=result.input_tokens + result.output_tokens,
+                    elapsed_seconds=elapsed / max(len(results), 1),
+                    provider=provider,
+                    model=model,
+                ))
+                self._cumulative_stats.batched_calls += 1
+        return results
+
     def get_current_provider(self) -> Optional[str]:
         """Get the currently active provider."""
         return self._current_provider
@@ -907,6 +1110,11 @@ class UnifiedLLMClient:
         if no_credit:
             result["billing_issues"] = no_credit
 
+        # Adaptive concurrency per provider/model and latency percentiles
+        # (shared by all jobs)
+        result["concurrency"] = limiter_stats()
+        result["latency"] = get_latency_tracker().snapshot()
+
         return result
 
 
@@ -159,6 +159,10 @@ class JobResponseV2(BaseModel):
     usage_stats: Optional[UsageStatsResponse] = None
     elapsed_time_seconds: float = 0.0
 
+    # PDF page cache hits/misses per extraction step
+    # (e.g. {"analysis": {"hits": 12, "misses": 0, "hit_rate": 1.0}, "vision": {...}})
+    page_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
     # Timestamps
     created_at: datetime
     completed_at: Optional[datetime] = None
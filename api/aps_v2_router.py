@@ -127,10 +127,12 @@ async def publish_file(
         file_path = await service.save_upload(file.filename, content_bytes)
 
         # Read content (Vision mode for PDFs, with source language for OCR routing)
+        page_cache: dict = {}
         content = await service.read_upload(
             file_path,
             use_vision=use_vision,
-            source_lang=source_language
+            source_lang=source_language,
+            page_cache=page_cache,
         )
 
         if not content.strip():
@@ -173,6 +175,7 @@ async def publish_file(
             provider=provider if provider != "auto" else None,
             model=model if model else None,
             user_id=user_id,
+            page_cache=page_cache,
         )
 
         return service.get_job_response(job)
@@ -79,13 +79,15 @@ class LLMClientAdapter:
         max_tokens: int = 8192,
         temperature: Optional[float] = None,
         cache_system: bool = False,
+        hedge: bool = False,
     ) -> Any:
         """
         Send chat request to LLM with automatic fallback.
         Delegates to UnifiedLLMClient which handles all fallback logic.
 
-        temperature/cache_system are forwarded so the translation orchestrator
-        can request low-variance output and Anthropic prompt caching.
+        temperature/cache_system/hedge are forwarded so the translation
+        orchestrator can request low-variance output, Anthropic prompt caching
+        and hedged calls.
         """
         try:
             return await self._unified_client.chat(
@@ -94,11 +96,24 @@ class LLMClientAdapter:
                 response_format=response_format,
                 temperature=temperature,
                 cache_system=cache_system,
+                hedge=hedge,
             )
         except AllProvidersUnavailableError as e:
             # Re-raise with clear message
             raise RuntimeError(str(e))
 
+    async def chat_batch(
+        self,
+        requests: Dict[str, List[Dict]],
+        max_tokens: int = 8192,
+        temperature: Optional[float] = None,
+        **batch_options,
+    ) -> Dict:
+        """Run requests through the provider batch API (orchestrator batch mode)."""
+        return await self._unified_client.chat_batch(
+            requests, max_tokens=max_tokens, temperature=temperature, **batch_options,
+        )
+
     async def validate_provider(self, provider: str) -> tuple:
         """Test if a provider's API key is valid."""
         health = await self._unified_client.validate_provider(provider)
@@ -258,6 +273,7 @@ class APSV2Service:
         user_id: str = "default_user",  # Multi-tenancy: owner user
         cover_template: Optional[str] = None,  # Pre-built cover template id (see cover_templates)
         cover_image: Optional[str] = None,  # Path to a user-supplied cover image (wins over template)
+        page_cache: Optional[Dict] = None,  # Page cache stats filled in by read_upload()
     ) -> Dict:
         """Create and start a new publishing job."""
 
@@ -331,6 +347,7 @@ class APSV2Service:
             "job_start_time": time.time(),
             # NOTE: api_key intentionally NOT stored in job record (security)
             "eqs": self._last_eqs_report,  # EQS extraction quality (Sprint 9)
+            "page_cache": page_cache or None,  # PDF page cache hits/misses
             "user_id": user_id,
         }
 
@@ -447,6 +464,12 @@ class APSV2Service:
             # Use source filename (without extension) as title fallback
             source_file = job.get("source_file", "")
             title_fallback = source_file.rsplit(".", 1)[0] if source_file else ""
+
+            def on_batch_submitted(batch_id: str):
+                # Persisted so resume_pending_jobs polls the batch, not repays it
+                job["batch_id"] = batch_id
+                self._repo.set_batch_id(job_id, batch_id)
+
             result = await publisher.publish(
                 source_text=content,
                 source_lang=job["source_language"],
@@ -460,6 +483,8 @@ class APSV2Service:
                 cover_template=cover_template,  # Pre-built cover template id
                 cover_image=cover_image,  # User-supplied cover image path
                 title_fallback=title_fallback,
+                batch_id=job.get("batch_id"),
+                on_batch_submitted=on_batch_submitted,
             )
 
             # Update job with results
@@ -475,6 +500,9 @@ class APSV2Service:
             if result.dna:
                 job["dna"] = result.dna
 
+            if result.page_cache:
+                job["page_cache"] = {**(job.get("page_cache") or {}), **result.page_cache}
+
             if result.chunks:
                 job["chunks"] = result.chunks
 
@@ -777,6 +805,7 @@ class APSV2Service:
             quality_level=quality_level,
             usage_stats=usage_stats_response,
             elapsed_time_seconds=round(elapsed, 1),
+            page_cache=job.get("page_cache"),
             created_at=job["created_at"],
             completed_at=job.get("completed_at"),
         )
@@ -853,11 +882,15 @@ class APSV2Service:
         self,
         file_path: Path,
         use_vision: bool = True,
-        source_lang: str = None
+        source_lang: str = None,
+        page_cache: Optional[Dict] = None,
     ) -> str:
         """
         Read uploaded file content.
 
+        If ``page_cache`` is given, PDF page cache hits/misses per extraction
+        step are written into it, to be passed on to create_job().
+
         For PDFs:
         - use_vision=True: Uses Smart Extraction Router (auto-detect strategy)
         - use_vision=False: Forces fast PyMuPDF extraction
@@ -887,7 +920,7 @@ class APSV2Service:
                 raise RuntimeError("python-docx required for .docx files")
 
         elif suffix == '.pdf':
-            return await self._smart_extract_pdf(file_path, use_vision, source_lang)
+            return await self._smart_extract_pdf(file_path, use_vision, source_lang, page_cache)
 
         else:
             # Try reading as text
@@ -922,7 +955,8 @@ class APSV2Service:
         self,
         file_path: Path,
         use_vision: bool = True,
-        source_lang: str = None
+        source_lang: str = None,
+        page_cache: Optional[Dict] = None,
     ) -> str:
         """
         Smart PDF extraction with automatic strategy selection.
@@ -940,8 +974,11 @@ class APSV2Service:
             file_path: Path to PDF file
             use_vision: Enable Vision API fallback
             source_lang: Source language for OCR routing ('ja', 'zh', 'ko', etc.)
+            page_cache: Optional dict that receives page cache stats per step
         """
         self._last_eqs_report = None
+        if page_cache is None:
+            page_cache = {}
 
         try:
             from core.smart_extraction import (
@@ -954,6 +991,8 @@ class APSV2Service:
             # First, analyze the document
             analysis = analyze_document(str(file_path))
 
+            page_cache["analysis"] = analysis.page_cache.to_dict()
+
             logger.info(f"📊 Document Analysis:")
             logger.info(f"   Pages: {analysis.total_pages}")
             logger.info(f"   Text coverage: {analysis.text_coverage:.0%}")
@@ -968,18 +1007,24 @@ class APSV2Service:
                 logger.info(f"   Vision disabled, forcing FAST_TEXT")
                 analysis.strategy = ExtractionStrategy.FAST_TEXT
 
+            def _record_page_cache(result):
+                # smart_extract re-analyzes; keep the first analysis' stats
+                page_cache.update((k, v) for k, v in result.page_cache.items() if k != "analysis")
+
             # === Extraction with EQS feedback loop (Sprint 9) ===
             async def _try_extract(strategy: ExtractionStrategy):
                 """Extract text using a specific strategy. Returns (text, pages)."""
                 if strategy == ExtractionStrategy.FAST_TEXT:
                     from core.smart_extraction import fast_extract
                     result = await fast_extract(str(file_path))
+                    page_cache["fast_text"] = result.page_cache.to_dict()
                     logger.info(f"   ⚡ Fast extracted {result.total_pages} pages in {result.extraction_time:.1f}s")
                     return result.full_content, result.total_pages
 
                 elif strategy == ExtractionStrategy.HYBRID:
                     from core.smart_extraction import fast_extract
                     result = await fast_extract(str(file_path))
+                    page_cache["fast_text"] = result.page_cache.to_dict()
                     logger.info(f"   📖 Hybrid extraction (fast for most pages)")
                     logger.info(f"   Complex pages that could use Vision: {len(analysis.complex_page_numbers)}")
                     return result.full_content, result.total_pages
@@ -993,6 +1038,7 @@ class APSV2Service:
                             source_lang=source_lang,
                             use_vision=False
                         )
+                        _record_page_cache(result)
                         logger.info(f"   ✅ OCR extracted {result.total_pages} pages")
                         logger.info(f"   📊 OCR confidence: {result.ocr_confidence:.1%}")
                         return result.content, result.total_pages
@@ -1008,6 +1054,7 @@ class APSV2Service:
                         source_lang=source_lang or 'en',
                         use_vision=False
                     )
+                    _record_page_cache(result)
                     logger.info(f"   ✅ OCR extracted {result.total_pages} pages")
                     logger.info(f"   📊 OCR confidence: {result.ocr_confidence:.1%}")
                     return result.content, result.total_pages
@@ -14,7 +14,7 @@ from typing import List, Optional
 from fastapi import Header, HTTPException, WebSocket
 
 from core.job_queue import JobQueue
-from core.cache.chunk_cache import ChunkCache
+from core.cache.tiered_cache import get_chunk_cache
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -26,7 +26,7 @@ start_time = time.time()
 
 # Chunk cache
 cache_db_path = Path(__file__).parent.parent / "data" / "cache" / "chunks.db"
-chunk_cache = ChunkCache(cache_db_path)
+chunk_cache = get_chunk_cache(cache_db_path)
 
 
 # --- WebSocket Manager ---
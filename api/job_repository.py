@@ -94,6 +94,12 @@ class JobRepository:
             except Exception:
                 pass  # Column already exists
 
+            # Migration: provider batch id (batch mode), resumed after a restart
+            try:
+                conn.execute("ALTER TABLE aps_jobs ADD COLUMN batch_id TEXT")
+            except Exception:
+                pass  # Column already exists
+
             # QA-23: Version history table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS job_history (
@@ -338,6 +344,14 @@ class JobRepository:
                 WHERE job_id = ?
             """, (progress, stage, datetime.now().isoformat(), job_id))
 
+    def set_batch_id(self, job_id: str, batch_id: str) -> None:
+        """Remember the provider batch a job submitted (resumed after a restart)."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                UPDATE aps_jobs SET batch_id = ?, updated_at = ?
+                WHERE job_id = ?
+            """, (batch_id, datetime.now().isoformat(), job_id))
+
     def mark_complete(self, job_id: str, output_paths: Dict) -> None:
         """Mark job as complete."""
         with self._get_connection() as conn:
@@ -383,6 +397,7 @@ class JobRepository:
             "updated_at": row["updated_at"],
             "completed_at": row["completed_at"],
             "user_id": row["user_id"] if "user_id" in row.keys() else "default_user",
+            "batch_id": row["batch_id"] if "batch_id" in row.keys() else None,
         }
 
     # QA-23: Version history
@@ -76,7 +76,7 @@ from core.batch_processor import BatchProcessor, read_document
 # Deprecated: DeepSeek OCR has been replaced by hybrid OCR system
 # from core.ocr_deepseek import DeepseekOCR, OCRResult
 from core.post_formatting.heading_detector import HeadingDetector
-from core.cache.chunk_cache import ChunkCache
+from core.cache.tiered_cache import get_chunk_cache
 import re
 import math
 from docx import Document as DocxDocument
@@ -645,6 +645,20 @@ async def startup_recover_stuck_v1_jobs():
         logger.debug(f"V1 stuck job recovery skipped: {e}")
 
 
+@app.on_event("startup")
+async def startup_prewarm_ocr_models():
+    """Load configured OCR models in the background so the first scanned job starts immediately."""
+    from config.settings import settings
+    if not settings.ocr_prewarm_languages:
+        return
+    try:
+        from core.ocr.paddle_client import prewarm_ocr_models
+    except ImportError as e:
+        logger.debug(f"OCR prewarm skipped: {e}")
+        return
+    asyncio.create_task(asyncio.to_thread(prewarm_ocr_models, settings.ocr_prewarm_languages))
+
+
 @app.on_event("startup")
 async def startup_ws_fanout():
     """Enable Redis WS fan-out across workers (no-op if ws_redis_url is empty)."""
@@ -743,7 +757,7 @@ websocket_connections: List[WebSocket] = []
 
 # Initialize chunk cache
 cache_db_path = Path(__file__).parent.parent / "data" / "cache" / "chunks.db"
-chunk_cache = ChunkCache(cache_db_path)
+chunk_cache = get_chunk_cache(cache_db_path)
 
 
 # =============================================================================
@@ -1069,13 +1083,16 @@ async def get_cache_stats():
     Get cache statistics
 
     Returns:
-        Cache statistics including total entries, hit rate, and database size
+        Cache statistics including total entries, hit rate, and database size,
+        plus loaded OCR models (hits, load times)
     """
     try:
+        from core.ocr.model_registry import get_model_registry
         stats = chunk_cache.stats()
         return {
             "success": True,
-            "stats": stats
+            "stats": stats,
+            "ocr_models": get_model_registry().stats(),
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
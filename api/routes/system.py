@@ -143,13 +143,16 @@ async def get_cache_stats():
     Get cache statistics
 
     Returns:
-        Cache statistics including total entries, hit rate, and database size
+        Cache statistics including total entries, hit rate, and database size,
+        plus loaded OCR models (hits, load times)
     """
     try:
+        from core.ocr.model_registry import get_model_registry
         stats = chunk_cache.stats()
         return {
             "success": True,
-            "stats": stats
+            "stats": stats,
+            "ocr_models": get_model_registry().stats(),
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
@@ -45,6 +45,18 @@ class Settings(BaseSettings):
     gemini_text_model: str = "gemini-2.0-flash"
     gemini_vision_model: str = "gemini-2.0-flash"
 
+    # ---- Vision page reading (core_v2/vision_reader.py) ----
+    # Pages read concurrently per document, and per-provider budgets
+    # (requests / input tokens per minute) shared by all vision jobs.
+    vision_concurrency: int = 8
+    vision_page_retries: int = 2
+    anthropic_vision_rpm: int = 50
+    anthropic_vision_tpm: int = 40000
+    openai_vision_rpm: int = 500
+    openai_vision_tpm: int = 30000
+    gemini_vision_rpm: int = 60
+    gemini_vision_tpm: int = 1000000
+
     # ---- Translation determinism & caching (live core_v2 path) ----
     # Low temperature => faithful, low-variance translation. The live
     # orchestrator previously ran at provider-default (~1.0).
@@ -97,6 +109,14 @@ class Settings(BaseSettings):
     # How long a provider stays benched after a transient failure before it
     # is retried again (was: benched permanently for the whole process).
     provider_health_ttl_seconds: float = 300.0
+    # Hedge translation chunks: once a call outlives the provider's p95
+    # latency, race a backup on the next healthy provider (costs the
+    # tokens of the losing request)
+    translation_hedging_enabled: bool = False
+    # "batch": send a job's cache-miss chunks through the provider batch API
+    # (OpenAI / Anthropic; about half price, results within 24h) and translate
+    # only what it could not interactively. Polling: LLM_BATCH_* env vars.
+    translation_execution_mode: str = "interactive"
 
     # ---- Bounded repair pass for suspect chunks ----
     # After translation, re-translate ONLY the chunks the deterministic quality
@@ -195,6 +215,27 @@ class Settings(BaseSettings):
     # Phase 5.1: Chunk Cache Settings
     chunk_cache_enabled: bool = True  # Enable chunk-level translation caching
     chunk_cache_ttl_days: int = 30  # Cache entry TTL (for future eviction)
+    # Tiers in front of the SQLite chunk cache: per-process LRU budget (MB)
+    # and optional Redis shared by all workers ("" = no shared tier)
+    chunk_cache_memory_mb: int = 64
+    chunk_cache_redis_url: str = ""
+    # Write-behind for TM / chunk cache writes on the translation hot path:
+    # queued writes are committed together every N items or T milliseconds
+    store_write_batch_size: int = 64
+    store_write_interval_ms: int = 250
+    # Per-page PDF extraction cache (text, analysis, Vision, OCR), keyed by
+    # page content so re-uploaded / partially edited PDFs only re-extract
+    # changed pages (data/cache/pages.db)
+    page_cache_enabled: bool = True
+    # Size budget of the page cache values; least recently used pages are
+    # evicted beyond it (0 = unbounded)
+    page_cache_max_mb: int = 1024
+    # LaTeX -> OMML conversions shared across jobs (data/cache/omml.db);
+    # equations are converted in batches of N per pandoc run, on up to
+    # `workers` pandoc processes at once (0 = one per CPU)
+    omml_cache_enabled: bool = True
+    omml_batch_size: int = 200
+    omml_workers: int = 0
 
     # Phase 5.2: Checkpoint Settings (Fault-Tolerant Resume)
     checkpoint_enabled: bool = True  # Enable job checkpointing for resume capability
@@ -242,6 +283,11 @@ class Settings(BaseSettings):
     database_backend: str = "sqlite"  # sqlite | postgresql (Sprint 2)
     database_url: Optional[str] = None
     database_dir: Path = BASE_DIR / "data"
+    # SQLite tuning: reader connections for pooled stores (job queue), page
+    # cache per connection in KiB and memory-mapped I/O in MB (0 = SQLite default)
+    sqlite_pool_size: int = 4
+    sqlite_cache_size_kib: int = 0
+    sqlite_mmap_size_mb: int = 0
 
     # WebSocket fan-out across workers (#6 Pha 1). Empty ws_redis_url => local-only
     # broadcast (single worker; current behaviour). Set to e.g. redis://host:6379/0.
@@ -269,9 +315,31 @@ class Settings(BaseSettings):
     # PaddleOCR Settings (local OCR, no API key needed)
     paddle_lang: str = "en"  # Language: en, ch, multilingual, etc.
     ocr_backend: str = "auto"  # auto, paddle, hybrid, mathpix, none
+    # Page-parallel OCR for PDFs: worker processes (0 = one per CPU, 1 = off)
+    # and total memory budget for them (each PaddleOCR worker needs ~1.5 GB)
+    ocr_workers: int = 0
+    ocr_memory_limit_mb: int = 6000
+    # Render each scanned page only as sharp as its text needs (text lines
+    # at ~48 px, the PaddleOCR recognizer input), between ocr_min_dpi and
+    # the pipeline's DPI
+    ocr_adaptive_dpi: bool = True
+    ocr_min_dpi: int = 100
+    # Loaded PaddleOCR models shared across jobs: languages kept at once,
+    # idle seconds before a model is unloaded (0 = never), and ISO codes
+    # loaded at API startup (comma-separated, e.g. "ja,zh")
+    ocr_model_cache_size: int = 2
+    ocr_model_idle_seconds: int = 1800
+    ocr_prewarm_languages: str = ""
 
     # PDF Processing
     poppler_path: Optional[str] = None
+    # Native-text extraction of long PDFs: worker processes that each open
+    # the document and extract a shard of pages (0 = one per CPU, 1 = a
+    # single thread)
+    text_extract_workers: int = 0
+    # PDF export of long books: chapters (split at level-1 headings) laid
+    # out in worker processes (0 = one per CPU, 1 = a single pass)
+    pdf_render_workers: int = 0
 
     # Deprecated (will be removed in future version)
     # deepseek_ocr_api_url: str = ""
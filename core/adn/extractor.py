@@ -14,6 +14,8 @@ Version: 1.0.0
 from typing import List, Dict, Optional
 import logging
 
+from core.term_automaton import TermAutomaton
+
 from .schema import ContentADN, Character, Term, ProperNoun, Pattern, ProperNounType
 from .proper_nouns import ProperNounExtractor
 from .patterns import PatternDetector
@@ -51,6 +53,7 @@ class ADNExtractor:
         self.source_lang = source_lang.lower()[:2]
         self.target_lang = target_lang.lower()[:2]
         self.glossary = glossary or {}
+        self._glossary_automaton: Optional[TermAutomaton] = None
 
         # Initialize sub-extractors
         self.proper_noun_extractor = ProperNounExtractor(self.source_lang)
@@ -163,6 +166,13 @@ class ADNExtractor:
 
         return characters
 
+    def _term_automaton(self) -> TermAutomaton:
+        """Automaton over the glossary sources (substring matching, like
+        ``str.count``), rebuilt when the glossary's terms change."""
+        if self._glossary_automaton is None or self._glossary_automaton.terms != list(self.glossary):
+            self._glossary_automaton = TermAutomaton(list(self.glossary), word_boundary=False)
+        return self._glossary_automaton
+
     def _extract_terms(self, segments: List[str]) -> List[Term]:
         """
         Extract and count terminology from glossary.
@@ -177,13 +187,14 @@ class ADNExtractor:
             return []
 
         terms = []
-        full_text = ' '.join(segments).lower()
-
-        for original, translation in self.glossary.items():
-            # Count occurrences (case-insensitive)
-            frequency = full_text.count(original.lower())
-
-            if frequency > 0:
+        full_text = ' '.join(segments)
+
+        # Count occurrences of all terms in one scan (case-insensitive)
+        automaton = self._term_automaton()
+        for idx, frequency in sorted(automaton.count(full_text).items()):
+            original = automaton.terms[idx]
+            translation = self.glossary.get(original)
+            if translation is not None:
                 # Find example contexts
                 examples = self._find_term_examples(original, segments, max_examples=3)
 
@@ -17,6 +17,8 @@ import logging
 from typing import List, Dict, Optional, Set
 from dataclasses import dataclass, field
 
+from core.term_automaton import TermAutomaton
+
 from .schema import (
     ContentADN,
     ProperNoun,
@@ -147,6 +149,7 @@ class OptimizedADNExtractor:
         self.source_lang = source_lang.lower()[:2]
         self.target_lang = target_lang.lower()[:2]
         self.glossary = glossary or {}
+        self._glossary_automaton: Optional[TermAutomaton] = None
 
         # Get pre-compiled patterns (singleton)
         self._patterns = CompiledPatterns()
@@ -303,16 +306,22 @@ class OptimizedADNExtractor:
         characters.sort(key=lambda c: c.first_appearance)
         return characters
 
+    def _term_automaton(self) -> TermAutomaton:
+        """Compiled glossary sources (cached; rebuilt if terms change)"""
+        if self._glossary_automaton is None or self._glossary_automaton.terms != list(self.glossary):
+            self._glossary_automaton = TermAutomaton(list(self.glossary), word_boundary=False)
+        return self._glossary_automaton
+
     def _extract_terms(self, text: str) -> List[Term]:
         """Extract terms from glossary matches"""
         terms = []
-        text_lower = text.lower()
-
-        for original, translation in self.glossary.items():
-            # Count occurrences
-            count = text_lower.count(original.lower())
 
-            if count > 0:
+        # Count occurrences of all terms in one scan
+        automaton = self._term_automaton()
+        for idx, count in sorted(automaton.count(text).items()):
+            original = automaton.terms[idx]
+            translation = self.glossary.get(original)
+            if translation is not None:
                 terms.append(Term(
                     original=original,
                     translation=translation,
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Async facades for TranslationMemory and ChunkCache
+
+Both stores are synchronous sqlite3. Called from an `async def` they block
+the event loop for the whole query - a fuzzy TM scan stalls every in-flight
+HTTP call and websocket update. The facades keep the loop free:
+
+- reads run on a small dedicated thread pool; each reader thread gets its
+  own sqlite3 connection (WAL lets them run alongside the writer)
+- writes go to a single writer thread through a queue (write-behind): the
+  writer collects up to N items or waits up to T ms after the first one,
+  then commits them as one transaction - one fsync per batch instead of
+  one per chunk
+
+Writes are fire-and-forget for the caller; `await flush()` waits until
+everything queued so far is on disk, `flush_blocking()` does the same from
+sync shutdown code. A failed batch is retried with backoff and then written
+item by item; writes that still fail make the next flush (or close) raise
+StoreWriteError instead of being dropped silently.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from config.logging_config import get_logger
+
+from .cache.chunk_cache import ChunkCache
+from .cache.tiered_cache import TieredChunkCache
+from .translation_memory import TranslationMemory, TMMatch, TMSegment
+
+logger = get_logger(__name__)
+
+# Sentinel that stops the writer thread
+_STOP = object()
+
+# Write-behind defaults: commit every N items or T seconds, whichever first
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_DELAY = 0.25
+
+# Attempts per batch before falling back to one item at a time, and the
+# delay before the first retry (doubled per attempt)
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_DELAY = 0.1
+
+
+class StoreWriteError(RuntimeError):
+    """Queued writes that could not be applied, even one at a time"""
+
+    def __init__(self, failed: int, error: BaseException):
+        super().__init__(f"{failed} queued writes could not be applied: {error}")
+        self.failed = failed
+
+
+class BackgroundWriter:
+    """
+    Single thread applying queued writes in batches
+
+    Args:
+        apply_batch: Called on the writer thread with a list of queued items
+        name: Thread name (for logs and debuggers)
+        max_batch: Most items applied in one call
+        max_delay: Seconds to keep collecting after the first queued item
+                   (0 applies whatever is already queued right away)
+        retries: Attempts per batch before applying its items one by one
+        retry_delay: Seconds before the first retry (doubled per attempt)
+    """
+
+    def __init__(
+        self,
+        apply_batch: Callable[[List[Any]], None],
+        name: str = "store-writer",
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = 0.0,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ):
+        self.apply_batch = apply_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.retries = max(1, retries)
+        self.retry_delay = retry_delay
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        # Writes lost since the last barrier, reported to it (writer thread only)
+        self._failed = 0
+        self._last_error: Optional[BaseException] = None
+        self._close_error: Optional[StoreWriteError] = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> None:
+        """Queue one write (never blocks)"""
+        if self._closed:
+            raise RuntimeError("writer is closed")
+        self._queue.put(item)
+
+    def barrier(self) -> Future:
+        """
+        Future resolved once every item queued before it is applied
+
+        Its result is a StoreWriteError if some of those items (or earlier
+        ones not yet reported) could not be written.
+        """
+        done: Future = Future()
+        if self._closed:
+            done.set_result(None)
+        else:
+            self._queue.put(done)
+        return done
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every item queued so far is applied
+
+        Returns:
+            False if the timeout expired first
+
+        Raises:
+            StoreWriteError: If queued items could not be written
+        """
+        try:
+            self.barrier().result(timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    def close(self) -> None:
+        """
+        Apply everything still queued, then stop the thread
+
+        Raises:
+            StoreWriteError: If queued items could not be written
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        if self._close_error is not None:
+            raise self._close_error
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            # Keep collecting until the batch is full, the delay is up, or a
+            # flush/close asks for the queued items now
+            while len(items) < self.max_batch and not _is_control(items[-1]):
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        items.append(self._queue.get(timeout=remaining))
+                    else:
+                        items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batch = [item for item in items if not _is_control(item)]
+            if batch:
+                self._apply(batch)
+
+            # A control item always ends its batch, so failures so far are its own
+            for item in items:
+                if isinstance(item, Future):
+                    error = self._take_error()
+                    if error is None:
+                        item.set_result(None)
+                    else:
+                        item.set_exception(error)
+            if any(item is _STOP for item in items):
+                self._close_error = self._take_error()
+                return
+
+    def _apply(self, batch: List[Any]) -> None:
+        """apply_batch() with retries, then item by item; counts what is lost"""
+        delay = self.retry_delay
+        for attempt in range(1, self.retries + 1):
+            try:
+                self.apply_batch(batch)
+                return
+            except Exception as e:
+                logger.warning(f"Background write of {len(batch)} items failed (attempt {attempt}): {e}")
+                if attempt < self.retries:
+                    time.sleep(delay)
+                    delay *= 2
+
+        # One bad item must not sink the rest of the batch
+        for item in batch:
+            try:
+                self.apply_batch([item])
+            except Exception as e:
+                self._failed += 1
+                self._last_error = e
+        if self._failed:
+            logger.error(f"{self._failed} queued writes could not be applied: {self._last_error}")
+
+    def _take_error(self) -> Optional[StoreWriteError]:
+        if not self._failed:
+            return None
+        error = StoreWriteError(self._failed, self._last_error)
+        self._failed, self._last_error = 0, None
+        return error
+
+
+def _is_control(item: Any) -> bool:
+    """Flush barrier or stop sentinel (as opposed to a write)"""
+    return item is _STOP or isinstance(item, Future)
+
+
+class _ReaderPool:
+    """
+    Thread pool whose threads each hold their own store instance
+
+    Args:
+        open_store: Returns the store a new reader thread should use
+        readers: Number of reader threads
+        name: Thread name prefix
+    """
+
+    def __init__(self, open_store: Callable[[], Any], readers: int, name: str):
+        self._open_store = open_store
+        self._local = threading.local()
+        self._opened: List[Any] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=readers, thread_name_prefix=name)
+
+    def _store(self) -> Any:
+        store = getattr(self._local, "store", None)
+        if store is None:
+            store = self._local.store = self._open_store()
+            with self._lock:
+                self._opened.append(store)
+        return store
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await fn(store, *args, **kwargs) on a reader thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: fn(self._store(), *args, **kwargs)
+        )
+
+    def close(self) -> List[Any]:
+        """Stop the threads; returns the stores they opened"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            opened, self._opened = self._opened, []
+        return opened
+
+
+class AsyncTranslationMemory:
+    """
+    Non-blocking access to a TranslationMemory from async code
+
+    A real TranslationMemory gets one extra connection per reader thread
+    plus one for the writer (TranslationMemory.reopen); any other object
+    (tests, custom TMs) is called as-is from the worker threads.
+
+    Usage:
+        >>> atm = AsyncTranslationMemory(tm)
+        >>> match = await atm.get_exact_match("Hello", "en", "vi")
+        >>> await atm.add_segment(segment)   # queued, returns at once
+        >>> await atm.flush()                # durable from here on
+        >>> atm.close()
+    """
+
+    def __init__(
+        self,
+        tm: Any,
+        readers: int = 4,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Args:
+            tm: TranslationMemory (or compatible object) to wrap
+            readers: Reader threads
+            max_batch: Most segments written per transaction
+            max_delay: Seconds queued segments may wait for a fuller batch
+        """
+        self.tm = tm
+        self._owns_connections = isinstance(tm, TranslationMemory)
+        self._readers = _ReaderPool(self._open, readers, "tm-reader")
+        self._writer_tm: Optional[Any] = None
+        self._writer = BackgroundWriter(self._write_batch, "tm-writer", max_batch, max_delay)
+
+    def _open(self) -> Any:
+        return self.tm.reopen() if self._owns_connections else self.tm
+
+    def _write_batch(self, segments: List[TMSegment]) -> None:
+        if self._writer_tm is None:
+            self._writer_tm = self._open()
+        if hasattr(self._writer_tm, "add_segments"):
+            self._writer_tm.add_segments(segments)
+        else:
+            for segment in segments:
+                self._writer_tm.add_segment(segment)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await fn(tm, *args, **kwargs) on a reader thread"""
+        return await self._readers.run(fn, *args, **kwargs)
+
+    async def get_exact_match(self, *args, **kwargs) -> Optional[TMMatch]:
+        """Async TranslationMemory.get_exact_match"""
+        return await self.run(lambda tm: tm.get_exact_match(*args, **kwargs))
+
+    async def get_fuzzy_matches(self, *args, **kwargs) -> List[TMMatch]:
+        """Async TranslationMemory.get_fuzzy_matches"""
+        return await self.run(lambda tm: tm.get_fuzzy_matches(*args, **kwargs))
+
+    async def lookup_many(self, *args, **kwargs) -> List[Optional[TMMatch]]:
+        """Async TranslationMemory.lookup_many"""
+        return await self.run(lambda tm: tm.lookup_many(*args, **kwargs))
+
+    async def get_statistics(self) -> dict:
+        """Async TranslationMemory.get_statistics"""
+        return await self.run(lambda tm: tm.get_statistics())
+
+    async def add_segment(self, segment: TMSegment) -> None:
+        """Queue a segment for the writer thread"""
+        self._writer.submit(segment)
+
+    async def flush(self) -> None:
+        """Wait until every segment queued so far is committed"""
+        await asyncio.wrap_future(self._writer.barrier())
+
+    def flush_blocking(self, timeout: Optional[float] = None) -> bool:
+        """flush() for sync code; False if the timeout expired first"""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """
+        Write pending segments, stop threads, close extra connections
+
+        Raises:
+            StoreWriteError: If queued segments could not be written
+        """
+        try:
+            self._writer.close()
+        finally:
+            opened = self._readers.close()
+            if self._owns_connections:
+                for tm in opened + [self._writer_tm]:
+                    if tm is not None:
+                        tm.close()
+            self._writer_tm = None
+
+
+class AsyncChunkCache:
+    """
+    Non-blocking access to a ChunkCache from async code
+
+    ChunkCache already keeps one connection per thread, so readers call it
+    directly; queued sets are written with ChunkCache.set_many. A
+    TieredChunkCache answers from its memory/shared tiers first, and queued
+    sets are visible there before the writer commits them.
+    """
+
+    def __init__(
+        self,
+        cache: Any,
+        readers: int = 4,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Args:
+            cache: ChunkCache (or compatible object) to wrap
+            readers: Reader threads
+            max_batch: Most entries written per transaction
+            max_delay: Seconds queued entries may wait for a fuller batch
+        """
+        self.cache = cache
+        self._readers = _ReaderPool(lambda: cache, readers, "cache-reader")
+        self._writer = BackgroundWriter(self._write_batch, "cache-writer", max_batch, max_delay)
+
+    def _write_batch(self, entries: List[dict]) -> None:
+        if isinstance(self.cache, ChunkCache):
+            self.cache.set_many(entries)
+        else:
+            for entry in entries:
+                self.cache.set(**entry)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Async ChunkCache.get"""
+        if isinstance(self.cache, TieredChunkCache):
+            return await self.cache.get_async(key)
+        return await self._readers.run(lambda cache: cache.get(key))
+
+    async def set(
+        self,
+        key: str,
+        value: str,
+        source_lang: str = '',
+        target_lang: str = '',
+        mode: str = ''
+    ) -> None:
+        """Queue an entry for the writer thread"""
+        if isinstance(self.cache, TieredChunkCache):
+            await self.cache.promote(key, value)
+        self._writer.submit({
+            'key': key,
+            'value': value,
+            'source_lang': source_lang,
+            'target_lang': target_lang,
+            'mode': mode,
+        })
+
+    async def flush(self) -> None:
+        """Wait until every entry queued so far is committed"""
+        await asyncio.wrap_future(self._writer.barrier())
+
+    def flush_blocking(self, timeout: Optional[float] = None) -> bool:
+        """flush() for sync code; False if the timeout expired first"""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """
+        Write pending entries and stop threads (the cache stays open)
+
+        Raises:
+            StoreWriteError: If queued entries could not be written
+        """
+        try:
+            self._writer.close()
+        finally:
+            self._readers.close()
@@ -549,11 +549,16 @@ class BatchOrchestrator:
             timeout=float(self.config.timeout_seconds),
         )
 
-        results, stats = await processor.process_all(
-            chunks=chunks,
-            http_client=self.http_client,
-            progress_callback=progress_callback,
-        )
+        try:
+            results, stats = await processor.process_all(
+                chunks=chunks,
+                http_client=self.http_client,
+                progress_callback=progress_callback,
+            )
+        finally:
+            # Commit TM / chunk cache writes queued by translate_chunk
+            # (also on cancellation)
+            await self.translator.flush_stores()
 
         logger.info(
             f"Chunk processing: {stats.successful}/{stats.total_chunks} successful, "
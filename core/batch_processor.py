@@ -19,7 +19,7 @@ import asyncio
 import time
 import traceback
 from pathlib import Path
-from typing import Optional, List, Any, Dict, Tuple
+from typing import Optional, List, Any, Dict, Set, Tuple
 from collections.abc import Callable
 import httpx
 from config.logging_config import get_logger
@@ -50,10 +50,11 @@ try:
 except ImportError:
     HAS_DOCX = False
 
-from .job_queue import JobQueue, TranslationJob, JobStatus, JobPriority
+from .job_queue import JobQueue, TranslationJob, JobStatus, JobPriority, LeaseLostError
+from .job_signal import JobWakeup
 from .chunker import SmartChunker
 from .cache import TranslationCache  # Legacy cache (keep for compatibility)
-from .cache.chunk_cache import ChunkCache  # Phase 5.1: New chunk-level cache
+from .cache.tiered_cache import get_chunk_cache  # Phase 5.1: chunk-level cache (memory/Redis/SQLite tiers)
 from .cache import CheckpointManager, serialize_translation_result, deserialize_translation_result  # Phase 5.2: Checkpoints
 from .validator import QualityValidator
 from .glossary_legacy import GlossaryManager
@@ -290,6 +291,11 @@ def _merge_equation_blocks(paragraphs: List[str]) -> List[str]:
     return merged
 
 
+# Longest idle sleep in BatchProcessor.start() when wakeups work across
+# processes (a safety net; new jobs normally wake the loop immediately)
+IDLE_RECHECK_SECONDS = 30.0
+
+
 class BatchProcessor:
     """Process translation jobs from queue with priority scheduling"""
 
@@ -313,6 +319,8 @@ class BatchProcessor:
         self.is_running = False
         self.current_jobs: List[str] = []
         self.background_tasks: List[asyncio.Task] = []  # Track all background tasks
+        self._active_translators: Set[TranslatorEngine] = set()  # For write-behind flush on stop()
+        self._wakeup: Optional[JobWakeup] = None  # Set while start() runs
         self.websocket_manager = websocket_manager  # For realtime progress broadcast
 
         # Phase 5.2: Initialize checkpoint manager
@@ -337,48 +345,80 @@ class BatchProcessor:
         """
         Start processing jobs from queue
 
+        Event-driven: instead of polling, the loop sleeps until the queue
+        signals a new/restarted job (from this or another process), one of
+        its own jobs finishes, or a scheduled job / expired lease falls due.
+
         Args:
             continuous: If True, keep processing until stopped
         """
         self.is_running = True
         logger.info("🚀 Batch Processor started")
 
-        while self.is_running:
-            # Check if we can process more jobs
-            if len(self.current_jobs) >= self.max_concurrent_jobs:
-                await asyncio.sleep(1)
-                continue
+        self._wakeup = self.queue.signal.subscribe()
+        try:
+            while self.is_running:
+                # Check if we can process more jobs (tasks not yet finished,
+                # including ones that haven't started running)
+                if len(self.background_tasks) >= self.max_concurrent_jobs:
+                    await self._wakeup.wait()
+                    continue
 
-            # Get next job from queue
-            job = self.queue.get_next_job()
+                # Get next job from queue
+                job = await asyncio.to_thread(self.queue.get_next_job)
 
-            if job:
-                logger.info(f"\n📋 Processing job: {job.job_name} (ID: {job.job_id})")
-                logger.info(f"  Priority: {job.priority} | Status: {job.status}")
+                if job:
+                    logger.info(f"\n📋 Processing job: {job.job_name} (ID: {job.job_id})")
+                    logger.info(f"  Priority: {job.priority} | Status: {job.status}")
 
-                # Process job in background with exception handling
-                task = asyncio.create_task(self._process_job(job))
-                task.add_done_callback(self._handle_task_exception)
+                    # Process job in background with exception handling
+                    task = asyncio.create_task(self._process_job(job))
+                    task.add_done_callback(self._handle_task_exception)
 
-                # Track this task so we can cancel it later
-                self.background_tasks.append(task)
+                    # Track this task so we can cancel it later
+                    self.background_tasks.append(task)
 
-            else:
-                # No jobs available
-                if not continuous:
-                    logger.info(" No more jobs in queue. Stopping.")
-                    break
+                else:
+                    # No jobs available
+                    if not continuous:
+                        logger.info(" No more jobs in queue. Stopping.")
+                        break
 
-                # Wait before checking again
-                await asyncio.sleep(2)
+                    await self._wakeup.wait(await self._idle_timeout())
+        finally:
+            self._wakeup.close()
+            self._wakeup = None
 
         self.is_running = False
         logger.info(" Batch Processor stopped")
 
+    async def _idle_timeout(self) -> float:
+        """Seconds an idle start() loop may sleep without missing due work"""
+        # Without cross-process wakeups, jobs submitted by other processes
+        # are only seen on the next check - keep the old poll interval there
+        timeout = IDLE_RECHECK_SECONDS if self._wakeup.cross_process else 2.0
+        try:
+            due = await asyncio.to_thread(self.queue.next_wakeup_at)
+        except Exception as e:
+            logger.debug(f"Cannot read next queue deadline: {e}")
+            return timeout
+        if due is not None:
+            timeout = min(timeout, max(0.0, due - time.time()) + 0.05)
+        return timeout
+
     def stop(self):
         """Stop processing jobs and cancel all background tasks"""
         self.is_running = False
 
+        # Commit write-behind TM / chunk cache writes of running jobs before
+        # their tasks are cancelled (the process may exit right after stop)
+        for translator in list(self._active_translators):
+            try:
+                if not translator.flush_stores_blocking(timeout=10.0):
+                    logger.warning(" Timed out flushing queued TM/cache writes")
+            except Exception as e:
+                logger.warning(f" Failed to flush queued TM/cache writes: {e}")
+
         # Cancel all running background tasks
         logger.info(f" Cancelling {len(self.background_tasks)} background tasks...")
         for task in self.background_tasks:
@@ -390,6 +430,10 @@ class BatchProcessor:
         self.background_tasks.clear()
         logger.info(f" All background tasks cancelled")
 
+        # Let start() see is_running=False now instead of at its next wakeup
+        if self._wakeup is not None:
+            self._wakeup.set()
+
     def _handle_task_exception(self, task: asyncio.Task):
         """Handle exceptions from background tasks"""
         try:
@@ -408,6 +452,9 @@ class BatchProcessor:
             # Remove completed/failed task from list to prevent memory leak
             if task in self.background_tasks:
                 self.background_tasks.remove(task)
+            # A slot is free: let start() claim the next job right away
+            if self._wakeup is not None:
+                self._wakeup.set()
 
     # =========================================================================
     # V2 Orchestrator Integration
@@ -777,9 +824,14 @@ class BatchProcessor:
             job: Job to process
         """
         self.current_jobs.append(job.job_id)
+        lease_keeper = self._keep_lease(job)
 
         # Set overall timeout for job (2 hours)
         job_timeout = 7200  # 2 hours in seconds
+        if self._execution_mode(job) == 'batch':
+            # Plus the time the provider may take to run the batch
+            from ai_providers.batch import max_batch_wait
+            job_timeout += max_batch_wait()
 
         try:
             # Wrap entire processing in timeout
@@ -794,11 +846,14 @@ class BatchProcessor:
                     self._process_job_impl(job),
                     timeout=job_timeout
                 )
+        except LeaseLostError as e:
+            # Another claim owns the job now; leave its state to that claim
+            logger.error(f" {e}; stopping it here")
         except asyncio.TimeoutError:
             error_msg = f"Job exceeded maximum time limit of {job_timeout/3600:.1f} hours"
             logger.info(f" {error_msg}")
             job.mark_failed(error_msg)
-            self.queue.update_job(job)
+            self._save_outcome(job)
         except Exception as e:
             error_msg = str(e)
 
@@ -819,13 +874,61 @@ class BatchProcessor:
                     full_error = f"{str(e)}\n{traceback.format_exc()}"
                     job.mark_failed(full_error)
 
-            self.queue.update_job(job)
+            self._save_outcome(job)
 
         finally:
+            if lease_keeper is not None:
+                lease_keeper.cancel()
             # Remove from current jobs
             if job.job_id in self.current_jobs:
                 self.current_jobs.remove(job.job_id)
 
+    @staticmethod
+    def _execution_mode(job: TranslationJob) -> str:
+        """'batch' or 'interactive' (job metadata overrides settings)"""
+        from config.settings import settings
+        return job.metadata.get('execution_mode') or settings.translation_execution_mode
+
+    def _save_outcome(self, job: TranslationJob):
+        """Record a failed/cancelled job unless its claim was already lost"""
+        try:
+            self.queue.update_job(job)
+        except LeaseLostError as e:
+            logger.error(f" {e}; discarding this worker's outcome")
+
+    def _keep_lease(self, job: TranslationJob) -> Optional[asyncio.Task]:
+        """
+        Heartbeat the queue lease of a job claimed by this worker
+
+        Renews the lease every third of its length. If the lease was lost
+        (this worker stalled and the job was reclaimed, by another worker or
+        by this one under a new claim) the job's task is cancelled so two
+        claims never keep translating the same job.
+
+        Returns:
+            The heartbeat task, or None if the job isn't leased to this queue
+        """
+        if not job.lease_token or job.worker_id != getattr(self.queue, "worker_id", None):
+            return None
+
+        job_task = asyncio.current_task()
+        interval = max(1.0, (job.lease_expires_at - time.time()) / 3)
+
+        async def heartbeat():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    owned = await asyncio.to_thread(self.queue.heartbeat, job.job_id, job.lease_token)
+                except Exception as e:
+                    logger.warning(f" Lease heartbeat failed for {job.job_id}: {e}")
+                    continue
+                if not owned:
+                    logger.error(f" Lost lease on job {job.job_id} (reclaimed by another worker); stopping it here")
+                    job_task.cancel()
+                    return
+
+        return asyncio.create_task(heartbeat())
+
     async def _process_job_v2(self, job: TranslationJob):
         """
         V2 implementation using BatchOrchestrator.
@@ -896,18 +999,23 @@ class BatchProcessor:
                 except Exception as e:
                     logger.debug("WebSocket broadcast failed: %s", e)
 
-        # Process with orchestrator
-        result = await self._orchestrator.process(
-            input_path=input_path,
-            input_text=input_text,
-            source_lang=job.source_lang,
-            target_lang=job.target_lang,
-            domain=job.metadata.get('domain', 'general'),
-            output_path=output_path,
-            output_format=job.output_format or 'txt',
-            progress_callback=progress_callback,
-            options=job.metadata,
-        )
+        # Process with orchestrator (its translator is flushed on stop())
+        translator = self._orchestrator.translator
+        self._active_translators.add(translator)
+        try:
+            result = await self._orchestrator.process(
+                input_path=input_path,
+                input_text=input_text,
+                source_lang=job.source_lang,
+                target_lang=job.target_lang,
+                domain=job.metadata.get('domain', 'general'),
+                output_path=output_path,
+                output_format=job.output_format or 'txt',
+                progress_callback=progress_callback,
+                options=job.metadata,
+            )
+        finally:
+            self._active_translators.discard(translator)
 
         # Update job with result
         if result.success:
@@ -1116,9 +1224,8 @@ class BatchProcessor:
         # Phase 5.1: Use new ChunkCache for better caching with hash keys
         from config.settings import settings
         if settings.chunk_cache_enabled:
-            chunk_cache = ChunkCache(
-                db_path=settings.cache_dir / "chunks.db"
-            )
+            # Process-wide: the memory tier stays warm across jobs
+            chunk_cache = get_chunk_cache(settings.cache_dir / "chunks.db")
             logger.info(f" Chunk cache enabled (DB: {settings.cache_dir / 'chunks.db'})")
         else:
             chunk_cache = None
@@ -1301,6 +1408,21 @@ class BatchProcessor:
                 )
                 logger.info(f" Initial checkpoint saved")
 
+        # Overnight jobs: cache-miss chunks go through the provider's batch
+        # API first; translate_chunk takes those answers as first attempt
+        if chunks_to_process and self._execution_mode(job) == 'batch':
+            def remember_batch(batch_id: str) -> None:
+                # Persisted so a restarted or reclaimed job resumes this batch
+                job.metadata['llm_batch_id'] = batch_id
+                self.queue.update_job(job)
+
+            job.metadata['batched_chunks'] = await translator.prefill_batch(
+                chunks_to_process,
+                batch_id=job.metadata.get('llm_batch_id'),
+                on_submitted=remember_batch,
+            )
+            self.queue.update_job(job)
+
         # Phase 5.4: Check if streaming mode should be used
         from config.settings import settings
         use_streaming = (
@@ -1322,7 +1444,8 @@ class BatchProcessor:
                 batch_size=settings.streaming_batch_size,
                 enable_streaming=settings.streaming_broadcast_chunks,
                 enable_partial_export=settings.streaming_partial_export,
-                websocket_manager=self.websocket_manager
+                websocket_manager=self.websocket_manager,
+                max_concurrency=job.concurrency or 10
             )
 
             # Define progress callback for streaming mode
@@ -1332,25 +1455,26 @@ class BatchProcessor:
                 self.queue.update_job(job)
                 logger.info(f"Progress: {completed_chunks}/{total_chunks} ({progress*100:.1f}%)")
 
-            # Process in streaming batches
+            # Process in streaming batches (process_streaming flushes the
+            # translator's TM / cache writes; stop() flushes them meanwhile)
             async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
-                all_results_list, batch_stats = await streaming_processor.process_streaming(
-                    job=job,
-                    chunks=chunks_to_process,
-                    translator=translator,
-                    http_client=client,
-                    output_path=output_path,
-                    progress_callback=streaming_progress_callback
-                )
+                self._active_translators.add(translator)
+                try:
+                    all_results_list, batch_stats = await streaming_processor.process_streaming(
+                        job=job,
+                        chunks=chunks_to_process,
+                        translator=translator,
+                        http_client=client,
+                        output_path=output_path,
+                        progress_callback=streaming_progress_callback
+                    )
+                finally:
+                    self._active_translators.discard(translator)
 
-                # Convert list to results array and merge with completed results
-                new_results = []
-                for chunk in chunks_to_process:
-                    # Find result for this chunk
-                    chunk_result = next((r for r in all_results_list if r.chunk_id == chunk.id), None)
-                    if chunk_result:
-                        new_results.append(chunk_result)
-                        all_completed_results[chunk.id] = chunk_result
+                # Merge streamed results (read back from the spill file) with completed results
+                for chunk_result in all_results_list:
+                    all_completed_results[chunk_result.chunk_id] = chunk_result
+                all_results_list.close()
 
                 # Merge with restored results for final output
                 results = []
@@ -1359,7 +1483,7 @@ class BatchProcessor:
                         results.append(all_completed_results[chunk.id])
 
                 logger.info(f" Streaming complete: {batch_stats['batches_processed']} batches")
-                logger.info(f"  Memory saved: {batch_stats['memory_saved_bytes'] / 1024 / 1024:.1f} MB")
+                logger.info(f"  Results spilled to disk: {batch_stats['spilled_bytes'] / 1024 / 1024:.1f} MB")
 
         else:
             # Use standard parallel processing (existing code path)
@@ -1452,11 +1576,18 @@ class BatchProcessor:
                         return result
 
                     # Process remaining chunks in parallel
-                    new_results, stats = await processor.process_all(
-                        chunks_to_process,
-                        translate_with_progress,
-                        http_client=client
-                    )
+                    self._active_translators.add(translator)
+                    try:
+                        new_results, stats = await processor.process_all(
+                            chunks_to_process,
+                            translate_with_progress,
+                            http_client=client
+                        )
+                    finally:
+                        # Commit TM / chunk cache writes queued by translate_chunk
+                        # (also on cancellation)
+                        self._active_translators.discard(translator)
+                        await translator.flush_stores()
 
                     # Phase 5.2: Merge new results with restored results
                     # Results must be in original chunk order
@@ -5,6 +5,7 @@ Exports:
 - TranslationCache (legacy cache from core/cache/legacy_cache.py)
 - ChunkCache (Phase 5.1, new hash-based SQLite cache)
 - compute_chunk_key (Phase 5.1, hash key generator)
+- TieredChunkCache, get_chunk_cache (memory/Redis tiers in front of ChunkCache)
 - CheckpointManager (Phase 5.2, fault-tolerant job state persistence)
 - CheckpointState (Phase 5.2, checkpoint data structure)
 - serialize_translation_result, deserialize_translation_result (Phase 5.2, serialization helpers)
@@ -12,6 +13,11 @@ Exports:
 - MemoryCache, LRUCache (in-memory LRU cache)
 - FileCache (file-based persistent cache)
 - APSCacheManager, get_cache_manager (APS-specific cache manager)
+- PageCache, get_page_cache, page_fingerprint, compute_page_key, PageCacheStats
+  (content-addressed per-page PDF extraction cache)
+- OmmlCache, get_omml_cache, compute_omml_key (LaTeX -> OMML conversions)
+- SingleFlight, SingleFlightStats, get_single_flight (coalesce identical
+  in-flight LLM calls)
 """
 
 # Import legacy cache (backward compatibility)
@@ -19,6 +25,7 @@ from .legacy_cache import TranslationCache
 
 # Import Phase 5.1 chunk cache
 from .chunk_cache import ChunkCache, compute_chunk_key
+from .tiered_cache import TieredChunkCache, get_chunk_cache
 
 # Import Phase 5.2 checkpoint manager
 from .checkpoint_manager import (
@@ -34,12 +41,23 @@ from .memory_cache import MemoryCache, LRUCache
 from .file_cache import FileCache
 from .aps_cache import APSCacheManager, get_cache_manager
 
+# Per-page PDF extraction cache
+from .page_cache import PageCache, PageCacheStats, compute_page_key, get_page_cache, page_fingerprint
+
+# LaTeX -> OMML conversion cache
+from .omml_cache import OmmlCache, compute_omml_key, get_omml_cache
+
+# In-flight call coalescing
+from .single_flight import SingleFlight, SingleFlightStats, get_single_flight
+
 __all__ = [
     # Legacy
     'TranslationCache',
     # Phase 5.1
     'ChunkCache',
     'compute_chunk_key',
+    'TieredChunkCache',
+    'get_chunk_cache',
     # Phase 5.2
     'CheckpointManager',
     'CheckpointState',
@@ -53,4 +71,18 @@ __all__ = [
     'FileCache',
     'APSCacheManager',
     'get_cache_manager',
+    # Page cache
+    'PageCache',
+    'PageCacheStats',
+    'compute_page_key',
+    'get_page_cache',
+    'page_fingerprint',
+    # OMML cache
+    'OmmlCache',
+    'compute_omml_key',
+    'get_omml_cache',
+    # Single flight
+    'SingleFlight',
+    'SingleFlightStats',
+    'get_single_flight',
 ]
@@ -17,6 +17,8 @@ class CacheStats:
     misses: int = 0
     size: int = 0
     max_size: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
     created_at: datetime = field(default_factory=datetime.utcnow)
 
     @property
@@ -31,6 +33,8 @@ class CacheStats:
             "hit_rate": f"{self.hit_rate:.1%}",
             "size": self.size,
             "max_size": self.max_size,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
         }
 
 
@@ -21,6 +21,31 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 import threading
+import time
+
+
+# Insert or overwrite one entry (an overwrite resets it like a fresh insert)
+_UPSERT_SQL = '''
+    INSERT INTO chunk_cache
+    (key, value, source_lang, target_lang, mode, created_at, last_accessed, access_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        source_lang = excluded.source_lang,
+        target_lang = excluded.target_lang,
+        mode = excluded.mode,
+        created_at = excluded.created_at,
+        last_accessed = excluded.last_accessed,
+        access_count = 1
+'''
+
+# Invalidation log rows older than this are pruned; a reader that falls
+# further behind is told to drop everything (as after clear())
+INVALIDATION_RETENTION_SECONDS = 3600
+# Seconds between prune attempts per ChunkCache instance
+INVALIDATION_PRUNE_INTERVAL = 60.0
+
+_NOW_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
 
 
 def compute_chunk_key(
@@ -140,6 +165,7 @@ class ChunkCache:
         self._stats_lock = threading.Lock()
         self._hits = 0
         self._misses = 0
+        self._next_prune = 0.0
 
         # Initialize database schema
         self._init_db()
@@ -185,6 +211,36 @@ class ChunkCache:
             CREATE INDEX IF NOT EXISTS idx_lang_pair ON chunk_cache(source_lang, target_lang)
         ''')
 
+        # Invalidation log: keys whose value changed (NULL key = cleared), so
+        # in-process caches layered on top can drop stale copies
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS chunk_cache_invalidations (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT,
+                created_at INTEGER
+            )
+        ''')
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(chunk_cache_invalidations)')}
+        if 'created_at' not in columns:
+            cursor.execute('ALTER TABLE chunk_cache_invalidations ADD COLUMN created_at INTEGER')
+            cursor.execute('DROP TRIGGER IF EXISTS chunk_cache_value_changed')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS chunk_cache_value_changed
+            AFTER UPDATE OF value ON chunk_cache
+            WHEN old.value IS NOT new.value
+            BEGIN
+                INSERT INTO chunk_cache_invalidations (key, created_at) VALUES (new.key, {_NOW_SQL});
+            END
+        ''')
+        # Counters: highest pruned sequence number (see prune_invalidations)
+        # and clear generation (see generation)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS chunk_cache_meta (
+                name TEXT PRIMARY KEY,
+                value INTEGER
+            )
+        ''')
+
         conn.commit()
 
     def get(self, key: str) -> Optional[str]:
@@ -250,13 +306,35 @@ class ChunkCache:
 
         now = datetime.utcnow().isoformat()
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO chunk_cache
-            (key, value, source_lang, target_lang, mode, created_at, last_accessed, access_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 1)
-        ''', (key, value, source_lang, target_lang, mode, now, now))
+        cursor.execute(_UPSERT_SQL, (key, value, source_lang, target_lang, mode, now, now))
 
         conn.commit()
+        self._maybe_prune_invalidations()
+
+    def set_many(self, entries: list[Dict[str, Any]]) -> None:
+        """
+        Store many values in one transaction.
+
+        Args:
+            entries: Dicts with the keyword arguments of set()
+                     (key, value and optional source_lang/target_lang/mode)
+        """
+        if not entries:
+            return
+
+        conn = self._get_connection()
+        now = datetime.utcnow().isoformat()
+
+        with conn:
+            conn.execute('BEGIN')
+            conn.executemany(_UPSERT_SQL, [
+                (
+                    e['key'], e['value'], e.get('source_lang', ''),
+                    e.get('target_lang', ''), e.get('mode', ''), now, now,
+                )
+                for e in entries
+            ])
+        self._maybe_prune_invalidations()
 
     def stats(self) -> Dict[str, Any]:
         """
@@ -297,15 +375,102 @@ class ChunkCache:
     def clear(self) -> None:
         """Clear all cache entries (for testing/maintenance)."""
         conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM chunk_cache')
-        conn.commit()
+        with conn:
+            conn.execute('BEGIN')
+            conn.execute('DELETE FROM chunk_cache')
+            conn.execute('DELETE FROM chunk_cache_invalidations')
+            conn.execute(f'INSERT INTO chunk_cache_invalidations (key, created_at) VALUES (NULL, {_NOW_SQL})')
+            conn.execute(
+                "INSERT INTO chunk_cache_meta (name, value) VALUES ('generation', 1) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + 1"
+            )
 
         # Reset stats
         with self._stats_lock:
             self._hits = 0
             self._misses = 0
 
+    def invalidations_since(self, seq: int) -> tuple[int, list[Optional[str]]]:
+        """
+        Keys invalidated after invalidation sequence number `seq`.
+
+        Args:
+            seq: Last sequence number already processed (0 for all)
+
+        Returns:
+            (latest sequence number, keys in order); a None key means the
+            whole cache was cleared
+        """
+        conn = self._get_connection()
+        rows = conn.execute(
+            'SELECT seq, key FROM chunk_cache_invalidations WHERE seq > ? ORDER BY seq',
+            (seq,)
+        ).fetchall()
+        pruned = conn.execute(
+            "SELECT value FROM chunk_cache_meta WHERE name = 'invalidations_pruned'"
+        ).fetchone()
+        # Entries the caller has not seen were pruned: treat as a clear
+        lost = [None] if pruned is not None and seq < pruned['value'] else []
+        if not rows:
+            return (max(seq, pruned['value']) if lost else seq), lost
+        return rows[-1]['seq'], lost + [row['key'] for row in rows]
+
+    def prune_invalidations(self, max_age: float = INVALIDATION_RETENTION_SECONDS) -> int:
+        """
+        Delete invalidation log entries older than `max_age` seconds.
+
+        Readers behind the pruned entries get a clear (None key) from
+        invalidations_since() instead of the keys they missed.
+
+        Returns:
+            Number of entries deleted
+        """
+        conn = self._get_connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                f'SELECT MAX(seq) AS seq FROM chunk_cache_invalidations '
+                f'WHERE created_at IS NULL OR created_at < {_NOW_SQL} - ?',
+                (max_age,)
+            ).fetchone()
+            if row['seq'] is None:
+                return 0
+            deleted = conn.execute(
+                'DELETE FROM chunk_cache_invalidations WHERE seq <= ?', (row['seq'],)
+            ).rowcount
+            conn.execute(
+                "INSERT INTO chunk_cache_meta (name, value) VALUES ('invalidations_pruned', ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = MAX(value, excluded.value)",
+                (row['seq'],)
+            )
+        return deleted
+
+    def _maybe_prune_invalidations(self) -> None:
+        """prune_invalidations() at most once per INVALIDATION_PRUNE_INTERVAL."""
+        now = time.monotonic()
+        if now < self._next_prune:
+            return
+        self._next_prune = now + INVALIDATION_PRUNE_INTERVAL
+        try:
+            self.prune_invalidations()
+        except sqlite3.Error:
+            pass  # Retried on a later write
+
+    def generation(self) -> int:
+        """Number of times the cache was cleared (by any process)."""
+        row = self._get_connection().execute(
+            "SELECT value FROM chunk_cache_meta WHERE name = 'generation'"
+        ).fetchone()
+        return row['value'] if row is not None else 0
+
+    def invalidation_seq(self) -> int:
+        """Current invalidation sequence number."""
+        row = self._get_connection().execute(
+            'SELECT COALESCE((SELECT MAX(seq) FROM chunk_cache_invalidations), '
+            "(SELECT value FROM chunk_cache_meta WHERE name = 'invalidations_pruned'), 0) AS seq"
+        ).fetchone()
+        return row['seq']
+
     def close(self) -> None:
         """Close database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
@@ -3,58 +3,94 @@
 
 """
 TranslationCache - Cache để tránh dịch lại content giống nhau
+
+Storage is a SQLite table keyed by hash(model:text): lookups read one row on
+demand and sets are single-row upserts, so neither startup nor set() cost
+grows with the cache size. A legacy translation_cache.json is imported once
+and then renamed to translation_cache.json.migrated.
 """
 
 import json
 import hashlib
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional
 from datetime import datetime
 
 from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-
 class TranslationCache:
     """Cache để tránh dịch lại content giống nhau"""
 
+    # Sets between commits (the old JSON file was rewritten every 10 sets)
+    COMMIT_EVERY = 10
+
     def __init__(self, cache_dir: Path, enabled: bool = True):
         self.enabled = enabled
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True, parents=True)
         self.cache_file = self.cache_dir / "translation_cache.json"
-        self.cache = self._load_cache()
+        self.db_path = self.cache_dir / "translation_cache.db"
         self.hits = 0
         self.misses = 0
 
-    def _load_cache(self) -> Dict:
-        """Load cache từ disk"""
-        if not self.enabled:
-            return {}
-
-        if self.cache_file.exists():
-            try:
-                data = json.loads(self.cache_file.read_text(encoding="utf-8"))
-                logger.info(f" Loaded {len(data)} cached translations")
-                return data
-            except Exception as e:
-                logger.debug("Failed to load cache from disk: %s", e)
-                return {}
-        return {}
-
-    def _save_cache(self):
-        """Save cache to disk"""
-        if not self.enabled:
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.conn: Optional[sqlite3.Connection] = None
+        if self.enabled:
+            self._init_db()
+            self._migrate_json()
+
+    def _init_db(self):
+        """Open database and create schema"""
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                translation TEXT NOT NULL,
+                model TEXT,
+                quality_score REAL DEFAULT 0.0,
+                timestamp TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def _migrate_json(self):
+        """One-time import of the legacy JSON cache file"""
+        if not self.cache_file.exists():
             return
 
         try:
-            self.cache_file.write_text(
-                json.dumps(self.cache, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            rows = []
+            skipped = 0
+            for key, entry in data.items():
+                # One bad entry must not lose the rest of the cache
+                if not isinstance(entry, dict) or not isinstance(entry.get("translation"), str):
+                    skipped += 1
+                    continue
+                rows.append((
+                    key,
+                    entry["translation"],
+                    entry.get("model"),
+                    entry.get("quality_score", 0.0),
+                    entry.get("timestamp"),
+                ))
+            with self._lock, self.conn:
+                # Existing rows are newer than the JSON snapshot
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO translations VALUES (?, ?, ?, ?, ?)", rows
+                )
+            self.cache_file.rename(self.cache_file.with_name(self.cache_file.name + ".migrated"))
+            logger.info(f" Migrated {len(rows)} cached translations from {self.cache_file.name}")
+            if skipped:
+                logger.warning(f" Skipped {skipped} malformed entries in {self.cache_file.name}")
         except Exception as e:
-            logger.warning(f" Cannot save cache: {e}")
+            logger.warning(f" Cannot migrate legacy cache file: {e}")
 
     def get_hash(self, text: str, model: str) -> str:
         """Generate unique hash cho text + model"""
@@ -67,9 +103,14 @@ class TranslationCache:
             return None
 
         hash_key = self.get_hash(text, model)
-        if hash_key in self.cache:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT translation FROM translations WHERE key = ?", (hash_key,)
+            ).fetchone()
+
+        if row:
             self.hits += 1
-            return self.cache[hash_key]["translation"]
+            return row[0]
 
         self.misses += 1
         return None
@@ -80,16 +121,30 @@ class TranslationCache:
             return
 
         hash_key = self.get_hash(text, model)
-        self.cache[hash_key] = {
-            "translation": translation,
-            "model": model,
-            "quality_score": quality_score,
-            "timestamp": datetime.now().isoformat()
-        }
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                (hash_key, translation, model, quality_score, datetime.now().isoformat()),
+            )
+            self._pending += 1
 
-        # Periodic save
-        if len(self.cache) % 10 == 0:
-            self._save_cache()
+            # Periodic commit
+            if self._pending >= self.COMMIT_EVERY:
+                self._commit()
+
+    def _commit(self):
+        """Commit pending sets (caller holds the lock)"""
+        try:
+            self.conn.commit()
+            self._pending = 0
+        except Exception as e:
+            logger.warning(f" Cannot save cache: {e}")
+
+    def __len__(self) -> int:
+        if not self.enabled:
+            return 0
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
 
     def get_stats(self) -> str:
         """Get cache statistics"""
@@ -102,4 +157,22 @@ class TranslationCache:
 
     def save(self):
         """Force save cache to disk"""
-        self._save_cache()
+        if not self.enabled:
+            return
+        with self._lock:
+            self._commit()
+
+    def compact(self):
+        """Reclaim space left by overwritten entries"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._commit()
+            self.conn.execute("VACUUM")
+
+    def close(self):
+        """Save and close database"""
+        if self.conn:
+            self.save()
+            self.conn.close()
+            self.conn = None
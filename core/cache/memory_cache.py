@@ -4,6 +4,7 @@ Memory Cache
 Fast in-memory LRU cache for frequently accessed data.
 """
 
+import sys
 import time
 import threading
 from typing import Any, Optional, Dict
@@ -23,6 +24,7 @@ class CacheEntry:
     created_at: float
     expires_at: Optional[float] = None
     access_count: int = 0
+    nbytes: int = 0
 
     @property
     def is_expired(self) -> bool:
@@ -39,15 +41,41 @@ class LRUCache(CacheInterface):
     - O(1) get/set operations
     - Automatic eviction of least recently used items
     - Optional TTL per entry
+    - Optional byte budget (max_bytes) on top of the entry count
     - Thread-safe
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
         self._lock = threading.RLock()
-        self._stats = CacheStats(max_size=max_size)
+        self._stats = CacheStats(max_size=max_size, max_bytes=max_bytes or 0)
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """Approximate payload size in bytes"""
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its byte count (caller holds the lock)"""
+        entry = self._cache.pop(key)
+        self._bytes -= entry.nbytes
+
+    def _update_size(self) -> None:
+        self._stats.size = len(self._cache)
+        self._stats.size_bytes = self._bytes
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
@@ -59,9 +87,9 @@ class LRUCache(CacheInterface):
 
             # Check expiration
             if entry.is_expired:
-                del self._cache[key]
+                self._remove(key)
                 self._stats.misses += 1
-                self._stats.size = len(self._cache)
+                self._update_size()
                 return None
 
             # Move to end (most recently used)
@@ -82,25 +110,36 @@ class LRUCache(CacheInterface):
                 value=value,
                 created_at=time.time(),
                 expires_at=expires_at,
+                nbytes=self._sizeof(value) if self.max_bytes else 0,
             )
 
+            # Too large to ever fit: don't flush the whole cache for it
+            if self.max_bytes and entry.nbytes > self.max_bytes:
+                if key in self._cache:
+                    self._remove(key)
+                self._update_size()
+                return False
+
             # Update or insert
             if key in self._cache:
-                self._cache.move_to_end(key)
+                self._remove(key)
             self._cache[key] = entry
+            self._bytes += entry.nbytes
 
             # Evict if over capacity
-            while len(self._cache) > self.max_size:
-                self._cache.popitem(last=False)
+            while len(self._cache) > self.max_size or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._cache)))
 
-            self._stats.size = len(self._cache)
+            self._update_size()
             return True
 
     def delete(self, key: str) -> bool:
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                self._stats.size = len(self._cache)
+                self._remove(key)
+                self._update_size()
                 return True
             return False
 
@@ -111,8 +150,8 @@ class LRUCache(CacheInterface):
 
             entry = self._cache[key]
             if entry.is_expired:
-                del self._cache[key]
-                self._stats.size = len(self._cache)
+                self._remove(key)
+                self._update_size()
                 return False
 
             return True
@@ -121,12 +160,13 @@ class LRUCache(CacheInterface):
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            self._stats.size = 0
+            self._bytes = 0
+            self._update_size()
             return count
 
     def stats(self) -> CacheStats:
         with self._lock:
-            self._stats.size = len(self._cache)
+            self._update_size()
             return self._stats
 
     def cleanup_expired(self) -> int:
@@ -136,9 +176,9 @@ class LRUCache(CacheInterface):
                 k for k, v in self._cache.items() if v.is_expired
             ]
             for key in expired_keys:
-                del self._cache[key]
+                self._remove(key)
 
-            self._stats.size = len(self._cache)
+            self._update_size()
             return len(expired_keys)
 
 
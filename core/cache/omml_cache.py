@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OMML Cache - content-addressed LaTeX -> OMML conversions
+
+Converting an equation means running pandoc, and textbooks repeat the
+same equations across chapters, editions and target languages. Results are
+stored by the equation's LaTeX and the pandoc version that converted it,
+shared by every job in the process and across restarts.
+
+Usage:
+    >>> cache = get_omml_cache()
+    >>> key = compute_omml_key("x^2", pandoc_version="3.1.9")
+    >>> cache.get_many([key])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Keys per SELECT ... IN (...) (below SQLite's host parameter limit)
+_LOOKUP_BATCH = 500
+
+_UPSERT_SQL = '''
+    INSERT INTO omml_cache (key, omml, created_at, last_accessed, access_count)
+    VALUES (?, ?, ?, ?, 1)
+    ON CONFLICT(key) DO UPDATE SET
+        omml = excluded.omml,
+        created_at = excluded.created_at,
+        last_accessed = excluded.last_accessed,
+        access_count = 1
+'''
+
+
+def compute_omml_key(latex: str, pandoc_version: str = '') -> str:
+    """
+    Generate stable cache key for one equation.
+
+    Args:
+        latex: Equation LaTeX without delimiters
+        pandoc_version: Converter version (OMML output differs between
+                        pandoc releases)
+
+    Returns:
+        Hex string (SHA256 hash)
+
+    Examples:
+        >>> compute_omml_key("x^2", "3.1") == compute_omml_key("x^2", "3.1")
+        True
+        >>> compute_omml_key("x^2", "3.1") != compute_omml_key("x^2", "3.2")
+        True
+    """
+    return hashlib.sha256(f"{pandoc_version}\x00{latex}".encode('utf-8')).hexdigest()
+
+
+class OmmlCache:
+    """
+    SQLite-backed cache of OMML XML by equation.
+
+    Thread-safe: one connection per thread, WAL journal.
+
+    Database Schema:
+        - key: TEXT PRIMARY KEY (compute_omml_key)
+        - omml: TEXT (<m:oMath> XML)
+        - created_at: TEXT (ISO timestamp)
+        - last_accessed: TEXT (ISO timestamp)
+        - access_count: INTEGER
+    """
+
+    def __init__(self, db_path: str | Path | None = None):
+        """
+        Initialize cache with SQLite database.
+
+        Args:
+            db_path: Path to SQLite database file (created if missing).
+                     If None, uses settings.cache_dir / "omml.db".
+        """
+        if db_path is None:
+            from config.settings import settings
+            db_path = settings.cache_dir / "omml.db"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+
+        # Stats tracking (in-memory, reset on restart)
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, 'conn') or self._local.conn is None:
+            self._local.conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                isolation_level=None  # Autocommit mode
+            )
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    def _init_db(self) -> None:
+        """Create database schema if it doesn't exist."""
+        conn = self._get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS omml_cache (
+                key TEXT PRIMARY KEY,
+                omml TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                last_accessed TEXT NOT NULL,
+                access_count INTEGER DEFAULT 1
+            )
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_omml_cache_last_accessed ON omml_cache(last_accessed)
+        ''')
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Retrieve many cached conversions at once.
+
+        Args:
+            keys: Cache keys (duplicates allowed)
+
+        Returns:
+            {key: omml} for the keys that were found
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+
+        conn = self._get_connection()
+        found: Dict[str, str] = {}
+        for i in range(0, len(unique), _LOOKUP_BATCH):
+            batch = unique[i:i + _LOOKUP_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            rows = conn.execute(
+                f'SELECT key, omml FROM omml_cache WHERE key IN ({placeholders})', batch
+            ).fetchall()
+            found.update((row['key'], row['omml']) for row in rows)
+
+        if found:
+            now = datetime.utcnow().isoformat()
+            with conn:
+                conn.execute('BEGIN')
+                conn.executemany('''
+                    UPDATE omml_cache
+                    SET last_accessed = ?, access_count = access_count + 1
+                    WHERE key = ?
+                ''', [(now, key) for key in found])
+
+        with self._stats_lock:
+            self._hits += len(found)
+            self._misses += len(unique) - len(found)
+
+        return found
+
+    def set_many(self, entries: List[Tuple[str, str]]) -> None:
+        """
+        Store many conversions in one transaction.
+
+        Args:
+            entries: (key, omml) pairs
+        """
+        if not entries:
+            return
+
+        conn = self._get_connection()
+        now = datetime.utcnow().isoformat()
+        with conn:
+            conn.execute('BEGIN')
+            conn.executemany(_UPSERT_SQL, [(key, omml, now, now) for key, omml in entries])
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with total_entries, hits, misses, hit_rate (since
+            init) and db_size_mb
+        """
+        conn = self._get_connection()
+        total = conn.execute('SELECT COUNT(*) FROM omml_cache').fetchone()[0]
+        db_size_bytes = self.db_path.stat().st_size if self.db_path.exists() else 0
+
+        with self._stats_lock:
+            total_requests = self._hits + self._misses
+            return {
+                'total_entries': total,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / total_requests if total_requests else 0.0,
+                'db_size_mb': round(db_size_bytes / (1024 * 1024), 2),
+            }
+
+    def clear(self) -> None:
+        """Clear all cache entries (for testing/maintenance)."""
+        self._get_connection().execute('DELETE FROM omml_cache')
+
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        """Close database connection."""
+        if hasattr(self._local, 'conn') and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
+
+
+_instance: Optional[OmmlCache] = None
+_instance_lock = threading.Lock()
+
+
+def get_omml_cache() -> OmmlCache:
+    """Get the process-wide OmmlCache (settings.cache_dir / "omml.db")"""
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = OmmlCache()
+        return _instance
+
+
+def default_omml_cache() -> Optional[OmmlCache]:
+    """The shared OMML cache, or None when settings.omml_cache_enabled is off"""
+    from config.settings import settings
+
+    if not settings.omml_cache_enabled:
+        return None
+    return get_omml_cache()
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page Cache - content-addressed per-page extraction results for PDFs
+
+The same PDF is often processed again (retries, other target languages or
+output formats), and a re-uploaded PDF is often only partially edited.
+Extraction results are therefore cached per *page*, keyed by what the page
+contains rather than by file or page number:
+
+- page_fingerprint(page): hash of the page's content stream, geometry,
+  images, form XObjects, fonts and annotations
+- compute_page_key(fingerprint, extractor, dpi, language, model, ...):
+  stable key for one extractor configuration
+- PageCache: SQLite store (same layout conventions as ChunkCache), kept
+  under a size budget by evicting the least recently used pages
+- PageCacheStats: hits/misses of one extraction run, for job metadata
+
+A page that moved (pages inserted before it) still hits; a page whose
+content changed misses and is re-extracted.
+
+Usage:
+    >>> cache = get_page_cache()
+    >>> key = compute_page_key(page_fingerprint(page), "vision", dpi=150, model="gpt-4o")
+    >>> cached = cache.get(key)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Keys per SELECT ... IN (...) (below SQLite's host parameter limit)
+_LOOKUP_BATCH = 500
+
+# Seconds between size checks (evict()) per PageCache instance
+EVICTION_INTERVAL = 60.0
+
+_UPSERT_SQL = '''
+    INSERT INTO page_cache
+    (key, value, extractor, created_at, last_accessed, access_count)
+    VALUES (?, ?, ?, ?, ?, 1)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        extractor = excluded.extractor,
+        created_at = excluded.created_at,
+        last_accessed = excluded.last_accessed,
+        access_count = 1
+'''
+
+
+def page_fingerprint(page) -> str:
+    """
+    Content hash of a PDF page (PyMuPDF page).
+
+    Covers everything that changes how the page renders or extracts: the
+    content stream, media/crop box and rotation, the raw streams of its
+    images and form XObjects, its fonts (by name and encoding - subset
+    fonts get a new tag when their glyphs change) and its annotations.
+    Independent of the page's position in the document.
+
+    Returns:
+        Hex SHA256 digest
+    """
+    doc = page.parent
+    digest = hashlib.sha256()
+
+    digest.update(page.read_contents())
+    digest.update(repr((tuple(page.mediabox), tuple(page.cropbox), page.rotation)).encode())
+
+    streams = [img[0] for img in page.get_images(full=True)]
+    streams += [xobj[0] for xobj in page.get_xobjects()]
+    for xref in streams:
+        try:
+            digest.update(doc.xref_stream_raw(xref) or b"")
+        except (RuntimeError, ValueError):
+            # Broken reference: hash what is known about it
+            digest.update(f"xref:{xref}".encode())
+
+    for font in page.get_fonts(full=True):
+        # (xref, ext, type, basefont, name, encoding, ...)
+        digest.update(repr(font[1:4] + font[5:6]).encode())
+
+    for xref in page.annot_xrefs():
+        digest.update(doc.xref_object(xref[0], compressed=True).encode())
+
+    return digest.hexdigest()
+
+
+def compute_page_key(
+    fingerprint: str,
+    extractor: str,
+    dpi: Optional[int] = None,
+    language: Optional[str] = None,
+    model: Optional[str] = None,
+    **flags
+) -> str:
+    """
+    Generate stable cache key for one page under one extractor configuration.
+
+    Args:
+        fingerprint: page_fingerprint() of the page
+        extractor: Extractor name (fast_text/analysis/vision/ocr)
+        dpi: Render resolution, for extractors that render
+        language: Language hint, for extractors that take one
+        model: Model / engine that produced the result
+        **flags: Other settings that change the result (prompt hash, OCR
+                 mode, extractor version, ...); None values are ignored
+
+    Returns:
+        Hex string (SHA256 hash)
+
+    Examples:
+        >>> compute_page_key("ab12", "ocr", dpi=300) == compute_page_key("ab12", "ocr", dpi=300)
+        True
+        >>> compute_page_key("ab12", "ocr", dpi=300) != compute_page_key("ab12", "ocr", dpi=200)
+        True
+    """
+    key_components = {
+        'page': fingerprint,
+        'extractor': extractor,
+        'dpi': dpi,
+        'language': language.lower() if language else None,
+        'model': model,
+    }
+    relevant_flags = {k: v for k, v in sorted(flags.items()) if v is not None}
+    if relevant_flags:
+        key_components['flags'] = relevant_flags
+
+    key_string = json.dumps(key_components, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(key_string.encode('utf-8')).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy scalars / arrays in OCR results (bbox coordinates)
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+@dataclass
+class PageCacheStats:
+    """Page cache hits/misses of one extraction run"""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @classmethod
+    def of(cls, pages: Iterable[Any]) -> "PageCacheStats":
+        """Count pages by their `cached` flag"""
+        stats = cls()
+        for page in pages:
+            if getattr(page, 'cached', False):
+                stats.hits += 1
+            else:
+                stats.misses += 1
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': round(self.hit_rate, 4)}
+
+
+class PageCache:
+    """
+    SQLite-backed cache of per-page extraction results (JSON values).
+
+    Thread-safe: one connection per thread, WAL journal.
+
+    Database Schema:
+        - key: TEXT PRIMARY KEY (compute_page_key)
+        - value: TEXT (JSON)
+        - extractor: TEXT
+        - created_at: TEXT (ISO timestamp)
+        - last_accessed: TEXT (ISO timestamp)
+        - access_count: INTEGER
+
+    Usage:
+        >>> cache = PageCache('./data/cache/pages.db')
+        >>> cache.set('abc123', {'content': 'Page text'}, extractor='fast_text')
+        >>> cache.get('abc123')
+        {'content': 'Page text'}
+    """
+
+    def __init__(self, db_path: str | Path | None = None, max_mb: Optional[float] = None):
+        """
+        Initialize cache with SQLite database.
+
+        Args:
+            db_path: Path to SQLite database file (created if missing).
+                     If None, uses settings.cache_dir / "pages.db".
+            max_mb: Size budget of the cached values (0 = unbounded).
+                    If None, uses settings.page_cache_max_mb.
+        """
+        if db_path is None or max_mb is None:
+            from config.settings import settings
+            if db_path is None:
+                db_path = settings.cache_dir / "pages.db"
+            if max_mb is None:
+                max_mb = settings.page_cache_max_mb
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._next_eviction = 0.0
+
+        self._local = threading.local()
+
+        # Stats tracking (in-memory, reset on restart)
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, 'conn') or self._local.conn is None:
+            self._local.conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                isolation_level=None  # Autocommit mode
+            )
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    def _init_db(self) -> None:
+        """Create database schema if it doesn't exist."""
+        conn = self._get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS page_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                extractor TEXT,
+                created_at TEXT NOT NULL,
+                last_accessed TEXT NOT NULL,
+                access_count INTEGER DEFAULT 1
+            )
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_page_cache_last_accessed ON page_cache(last_accessed)
+        ''')
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_page_cache_extractor ON page_cache(extractor)
+        ''')
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a cached page result.
+
+        Args:
+            key: Cache key from compute_page_key
+
+        Returns:
+            Decoded value if found, None otherwise
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve many cached page results at once.
+
+        Updates last_accessed / access_count of the hits.
+
+        Args:
+            keys: Cache keys (duplicates allowed)
+
+        Returns:
+            {key: value} for the keys that were found
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+
+        conn = self._get_connection()
+        found: Dict[str, Any] = {}
+        for i in range(0, len(unique), _LOOKUP_BATCH):
+            batch = unique[i:i + _LOOKUP_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            rows = conn.execute(
+                f'SELECT key, value FROM page_cache WHERE key IN ({placeholders})', batch
+            ).fetchall()
+            found.update((row['key'], json.loads(row['value'])) for row in rows)
+
+        if found:
+            now = datetime.utcnow().isoformat()
+            with conn:
+                conn.execute('BEGIN')
+                conn.executemany('''
+                    UPDATE page_cache
+                    SET last_accessed = ?, access_count = access_count + 1
+                    WHERE key = ?
+                ''', [(now, key) for key in found])
+
+        with self._stats_lock:
+            self._hits += len(found)
+            self._misses += len(unique) - len(found)
+
+        return found
+
+    def set(self, key: str, value: Any, extractor: str = '') -> None:
+        """
+        Store a page result.
+
+        Args:
+            key: Cache key from compute_page_key
+            value: JSON-serializable result
+            extractor: Optional extractor name (for metadata)
+        """
+        self.set_many([{'key': key, 'value': value, 'extractor': extractor}])
+
+    def set_many(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Store many page results in one transaction.
+
+        Args:
+            entries: Dicts with the keyword arguments of set()
+                     (key, value and optional extractor)
+        """
+        if not entries:
+            return
+
+        conn = self._get_connection()
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (
+                e['key'], json.dumps(e['value'], ensure_ascii=False, default=_json_default),
+                e.get('extractor', ''), now, now,
+            )
+            for e in entries
+        ]
+        with conn:
+            conn.execute('BEGIN')
+            conn.executemany(_UPSERT_SQL, rows)
+        self._maybe_evict()
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Delete the least recently used pages until the cached values fit
+        in `max_bytes`.
+
+        Args:
+            max_bytes: Size budget (default: the cache's max_bytes; 0 = unbounded)
+
+        Returns:
+            Number of pages deleted
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        if max_bytes <= 0:
+            return 0
+
+        conn = self._get_connection()
+        total = conn.execute(
+            'SELECT COALESCE(SUM(LENGTH(CAST(value AS BLOB))), 0) FROM page_cache'
+        ).fetchone()[0]
+        excess = total - max_bytes
+        if excess <= 0:
+            return 0
+
+        victims = []
+        rows = conn.execute(
+            'SELECT key, LENGTH(CAST(value AS BLOB)) AS size FROM page_cache ORDER BY last_accessed'
+        )
+        for row in rows:
+            victims.append((row['key'],))
+            excess -= row['size']
+            if excess <= 0:
+                break
+        rows.close()
+
+        with conn:
+            conn.execute('BEGIN')
+            conn.executemany('DELETE FROM page_cache WHERE key = ?', victims)
+        return len(victims)
+
+    def _maybe_evict(self) -> None:
+        """evict() at most once per EVICTION_INTERVAL."""
+        now = time.monotonic()
+        if now < self._next_eviction:
+            return
+        self._next_eviction = now + EVICTION_INTERVAL
+        try:
+            self.evict()
+        except sqlite3.Error:
+            pass  # Retried on a later write
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with total_entries, entries_by_extractor, hits,
+            misses, hit_rate (since init) and db_size_mb
+        """
+        conn = self._get_connection()
+        rows = conn.execute(
+            'SELECT extractor, COUNT(*) AS count FROM page_cache GROUP BY extractor'
+        ).fetchall()
+        by_extractor = {row['extractor'] or '': row['count'] for row in rows}
+
+        db_size_bytes = self.db_path.stat().st_size if self.db_path.exists() else 0
+
+        with self._stats_lock:
+            total_requests = self._hits + self._misses
+            return {
+                'total_entries': sum(by_extractor.values()),
+                'entries_by_extractor': by_extractor,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / total_requests if total_requests else 0.0,
+                'db_size_mb': round(db_size_bytes / (1024 * 1024), 2),
+            }
+
+    def clear(self) -> None:
+        """Clear all cache entries (for testing/maintenance)."""
+        conn = self._get_connection()
+        conn.execute('DELETE FROM page_cache')
+
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        """Close database connection."""
+        if hasattr(self._local, 'conn') and self._local.conn:
+            self._local.conn.close()
+            self._local.conn = None
+
+
+_instances: Dict[Path, PageCache] = {}
+_instances_lock = threading.Lock()
+
+
+def get_page_cache(db_path: str | Path | None = None) -> PageCache:
+    """
+    Get the process-wide PageCache for a database.
+
+    Args:
+        db_path: SQLite database; settings.cache_dir / "pages.db" if None
+    """
+    if db_path is None:
+        from config.settings import settings
+        db_path = settings.cache_dir / "pages.db"
+    resolved = Path(db_path).resolve()
+
+    with _instances_lock:
+        cache = _instances.get(resolved)
+        if cache is None:
+            cache = _instances[resolved] = PageCache(resolved)
+        return cache
+
+
+def default_page_cache() -> Optional[PageCache]:
+    """The shared page cache, or None when settings.page_cache_enabled is off"""
+    from config.settings import settings
+
+    if not settings.page_cache_enabled:
+        return None
+    return get_page_cache()
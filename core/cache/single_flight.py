@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single Flight - coalesce concurrent identical translation calls
+
+Repeated headers, boilerplate paragraphs and epigraphs are translated
+concurrently, so they all miss ChunkCache before the first result lands and
+each pays for its own LLM call. A SingleFlight lets the first caller for a
+key (the chunk cache key, or a prompt+model hash) make the call; callers
+arriving while it runs await that result instead.
+
+If the leading call fails or is cancelled, each waiting caller makes its
+own call (its retries and error reporting stay its own). Coalescing only
+happens between callers on the same event loop.
+
+Usage:
+    >>> flight = get_single_flight()
+    >>> stats = SingleFlightStats()
+    >>> text = await flight.do("v2:" + key, translate, stats=stats,
+    ...                        tokens_of=lambda value: value[1])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# Result handed to waiting callers when the leading call did not succeed
+_FAILED = object()
+
+
+@dataclass
+class SingleFlightStats:
+    """Calls one job saved by waiting on an identical in-flight call"""
+    calls_saved: int = 0
+    tokens_saved: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {'calls_saved': self.calls_saved, 'tokens_saved': self.tokens_saved}
+
+
+class SingleFlight:
+    """In-flight calls by key; one upstream call per key at a time."""
+
+    def __init__(self):
+        self._inflight: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        stats: Optional[SingleFlightStats] = None,
+        tokens_of: Optional[Callable[[Any], int]] = None,
+    ) -> Any:
+        """
+        Run `fn` unless an identical call is in flight; then share its result.
+
+        Args:
+            key: Identity of the call; callers of different result types
+                 must use different key prefixes
+            fn: Makes the upstream call
+            stats: Credited when this caller's call was saved
+            tokens_of: Tokens a result cost (for stats.tokens_saved)
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._inflight.get(key)
+            leader = entry is None or entry[0] is not loop
+            if leader:
+                future = loop.create_future()
+                if entry is None:
+                    self._inflight[key] = (loop, future)
+            else:
+                future = entry[1]
+
+        if not leader:
+            # shield: a cancelled waiter must not cancel the leader's call
+            value = await asyncio.shield(future)
+            if value is _FAILED:
+                return await fn()
+            if stats is not None:
+                stats.calls_saved += 1
+                stats.tokens_saved += tokens_of(value) if tokens_of else 0
+            return value
+
+        value = _FAILED
+        try:
+            value = await fn()
+            return value
+        finally:
+            future.set_result(value)
+            with self._lock:
+                if self._inflight.get(key) == (loop, future):
+                    del self._inflight[key]
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide SingleFlight (shared by all jobs)"""
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
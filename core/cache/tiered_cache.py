@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tiered Chunk Cache
+
+ChunkCache with faster tiers in front of SQLite:
+
+1. memory - per-process LRUCache bounded by bytes (not entry count)
+2. shared - optional Redis through RedisClient, shared by all workers
+3. sqlite - the ChunkCache database (source of truth)
+
+Hits in a lower tier are copied into the tiers above it. Values that change
+in SQLite (overwrites, clear) are recorded in ChunkCache's invalidation log;
+each process polls the log at most once per `invalidation_interval` seconds
+and drops the stale memory entries, so workers never serve an overwritten
+translation for long. Shared tier keys carry the SQLite clear generation,
+so clear() in any process retires every Redis entry written before it (they
+expire with their TTL).
+
+The shared tier is async-only (get_async / set_async); the sync ChunkCache
+API used from worker threads goes memory -> sqlite.
+
+Usage:
+    >>> cache = get_chunk_cache()
+    >>> await cache.get_async(key)
+    >>> cache.stats()['tiers']['memory']['hit_rate']
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.logging_config import get_logger
+
+from .chunk_cache import ChunkCache
+from .memory_cache import LRUCache
+
+logger = get_logger(__name__)
+
+# Redis key prefix for the shared tier (followed by "<generation>:<key>")
+SHARED_PREFIX = "chunk_cache:"
+
+# Seconds to wait before reconnecting to an unreachable shared tier
+SHARED_RETRY_SECONDS = 60.0
+
+
+@dataclass
+class TierStats:
+    """Hit/miss/latency counters of one cache tier"""
+    hits: int = 0
+    misses: int = 0
+    total_seconds: float = 0.0
+
+    def record(self, hit: bool, started: float) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.total_seconds += time.perf_counter() - started
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'avg_latency_ms': round(self.total_seconds / lookups * 1000, 3) if lookups else 0.0,
+        }
+
+
+class TieredChunkCache(ChunkCache):
+    """
+    ChunkCache with a byte-bounded memory LRU and an optional Redis tier.
+
+    Drop-in for ChunkCache: same get/set/set_many/stats/clear API, plus
+    get_async/set_async that also use the shared tier.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        memory_bytes: int = 64 * 1024 * 1024,
+        shared_url: str = "",
+        shared_ttl: int = 30 * 24 * 3600,
+        invalidation_interval: float = 1.0,
+    ):
+        """
+        Args:
+            db_path: SQLite database (see ChunkCache)
+            memory_bytes: Memory tier budget in bytes (0 disables the tier)
+            shared_url: Redis URL for the shared tier ("" disables it)
+            shared_ttl: Shared tier entry TTL in seconds
+            invalidation_interval: Seconds between invalidation log polls
+        """
+        super().__init__(db_path)
+        self.memory = LRUCache(max_size=10 ** 9, max_bytes=memory_bytes) if memory_bytes else None
+        self.shared_url = shared_url
+        self.shared_ttl = shared_ttl
+        self.invalidation_interval = invalidation_interval
+
+        self._shared = None
+        self._shared_loop = None
+        self._shared_retry_at = 0.0  # monotonic time of the next connect attempt
+        self._tier_lock = threading.Lock()
+        self._tier_stats = {
+            'memory': TierStats(),
+            'shared': TierStats(),
+            'sqlite': TierStats(),
+        }
+        self._invalidation_seq = super().invalidation_seq()
+        self._generation = self.generation()
+        self._next_invalidation_check = time.monotonic() + invalidation_interval
+
+    # ------------------------------------------------------------------ tiers
+
+    def _record(self, tier: str, hit: bool, started: float) -> None:
+        with self._tier_lock:
+            self._tier_stats[tier].record(hit, started)
+
+    def _invalidation_due(self) -> bool:
+        tiers = self.memory is not None or bool(self.shared_url)
+        return tiers and time.monotonic() >= self._next_invalidation_check
+
+    def _shared_key(self, key: str) -> str:
+        return f"{SHARED_PREFIX}{self._generation}:{key}"
+
+    def _apply_invalidations(self) -> None:
+        """Drop memory entries whose SQLite value changed in any process,
+        and follow clears to the new shared tier generation."""
+        self._next_invalidation_check = time.monotonic() + self.invalidation_interval
+        try:
+            seq, keys = self.invalidations_since(self._invalidation_seq)
+        except Exception as e:
+            logger.debug(f"Invalidation poll failed: {e}")
+            return
+        self._invalidation_seq = max(self._invalidation_seq, seq)
+        if None in keys:
+            self._generation = self.generation()
+        if self.memory is None:
+            return
+        for key in keys:
+            if key is None:
+                self.memory.clear()
+            else:
+                self.memory.delete(key)
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        if self.memory is None:
+            return None
+        started = time.perf_counter()
+        value = self.memory.get(key)
+        self._record('memory', value is not None, started)
+        return value
+
+    def _remember(self, key: str, value: str) -> None:
+        if self.memory is not None:
+            self.memory.set(key, value)
+
+    def _sqlite_get(self, key: str) -> Optional[str]:
+        started = time.perf_counter()
+        value = super().get(key)
+        self._record('sqlite', value is not None, started)
+        return value
+
+    async def _shared_client(self):
+        """Redis client for the running loop, or None (disabled/unavailable)."""
+        if not self.shared_url or time.monotonic() < self._shared_retry_at:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._shared is not None and self._shared_loop is loop:
+            return self._shared
+
+        # redis.asyncio connections are bound to the loop that made them
+        from .redis_client import RedisClient
+        client = await RedisClient.create(self.shared_url)
+        if not client.is_real_redis:
+            # In-memory fallback would only duplicate the memory tier; skip
+            # the shared tier until the backoff expires, then reconnect
+            self._shared_retry_at = time.monotonic() + SHARED_RETRY_SECONDS
+            return None
+        self._shared, self._shared_loop = client, loop
+        return client
+
+    # ------------------------------------------------------------------ sync API
+
+    def get(self, key: str) -> Optional[str]:
+        """Memory tier, then SQLite (promoting hits into memory)."""
+        if self._invalidation_due():
+            self._apply_invalidations()
+
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+
+        value = self._sqlite_get(key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: str,
+        source_lang: str = '',
+        target_lang: str = '',
+        mode: str = ''
+    ) -> None:
+        """Write through to SQLite and the memory tier."""
+        super().set(key, value, source_lang, target_lang, mode)
+        self._remember(key, value)
+
+    def set_many(self, entries: list[Dict[str, Any]]) -> None:
+        """Write through to SQLite and the memory tier."""
+        super().set_many(entries)
+        for entry in entries:
+            self._remember(entry['key'], entry['value'])
+
+    def clear(self) -> None:
+        """
+        Clear SQLite, the memory tier and (by moving to a new generation)
+        the shared tier; other processes follow via the log.
+        """
+        super().clear()
+        self._generation = self.generation()
+        if self.memory is not None:
+            self.memory.clear()
+        with self._tier_lock:
+            self._tier_stats = {tier: TierStats() for tier in self._tier_stats}
+
+    def stats(self) -> Dict[str, Any]:
+        """ChunkCache stats plus per-tier hit/miss/latency under 'tiers'."""
+        stats = super().stats()
+        with self._tier_lock:
+            tiers = {tier: s.to_dict() for tier, s in self._tier_stats.items()}
+        if self.memory is not None:
+            memory_stats = self.memory.stats()
+            tiers['memory'].update(
+                entries=memory_stats.size,
+                size_bytes=memory_stats.size_bytes,
+                max_bytes=memory_stats.max_bytes,
+            )
+        tiers['shared']['enabled'] = bool(self.shared_url) and time.monotonic() >= self._shared_retry_at
+        stats['tiers'] = tiers
+        return stats
+
+    # ------------------------------------------------------------------ async API
+
+    async def get_async(self, key: str) -> Optional[str]:
+        """
+        Memory, then shared, then SQLite (off the event loop).
+
+        A memory hit returns without leaving the loop; hits in a lower tier
+        are copied into the tiers above it.
+        """
+        if self._invalidation_due():
+            await asyncio.to_thread(self._apply_invalidations)
+
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+
+        shared = await self._shared_client()
+        if shared is not None:
+            started = time.perf_counter()
+            try:
+                value = await shared.get(self._shared_key(key))
+            except Exception as e:
+                logger.debug(f"Shared cache get failed: {e}")
+                value = None
+            self._record('shared', value is not None, started)
+            if value is not None:
+                self._remember(key, value)
+                return value
+
+        value = await asyncio.to_thread(self._sqlite_get, key)
+        if value is not None:
+            self._remember(key, value)
+            if shared is not None:
+                await self._shared_set(shared, key, value)
+        return value
+
+    async def set_async(
+        self,
+        key: str,
+        value: str,
+        source_lang: str = '',
+        target_lang: str = '',
+        mode: str = ''
+    ) -> None:
+        """set() off the event loop, plus the shared tier."""
+        await asyncio.to_thread(self.set, key, value, source_lang, target_lang, mode)
+        await self.promote(key, value)
+
+    async def promote(self, key: str, value: str) -> None:
+        """Put a value into the memory and shared tiers (not SQLite)."""
+        self._remember(key, value)
+        shared = await self._shared_client()
+        if shared is not None:
+            await self._shared_set(shared, key, value)
+
+    async def _shared_set(self, shared, key: str, value: str) -> None:
+        try:
+            await shared.set(self._shared_key(key), value, ex=self.shared_ttl)
+        except Exception as e:
+            logger.debug(f"Shared cache set failed: {e}")
+
+
+# Process-wide instances, one per database, so the memory tier outlives jobs
+_instances: Dict[Path, TieredChunkCache] = {}
+_instances_lock = threading.Lock()
+
+
+def get_chunk_cache(db_path: str | Path | None = None) -> TieredChunkCache:
+    """
+    Get the process-wide TieredChunkCache for a database.
+
+    Tier sizes come from settings (chunk_cache_memory_mb,
+    chunk_cache_redis_url, chunk_cache_ttl_days).
+
+    Args:
+        db_path: SQLite database; settings.cache_dir / "chunks.db" if None
+    """
+    from config.settings import settings
+
+    if db_path is None:
+        db_path = settings.cache_dir / "chunks.db"
+    resolved = Path(db_path).resolve()
+
+    with _instances_lock:
+        cache = _instances.get(resolved)
+        if cache is None:
+            cache = TieredChunkCache(
+                resolved,
+                memory_bytes=settings.chunk_cache_memory_mb * 1024 * 1024,
+                shared_url=settings.chunk_cache_redis_url,
+                shared_ttl=settings.chunk_cache_ttl_days * 24 * 3600,
+            )
+            _instances[resolved] = cache
+        return cache
@@ -16,6 +16,7 @@ def get_db_backend(
     db_name: str,
     db_dir: Optional[Union[str, Path]] = None,
     persistent: bool = False,
+    pool_size: int = 0,
 ) -> DatabaseBackend:
     """
     Factory: return a DatabaseBackend for the given database name.
@@ -26,6 +27,9 @@ def get_db_backend(
         db_dir:  directory for database files.  Defaults to settings.database_dir.
         persistent: if True, reuse a single connection across calls
                     (suited for modules that keep a long-lived connection).
+        pool_size: if > 0, keep a writer connection plus this many
+                   concurrent reader connections open (suited for hot,
+                   multi-threaded stores such as the job queue).
 
     Returns:
         A DatabaseBackend instance (currently always SQLiteBackend).
@@ -39,7 +43,13 @@ def get_db_backend(
     db_dir = Path(db_dir)
 
     if backend_type == "sqlite":
-        return SQLiteBackend(db_dir / f"{db_name}.db", persistent=persistent)
+        return SQLiteBackend(
+            db_dir / f"{db_name}.db",
+            persistent=persistent,
+            pool_size=pool_size,
+            cache_size_kib=getattr(settings, "sqlite_cache_size_kib", 0),
+            mmap_size=getattr(settings, "sqlite_mmap_size_mb", 0) * 1024 * 1024,
+        )
 
     # Sprint 2: postgresql
     raise ValueError(f"Unsupported database backend: {backend_type}")
@@ -33,10 +33,11 @@ class DatabaseBackend(Protocol):
     Protocol that all database backends must implement.
 
     The connection() context manager yields a DBConnection that
-    auto-commits on success and rolls back on exception.
+    auto-commits on success and rolls back on exception. Callers that only
+    read pass readonly=True so pooled backends can serve them concurrently.
     """
 
     @contextmanager
-    def connection(self) -> Iterator[DBConnection]: ...
+    def connection(self, readonly: bool = False) -> Iterator[DBConnection]: ...
 
     def close(self) -> None: ...
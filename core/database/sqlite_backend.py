@@ -47,6 +47,75 @@ class SQLiteCursor:
             return 0
         return self._cursor.rowcount
 
+    def close(self) -> None:
+        """Finish the current statement (releases its read snapshot)"""
+        if self._cursor is not None:
+            self._cursor.close()
+
+
+class _ReaderPool:
+    """
+    Bounded pool of read-only connections with per-thread affinity
+
+    A thread gets back the connection it used last when that one is idle
+    (its statement cache is warm for that thread's queries), otherwise any
+    idle one; a new connection is opened while fewer than `size` exist, and
+    callers wait beyond that.
+    """
+
+    def __init__(self, factory, size: int):
+        self._factory = factory
+        self._size = size
+        self._idle: list[sqlite3.Connection] = []
+        self._created = 0
+        self._generation = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    def acquire(self) -> tuple[sqlite3.Connection, int]:
+        with self._cond:
+            while True:
+                preferred = getattr(self._local, "conn", None)
+                if preferred is not None and any(c is preferred for c in self._idle):
+                    self._idle = [c for c in self._idle if c is not preferred]
+                    return preferred, self._generation
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._local.conn = conn
+                    return conn, self._generation
+                if self._created < self._size:
+                    self._created += 1
+                    generation = self._generation
+                    break
+                self._cond.wait()
+
+        try:
+            conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+        self._local.conn = conn
+        return conn, generation
+
+    def release(self, conn: sqlite3.Connection, generation: int) -> None:
+        with self._cond:
+            if generation == self._generation:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+        conn.close()  # Pool was closed while this one was in use
+
+    def close(self) -> None:
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._created = 0
+            self._generation += 1
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
 
 class SQLiteBackend:
     """
@@ -57,13 +126,34 @@ class SQLiteBackend:
 
     When persistent=True: a single connection is reused across calls,
     protected by a threading.Lock for thread safety.
+
+    When pool_size > 0 (pooled): connections stay open and are reused, so
+    PRAGMAs and prepared statements are paid once per connection instead of
+    once per call. connection() goes through a single writer connection
+    (SQLite allows one writer anyway; waiting on a lock is cheaper than
+    busy-retrying), connection(readonly=True) through up to `pool_size`
+    query_only reader connections that run concurrently with the writer
+    and each other under WAL.
     """
 
     def __init__(self, db_path: str | Path, persistent: bool = False,
-                 busy_timeout: float = 5.0):
+                 busy_timeout: float = 5.0, pool_size: int = 0,
+                 cache_size_kib: int = 0, mmap_size: int = 0,
+                 statement_cache_size: int = 128):
+        """
+        Args:
+            db_path: Database file (parent directories are created)
+            persistent: Reuse one connection for everything (ignored if pooled)
+            busy_timeout: Seconds to wait for another process's write lock
+            pool_size: Reader connections; > 0 enables pooled mode
+            cache_size_kib: Page cache per connection in KiB (0 = SQLite default)
+            mmap_size: Bytes of the file to memory-map for reads (0 = off)
+            statement_cache_size: Prepared statements kept per connection
+        """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._persistent = persistent
+        self._pool_size = max(0, int(pool_size))
+        self._persistent = persistent and not self._pool_size
         # Busy timeout (seconds) a connection waits for a held write lock before
         # raising "database is locked". Matters under concurrency: WAL allows one
         # writer at a time, so with per-call connections (non-persistent) or
@@ -71,24 +161,62 @@ class SQLiteBackend:
         # fail. Set both the connect() timeout and PRAGMA busy_timeout so it
         # applies regardless of how the driver routes it.
         self._busy_timeout = max(0.0, float(busy_timeout))
+        self._cache_size_kib = int(cache_size_kib)
+        self._mmap_size = int(mmap_size)
+        self._statement_cache_size = int(statement_cache_size)
         self._conn: Optional[sqlite3.Connection] = None
-        self._lock: Optional[threading.Lock] = threading.Lock() if persistent else None
+        self._lock: Optional[threading.Lock] = (
+            threading.Lock() if self._persistent or self._pool_size else None
+        )
+        self._readers: Optional[_ReaderPool] = (
+            _ReaderPool(lambda: self._create_connection(readonly=True), self._pool_size)
+            if self._pool_size else None
+        )
+
+    @property
+    def pooled(self) -> bool:
+        return self._readers is not None
 
-    def _create_connection(self) -> sqlite3.Connection:
+    def _create_connection(self, readonly: bool = False) -> sqlite3.Connection:
         conn = sqlite3.connect(
             str(self.db_path),
-            check_same_thread=not self._persistent,
+            check_same_thread=not (self._persistent or self.pooled),
             timeout=self._busy_timeout,
+            cached_statements=self._statement_cache_size,
         )
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute(f"PRAGMA busy_timeout={int(self._busy_timeout * 1000)}")
         conn.execute("PRAGMA foreign_keys=ON")
+        if self._cache_size_kib:
+            conn.execute(f"PRAGMA cache_size=-{self._cache_size_kib}")
+        if self._mmap_size:
+            conn.execute(f"PRAGMA mmap_size={self._mmap_size}")
+        if readonly:
+            conn.execute("PRAGMA query_only=ON")
         conn.row_factory = sqlite3.Row
         return conn
 
     @contextmanager
-    def connection(self) -> Iterator[SQLiteCursor]:
-        if self._persistent:
+    def connection(self, readonly: bool = False) -> Iterator[SQLiteCursor]:
+        """
+        Yield a cursor; commit on success, roll back on error.
+
+        Args:
+            readonly: The caller only reads. In pooled mode this picks a
+                      reader connection (writes then fail); other modes
+                      ignore it.
+        """
+        if self.pooled and readonly:
+            conn, generation = self._readers.acquire()
+            cursor = SQLiteCursor(conn)
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+                if conn.in_transaction:
+                    conn.rollback()
+                self._readers.release(conn, generation)
+        elif self._persistent or self.pooled:
             assert self._lock is not None
             with self._lock:
                 if self._conn is None:
@@ -97,9 +225,11 @@ class SQLiteBackend:
                 try:
                     yield cursor
                     self._conn.commit()
-                except Exception:
+                except BaseException:
                     self._conn.rollback()
                     raise
+                finally:
+                    cursor.close()
         else:
             conn = self._create_connection()
             cursor = SQLiteCursor(conn)
@@ -113,6 +243,10 @@ class SQLiteBackend:
                 conn.close()
 
     def close(self) -> None:
-        if self._persistent and self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        if self._readers is not None:
+            self._readers.close()
+        if self._lock is not None:
+            with self._lock:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
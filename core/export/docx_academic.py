@@ -122,6 +122,14 @@ class AcademicDocxExporter(DocxExporterBase):
         """
         logger.debug(f"AcademicDocxExporter: Processing {len(content)} nodes")
 
+        # Convert all equations in one batch; _try_omml_rendering then finds
+        # them in the OMML cache
+        if self.academic_config.equation_rendering_mode == "omml":
+            omml_converter.prefetch_omml([
+                node.metadata.get('latex_equation_primary') or node.metadata.get('latex_source') or node.text or ""
+                for node in content if node.is_equation()
+            ])
+
         for node in content:
             if node.is_heading():
                 self._add_heading_node(node)
@@ -101,6 +101,14 @@ def build_academic_docx(
         # For now, always include if metadata provided for premium feel
         fm_generator.generate_toc()
 
+    # Convert all equations in one batch; _format_equation_block then finds
+    # them in the OMML cache
+    if config.equation_rendering_mode == "omml":
+        omml_converter.prefetch_omml([
+            n.metadata.get('latex_equation_primary') or n.metadata.get('latex_source') or n.text or ""
+            for n in equation_nodes
+        ])
+
     # Process each nodes
 
     for node in nodes:
@@ -2,11 +2,11 @@
 Term Matcher
 Engine for finding glossary terms in text.
 """
-import re
 import logging
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from functools import lru_cache
+
+from core.term_automaton import TermAutomaton
 
 from .models import GlossaryTerm
 from .repository import get_repository
@@ -35,12 +35,15 @@ class TermMatcher:
     - Longest match first (prevents partial matches)
     - Priority-based selection for overlapping matches
     - Caching for frequently used glossaries
+    - One Aho-Corasick scan per text for all terms (core.term_automaton)
     """
 
     def __init__(self):
         """Initialize matcher."""
         self.repository = get_repository()
         self._term_cache: Dict[str, List[GlossaryTerm]] = {}
+        # (glossary ids, case_insensitive) -> compiled automaton + its terms
+        self._automaton_cache: Dict[tuple, Tuple[TermAutomaton, List[tuple]]] = {}
 
     def load_glossary(self, glossary_id: str) -> List[GlossaryTerm]:
         """
@@ -96,11 +99,46 @@ class TermMatcher:
             return []
 
     def clear_cache(self, glossary_id: Optional[str] = None):
-        """Clear term cache."""
+        """Clear term cache (and the automata built from those terms)."""
         if glossary_id:
             self._term_cache.pop(glossary_id, None)
+            for key in [k for k in self._automaton_cache if glossary_id in k[0]]:
+                del self._automaton_cache[key]
         else:
             self._term_cache.clear()
+            self._automaton_cache.clear()
+
+    def get_automaton(
+        self,
+        glossary_ids: List[str],
+        case_insensitive: bool = True,
+    ) -> Tuple[TermAutomaton, List[tuple]]:
+        """
+        Compiled automaton over the terms of the given glossaries.
+
+        Built on first use and kept until clear_cache() drops one of the
+        glossaries (every term edit in GlossaryService does).
+
+        Returns:
+            (automaton, [(term, glossary_id)] in automaton term order)
+        """
+        key = (tuple(glossary_ids), case_insensitive)
+        cached = self._automaton_cache.get(key)
+        if cached is None:
+            all_terms: List[tuple] = []  # (term, glossary_id)
+            for gid in glossary_ids:
+                for term in self.load_glossary(gid):
+                    all_terms.append((term, gid))
+            automaton = TermAutomaton(
+                [term.source_term for term, _ in all_terms],
+                case_sensitive=[
+                    term.case_sensitive or not case_insensitive for term, _ in all_terms
+                ],
+                priorities=[term.priority for term, _ in all_terms],
+            )
+            cached = self._automaton_cache[key] = (automaton, all_terms)
+            logger.debug(f"Compiled automaton over {len(all_terms)} terms for {glossary_ids}")
+        return cached
 
     def find_matches(
         self,
@@ -122,66 +160,28 @@ class TermMatcher:
         if not text or not glossary_ids:
             return []
 
-        # Collect all terms from all glossaries
-        all_terms: List[tuple] = []  # (term, glossary_id)
-        for gid in glossary_ids:
-            terms = self.load_glossary(gid)
-            for term in terms:
-                all_terms.append((term, gid))
-
+        automaton, all_terms = self.get_automaton(glossary_ids, case_insensitive)
         if not all_terms:
             return []
 
-        # Sort by length descending (longest match first)
-        all_terms.sort(key=lambda x: len(x[0].source_term), reverse=True)
-
+        # Longest match first; overlaps go to the longer (then higher
+        # priority, then earlier) term
         matches: List[TermMatch] = []
-        matched_positions: Set[tuple] = set()  # (start, end) pairs
-
-        for term, glossary_id in all_terms:
-            # Build regex pattern
-            escaped = re.escape(term.source_term)
-            flags = re.IGNORECASE if (case_insensitive and not term.case_sensitive) else 0
-
-            # Word boundary matching
-            pattern = rf'\b{escaped}\b'
-
-            try:
-                for match in re.finditer(pattern, text, flags):
-                    start, end = match.start(), match.end()
-
-                    # Check for overlap with existing matches
-                    is_overlapping = any(
-                        self._ranges_overlap(start, end, s, e)
-                        for s, e in matched_positions
-                    )
-
-                    if not is_overlapping:
-                        matches.append(TermMatch(
-                            source_term=term.source_term,
-                            target_term=term.target_term,
-                            start=start,
-                            end=end,
-                            glossary_id=glossary_id,
-                            priority=term.priority,
-                            term_id=term.id,
-                        ))
-                        matched_positions.add((start, end))
-
-            except re.error as e:
-                logger.warning(f"Regex error for term '{term.source_term}': {e}")
-                continue
-
-        # Sort by position
-        matches.sort(key=lambda m: m.start)
+        for start, end, idx in automaton.longest_matches(text):
+            term, glossary_id = all_terms[idx]
+            matches.append(TermMatch(
+                source_term=term.source_term,
+                target_term=term.target_term,
+                start=start,
+                end=end,
+                glossary_id=glossary_id,
+                priority=term.priority,
+                term_id=term.id,
+            ))
 
         logger.debug(f"Found {len(matches)} matches in text")
         return matches
 
-    def _ranges_overlap(self, s1: int, e1: int, s2: int, e2: int) -> bool:
-        """Check if two ranges overlap."""
-        return not (e1 <= s2 or e2 <= s1)
-
     def highlight_matches(
         self,
         text: str,
@@ -5,11 +5,12 @@
 GlossaryManager - Quản lý thuật ngữ để đảm bảo consistency
 """
 
-import re
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from core.term_automaton import TermAutomaton
+
 
 class GlossaryManager:
     """Quản lý thuật ngữ để đảm bảo consistency"""
@@ -18,7 +19,7 @@ class GlossaryManager:
         self.glossary_dir = Path(glossary_dir)
         self.glossary_dir.mkdir(exist_ok=True, parents=True)
         self.terms = {}
-        self.regex_cache = {}
+        self._automaton: Optional[TermAutomaton] = None  # rebuilt after term edits
         self.domain = 'default'  # Track current domain
         self.description = ""
 
@@ -39,6 +40,7 @@ class GlossaryManager:
         try:
             data = json.loads(path.read_text(encoding="utf-8"))
             self.terms.update(data.get("terms", {}))
+            self._automaton = None
 
             # Extract domain and description if available
             if 'domain' in data:
@@ -72,11 +74,13 @@ class GlossaryManager:
     def add_term(self, en_term: str, vi_term: str):
         """Add or update a term"""
         self.terms[en_term] = vi_term
+        self._automaton = None
 
     def remove_term(self, en_term: str):
         """Remove a term"""
         if en_term in self.terms:
             del self.terms[en_term]
+            self._automaton = None
 
     def build_prompt_section(self) -> str:
         """Tạo prompt section cho glossary"""
@@ -93,12 +97,18 @@ class GlossaryManager:
         score = 1.0
         warnings = []
 
-        for en_term, vi_term in self.terms.items():
-            # Case-insensitive search
-            if re.search(r'\b' + re.escape(en_term) + r'\b', source, re.IGNORECASE):
-                if vi_term.lower() not in translated.lower():
-                    warnings.append(f"Missing term: {en_term} → {vi_term}")
-                    score -= 0.1
+        # One scan of the source for all terms (case-insensitive, whole words)
+        # self.terms is public, so compare keys rather than trust add/remove_term
+        if self._automaton is None or self._automaton.terms != list(self.terms):
+            self._automaton = TermAutomaton(list(self.terms))
+        automaton = self._automaton
+        translated_lower = translated.lower()
+        for idx in sorted(automaton.present(source)):
+            en_term = automaton.terms[idx]
+            vi_term = self.terms.get(en_term)
+            if vi_term is not None and vi_term.lower() not in translated_lower:
+                warnings.append(f"Missing term: {en_term} → {vi_term}")
+                score -= 0.1
 
         return max(0.0, score), warnings
 
@@ -10,7 +10,10 @@ No external dependencies like Redis or Celery required.
 
 import json
 import hashlib
+import os
+import socket
 import time
+import uuid
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from collections.abc import Callable
@@ -19,6 +22,8 @@ from datetime import datetime
 from enum import Enum
 import asyncio
 
+from .job_signal import JobSignal
+
 
 class JobStatus(str, Enum):
     """Job status states"""
@@ -32,6 +37,19 @@ class JobStatus(str, Enum):
     RETRYING = "retrying"        # Failed, will retry
 
 
+# Seconds a claimed job stays owned by its worker without a heartbeat
+DEFAULT_LEASE_SECONDS = 60.0
+
+
+def default_worker_id() -> str:
+    """Worker id unique across hosts, processes and JobQueue instances"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class LeaseLostError(RuntimeError):
+    """Raised when a job is saved by a claim that no longer owns it"""
+
+
 class JobPriority(int, Enum):
     """Job priority levels (higher number = higher priority)"""
     LOW = 1
@@ -105,6 +123,11 @@ class TranslationJob:
     # Multi-tenancy
     user_id: str = "default_user"
 
+    # Worker lease (set by JobQueue.get_next_job / heartbeat only)
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    lease_token: Optional[str] = None
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
         data = asdict(self)
@@ -178,16 +201,40 @@ class TranslationJob:
         self.updated_at = time.time()
 
 
+# Columns written by JobQueue._save_job (everything except the worker lease)
+_SAVED_COLUMNS = (
+    'job_id', 'job_name', 'status', 'priority',
+    'input_file', 'output_file', 'input_format', 'output_format',
+    'source_lang', 'target_lang', 'domain', 'glossary',
+    'provider', 'model', 'concurrency', 'chunk_size',
+    'progress', 'total_chunks', 'completed_chunks', 'failed_chunks',
+    'avg_quality_score', 'total_cost_usd', 'tm_hits', 'cache_hits',
+    'scheduled_at', 'created_at', 'started_at', 'completed_at', 'updated_at',
+    'error_message', 'retry_count', 'max_retries',
+    'tags', 'metadata', 'user_id',
+)
+
+
 class JobQueue:
     """SQLite-based job queue with priority scheduling"""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ):
         """
         Initialize job queue
 
         Args:
             db_path: Path to SQLite database (default: data/jobs.db)
+            worker_id: Id recorded on jobs this instance claims (default: host:pid:random)
+            lease_seconds: How long a claim lasts without a heartbeat
         """
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+
         if db_path is None:
             from config.settings import BASE_DIR
             db_path = BASE_DIR / "data" / "jobs.db"
@@ -195,8 +242,15 @@ class JobQueue:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
 
+        from config.settings import settings
         from core.database import get_db_backend
-        self._backend = get_db_backend("jobs", db_dir=self.db_path.parent)
+        # Pooled: API handlers and workers hit the queue from many threads
+        self._backend = get_db_backend(
+            "jobs", db_dir=self.db_path.parent, pool_size=settings.sqlite_pool_size
+        )
+
+        # Wakes idle workers (any process) when a job becomes claimable
+        self.signal = JobSignal(getattr(self._backend, "db_path", self.db_path))
 
         self._init_db()
 
@@ -289,6 +343,18 @@ class JobQueue:
                 ON jobs(user_id)
             """)
 
+            # Migration: worker leases for multi-worker claiming
+            for column in ("worker_id TEXT", "lease_expires_at REAL", "lease_token TEXT"):
+                try:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column}")
+                except Exception:
+                    pass  # Column already exists
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lease
+                ON jobs(status, lease_expires_at)
+            """)
+
     def create_job(
         self,
         job_name: str,
@@ -331,6 +397,7 @@ class JobQueue:
 
         # Save to database
         self._save_job(job)
+        self.signal.notify()
 
         return job
 
@@ -341,35 +408,42 @@ class JobQueue:
         return hashlib.md5(data.encode()).hexdigest()[:12]
 
     def _save_job(self, job: TranslationJob):
-        """Save job to database"""
+        """
+        Save job to database
+
+        Lease columns are owned by get_next_job/heartbeat and left untouched,
+        so a progress update can't shorten or drop a renewed lease. The write
+        is fenced on the job's lease_token: a claim that was reclaimed (and
+        possibly re-claimed by the same worker) can no longer overwrite it.
+
+        Raises:
+            LeaseLostError: The stored job belongs to a newer claim
+        """
+        values = (
+            job.job_id, job.job_name, job.status, job.priority,
+            job.input_file, job.output_file, job.input_format, job.output_format,
+            job.source_lang, job.target_lang, job.domain, job.glossary,
+            job.provider, job.model, job.concurrency, job.chunk_size,
+            job.progress, job.total_chunks, job.completed_chunks, job.failed_chunks,
+            job.avg_quality_score, job.total_cost_usd, job.tm_hits, job.cache_hits,
+            job.scheduled_at, job.created_at, job.started_at, job.completed_at, job.updated_at,
+            job.error_message, job.retry_count, job.max_retries,
+            json.dumps(job.tags), json.dumps(job.metadata), job.user_id
+        )
         with self._backend.connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO jobs (
-                    job_id, job_name, status, priority,
-                    input_file, output_file, input_format, output_format,
-                    source_lang, target_lang, domain, glossary,
-                    provider, model, concurrency, chunk_size,
-                    progress, total_chunks, completed_chunks, failed_chunks,
-                    avg_quality_score, total_cost_usd, tm_hits, cache_hits,
-                    scheduled_at, created_at, started_at, completed_at, updated_at,
-                    error_message, retry_count, max_retries,
-                    tags, metadata, user_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.job_id, job.job_name, job.status, job.priority,
-                job.input_file, job.output_file, job.input_format, job.output_format,
-                job.source_lang, job.target_lang, job.domain, job.glossary,
-                job.provider, job.model, job.concurrency, job.chunk_size,
-                job.progress, job.total_chunks, job.completed_chunks, job.failed_chunks,
-                job.avg_quality_score, job.total_cost_usd, job.tm_hits, job.cache_hits,
-                job.scheduled_at, job.created_at, job.started_at, job.completed_at, job.updated_at,
-                job.error_message, job.retry_count, job.max_retries,
-                json.dumps(job.tags), json.dumps(job.metadata), job.user_id
-            ))
+            conn.execute(f"""
+                INSERT INTO jobs ({', '.join(_SAVED_COLUMNS)})
+                VALUES ({', '.join('?' * len(_SAVED_COLUMNS))})
+                ON CONFLICT(job_id) DO UPDATE SET
+                {', '.join(f'{c} = excluded.{c}' for c in _SAVED_COLUMNS[1:])}
+                WHERE jobs.lease_token IS ?
+            """, values + (job.lease_token,))
+            if conn.rowcount == 0:
+                raise LeaseLostError(f"Job {job.job_id} was reclaimed; claim {job.lease_token} no longer owns it")
 
     def get_job(self, job_id: str) -> Optional[TranslationJob]:
         """Get job by ID (supports partial ID prefix matching)"""
-        with self._backend.connection() as conn:
+        with self._backend.connection(readonly=True) as conn:
             # Try exact match first
             row = conn.execute(
                 "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
@@ -408,31 +482,138 @@ class JobQueue:
         job.updated_at = time.time()
         self._save_job(job)
 
-    def get_next_job(self) -> Optional[TranslationJob]:
+    def get_next_job(
+        self,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> Optional[TranslationJob]:
         """
-        Get next job to process based on priority and FIFO
+        Claim the next job to process based on priority and FIFO
+
+        Selecting and claiming happen in one statement inside an IMMEDIATE
+        transaction, so concurrent workers (threads or processes sharing the
+        queue DB) never get the same job. The claimed job is QUEUED, owned by
+        `worker_id` and leased for `lease_seconds` under a fresh lease_token
+        that fences its later heartbeats and updates; jobs whose lease expired
+        are reclaimed first (see reclaim_expired_jobs).
+
+        Args:
+            worker_id: Claiming worker (default: this queue's worker_id)
+            lease_seconds: Lease length (default: this queue's lease_seconds)
 
         Returns:
             Next job or None if queue is empty
         """
+        worker_id = worker_id or self.worker_id
+        now = time.time()
+        lease_expires_at = now + (lease_seconds or self.lease_seconds)
+
         with self._backend.connection() as conn:
-            # Get highest priority pending/retrying job (NOT queued - prevents race condition)
+            conn.execute("BEGIN IMMEDIATE")
+            self._reclaim_expired(conn, now)
+            rows = conn.execute("""
+                UPDATE jobs
+                SET status = 'queued', worker_id = ?, lease_expires_at = ?, lease_token = ?,
+                    updated_at = ?
+                WHERE job_id = (
+                    SELECT job_id FROM jobs
+                    WHERE status IN ('pending', 'retrying')
+                    AND (scheduled_at IS NULL OR scheduled_at <= ?)
+                    ORDER BY priority DESC, created_at ASC
+                    LIMIT 1
+                )
+                RETURNING *
+            """, (worker_id, lease_expires_at, uuid.uuid4().hex, now, now)).fetchall()
+
+        if rows:
+            return self._row_to_job(rows[0])
+        return None
+
+    def next_wakeup_at(self) -> Optional[float]:
+        """
+        Earliest future time the queue changes without a notify: a scheduled
+        job becoming due or a lease expiring
+
+        Returns:
+            Unix timestamp, or None if nothing is pending on time
+        """
+        with self._backend.connection(readonly=True) as conn:
             row = conn.execute("""
-                SELECT * FROM jobs
-                WHERE status IN ('pending', 'retrying')
-                AND (scheduled_at IS NULL OR scheduled_at <= ?)
-                ORDER BY priority DESC, created_at ASC
-                LIMIT 1
+                SELECT MIN(t) FROM (
+                    SELECT MIN(scheduled_at) AS t FROM jobs
+                    WHERE status IN ('pending', 'retrying') AND scheduled_at > ?
+                    UNION ALL
+                    SELECT MIN(lease_expires_at) FROM jobs
+                    WHERE status IN ('queued', 'running') AND lease_expires_at IS NOT NULL
+                )
             """, (time.time(),)).fetchone()
+        return row[0] if row else None
 
-        if row:
-            job = self._row_to_job(row)
-            # Mark as queued immediately to prevent race condition
-            job.status = JobStatus.QUEUED
-            self.update_job(job)
-            return job
+    def heartbeat(
+        self,
+        job_id: str,
+        lease_token: str,
+        lease_seconds: Optional[float] = None,
+    ) -> bool:
+        """
+        Extend the lease on a claimed job
 
-        return None
+        Args:
+            job_id: Job claimed with get_next_job
+            lease_token: The claim's lease_token (worker ids repeat when the
+                same worker reclaims its own expired job)
+            lease_seconds: New lease length from now
+
+        Returns:
+            False if the claim no longer owns the job (lease expired and the
+            job was reclaimed) - the caller should stop working on it
+        """
+        lease_expires_at = time.time() + (lease_seconds or self.lease_seconds)
+
+        with self._backend.connection() as conn:
+            conn.execute("""
+                UPDATE jobs SET lease_expires_at = ?
+                WHERE job_id = ? AND lease_token = ?
+                AND status IN ('queued', 'running')
+            """, (lease_expires_at, job_id, lease_token))
+            return conn.rowcount > 0
+
+    def reclaim_expired_jobs(self) -> int:
+        """
+        Return jobs of dead workers (lease expired) to the queue
+
+        Returns:
+            Number of jobs reclaimed or failed
+        """
+        with self._backend.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            return self._reclaim_expired(conn, time.time())
+
+    def _reclaim_expired(self, conn: Any, now: float) -> int:
+        """
+        Requeue expired leases as RETRYING (counting a retry), or fail the job
+        once it is out of retries so a job that kills its worker can't loop.
+        Jobs without a lease (claimed before leases existed) are left alone.
+        """
+        conn.execute("""
+            UPDATE jobs
+            SET status = 'failed',
+                error_message = 'Worker ' || COALESCE(worker_id, '?') || ' stopped responding (lease expired)',
+                completed_at = ?, updated_at = ?, lease_expires_at = NULL, lease_token = NULL
+            WHERE status IN ('queued', 'running')
+            AND lease_expires_at IS NOT NULL AND lease_expires_at < ?
+            AND retry_count >= max_retries
+        """, (now, now, now))
+        failed = conn.rowcount
+
+        conn.execute("""
+            UPDATE jobs
+            SET status = 'retrying', retry_count = retry_count + 1,
+                worker_id = NULL, lease_expires_at = NULL, lease_token = NULL, updated_at = ?
+            WHERE status IN ('queued', 'running')
+            AND lease_expires_at IS NOT NULL AND lease_expires_at < ?
+        """, (now, now))
+        return failed + conn.rowcount
 
     def list_jobs(
         self,
@@ -453,7 +634,7 @@ class JobQueue:
         Returns:
             List of jobs
         """
-        with self._backend.connection() as conn:
+        with self._backend.connection(readonly=True) as conn:
             conditions = []
             params = []
 
@@ -478,7 +659,7 @@ class JobQueue:
 
     def get_queue_stats(self) -> Dict[str, int]:
         """Get queue statistics"""
-        with self._backend.connection() as conn:
+        with self._backend.connection(readonly=True) as conn:
             rows = conn.execute("""
                 SELECT status, COUNT(*) as count
                 FROM jobs
@@ -540,8 +721,13 @@ class JobQueue:
         job.retry_count += 1
         job.updated_at = time.time()
         self._save_job(job)
+        self.signal.notify()
         return job
 
+    def close(self):
+        """Close pooled database connections (reopened on next use)"""
+        self._backend.close()
+
     def cleanup_old_jobs(self, days: int = 30) -> int:
         """
         Delete old completed/failed jobs
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Job Signal - wake idle job workers when work arrives
+
+JobQueue calls `notify()` whenever a job becomes claimable (create, restart).
+Workers `subscribe()` and `await wakeup.wait(timeout)` instead of polling
+the queue database.
+
+- In-process: every subscriber on the same queue DB is woken through its
+  event loop (thread-safe, so sync API handlers running in a threadpool can
+  notify too).
+- Cross-process: each subscriber binds a Unix datagram socket in
+  `<db dir>/<db name>.wakeup/`; notify sends one byte to every socket in
+  that directory. No broker needed - the same "file-based, no Redis"
+  approach as the queue itself. Sockets of dead processes are removed by the
+  next notify. Where AF_UNIX is unavailable (Windows) subscribers only get
+  in-process wakeups and rely on their wait timeout.
+
+Usage:
+    >>> signal = JobSignal(Path("data/jobs.db"))
+    >>> wakeup = signal.subscribe()          # inside the worker's event loop
+    >>> await wakeup.wait(timeout=30)        # returns early on notify()
+    >>> signal.notify()                      # from anywhere
+"""
+
+import asyncio
+import os
+import socket
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# In-process subscribers and own socket paths, per queue DB
+_subscribers: Dict[Path, Set["JobWakeup"]] = {}
+_own_sockets: Set[str] = set()
+_registry_lock = threading.Lock()
+
+
+class JobWakeup:
+    """
+    One worker's wakeup channel (see JobSignal.subscribe)
+
+    Must be created and awaited on the same event loop.
+    """
+
+    def __init__(self, signal: "JobSignal"):
+        self._signal = signal
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        self._sock: Optional[socket.socket] = None
+        self._sock_path: Optional[Path] = None
+
+    @property
+    def cross_process(self) -> bool:
+        """True if notifications from other processes reach this worker"""
+        return self._sock is not None
+
+    def set(self) -> None:
+        """Wake the worker (callable from any thread)"""
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def _on_datagram(self) -> None:
+        # Drain everything queued; any number of notifies is one wakeup
+        try:
+            while self._sock.recv(64):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self._event.set()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a notification or the timeout
+
+        Returns:
+            True if notified, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            # Cleared before the caller re-checks the queue, so a notify that
+            # arrives during the check wakes the next wait()
+            self._event.clear()
+
+    def _bind(self, directory: Path) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        path = directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            sock.bind(str(path))
+            sock.setblocking(False)
+            self._loop.add_reader(sock.fileno(), self._on_datagram)
+        except (OSError, NotImplementedError) as e:
+            # Path too long, read-only dir, loop without add_reader (Windows)
+            logger.debug(f"Cross-process job wakeups unavailable: {e}")
+            sock.close()
+            path.unlink(missing_ok=True)
+            return
+        self._sock, self._sock_path = sock, path
+        with _registry_lock:
+            _own_sockets.add(str(path))
+
+    def close(self) -> None:
+        """Unsubscribe and remove this worker's socket"""
+        self._signal._unsubscribe(self)
+        if self._sock is not None:
+            try:
+                self._loop.remove_reader(self._sock.fileno())
+            except Exception:
+                pass
+            self._sock.close()
+            self._sock = None
+        if self._sock_path is not None:
+            with _registry_lock:
+                _own_sockets.discard(str(self._sock_path))
+            self._sock_path.unlink(missing_ok=True)
+            self._sock_path = None
+
+
+class JobSignal:
+    """
+    Wakeup signal shared by everything using one queue database
+
+    Args:
+        db_path: Queue database the signal belongs to
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path).resolve()
+        self.socket_dir = self.db_path.parent / f"{self.db_path.stem}.wakeup"
+
+    def subscribe(self) -> JobWakeup:
+        """Create a wakeup channel for the running event loop"""
+        wakeup = JobWakeup(self)
+        wakeup._bind(self.socket_dir)
+        with _registry_lock:
+            _subscribers.setdefault(self.db_path, set()).add(wakeup)
+        return wakeup
+
+    def _unsubscribe(self, wakeup: JobWakeup) -> None:
+        with _registry_lock:
+            _subscribers.get(self.db_path, set()).discard(wakeup)
+
+    def notify(self) -> None:
+        """Wake every subscriber of this queue, in any process (never raises)"""
+        with _registry_lock:
+            local = list(_subscribers.get(self.db_path, ()))
+            own = set(_own_sockets)
+        for wakeup in local:
+            wakeup.set()
+
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        try:
+            paths = [p for p in self.socket_dir.glob("*.sock") if str(p) not in own]
+        except OSError:
+            return
+        if not paths:
+            return
+
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sender.setblocking(False)
+        try:
+            for path in paths:
+                try:
+                    sender.sendto(b"1", str(path))
+                except BlockingIOError:
+                    pass  # Receiver buffer full - it has wakeups pending anyway
+                except (ConnectionRefusedError, FileNotFoundError):
+                    path.unlink(missing_ok=True)  # Process is gone
+                except OSError as e:
+                    logger.debug(f"Job wakeup to {path.name} failed: {e}")
+        finally:
+            sender.close()
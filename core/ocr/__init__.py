@@ -8,6 +8,8 @@ Provides intelligent OCR capabilities for scanned/handwritten documents:
 - Hybrid OCR router (combines both intelligently)
 - Smart PDF detector (auto-detects native vs scanned)
 - High-level OCR pipeline for PDFs and images
+- Page-parallel OCR on warm worker processes
+- Process-wide registry of loaded OCR models
 
 Example usage:
 
@@ -69,6 +71,8 @@ except ImportError:
 
 from .smart_detector import SmartDetector, PDFType, OCRMode, DetectionResult
 from .pipeline import OcrPipeline, OcrPage
+from .parallel import ParallelOcrRunner, get_ocr_runner
+from .model_registry import OcrModelRegistry, get_model_registry
 
 from config.logging_config import get_logger
 logger = get_logger(__name__)
@@ -105,6 +109,12 @@ __all__ = [
     # Pipeline
     'OcrPipeline',
     'OcrPage',
+    'ParallelOcrRunner',
+    'get_ocr_runner',
+
+    # Shared model registry
+    'OcrModelRegistry',
+    'get_model_registry',
 
     # Legacy (deprecated)
     'DeepseekOcrClient',
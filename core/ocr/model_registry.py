@@ -0,0 +1,229 @@
+"""
+OCR Model Registry
+
+Process-wide cache of loaded PaddleOCR engines, keyed by PaddleOCR language.
+Loading a model takes seconds and hundreds of MB, so every PaddleOcrClient
+borrows its engine from here instead of constructing one per job:
+
+- At most `max_models` languages stay loaded (least recently used evicted)
+- Models unused for `idle_timeout` seconds are dropped by a background timer
+- Concurrent first requests for a language load the model once
+- Inference on a shared engine is serialized per model (PaddleOCR
+  predictors are not thread-safe)
+
+Example:
+    registry = get_model_registry()
+    registry.prewarm(['japan'])          # e.g. at API startup
+    engine = registry.get('japan')       # no load: already warm
+    result = engine.predict(img_array)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from config.logging_config import get_logger
+logger = get_logger(__name__)
+
+
+def _load_paddle(lang: str) -> Any:
+    from paddleocr import PaddleOCR
+
+    # PaddleOCR 3.x simplified API - only lang is needed
+    return PaddleOCR(lang=lang)
+
+
+@dataclass
+class _ModelEntry:
+    lang: str
+    engine: Any
+    load_seconds: float
+    last_used: float = field(default_factory=time.monotonic)
+    hits: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SharedOcrEngine:
+    """Engine handle given to clients; one predict() at a time per model"""
+
+    def __init__(self, entry: _ModelEntry):
+        self._entry = entry
+
+    @property
+    def lang(self) -> str:
+        return self._entry.lang
+
+    def predict(self, *args, **kwargs):
+        with self._entry.lock:
+            self._entry.last_used = time.monotonic()
+            return self._entry.engine.predict(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._entry.engine, name)
+
+
+class OcrModelRegistry:
+    """
+    Bounded, thread-safe LRU of loaded OCR engines
+
+    Args:
+        max_models: Languages kept loaded at once (>= 1)
+        idle_timeout: Seconds after which an unused model is dropped (0 = never)
+        loader: Callable building an engine for a language (default: PaddleOCR)
+    """
+
+    def __init__(
+        self,
+        max_models: int = 2,
+        idle_timeout: float = 1800.0,
+        loader: Optional[Callable[[str], Any]] = None,
+    ):
+        self.max_models = max(1, max_models)
+        self.idle_timeout = idle_timeout
+        self._loader = loader or _load_paddle
+        self._models: "OrderedDict[str, _ModelEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_seconds = 0.0
+        self._idle_timer: Optional[threading.Timer] = None
+
+    def get(self, lang: str) -> SharedOcrEngine:
+        """
+        Engine for a PaddleOCR language, loading it if needed
+
+        Raises:
+            Whatever the loader raises (ImportError, model download errors)
+        """
+        with self._lock:
+            self._evict_idle_locked()
+            entry = self._checkout_locked(lang)
+            if entry is not None:
+                self._schedule_idle_eviction_locked()
+                return SharedOcrEngine(entry)
+            load_lock = self._loading.setdefault(lang, threading.Lock())
+
+        # Load outside the registry lock; other languages stay available
+        with load_lock:
+            with self._lock:
+                entry = self._checkout_locked(lang)
+                if entry is not None:
+                    return SharedOcrEngine(entry)  # Loaded by a concurrent caller
+
+            started = time.perf_counter()
+            engine = self._loader(lang)
+            load_seconds = time.perf_counter() - started
+            logger.info(f"Loaded OCR model lang='{lang}' in {load_seconds:.1f}s")
+
+            with self._lock:
+                self._misses += 1
+                self._load_seconds += load_seconds
+                entry = self._models[lang] = _ModelEntry(lang, engine, load_seconds)
+                while len(self._models) > self.max_models:
+                    old_lang, _ = self._models.popitem(last=False)
+                    self._evictions += 1
+                    logger.info(f"Evicted OCR model lang='{old_lang}' (LRU)")
+                self._loading.pop(lang, None)
+                self._schedule_idle_eviction_locked()
+            return SharedOcrEngine(entry)
+
+    def _checkout_locked(self, lang: str) -> Optional[_ModelEntry]:
+        entry = self._models.get(lang)
+        if entry is not None:
+            self._models.move_to_end(lang)
+            entry.hits += 1
+            entry.last_used = time.monotonic()
+            self._hits += 1
+        return entry
+
+    def _evict_idle_locked(self) -> None:
+        if self.idle_timeout <= 0:
+            return
+        cutoff = time.monotonic() - self.idle_timeout
+        for lang in [lang for lang, e in self._models.items() if e.last_used < cutoff]:
+            del self._models[lang]
+            self._evictions += 1
+            logger.info(f"Evicted OCR model lang='{lang}' (idle)")
+
+    def _schedule_idle_eviction_locked(self) -> None:
+        """Arm the idle timer for the least recently used model, if not armed"""
+        if self.idle_timeout <= 0 or not self._models or self._idle_timer is not None:
+            return
+        oldest = min(e.last_used for e in self._models.values())
+        delay = max(0.0, oldest + self.idle_timeout - time.monotonic())
+        self._idle_timer = threading.Timer(delay, self._on_idle_timer)
+        self._idle_timer.daemon = True  # never keeps the process alive
+        self._idle_timer.start()
+
+    def _on_idle_timer(self) -> None:
+        with self._lock:
+            self._idle_timer = None
+            self._evict_idle_locked()
+            # Models used since the timer was armed get a fresh deadline
+            self._schedule_idle_eviction_locked()
+
+    def evict_idle(self) -> None:
+        """Drop models idle longer than idle_timeout"""
+        with self._lock:
+            self._evict_idle_locked()
+
+    def prewarm(self, langs: Iterable[str]) -> None:
+        """Load models ahead of the first job; failures are logged, not raised"""
+        for lang in langs:
+            try:
+                self.get(lang)
+            except Exception as e:
+                logger.warning(f"OCR model prewarm failed for lang='{lang}': {e}")
+
+    def clear(self) -> None:
+        """Drop all loaded models"""
+        with self._lock:
+            self._models.clear()
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Loaded models, hit/miss counts and load times"""
+        now = time.monotonic()
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "max_models": self.max_models,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "total_load_seconds": round(self._load_seconds, 3),
+                "models": [
+                    {
+                        "lang": e.lang,
+                        "hits": e.hits,
+                        "load_seconds": round(e.load_seconds, 3),
+                        "idle_seconds": round(now - e.last_used, 1),
+                    }
+                    for e in self._models.values()
+                ],
+            }
+
+
+_registry: Optional[OcrModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> OcrModelRegistry:
+    """Process-wide registry configured from settings"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from config.settings import settings
+                _registry = OcrModelRegistry(
+                    max_models=settings.ocr_model_cache_size,
+                    idle_timeout=settings.ocr_model_idle_seconds,
+                )
+    return _registry
@@ -13,6 +13,7 @@ from PIL import Image
 import numpy as np
 
 from .base import OcrClient, OcrError, OcrConnectionError, OcrInvalidInputError
+from .model_registry import get_model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -96,13 +97,19 @@ class PaddleOcrClient(OcrClient):
 
         Raises:
             OcrError: If PaddleOCR is not installed
+
+        Note:
+            Models come from the process-wide OcrModelRegistry, so creating
+            a client for an already-loaded language is cheap.
         """
         self.lang = lang
         self.use_angle_cls = use_angle_cls
         self.use_gpu = use_gpu
 
         try:
-            from paddleocr import PaddleOCR
+            # Shared, already-loaded model when a previous job used this
+            # language; first run will download models (~100-200MB)
+            self.ocr = get_model_registry().get(lang)
         except ImportError as e:
             raise OcrError(
                 "PaddleOCR is not installed. Install it with:\n"
@@ -110,17 +117,6 @@ class PaddleOcrClient(OcrClient):
                 "Or install with OCR extras:\n"
                 "  pip install -e .[ocr]"
             ) from e
-
-        try:
-            # Initialize PaddleOCR 3.x
-            # First run will download models (~100-200MB)
-            logger.info(f"Initializing PaddleOCR 3.x with lang='{lang}'")
-
-            # PaddleOCR 3.x simplified API - only lang is needed
-            self.ocr = PaddleOCR(lang=lang)
-
-            logger.info("PaddleOCR initialized successfully")
-
         except Exception as e:
             raise OcrConnectionError(f"Failed to initialize PaddleOCR: {str(e)}") from e
 
@@ -253,18 +249,45 @@ class PaddleOcrClient(OcrClient):
             # Convert bytes to PIL Image
             image = Image.open(io.BytesIO(image_bytes))
 
-            # Get image dimensions
-            img_width, img_height = image.size
-
             # Convert to RGB if needed
             if image.mode != 'RGB':
                 image = image.convert('RGB')
 
             # Convert to numpy array
             img_array = np.array(image)
+        except Exception as e:
+            raise OcrInvalidInputError(f"Invalid image data: {str(e)}") from e
+
+        return self.extract_structured_pixels(img_array, mode=mode, language=language)
+
+    def extract_structured_pixels(
+        self,
+        pixels: np.ndarray,
+        mode: str = "document",
+        language: Optional[str] = None
+    ) -> Dict:
+        """
+        Like extract_structured(), but for a decoded RGB image.
+
+        Lets callers that already hold pixels (e.g. a rendered PDF page, see
+        core.ocr.raster) skip a PNG encode/decode round trip.
+
+        Args:
+            pixels: (height, width, 3) uint8 RGB array; not modified
+            mode: OCR mode (ignored for PaddleOCR)
+            language: Language hint (ignored - uses lang from init)
+
+        Returns:
+            Same dictionary as extract_structured()
+
+        Raises:
+            OcrError: If OCR fails
+        """
+        try:
+            img_height, img_width = pixels.shape[:2]
 
             # Run OCR - PaddleOCR 3.x uses predict() method
-            result = self.ocr.predict(img_array)
+            result = self.ocr.predict(pixels)
 
             # Parse result - PaddleOCR 3.x returns list of OCRResult objects
             if not result or len(result) == 0:
@@ -456,6 +479,21 @@ def get_ocr_client_for_language(
     )
 
 
+def prewarm_ocr_models(languages: str) -> None:
+    """
+    Load PaddleOCR models into the shared registry ahead of the first job.
+
+    Args:
+        languages: Comma-separated ISO 639-1 codes (e.g. "ja,zh"); PaddleOCR
+                   codes ("japan") are accepted as-is
+    """
+    codes = [c.strip() for c in languages.split(",") if c.strip()]
+    paddle_langs = list(dict.fromkeys(LANGUAGE_TO_PADDLE_MAP.get(c, c) for c in codes))
+    if paddle_langs:
+        logger.info(f"Prewarming OCR models: {', '.join(paddle_langs)}")
+        get_model_registry().prewarm(paddle_langs)
+
+
 def detect_language_from_text(text: str) -> str:
     """
     Detect language from text sample using character ranges.
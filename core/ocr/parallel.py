@@ -0,0 +1,313 @@
+"""
+Parallel OCR
+
+Process pool that OCRs PDF pages on several cores. Each worker process
+builds its own OCR client once (PaddleOCR models load in the worker and stay
+warm for every later shard), opens the PDF itself and renders + OCRs a shard
+of pages. Only the path and page numbers go to the worker and
+only OcrPage results come back - no images cross process boundaries.
+
+Results are yielded in page order while later shards are still running;
+at most `workers * 2` shards are in flight so memory stays flat on long
+books.
+
+`get_ocr_runner()` returns the process-wide runner for an OCR engine, sized
+once from settings, so every document (and job) reuses the same warm
+workers instead of cold-loading the models again.
+
+Example:
+    from functools import partial
+    from core.ocr import PaddleOcrClient
+
+    with ParallelOcrRunner(partial(PaddleOcrClient, lang='ja'), workers=4) as runner:
+        for page in runner.iter_pdf(Path("scan.pdf"), dpi=300):
+            ...
+"""
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .base import OcrClient, OcrError
+
+from config.logging_config import get_logger
+logger = get_logger(__name__)
+
+# Rough resident size of one PaddleOCR worker (models + buffers), used to
+# turn a memory budget into a worker count
+WORKER_MEMORY_MB = 1500
+
+# Pages per task: small enough to balance, large enough to amortize IPC
+DEFAULT_SHARD_PAGES = 4
+
+# Shards a worker handles before it is replaced (contains slow leaks in
+# native OCR libraries); 0 = never
+DEFAULT_MAX_SHARDS_PER_WORKER = 0
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def resolve_worker_count(workers: int, memory_limit_mb: int = 0) -> int:
+    """
+    Number of OCR processes to start
+
+    Args:
+        workers: Requested workers (0 = one per CPU)
+        memory_limit_mb: Total memory budget for OCR workers (0 = no limit)
+
+    Returns:
+        At least 1
+    """
+    count = workers if workers > 0 else (os.cpu_count() or 1)
+    if memory_limit_mb > 0:
+        count = min(count, memory_limit_mb // WORKER_MEMORY_MB)
+    return max(1, count)
+
+
+# -----------------------------------------------------------------------------
+# Worker process side
+# -----------------------------------------------------------------------------
+
+_worker_client: Optional[OcrClient] = None
+_worker_docs: dict = {}
+
+
+def _init_worker(client_factory: Callable[[], OcrClient]) -> None:
+    """Pool initializer: load the OCR client once per process"""
+    global _worker_client
+    _worker_client = client_factory()
+
+
+def _ocr_shard(
+    pdf_path: str,
+    pages: Sequence[int],
+    dpi: int,
+    image_format: str,
+    mode: str,
+    language: Optional[str],
+    min_dpi: Optional[int] = None,
+) -> list:
+    """Render and OCR the given pages of a PDF in a worker process"""
+    import fitz
+    from .pipeline import ocr_page
+
+    doc = _worker_docs.get(pdf_path)
+    if doc is None:
+        # Keep only the current book open
+        for old in _worker_docs.values():
+            old.close()
+        _worker_docs.clear()
+        doc = _worker_docs[pdf_path] = fitz.open(pdf_path)
+
+    return [
+        ocr_page(_worker_client, doc[page_num], dpi, image_format, mode, language, min_dpi)
+        for page_num in pages
+    ]
+
+
+# -----------------------------------------------------------------------------
+# Parent process side
+# -----------------------------------------------------------------------------
+
+class ParallelOcrRunner:
+    """
+    Pool of warm OCR worker processes
+
+    Args:
+        client_factory: Picklable zero-argument callable returning an OCR
+                        client (a class or functools.partial of one)
+        workers: Worker processes (0 = one per CPU)
+        memory_limit_mb: Total memory budget; caps the worker count
+        shard_pages: Pages per task
+        max_shards_per_worker: Recycle a worker after this many shards (0 = never)
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], OcrClient],
+        workers: int = 0,
+        memory_limit_mb: int = 0,
+        shard_pages: int = DEFAULT_SHARD_PAGES,
+        max_shards_per_worker: int = DEFAULT_MAX_SHARDS_PER_WORKER,
+    ):
+        self.client_factory = client_factory
+        self.workers = resolve_worker_count(workers, memory_limit_mb)
+        self.shard_pages = max(1, shard_pages)
+        self.max_shards_per_worker = max_shards_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._active = 0  # iter_pdf calls in progress
+
+    @property
+    def busy(self) -> bool:
+        return self._active > 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            return self._pool_locked()
+
+    def _pool_locked(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a parent that already runs threads / native OCR
+            # libraries can deadlock the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.client_factory,),
+                max_tasks_per_child=self.max_shards_per_worker or None,
+            )
+            logger.info(f"Started {self.workers} OCR worker processes")
+        return self._executor
+
+    def _shards(self, page_numbers: Sequence[int]) -> List[List[int]]:
+        return [
+            list(page_numbers[i:i + self.shard_pages])
+            for i in range(0, len(page_numbers), self.shard_pages)
+        ]
+
+    def iter_pdf(
+        self,
+        pdf_path: Path,
+        page_range: Optional[Tuple[int, int]] = None,
+        dpi: int = 300,
+        image_format: str = "PNG",
+        mode: str = "document",
+        language: Optional[str] = None,
+        min_dpi: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        pages: Optional[Sequence[int]] = None,
+    ) -> Iterator:
+        """
+        OCR pages of a PDF across the pool, yielding OcrPage in page order
+
+        Args:
+            pdf_path: PDF file
+            page_range: Optional (start, end) page range (0-indexed, end exclusive)
+            dpi: Render resolution
+            image_format: "PNG" or "JPEG"
+            mode: OCR mode passed to the client
+            language: Language hint passed to the client
+            min_dpi: Adaptive per-page DPI down to this value (None = fixed `dpi`)
+            progress_callback: Called as (pages_done, total_pages) when a
+                               shard finishes (in completion order)
+            pages: Explicit page numbers (0-indexed) instead of `page_range`
+
+        Raises:
+            OcrError: If the worker pool broke (e.g. the client failed to load)
+        """
+        import fitz
+
+        if pages is None:
+            with fitz.open(pdf_path) as doc:
+                total_pages = doc.page_count
+            start, end = page_range if page_range else (0, total_pages)
+            pages = range(max(0, start), min(total_pages, end))
+
+        shards = deque(self._shards(pages))
+        in_flight: Deque[Future] = deque()
+        done_pages = 0
+        with self._lock:
+            pool = self._pool_locked()
+            self._active += 1
+
+        def on_done(future: Future, size: int) -> None:
+            nonlocal done_pages
+            if progress_callback and not future.cancelled() and future.exception() is None:
+                done_pages += size
+                progress_callback(done_pages, len(pages))
+
+        try:
+            while shards or in_flight:
+                # Keep the pipeline full without rendering the whole book ahead
+                while shards and len(in_flight) < self.workers * 2:
+                    shard = shards.popleft()
+                    future = pool.submit(
+                        _ocr_shard, str(pdf_path), shard, dpi, image_format, mode, language, min_dpi
+                    )
+                    future.add_done_callback(lambda f, n=len(shard): on_done(f, n))
+                    in_flight.append(future)
+
+                yield from in_flight.popleft().result()
+        except BrokenProcessPool as e:
+            self.close()
+            raise OcrError(f"OCR worker pool failed: {e}") from e
+        finally:
+            for future in in_flight:
+                future.cancel()
+            with self._lock:
+                self._active -= 1
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ParallelOcrRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# -----------------------------------------------------------------------------
+# Process-wide runners
+# -----------------------------------------------------------------------------
+
+_runners: Dict[Any, ParallelOcrRunner] = {}
+_runners_lock = threading.Lock()
+
+
+def _factory_key(client_factory: Callable[[], OcrClient]) -> Any:
+    # partial objects compare by identity; key them by what they build
+    if isinstance(client_factory, partial):
+        return (client_factory.func, client_factory.args, tuple(sorted(client_factory.keywords.items())))
+    return client_factory
+
+
+def get_ocr_runner(client_factory: Callable[[], OcrClient]) -> ParallelOcrRunner:
+    """
+    The process-wide runner for an OCR engine, created on first use
+
+    Sized from settings.ocr_workers / settings.ocr_memory_limit_mb. Runners
+    of other engines that are idle are stopped when a new one starts, so
+    the memory budget isn't multiplied by the number of languages seen.
+
+    Args:
+        client_factory: Picklable zero-argument callable returning the client
+    """
+    key = _factory_key(client_factory)
+    with _runners_lock:
+        runner = _runners.get(key)
+        if runner is not None:
+            return runner
+
+        for other_key, other in list(_runners.items()):
+            if not other.busy:
+                other.close()
+                del _runners[other_key]
+
+        from config.settings import settings
+        runner = _runners[key] = ParallelOcrRunner(
+            client_factory,
+            workers=settings.ocr_workers,
+            memory_limit_mb=settings.ocr_memory_limit_mb,
+        )
+        return runner
+
+
+def shutdown_ocr_runners() -> None:
+    """Stop all process-wide OCR workers (next use starts new ones)"""
+    with _runners_lock:
+        runners = list(_runners.values())
+        _runners.clear()
+    for runner in runners:
+        runner.close()
@@ -6,12 +6,16 @@ Converts PDF pages to images and processes with OCR.
 """
 
 import fitz  # PyMuPDF
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Dict
-from dataclasses import dataclass
-from io import BytesIO
+from typing import Any, Callable, List, Optional, Dict
+from dataclasses import asdict, dataclass
+
+from core.cache.page_cache import PageCache, compute_page_key, default_page_cache, page_fingerprint
 
 from .base import OcrClient, OcrError
+from .parallel import ParallelOcrRunner, ProgressCallback, get_ocr_runner, resolve_worker_count
+from .raster import adaptive_dpi, encode_pixmap, pixmap_array, rasterize
 
 from config.logging_config import get_logger
 logger = get_logger(__name__)
@@ -26,6 +30,100 @@ class OcrPage:
     confidence: float
     blocks: List[Dict]
     metadata: Dict
+    cached: bool = False  # Served from the page cache
+
+
+def render_page(page: fitz.Page, dpi: int, image_format: str = "PNG") -> bytes:
+    """
+    Convert PDF page to image bytes
+
+    Args:
+        page: PyMuPDF page object
+        dpi: Render resolution
+        image_format: "PNG" or "JPEG"
+
+    Returns:
+        Image bytes (PNG or JPEG)
+    """
+    return encode_pixmap(rasterize(page, dpi), image_format)
+
+
+def _accepts_pixels(ocr_client: OcrClient) -> bool:
+    # Looked up on the class so mocks don't claim support for every method
+    return callable(getattr(type(ocr_client), "extract_structured_pixels", None))
+
+
+def ocr_page(
+    ocr_client: OcrClient,
+    page: fitz.Page,
+    dpi: int,
+    image_format: str = "PNG",
+    mode: str = "document",
+    language: Optional[str] = None,
+    min_dpi: Optional[int] = None,
+) -> OcrPage:
+    """
+    Render and OCR one PDF page
+
+    Clients with `extract_structured_pixels` (PaddleOCR) get the rendered
+    pixels directly; others get encoded image bytes.
+
+    Args:
+        ocr_client: OCR client
+        page: PyMuPDF page object
+        dpi: Render resolution (upper bound with adaptive DPI)
+        image_format: Encoding for clients that need image bytes
+        mode: OCR mode
+        language: Language hint
+        min_dpi: Enable adaptive DPI down to this resolution (None = fixed `dpi`)
+
+    Returns:
+        OcrPage; OCR failures give an empty page with metadata["error"]
+    """
+    if min_dpi is not None:
+        dpi = adaptive_dpi(page, max_dpi=dpi, min_dpi=min_dpi)
+    try:
+        pix = rasterize(page, dpi)
+        if _accepts_pixels(ocr_client):
+            ocr_result = ocr_client.extract_structured_pixels(
+                pixmap_array(pix), mode=mode, language=language
+            )
+        else:
+            ocr_result = ocr_client.extract_structured(
+                image_bytes=encode_pixmap(pix, image_format),
+                mode=mode,
+                language=language
+            )
+        del pix
+    except Exception as e:
+        # Any engine failure costs only this page, not the document
+        return OcrPage(
+            page_num=page.number,
+            text="",
+            confidence=0.0,
+            blocks=[],
+            metadata={"error": str(e), "dpi": dpi}
+        )
+
+    return OcrPage(
+        page_num=page.number,
+        text=ocr_result.get("text", ""),
+        confidence=ocr_result.get("confidence", 0.0),
+        blocks=ocr_result.get("blocks", []),
+        metadata={**ocr_result.get("metadata", {}), "dpi": dpi}
+    )
+
+
+def _worker_factory(ocr_client: OcrClient) -> Optional[Callable[[], OcrClient]]:
+    """Picklable factory that rebuilds `ocr_client` in a worker process"""
+    try:
+        from .paddle_client import PaddleOcrClient
+    except ImportError:
+        return None
+    # Exact type: subclasses / wrappers may carry state a factory can't rebuild
+    if type(ocr_client) is PaddleOcrClient:
+        return partial(PaddleOcrClient, lang=ocr_client.lang)
+    return None
 
 
 class OcrPipeline:
@@ -35,6 +133,10 @@ class OcrPipeline:
     Features:
     - PDF to image conversion
     - Per-page OCR processing
+    - Page-parallel OCR on a pool of warm worker processes (local engines),
+      shared by every pipeline in the process unless `workers` is given
+    - Page cache: pages OCRed before with the same engine and settings are
+      not OCRed again
     - Progress tracking
     - Error recovery
 
@@ -48,14 +150,29 @@ class OcrPipeline:
 
         for page in pages:
             logger.info(f"Page {page.page_num + 1}: {len(page.text)} chars")
+
+        # Dedicated workers, kept warm across several documents
+        with OcrPipeline(PaddleOcrClient(lang='ja'), workers=4) as pipeline:
+            for path in paths:
+                pages = pipeline.process_pdf(path)
     """
 
+    # Documents shorter than this are OCRed in-process: starting workers
+    # (and loading a model in each) costs more than it saves
+    MIN_PARALLEL_PAGES = 8
+
     def __init__(
         self,
         ocr_client: OcrClient,
         dpi: int = 300,  # Image resolution for OCR
         image_format: str = "PNG",
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        workers: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        client_factory: Optional[Callable[[], OcrClient]] = None,
+        adaptive: Optional[bool] = None,
+        min_dpi: Optional[int] = None,
+        page_cache: Optional[PageCache] = None,
     ):
         """
         Initialize OCR pipeline
@@ -65,25 +182,73 @@ class OcrPipeline:
             dpi: DPI for PDF-to-image conversion (higher = better quality)
             image_format: Image format for OCR ("PNG", "JPEG")
             language: Default language hint for OCR
+            workers: Dedicated OCR processes for PDFs (0 = one per CPU,
+                     1 = in-process; default: the process-wide pool sized
+                     from settings.ocr_workers)
+            memory_limit_mb: Memory budget for all OCR processes, caps the
+                             worker count (0 = none; default: settings.ocr_memory_limit_mb)
+            client_factory: Picklable callable building the client inside a
+                            worker. Derived automatically for PaddleOcrClient;
+                            other clients stay in-process unless given one.
+            adaptive: Pick each page's DPI from its text size, at most `dpi`
+                      (default: settings.ocr_adaptive_dpi)
+            min_dpi: Lowest adaptive DPI (default: settings.ocr_min_dpi)
+            page_cache: Cache of OCRed pages (default: the shared one, if
+                        settings.page_cache_enabled)
         """
         self.ocr_client = ocr_client
         self.dpi = dpi
         self.image_format = image_format
         self.language = language
 
+        from config.settings import settings
+        # No explicit count: use the process-wide workers (get_ocr_runner)
+        self._shared_workers = workers is None
+        workers = settings.ocr_workers if workers is None else workers
+        memory_limit_mb = settings.ocr_memory_limit_mb if memory_limit_mb is None else memory_limit_mb
+        adaptive = settings.ocr_adaptive_dpi if adaptive is None else adaptive
+        # None = fixed DPI
+        self.min_dpi = (settings.ocr_min_dpi if min_dpi is None else min_dpi) if adaptive else None
+        self.client_factory = client_factory or _worker_factory(ocr_client)
+        self.workers = resolve_worker_count(workers, memory_limit_mb) if self.client_factory else 1
+        self._runner: Optional[ParallelOcrRunner] = None
+        self._keep_workers = False
+        self.page_cache = page_cache if page_cache is not None else default_page_cache()
+
+    def __enter__(self) -> "OcrPipeline":
+        self._keep_workers = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._keep_workers = False
+        self.close()
+
+    def close(self) -> None:
+        """Stop this pipeline's dedicated OCR worker processes (if any)"""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
     def process_pdf(
         self,
         pdf_path: Path,
         page_range: Optional[tuple] = None,
-        mode: str = "document"
+        mode: str = "document",
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> List[OcrPage]:
         """
         Process entire PDF with OCR
 
+        Pages found in the page cache are not OCRed again. The rest use the
+        worker pool when more than one worker is configured and there are
+        enough of them; pages come back in order either way.
+
         Args:
             pdf_path: Path to PDF file
             page_range: Optional (start, end) page range (0-indexed)
             mode: OCR mode ("document", "handwriting")
+            progress_callback: Called as (pages_done, total_pages); from a
+                               pool thread when running in parallel
 
         Returns:
             List of OcrPage results
@@ -103,55 +268,141 @@ class OcrPipeline:
         # Determine page range
         total_pages = doc.page_count
         start_page, end_page = page_range if page_range else (0, total_pages)
-        start_page = max(0, start_page)
-        end_page = min(total_pages, end_page)
-
-        logger.info(f"Processing {end_page - start_page} pages with OCR (DPI: {self.dpi})...")
+        page_numbers = list(range(max(0, start_page), min(total_pages, end_page)))
 
-        ocr_pages = []
+        results: Dict[int, OcrPage] = {}
+        keys: Dict[int, str] = {}
+        try:
+            if self.page_cache is not None:
+                fields = self._cache_key_fields(mode)
+                keys = {n: compute_page_key(page_fingerprint(doc[n]), "ocr", **fields) for n in page_numbers}
+                cached = self.page_cache.get_many(list(keys.values()))
+                for page_num in page_numbers:
+                    hit = cached.get(keys[page_num])
+                    if hit is not None:
+                        results[page_num] = OcrPage(**{**hit, "page_num": page_num, "cached": True})
+                if results:
+                    logger.info(f"{len(results)}/{len(page_numbers)} pages from page cache")
+
+            pending = [n for n in page_numbers if n not in results]
+            hits = len(results)
+
+            def on_progress(done: int, _total: int) -> None:
+                progress_callback(hits + done, len(page_numbers))
+
+            if pending:
+                ocr_pages = self._ocr_pages(doc, pdf_path, pending, mode, on_progress if progress_callback else None)
+            else:
+                ocr_pages = []
+                if progress_callback:
+                    progress_callback(len(page_numbers), len(page_numbers))
+        finally:
+            doc.close()
+
+        new_entries = []
+        for page in ocr_pages:
+            results[page.page_num] = page
+            # Failed pages are retried next time, not cached
+            if keys and "error" not in page.metadata:
+                value = asdict(page)
+                del value["page_num"], value["cached"]
+                new_entries.append({"key": keys[page.page_num], "value": value, "extractor": "ocr"})
+        if new_entries:
+            self.page_cache.set_many(new_entries)
+
+        return [results[n] for n in page_numbers]
+
+    def _cache_key_fields(self, mode: str) -> Dict[str, Any]:
+        """What a cached page OCR depends on besides the page itself"""
+        client_lang = getattr(self.ocr_client, "lang", None)
+        return {
+            "dpi": self.dpi,
+            "language": self.language,
+            "model": f"{type(self.ocr_client).__qualname__}:{client_lang if isinstance(client_lang, str) else ''}",
+            "min_dpi": self.min_dpi,
+            "mode": mode,
+            "image_format": None if _accepts_pixels(self.ocr_client) else self.image_format,
+        }
 
-        for page_num in range(start_page, end_page):
+    def _ocr_pages(
+        self,
+        doc: fitz.Document,
+        pdf_path: Path,
+        page_numbers: List[int],
+        mode: str,
+        progress_callback: Optional[ProgressCallback],
+    ) -> List[OcrPage]:
+        """OCR pages on the worker pool if worthwhile, otherwise in-process"""
+        if self.workers > 1 and len(page_numbers) >= self.MIN_PARALLEL_PAGES:
+            logger.info(
+                f"Processing {len(page_numbers)} pages with OCR "
+                f"(DPI: {self.dpi}, {self.workers} worker processes)..."
+            )
             try:
-                logger.debug(f"Processing page {page_num + 1}/{total_pages}...")
+                return self._process_parallel(pdf_path, page_numbers, mode, progress_callback)
+            except OcrError as e:
+                logger.warning(f"Parallel OCR unavailable ({e}), continuing in-process")
 
-                # Convert page to image
-                image_bytes = self._page_to_image(doc[page_num])
+        logger.info(f"Processing {len(page_numbers)} pages with OCR (DPI: {self.dpi})...")
 
-                # Process with OCR
-                ocr_result = self.ocr_client.extract_structured(
-                    image_bytes=image_bytes,
-                    mode=mode,
-                    language=self.language
-                )
+        ocr_pages = []
 
-                # Create OcrPage
-                ocr_page = OcrPage(
-                    page_num=page_num,
-                    text=ocr_result.get("text", ""),
-                    confidence=ocr_result.get("confidence", 0.0),
-                    blocks=ocr_result.get("blocks", []),
-                    metadata=ocr_result.get("metadata", {})
-                )
+        for page_num in page_numbers:
+            logger.debug(f"Processing page {page_num + 1}/{doc.page_count}...")
 
-                ocr_pages.append(ocr_page)
+            result = ocr_page(
+                self.ocr_client,
+                doc[page_num],
+                dpi=self.dpi,
+                image_format=self.image_format,
+                mode=mode,
+                language=self.language,
+                min_dpi=self.min_dpi,
+            )
+            ocr_pages.append(result)
 
-                logger.info(f" ({len(ocr_page.text)} chars, {ocr_page.confidence:.1%} confidence)")
+            if "error" in result.metadata:
+                logger.info(f"✗ OCR failed: {result.metadata['error']}")
+            else:
+                logger.info(f" ({len(result.text)} chars, {result.confidence:.1%} confidence)")
 
-            except OcrError as e:
-                logger.info(f"✗ OCR failed: {e}")
-                # Create empty page on error
-                ocr_pages.append(OcrPage(
-                    page_num=page_num,
-                    text="",
-                    confidence=0.0,
-                    blocks=[],
-                    metadata={"error": str(e)}
-                ))
-
-        doc.close()
+            if progress_callback:
+                progress_callback(len(ocr_pages), len(page_numbers))
 
         return ocr_pages
 
+    def _process_parallel(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        mode: str,
+        progress_callback: Optional[ProgressCallback],
+    ) -> List[OcrPage]:
+        """
+        OCR pages on the process-wide pool, or on dedicated workers (kept
+        open inside `with pipeline:`)
+        """
+        if self._shared_workers:
+            runner = get_ocr_runner(self.client_factory)
+        else:
+            if self._runner is None:
+                self._runner = ParallelOcrRunner(self.client_factory, workers=self.workers)
+            runner = self._runner
+        try:
+            return list(runner.iter_pdf(
+                pdf_path,
+                pages=page_numbers,
+                dpi=self.dpi,
+                image_format=self.image_format,
+                mode=mode,
+                language=self.language,
+                min_dpi=self.min_dpi,
+                progress_callback=progress_callback,
+            ))
+        finally:
+            if not self._keep_workers:
+                self.close()
+
     def process_image(
         self,
         image_path: Path,
@@ -197,19 +448,7 @@ class OcrPipeline:
         Returns:
             Image bytes (PNG or JPEG)
         """
-        # Render page to pixmap
-        mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)  # Scale matrix
-        pix = page.get_pixmap(matrix=mat)
-
-        # Convert to bytes
-        if self.image_format.upper() == "PNG":
-            image_bytes = pix.tobytes("png")
-        elif self.image_format.upper() == "JPEG":
-            image_bytes = pix.tobytes("jpeg")
-        else:
-            raise ValueError(f"Unsupported image format: {self.image_format}")
-
-        return image_bytes
+        return render_page(page, self.dpi, self.image_format)
 
     def merge_pages_to_text(self, ocr_pages: List[OcrPage]) -> str:
         """
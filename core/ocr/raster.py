@@ -0,0 +1,128 @@
+"""
+Page Rasterization
+
+Turns PDF pages into OCR input without an image codec in between:
+
+- `rasterize()` renders a page to an RGB pixmap (no alpha)
+- `pixmap_array()` exposes the pixmap samples as an H x W x 3 uint8 NumPy
+  array *without copying* - local engines (PaddleOCR) take it directly
+- `encode_pixmap()` produces PNG/JPEG bytes, only needed for clients that
+  want an image file (remote APIs)
+- `adaptive_dpi()` picks a per-page resolution from the text size, so pages
+  set in large type are not rendered (and OCRed) at full resolution
+
+Example:
+    pix = rasterize(page, adaptive_dpi(page, max_dpi=300))
+    result = client.extract_structured_pixels(pixmap_array(pix))
+"""
+
+import statistics
+from typing import TYPE_CHECKING, Optional
+
+import fitz  # PyMuPDF
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Height in pixels PaddleOCR's recognizer resizes text lines to; rendering
+# lines taller than this only costs time and memory
+TARGET_LINE_PX = 48
+
+# Line height relative to font size
+LINE_HEIGHT_FACTOR = 1.2
+
+# Resolution of the low-res render used to measure text on scanned pages
+PROBE_DPI = 72
+
+
+def rasterize(page: fitz.Page, dpi: int) -> fitz.Pixmap:
+    """Render a page to an RGB pixmap at `dpi`"""
+    return page.get_pixmap(dpi=dpi, colorspace=fitz.csRGB, alpha=False)
+
+
+def pixmap_array(pix: fitz.Pixmap) -> "np.ndarray":
+    """
+    View pixmap samples as an (height, width, channels) uint8 array
+
+    The array shares memory with the pixmap: keep `pix` alive while the
+    array is in use and don't write to it.
+    """
+    # NumPy ships with the OCR engines; imported here so that core.ocr
+    # loads without them
+    import numpy as np
+
+    samples = np.frombuffer(pix.samples_mv, dtype=np.uint8)
+    if pix.stride != pix.width * pix.n:
+        # Padded rows: view the full stride, then drop the padding
+        return samples.reshape(pix.height, pix.stride)[:, :pix.width * pix.n].reshape(pix.height, pix.width, pix.n)
+    return samples.reshape(pix.height, pix.width, pix.n)
+
+
+def encode_pixmap(pix: fitz.Pixmap, image_format: str = "PNG") -> bytes:
+    """Encode a pixmap as PNG or JPEG bytes"""
+    if image_format.upper() == "PNG":
+        return pix.tobytes("png")
+    if image_format.upper() == "JPEG":
+        return pix.tobytes("jpeg")
+    raise ValueError(f"Unsupported image format: {image_format}")
+
+
+def text_line_height(page: fitz.Page) -> Optional[float]:
+    """
+    Typical text line height of a page in points
+
+    Uses font sizes from the text layer when there is one, otherwise
+    measures ink rows on a low-resolution grayscale render (scans).
+
+    Returns:
+        Median line height, or None if no text was found
+    """
+    sizes = [
+        span["size"]
+        # Text only: with images included this decodes every scan
+        for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]
+        for line in block.get("lines", ())
+        for span in line["spans"]
+        if span["text"].strip()
+    ]
+    if sizes:
+        return statistics.median(sizes) * LINE_HEIGHT_FACTOR
+
+    import numpy as np
+
+    pix = page.get_pixmap(dpi=PROBE_DPI, colorspace=fitz.csGRAY, alpha=False)
+    gray = pixmap_array(pix)[:, :, 0]
+    # Rows with ink across at least 1% of the width
+    ink_rows = ((gray < 128).mean(axis=1) > 0.01).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], ink_rows, [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    # Single-pixel runs are rules / noise, not text
+    keep = ends - starts > 1
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) >= 2:
+        # Line pitch (baseline to baseline), comparable to font size * 1.2
+        pitch_px = float(np.median(np.diff(starts)))
+    elif len(starts) == 1:
+        pitch_px = float(ends[0] - starts[0]) * LINE_HEIGHT_FACTOR
+    else:
+        return None
+    return pitch_px * 72 / PROBE_DPI
+
+
+def adaptive_dpi(page: fitz.Page, max_dpi: int, min_dpi: int = 100) -> int:
+    """
+    Lowest DPI that renders the page's text lines at about TARGET_LINE_PX
+
+    Args:
+        page: PDF page
+        max_dpi: Upper bound (the configured OCR DPI)
+        min_dpi: Lower bound
+
+    Returns:
+        DPI in [min_dpi, max_dpi]; max_dpi when no text size can be measured
+    """
+    line_pt = text_line_height(page)
+    if not line_pt:
+        return max_dpi
+    dpi = int(TARGET_LINE_PX * 72 / line_pt)
+    return max(min(min_dpi, max_dpi), min(dpi, max_dpi))
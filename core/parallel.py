@@ -55,6 +55,9 @@ class ProcessingStats:
     tokens_used: int = 0
     cache_hits: int = 0
     cache_misses: int = 0
+    coalesced_calls: int = 0   # saved by sharing an identical in-flight call
+    coalesced_tokens: int = 0
+    batched: int = 0           # translated by a provider batch API
 
     def update(self, task: Task):
         """Update stats from completed task"""
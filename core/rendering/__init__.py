@@ -6,12 +6,16 @@ Handles conversion of LaTeX equations to various output formats (OMML, MathML, e
 
 from .omml_converter import (
     latex_to_omml,
+    latex_to_omml_batch,
+    prefetch_omml,
     inject_omml_into_paragraph,
     strip_latex_delimiters
 )
 
 __all__ = [
     'latex_to_omml',
+    'latex_to_omml_batch',
+    'prefetch_omml',
     'inject_omml_into_paragraph',
     'strip_latex_delimiters',
 ]
@@ -69,6 +69,7 @@ from core.rendering.omml_converter import (
     latex_to_omml,
     inject_omml_as_display,
     is_pandoc_available,
+    prefetch_omml,
 )
 from core.rendering.inline import runs_or_plain
 
@@ -241,6 +242,13 @@ def render_docx_from_ast(
     if header_footer:
         _add_running_header_footer(doc, ast, title)
 
+    # Convert all display equations in one batch; _render_equation then
+    # finds them in the OMML cache
+    prefetch_omml([
+        block.latex for block in ast.blocks
+        if isinstance(block, Equation) and block.mode == EquationMode.DISPLAY
+    ])
+
     # Render each block
     for idx, block in enumerate(ast.blocks):
         try:
@@ -4,6 +4,14 @@ Phase 2.0.3b - OMML Equation Converter
 Converts LaTeX equations to OMML (Office Math Markup Language) for native Word math rendering.
 
 Uses pandoc to convert LaTeX → DOCX → extract OMML XML.
+
+Equations are converted in batches: one pandoc run converts many equations,
+each preceded by a marker paragraph, and the OMML is split back out at the
+markers. Conversions are cached in process and in the shared OmmlCache, so
+latex_to_omml_batch() can be called up front for a whole document and the
+per-equation latex_to_omml() calls during rendering become lookups. Failed
+conversions are remembered in process too, so a bad equation costs one
+pandoc attempt per pandoc version rather than one per render.
 """
 
 import subprocess
@@ -11,12 +19,36 @@ import tempfile
 import os
 import re
 import logging
-from typing import Optional
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 from lxml import etree
-from docx import Document as DocxDocument
 
 logger = logging.getLogger(__name__)
 
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_M_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/math}'
+
+# Marker paragraph written before each equation of a batch (plain letters
+# and digits: nothing LaTeX would interpret)
+_MARKER = 'OMMLEQ'
+_MARKER_RE = re.compile(rf'^{_MARKER}(\d+)$')
+
+# Extra pandoc time allowed per equation of a batch (seconds)
+_PER_EQUATION_TIMEOUT = 0.1
+
+# In-process conversions (LRU), in front of the persistent OmmlCache, keyed
+# by (pandoc version, latex); None records a failed conversion
+_MEMO_SIZE = 8192
+_memo: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+class _PandocMissing(Exception):
+    """pandoc executable not found"""
+
 
 def strip_latex_delimiters(latex_str: str) -> str:
     """
@@ -64,10 +96,9 @@ def latex_to_omml(latex_str: str, timeout: int = 5) -> Optional[str]:
 
     Process:
         1. Strip LaTeX delimiters ($, $$, etc.)
-        2. Create temporary .tex file
-        3. Call pandoc to convert .tex → .docx
-        4. Extract OMML XML from generated DOCX
-        5. Return OMML XML string
+        2. Return the cached conversion if there is one
+        3. Otherwise convert it with pandoc (a batch of one, see
+           latex_to_omml_batch) and cache the result
 
     Args:
         latex_str: LaTeX equation with or without delimiters
@@ -93,112 +124,250 @@ def latex_to_omml(latex_str: str, timeout: int = 5) -> Optional[str]:
         >>> latex_to_omml(r"$\\invalid{command}$")  # Invalid LaTeX
         None
     """
-    tex_path = None
-    docx_path = None
-
     try:
-        # 1. Strip delimiters
-        clean_latex = strip_latex_delimiters(latex_str)
-
-        if not clean_latex:
+        if not strip_latex_delimiters(latex_str):
             logger.warning("Empty LaTeX string after stripping delimiters")
             return None
 
-        # 2. Create temporary LaTeX file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.tex',
-            delete=False,
-            encoding='utf-8'
-        ) as tex_file:
-            # Wrap in display math delimiters for pandoc
-            tex_content = f"$${clean_latex}$$"
-            tex_file.write(tex_content)
-            tex_path = tex_file.name
+        omml_xml = latex_to_omml_batch([latex_str], timeout=timeout)[0]
+        if omml_xml is None:
+            logger.debug(f"No OMML produced for: {latex_str[:50]}...")
+        return omml_xml
+
+    except Exception as e:
+        logger.error(f"Unexpected error in latex_to_omml: {e}")
+        return None
+
+
+def latex_to_omml_batch(
+    latex_list: Sequence[str],
+    timeout: int = 5,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    cache=None
+) -> List[Optional[str]]:
+    """
+    Convert many LaTeX equations to OMML XML.
+
+    Duplicates are converted once and cached conversions (and failures)
+    are reused; the rest are split into batches of `batch_size` equations, one pandoc run
+    per batch, with up to `workers` pandoc processes at a time.
+
+    Args:
+        latex_list: LaTeX equations with or without delimiters
+        timeout: Pandoc timeout per run in seconds (plus a small allowance
+                 per equation of the batch)
+        batch_size: Equations per pandoc run (default: settings.omml_batch_size)
+        workers: Concurrent pandoc processes (default: settings.omml_workers,
+                 0 = one per CPU)
+        cache: OmmlCache to use (default: the shared cache, if enabled)
+
+    Returns:
+        OMML XML string or None (conversion failed) per input equation
+
+    Example:
+        >>> omml = latex_to_omml_batch([eq.latex for eq in equations])
+    """
+    from config.settings import settings
+    from core.cache.omml_cache import compute_omml_key, default_omml_cache
+
+    cleaned = [strip_latex_delimiters(latex) for latex in latex_list]
+    pending = [latex for latex in dict.fromkeys(cleaned) if latex]
+    results: Dict[str, Optional[str]] = {}
+    version = pandoc_version() if pending else ''
+
+    with _memo_lock:
+        for latex in pending:
+            if (version, latex) in _memo:
+                _memo.move_to_end((version, latex))
+                results[latex] = _memo[(version, latex)]
+    pending = [latex for latex in pending if latex not in results]
+
+    if cache is None:
+        cache = default_omml_cache()
+
+    if pending and cache is not None:
+        keys = {latex: compute_omml_key(latex, version) for latex in pending}
+        found = cache.get_many(list(keys.values()))
+        for latex, key in keys.items():
+            if key in found:
+                results[latex] = found[key]
+        _remember(version, {latex: results[latex] for latex in pending if latex in results})
+        pending = [latex for latex in pending if latex not in results]
+
+    if pending and is_pandoc_available():
+        size = max(1, batch_size or settings.omml_batch_size)
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+        workers = workers if workers is not None else settings.omml_workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+
+        converted: Dict[str, Optional[str]] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+                for batch_result in pool.map(lambda batch: _convert_batch(batch, timeout), batches):
+                    converted.update(batch_result)
+        except _PandocMissing:
+            logger.error("Pandoc not found - OMML rendering unavailable. Install pandoc or use equation_rendering_mode='latex'")
+            converted = {}
+
+        succeeded = {latex: omml for latex, omml in converted.items() if omml}
+        results.update(succeeded)
+        # Failures stay in process only: a later pandoc may convert them
+        _remember(version, {latex: omml or None for latex, omml in converted.items()})
+        if cache is not None and succeeded:
+            cache.set_many([(compute_omml_key(latex, version), omml) for latex, omml in succeeded.items()])
+
+        logger.debug(f"Converted {len(succeeded)}/{len(pending)} equations to OMML in {len(batches)} pandoc run(s)")
+
+    return [results.get(latex) if latex else None for latex in cleaned]
+
+
+def prefetch_omml(latex_list: Sequence[str]) -> int:
+    """
+    Convert a document's equations ahead of rendering.
+
+    Renderers call latex_to_omml() once per equation; calling this first
+    with all of them turns those calls into cache lookups. Never raises.
+
+    Returns:
+        Number of equations with OMML available
+    """
+    if not latex_list or not is_pandoc_available():
+        return 0
+    try:
+        return sum(1 for omml in latex_to_omml_batch(latex_list) if omml)
+    except Exception as e:
+        logger.warning(f"OMML prefetch failed, equations will be converted one by one: {e}")
+        return 0
+
+
+def _remember(version: str, conversions: Dict[str, Optional[str]]) -> None:
+    """Add conversions (None = failed) made with pandoc `version` to the in-process LRU"""
+    with _memo_lock:
+        for latex, omml in conversions.items():
+            _memo[(version, latex)] = omml
+            _memo.move_to_end((version, latex))
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
 
-        # 3. Create temporary output DOCX path
-        docx_path = tex_path.replace('.tex', '.docx')
+def _convert_batch(latex_list: List[str], timeout: int) -> Dict[str, Optional[str]]:
+    """
+    Convert one batch with pandoc.
+
+    A batch that pandoc rejects (or that loses a marker, e.g. to an
+    unbalanced brace swallowing the next paragraph) is split in half and
+    retried, so one bad equation costs O(log n) extra runs instead of
+    failing its neighbours.
+    """
+    converted = _run_pandoc_batch(latex_list, timeout)
+    if converted is not None:
+        return converted
+    if len(latex_list) == 1:
+        return {latex_list[0]: None}
+
+    middle = len(latex_list) // 2
+    converted = _convert_batch(latex_list[:middle], timeout)
+    converted.update(_convert_batch(latex_list[middle:], timeout))
+    return converted
+
+
+def _run_pandoc_batch(latex_list: List[str], timeout: int) -> Optional[Dict[str, Optional[str]]]:
+    """
+    One pandoc run over a batch of equations.
+
+    Returns:
+        {latex: omml or None} (None = pandoc produced no math for it), or
+        None when the run itself failed
+
+    Raises:
+        _PandocMissing: pandoc executable not found
+    """
+    tex_content = "\n\n".join(
+        f"{_MARKER}{i}\n\n$${latex}$$" for i, latex in enumerate(latex_list)
+    )
+    run_timeout = timeout + _PER_EQUATION_TIMEOUT * len(latex_list)
+
+    with tempfile.TemporaryDirectory(prefix='omml_') as tmp_dir:
+        tex_path = os.path.join(tmp_dir, 'equations.tex')
+        docx_path = os.path.join(tmp_dir, 'equations.docx')
+        with open(tex_path, 'w', encoding='utf-8') as tex_file:
+            tex_file.write(tex_content)
 
-        # 4. Call pandoc subprocess
         try:
             result = subprocess.run(
                 ['pandoc', '-f', 'latex', '-t', 'docx', tex_path, '-o', docx_path],
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=run_timeout
             )
-
-            if result.returncode != 0:
-                logger.debug(f"Pandoc conversion failed (exit {result.returncode}): {result.stderr[:100]}")
-                return None
-
         except subprocess.TimeoutExpired:
-            logger.warning(f"Pandoc timeout ({timeout}s) for LaTeX: {latex_str[:50]}...")
+            logger.warning(f"Pandoc timeout ({run_timeout:.1f}s) for {len(latex_list)} equation(s): {latex_list[0][:50]}...")
             return None
-
         except FileNotFoundError:
-            logger.error("Pandoc not found - OMML rendering unavailable. Install pandoc or use equation_rendering_mode='latex'")
+            raise _PandocMissing()
+
+        if result.returncode != 0:
+            logger.debug(f"Pandoc conversion failed (exit {result.returncode}): {result.stderr[:100]}")
             return None
 
-        # 5. Check if DOCX was created
         if not os.path.exists(docx_path):
             logger.warning("Pandoc did not create output DOCX")
             return None
 
-        # 6. Extract OMML XML from generated DOCX
         try:
-            doc = DocxDocument(docx_path)
+            with zipfile.ZipFile(docx_path) as docx:
+                document = etree.fromstring(docx.read('word/document.xml'))
         except Exception as e:
-            logger.warning(f"Failed to open generated DOCX: {e}")
-            return None
-
-        if len(doc.paragraphs) == 0:
-            logger.warning("Generated DOCX has no paragraphs")
-            return None
-
-        # Get first paragraph's XML element
-        para_elem = doc.paragraphs[0]._element
-
-        # Find <m:oMath> elements (OMML namespace)
-        omml_ns = '{http://schemas.openxmlformats.org/officeDocument/2006/math}'
-        omath_elems = para_elem.findall(f'.//{omml_ns}oMath')
-
-        if not omath_elems:
-            logger.debug(f"No OMML elements found in generated DOCX for: {latex_str[:50]}...")
+            logger.warning(f"Failed to read generated DOCX: {e}")
             return None
 
-        # 7. Serialize OMML XML to string
-        try:
-            omml_xml = etree.tostring(omath_elems[0], encoding='unicode')
-        except Exception as e:
-            logger.warning(f"Failed to serialize OMML XML: {e}")
-            return None
+    return _split_at_markers(document, latex_list)
 
-        # 8. Validate XML structure (basic check)
-        if '<m:oMath' not in omml_xml:
-            logger.warning("Generated XML does not contain expected OMML structure")
-            return None
 
-        logger.debug(f"Successfully converted LaTeX to OMML ({len(omml_xml)} chars)")
-        return omml_xml
+def _split_at_markers(document, latex_list: List[str]) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Assign the first <m:oMath> after each marker paragraph to its equation.
 
-    except Exception as e:
-        logger.error(f"Unexpected error in latex_to_omml: {e}")
+    Returns:
+        {latex: omml or None}, or None if any marker is missing
+    """
+    body = document.find(f'{_W_NS}body')
+    if body is None:
         return None
 
-    finally:
-        # Cleanup temporary files
-        if tex_path and os.path.exists(tex_path):
+    converted: Dict[str, Optional[str]] = {}
+    seen = set()
+    current = None
+    for para in body.iter(f'{_W_NS}p'):
+        text = ''.join(t.text or '' for t in para.iter(f'{_W_NS}t')).strip()
+        match = _MARKER_RE.match(text)
+        if match:
+            current = int(match.group(1))
+            seen.add(current)
+            continue
+        if current is None or current >= len(latex_list) or latex_list[current] in converted:
+            continue
+
+        omath_elems = para.findall(f'.//{_M_NS}oMath')
+        if omath_elems:
             try:
-                os.unlink(tex_path)
+                omml_xml = etree.tostring(omath_elems[0], encoding='unicode')
             except Exception as e:
-                logger.warning(f"Failed to delete temp .tex file: {e}")
+                logger.warning(f"Failed to serialize OMML XML: {e}")
+                omml_xml = None
+            # Validate XML structure (basic check)
+            if omml_xml and '<m:oMath' in omml_xml:
+                converted[latex_list[current]] = omml_xml
+
+    if seen != set(range(len(latex_list))):
+        logger.debug(f"Pandoc output lost {len(latex_list) - len(seen)} equation marker(s)")
+        return None
 
-        if docx_path and os.path.exists(docx_path):
-            try:
-                os.unlink(docx_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp .docx file: {e}")
+    for latex in latex_list:
+        converted.setdefault(latex, None)
+    return converted
 
 
 def inject_omml_into_paragraph(para, omml_xml: str) -> bool:
@@ -345,6 +514,7 @@ def check_pandoc_available() -> bool:
 
 # Module-level pandoc availability check (cached)
 _PANDOC_AVAILABLE = None
+_PANDOC_VERSION = None
 
 
 def is_pandoc_available() -> bool:
@@ -365,3 +535,20 @@ def is_pandoc_available() -> bool:
         else:
             logger.warning("Pandoc not found - OMML rendering unavailable")
     return _PANDOC_AVAILABLE
+
+
+def pandoc_version() -> str:
+    """
+    Cached pandoc version string ("" if pandoc is unavailable).
+
+    Part of the OMML cache key: OMML output differs between pandoc releases.
+    """
+    global _PANDOC_VERSION
+    if _PANDOC_VERSION is None:
+        try:
+            result = subprocess.run(['pandoc', '--version'], capture_output=True, text=True, timeout=2)
+            first_line = result.stdout.splitlines()[0] if result.returncode == 0 and result.stdout else ''
+            _PANDOC_VERSION = first_line.strip()
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            _PANDOC_VERSION = ''
+    return _PANDOC_VERSION
@@ -403,9 +403,12 @@ class _PdfRenderer:
         out.append(_PB())
         return out
 
-    def toc_flowables(self) -> list:
+    def toc_flowables(self, entries: Optional[list] = None) -> list:
         """A localized heading + a real TableOfContents (page numbers resolved by
-        the multiBuild pass), followed by a page break."""
+        the multiBuild pass), followed by a page break.
+
+        With *entries* — ``(level, text, page)`` tuples whose pages are already
+        known — the TOC is pre-filled and a plain ``build`` suffices."""
         from reportlab.lib.styles import ParagraphStyle
         from reportlab.platypus import PageBreak as _PB
         from reportlab.platypus import Paragraph as _P
@@ -420,9 +423,24 @@ class _PdfRenderer:
             ParagraphStyle("toc3", fontName=self.font, fontSize=10, leading=14,
                            leftIndent=60, firstLineIndent=-20),
         ]
+        if entries is not None:
+            for level, text, page in entries:
+                toc.addEntry(level, text, page)
+            toc.beforeBuild()  # what multiBuild does between passes
         heading = _P(f"<b>{escape(self._toc_title())}</b>", self.headings[1])
         return [heading, toc, _PB()]
 
+    def body_flowables(self, blocks) -> list:
+        """Flowables for *blocks*; a block that fails to render is logged and
+        skipped."""
+        out: list = []
+        for block in blocks:
+            try:
+                out.extend(self.flowables_for(block))
+            except Exception as e:
+                logger.error("PDF render failed for block %s: %s", type(block).__name__, e)
+        return out
+
 
 def _make_footer(page_face: str, page_width_pt: float, bottom_margin_pt: float, skip_first: bool):
     """Build an onPage callback that draws a centered page number, skipping the
@@ -438,6 +456,23 @@ def _make_footer(page_face: str, page_width_pt: float, bottom_margin_pt: float,
     return _draw
 
 
+def _doc_kwargs(md, title: Optional[str]) -> dict:
+    """SimpleDocTemplate page geometry + document info from the AST metadata."""
+    from reportlab.lib.units import mm
+
+    return dict(
+        # Page size from metadata (defaults to A4) — parity with the legacy
+        # engine's page presets instead of a hardcoded A4.
+        pagesize=(md.page_width_mm * mm, md.page_height_mm * mm),
+        topMargin=md.margin_top_mm * mm,
+        bottomMargin=md.margin_bottom_mm * mm,
+        leftMargin=md.margin_left_mm * mm,
+        rightMargin=md.margin_right_mm * mm,
+        title=title or md.title or "",
+        author=md.author or "",
+    )
+
+
 def _toc_doc_template_cls():
     """A SimpleDocTemplate subclass that feeds heading flowables to the TOC (via
     ``notify('TOCEntry', …)``) so page numbers resolve during ``multiBuild``.
@@ -463,6 +498,7 @@ def render_pdf_from_ast(
     toc: bool = False,
     header_footer: bool = False,
     cover_template: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> None:
     """Render a DocumentAST to a PDF file.
 
@@ -472,12 +508,23 @@ def render_pdf_from_ast(
     layout (all default-off): ``title_page`` prepends a centered cover,
     ``toc`` inserts a real table of contents with page numbers (built via
     multiBuild), and ``header_footer`` adds a centered page-number footer (the
-    cover is left unnumbered)."""
-    from reportlab.lib.units import mm
+    cover is left unnumbered).
+
+    ``workers`` > 1 lays chapters (split at level-1 headings, each starting on
+    a new page) out in worker processes — see ``pdf_parallel``. When None,
+    long books use ``settings.pdf_render_workers``; short ones one pass."""
     from reportlab.platypus import SimpleDocTemplate, Spacer
 
+    from core.rendering import pdf_parallel
+
     output_path = Path(output_path)
 
+    if template:
+        import dataclasses
+
+        ast = dataclasses.replace(ast, styles=_stylesheet_for_template(template))
+    workers = pdf_parallel.chapter_workers(ast, workers)
+
     # Pre-built cover template: render the body WITHOUT the plain Platypus cover,
     # render the chosen template to its own page, and merge it in as page 1.
     # Default-safe: unknown template falls through to the normal cover path.
@@ -492,11 +539,19 @@ def render_pdf_from_ast(
             with tempfile.TemporaryDirectory() as _td:
                 body = Path(_td) / "body.pdf"
                 cover = Path(_td) / "cover.pdf"
+                _covers.render_cover_pdf(cover_template, ast.metadata, cover, title=title)
+                if workers > 1:
+                    # The chapter merge takes the cover as its first piece
+                    pdf_parallel.render_chapters(
+                        ast, output_path, workers, title=title, toc=toc,
+                        header_footer=header_footer, cover_pdf=cover,
+                    )
+                    logger.info("PDF saved with '%s' cover: %s", cover_template, output_path)
+                    return
                 render_pdf_from_ast(
-                    ast, body, title=title, template=template,
-                    title_page=False, toc=toc, header_footer=header_footer,
+                    ast, body, title=title, title_page=False, toc=toc,
+                    header_footer=header_footer, workers=1,
                 )
-                _covers.render_cover_pdf(cover_template, ast.metadata, cover, title=title)
                 writer = pypdf.PdfWriter()
                 for pg in pypdf.PdfReader(str(cover)).pages:
                     writer.add_page(pg)
@@ -509,12 +564,14 @@ def render_pdf_from_ast(
             return
         logger.warning("unknown cover_template %r; using default cover path", cover_template)
 
-    if template:
-        import dataclasses
-
-        ast = dataclasses.replace(ast, styles=_stylesheet_for_template(template))
+    if workers > 1:
+        pdf_parallel.render_chapters(
+            ast, output_path, workers, title=title, title_page=title_page,
+            toc=toc, header_footer=header_footer,
+        )
+        logger.info("PDF saved: %s", output_path)
+        return
 
-    output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     faces = _ensure_fonts()
@@ -522,35 +579,22 @@ def render_pdf_from_ast(
     md = ast.metadata
 
     doc_cls = _toc_doc_template_cls() if toc else SimpleDocTemplate
-    doc = doc_cls(
-        str(output_path),
-        # Page size from metadata (defaults to A4) — parity with the legacy
-        # engine's page presets instead of a hardcoded A4.
-        pagesize=(md.page_width_mm * mm, md.page_height_mm * mm),
-        topMargin=md.margin_top_mm * mm,
-        bottomMargin=md.margin_bottom_mm * mm,
-        leftMargin=md.margin_left_mm * mm,
-        rightMargin=md.margin_right_mm * mm,
-        title=title or md.title or "",
-        author=md.author or "",
-    )
+    doc = doc_cls(str(output_path), **_doc_kwargs(md, title))
 
     flowables: List = []
     if title_page:
         flowables.extend(renderer.title_page_flowables(title or md.title, md.author))
     if toc:
         flowables.extend(renderer.toc_flowables())
-    for block in ast.blocks:
-        try:
-            flowables.extend(renderer.flowables_for(block))
-        except Exception as e:
-            logger.error("PDF render failed for block %s: %s", type(block).__name__, e)
+    flowables.extend(renderer.body_flowables(ast.blocks))
 
     if not flowables:
         flowables.append(Spacer(1, 1))
 
     build_kwargs = {}
     if header_footer:
+        from reportlab.lib.units import mm
+
         footer = _make_footer(
             renderer.font, md.page_width_mm * mm, md.margin_bottom_mm * mm, skip_first=title_page
         )
@@ -0,0 +1,310 @@
+"""Chapter-parallel PDF rendering for ``render_pdf_from_ast``.
+
+A single ReportLab build lays the whole book out on one core, and with a
+table of contents ``multiBuild`` lays it out at least twice more. Here the
+AST is split at its level-1 headings and every chapter is built in a worker
+process of its own. A worker returns the chapter's page count and the
+``(level, text, page)`` of each h1–h3 heading, so the parent knows every
+chapter's page offset without laying anything out again:
+
+1. chapters render in parallel, each to its own temporary PDF;
+2. the front matter (title page + TOC, entries already numbered) is built
+   in one cheap pass — repeated only if the TOC turns out longer than
+   estimated;
+3. cover, front matter and chapters are concatenated with pypdf, and
+   page-number footers are stamped on during that merge.
+
+Each chapter starts on a new page. The pool is shared by every export in
+the process and created on first use (spawn context, like the text
+extraction pool), so later exports start on warm workers; if it breaks,
+the chapters are rendered in-process instead.
+
+Example:
+    workers = chapter_workers(ast, None)
+    if workers > 1:
+        render_chapters(ast, "book.pdf", workers, title_page=True, toc=True)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from core.rendering.document_ast import Block, DocumentAST, Heading
+
+logger = logging.getLogger(__name__)
+
+# Books with fewer blocks are rendered in one pass unless workers are given
+# explicitly: spawning workers and merging only pays off on long exports
+MIN_PARALLEL_BLOCKS = 1000
+
+# (level 0-2, plain heading text, page number)
+TocEntry = Tuple[int, str, int]
+
+
+def _resolve_workers(workers: int) -> int:
+    """Worker processes to use (0 = one per CPU)"""
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, workers)
+
+
+def split_chapters(blocks: List[Block]) -> List[List[Block]]:
+    """Split blocks before every level-1 heading (leading blocks form their
+    own chapter)."""
+    chapters: List[List[Block]] = []
+    for block in blocks:
+        if not chapters or (isinstance(block, Heading) and getattr(block.level, "value", 1) == 1 and chapters[-1]):
+            chapters.append([])
+        chapters[-1].append(block)
+    return chapters
+
+
+def chapter_workers(ast: DocumentAST, workers: Optional[int]) -> int:
+    """Worker processes ``render_pdf_from_ast`` should use for *ast*; 1 means
+    a single ReportLab pass.
+
+    Args:
+        ast: The document to render
+        workers: Explicit worker count (0 = one per CPU), or None to follow
+                 settings.pdf_render_workers for long books only
+    """
+    if workers is None:
+        if len(ast.blocks) < MIN_PARALLEL_BLOCKS:
+            return 1
+        from config.settings import settings
+
+        workers = settings.pdf_render_workers
+    workers = _resolve_workers(workers)
+    if workers <= 1:
+        return 1
+    chapters = len(split_chapters(ast.blocks))
+    return min(workers, chapters) if chapters > 1 else 1
+
+
+# -----------------------------------------------------------------------------
+# Worker process side
+# -----------------------------------------------------------------------------
+
+def render_chapter(ast: DocumentAST, output_path: str, title: Optional[str] = None) -> Tuple[int, List[TocEntry]]:
+    """Lay one chapter out to *output_path* (runs in a worker process).
+
+    Returns:
+        (page count, TOC entries with chapter-relative page numbers)
+    """
+    from reportlab.platypus import Spacer
+
+    from core.rendering.pdf_adapter import _PdfRenderer, _doc_kwargs, _ensure_fonts, _toc_doc_template_cls
+
+    entries: List[TocEntry] = []
+
+    class _ChapterDocTemplate(_toc_doc_template_cls()):
+        def notify(self, kind, stuff) -> None:
+            if kind == "TOCEntry":
+                entries.append(stuff)
+
+    renderer = _PdfRenderer(ast, _ensure_fonts())
+    doc = _ChapterDocTemplate(output_path, **_doc_kwargs(ast.metadata, title))
+    doc.build(renderer.body_flowables(ast.blocks) or [Spacer(1, 1)])
+    return doc.page, entries
+
+
+# -----------------------------------------------------------------------------
+# Parent process side
+# -----------------------------------------------------------------------------
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    The process-wide chapter rendering pool
+
+    Sized once, when created, from settings.pdf_render_workers (or `workers`
+    if larger); never resized afterwards, since that would cancel chapters
+    other exports have queued. _render_all() keeps each export to its own
+    worker count.
+
+    Args:
+        workers: Worker processes wanted by the first caller (already resolved)
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from config.settings import settings
+
+            size = max(_resolve_workers(settings.pdf_render_workers), workers or 1)
+            # spawn: forking a parent that runs an event loop and threads can
+            # deadlock the child
+            _pool = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context("spawn"))
+            logger.info("Started %d PDF chapter worker processes", size)
+        return _pool
+
+
+def shutdown_pdf_pool(wait: bool = True) -> None:
+    """Stop the chapter rendering workers (next use starts a new pool)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+            _pool = None
+
+
+def _render_all(asts: List[DocumentAST], paths: List[str], workers: int, title: Optional[str]) -> list:
+    """render_chapter() for every chapter, in the pool or (if it breaks) here."""
+    try:
+        pool = get_pdf_pool(workers)
+        # At most `workers` chapters in flight: the shared pool may be larger
+        results: list = [None] * len(asts)
+        pending = {}
+        for index, (chapter, path) in enumerate(zip(asts, paths)):
+            if len(pending) >= workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+            pending[pool.submit(render_chapter, chapter, path, title)] = index
+        for future, index in pending.items():
+            results[index] = future.result()
+        return results
+    except BrokenProcessPool as e:
+        logger.warning("PDF chapter workers failed (%s); rendering chapters in-process", e)
+        shutdown_pdf_pool(wait=False)
+        return [render_chapter(a, p, title) for a, p in zip(asts, paths)]
+
+
+def _estimate_toc_pages(renderer, entries: List[TocEntry], frame_height: float) -> int:
+    """Rough TOC page count from its line heights (verified after rendering)"""
+    toc = renderer.toc_flowables()[1]
+    height = renderer.headings[1].leading + sum(toc.getLevelStyle(level).leading for level, _, _ in entries)
+    return max(1, math.ceil(height / frame_height))
+
+
+def _render_front(renderer, md, output_path: str, title: Optional[str],
+                  title_page: bool, toc_entries: Optional[List[TocEntry]]) -> int:
+    """Build the title page / numbered TOC; returns its page count."""
+    from reportlab.platypus import SimpleDocTemplate
+
+    from core.rendering.pdf_adapter import _doc_kwargs
+
+    flowables: list = []
+    if title_page:
+        flowables.extend(renderer.title_page_flowables(title or md.title, md.author))
+    if toc_entries is not None:
+        flowables.extend(renderer.toc_flowables(toc_entries))
+    doc = SimpleDocTemplate(output_path, **_doc_kwargs(md, title))
+    doc.build(flowables)
+    return doc.page
+
+
+def _number_pages(writer, first: int, skip_first: bool, face: str, md) -> None:
+    """Stamp centered page numbers on writer pages[first:] (numbered from 1,
+    like the single-pass footer)."""
+    import io
+
+    import pypdf
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    width, height = md.page_width_mm * mm, md.page_height_mm * mm
+    pages = writer.pages[first:]
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=(width, height))
+    for number in range(1, len(pages) + 1):
+        if not (skip_first and number == 1):
+            c.setFont(face, 9)
+            c.drawCentredString(width / 2.0, max(md.margin_bottom_mm * mm / 2.0, 12.0), str(number))
+        c.showPage()
+    c.save()
+
+    overlay = pypdf.PdfReader(buf)
+    for number, page in enumerate(pages, start=1):
+        if not (skip_first and number == 1):
+            page.merge_page(overlay.pages[number - 1])
+
+
+def render_chapters(
+    ast: DocumentAST,
+    output_path: Path,
+    workers: int,
+    title: Optional[str] = None,
+    title_page: bool = False,
+    toc: bool = False,
+    header_footer: bool = False,
+    cover_pdf: Optional[Path] = None,
+) -> None:
+    """Render *ast* chapter by chapter in `workers` processes and merge.
+
+    Args:
+        ast: The document (stylesheet already chosen)
+        output_path: Where to write the merged PDF
+        workers: Worker processes (already resolved, > 1)
+        title, title_page, toc, header_footer: As for render_pdf_from_ast
+        cover_pdf: Pre-rendered cover page(s), merged first and unnumbered
+    """
+    import pypdf
+    from reportlab.lib.units import mm
+
+    from core.rendering.pdf_adapter import _PdfRenderer, _ensure_fonts
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    md = ast.metadata
+    chapters = split_chapters(ast.blocks)
+
+    with tempfile.TemporaryDirectory() as td:
+        paths = [str(Path(td) / f"chapter_{i:04d}.pdf") for i in range(len(chapters))]
+        asts = [dataclasses.replace(ast, blocks=blocks) for blocks in chapters]
+        results = _render_all(asts, paths, workers, title)
+
+        # Chapter-relative TOC entries -> offsets within the body
+        body_entries: List[TocEntry] = []
+        offset = 0
+        for pages, entries in results:
+            body_entries.extend((level, text, offset + page) for level, text, page in entries)
+            offset += pages
+
+        renderer = _PdfRenderer(ast, _ensure_fonts())
+        front_path = str(Path(td) / "front.pdf")
+        front_pages = 0
+        if title_page or toc:
+            frame_height = (md.page_height_mm - md.margin_top_mm - md.margin_bottom_mm) * mm
+            expected = int(title_page) + (_estimate_toc_pages(renderer, body_entries, frame_height) if toc else 0)
+            # TOC line breaks don't depend on the page numbers, so a wrong
+            # estimate is corrected by one re-render
+            for _ in range(2):
+                numbered = [(level, text, expected + page) for level, text, page in body_entries]
+                front_pages = _render_front(renderer, md, front_path, title, title_page,
+                                            numbered if toc else None)
+                if front_pages == expected:
+                    break
+                expected = front_pages
+
+        writer = pypdf.PdfWriter()
+        cover_pages = 0
+        if cover_pdf is not None:
+            for page in pypdf.PdfReader(str(cover_pdf)).pages:
+                writer.add_page(page)
+            cover_pages = len(writer.pages)
+        pieces = ([front_path] if front_pages else []) + paths
+        for path in pieces:
+            for page in pypdf.PdfReader(path).pages:
+                writer.add_page(page)
+
+        if header_footer:
+            _number_pages(writer, cover_pages, title_page, renderer.font, md)
+        writer.add_metadata({"/Title": title or md.title or "", "/Author": md.author or ""})
+        with open(output_path, "wb") as fh:
+            writer.write(fh)
+
+    logger.info("PDF rendered as %d chapters on %d workers (%d pages)",
+                len(chapters), workers, len(writer.pages))
@@ -13,11 +13,19 @@ Performance Impact:
 
 import logging
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import List, Optional, Set
 import fitz  # PyMuPDF
 
+from core.cache.page_cache import (
+    PageCache,
+    PageCacheStats,
+    compute_page_key,
+    default_page_cache,
+    page_fingerprint,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +55,8 @@ class PageAnalysis:
     char_count: int = 0
     sample_text: str = ""  # First 500 chars for content detection
 
+    cached: bool = False  # Served from the page cache
+
 
 @dataclass
 class DocumentAnalysis:
@@ -79,6 +89,10 @@ class DocumentAnalysis:
     estimated_time_vision: float = 0.0  # seconds
     estimated_cost_vision: float = 0.0  # USD
 
+    @property
+    def page_cache(self) -> PageCacheStats:
+        return PageCacheStats.of(self.pages)
+
 
 class DocumentAnalyzer:
     """
@@ -136,12 +150,18 @@ class DocumentAnalyzer:
         '学会', '紀要', '大学',                            # Academic institutions
     ]
 
-    def __init__(self, sample_pages: int = 10):
+    # Bump when _analyze_page output changes, so cached pages are redone
+    CACHE_VERSION = 1
+
+    def __init__(self, sample_pages: int = 10, page_cache: Optional[PageCache] = None):
         """
         Args:
             sample_pages: Number of pages to sample for quick analysis
+            page_cache: Cache of per-page analyses (default: the shared one,
+                        if settings.page_cache_enabled)
         """
         self.sample_pages = sample_pages
+        self.page_cache = page_cache if page_cache is not None else default_page_cache()
 
     def analyze(self, pdf_path: str, full_scan: bool = False) -> DocumentAnalysis:
         """
@@ -179,12 +199,11 @@ class DocumentAnalyzer:
             logger.info(f"  Analyzing {len(pages_to_analyze)}/{total_pages} pages")
 
             # Analyze each page
-            for page_num in pages_to_analyze:
-                page_analysis = self._analyze_page(doc[page_num], page_num)
+            for page_analysis in self._analyze_pages(doc, pages_to_analyze):
                 analysis.pages.append(page_analysis)
 
                 if page_analysis.needs_vision:
-                    analysis.complex_page_numbers.add(page_num)
+                    analysis.complex_page_numbers.add(page_analysis.page_number)
 
             doc.close()
 
@@ -237,6 +256,33 @@ class DocumentAnalyzer:
 
         return sorted(set(sample))
 
+    def _analyze_pages(self, doc: fitz.Document, page_numbers: List[int]) -> List[PageAnalysis]:
+        """Analyze pages, reusing cached analyses of unchanged pages"""
+        if self.page_cache is None:
+            return [self._analyze_page(doc[n], n) for n in page_numbers]
+
+        keys = {
+            n: compute_page_key(page_fingerprint(doc[n]), "analysis", version=self.CACHE_VERSION)
+            for n in page_numbers
+        }
+        cached = self.page_cache.get_many(list(keys.values()))
+
+        results = []
+        new_entries = []
+        for page_num in page_numbers:
+            hit = cached.get(keys[page_num])
+            if hit is not None:
+                results.append(PageAnalysis(**{**hit, "page_number": page_num, "cached": True}))
+                continue
+            page_analysis = self._analyze_page(doc[page_num], page_num)
+            value = asdict(page_analysis)
+            del value["page_number"], value["cached"]
+            new_entries.append({"key": keys[page_num], "value": value, "extractor": "analysis"})
+            results.append(page_analysis)
+
+        self.page_cache.set_many(new_entries)
+        return results
+
     def _analyze_page(self, page: fitz.Page, page_num: int) -> PageAnalysis:
         """Analyze a single page"""
         analysis = PageAnalysis(page_number=page_num)
@@ -21,8 +21,10 @@ Japanese Scanned PDF Support:
 import logging
 import asyncio
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional, Callable, List, Any
+from dataclasses import dataclass, field
+from typing import Optional, Callable, List, Any, Dict
+
+from core.cache.page_cache import PageCacheStats
 
 from .document_analyzer import (
     DocumentAnalyzer,
@@ -51,6 +53,10 @@ class ExtractionResult:
     cost_saved: float = 0.0
     ocr_confidence: float = 0.0  # Average OCR confidence (0-1)
 
+    # Page cache hits/misses per extraction step, e.g.
+    # {"analysis": {"hits": 10, "misses": 0, "hit_rate": 1.0}, "fast_text": {...}}
+    page_cache: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
 
 class SmartExtractionRouter:
     """
@@ -158,6 +164,7 @@ class SmartExtractionRouter:
             result = await self._extract_vision(pdf_path, progress_callback)
 
         # Calculate metrics
+        result.page_cache = {"analysis": analysis.page_cache.to_dict(), **result.page_cache}
         result.extraction_time = time.time() - start_time
         result.estimated_vision_time = analysis.estimated_time_vision
         result.time_saved = max(0, result.estimated_vision_time - result.extraction_time)
@@ -193,6 +200,7 @@ class SmartExtractionRouter:
             extraction_time=doc.extraction_time,
             pages_via_text=len(doc.pages),
             pages_via_vision=0,
+            page_cache={"fast_text": doc.page_cache.to_dict()},
         )
 
     async def _extract_hybrid(
@@ -218,19 +226,35 @@ class SmartExtractionRouter:
         if analysis.complex_page_numbers and self.vision_reader:
             logger.info(f"  🔍 Re-extracting {len(analysis.complex_page_numbers)} complex pages with Vision")
 
-            for page_num in sorted(analysis.complex_page_numbers):
-                if progress_callback:
-                    progress = (page_num + 1) / analysis.total_pages
-                    progress_callback(0.5 + progress * 0.4, f"Vision reading page {page_num + 1}")
-
-                try:
-                    # Use Vision for this page
-                    vision_content = await self._extract_page_vision(pdf_path, page_num)
-                    if vision_content:
-                        content_pages[page_num] = vision_content
-                        pages_via_vision += 1
-                except Exception as e:
-                    logger.warning(f"Vision failed for page {page_num}: {e}, keeping text extraction")
+            from config.settings import settings
+
+            complex_pages = sorted(analysis.complex_page_numbers)
+            limit = asyncio.Semaphore(max(1, settings.vision_concurrency))
+            done = 0
+
+            async def read(page_num: int) -> Optional[str]:
+                nonlocal done
+                async with limit:
+                    try:
+                        # Use Vision for this page
+                        return await self._extract_page_vision(pdf_path, page_num)
+                    except Exception as e:
+                        logger.warning(f"Vision failed for page {page_num}: {e}, keeping text extraction")
+                        return None
+                    finally:
+                        done += 1
+                        if progress_callback:
+                            progress_callback(
+                                0.5 + done / len(complex_pages) * 0.4,
+                                f"Vision reading page {page_num + 1}"
+                            )
+
+            # Pages run concurrently; the vision reader paces provider calls
+            vision_contents = await asyncio.gather(*(read(n) for n in complex_pages))
+            for page_num, vision_content in zip(complex_pages, vision_contents):
+                if vision_content:
+                    content_pages[page_num] = vision_content
+                    pages_via_vision += 1
 
         # Combine all pages in order
         full_content = "\n\n".join(
@@ -244,6 +268,7 @@ class SmartExtractionRouter:
             extraction_time=0,  # Will be set by caller
             pages_via_text=analysis.total_pages - pages_via_vision,
             pages_via_vision=pages_via_vision,
+            page_cache={"fast_text": doc.page_cache.to_dict()},
         )
 
     async def _extract_vision(
@@ -265,6 +290,7 @@ class SmartExtractionRouter:
                 progress_callback=adjusted_callback,
             )
 
+            page_cache = getattr(vision_doc, "page_cache", None)
             return ExtractionResult(
                 content=vision_doc.full_content,
                 total_pages=vision_doc.total_pages,
@@ -272,6 +298,9 @@ class SmartExtractionRouter:
                 extraction_time=0,
                 pages_via_text=0,
                 pages_via_vision=vision_doc.total_pages,
+                page_cache=(
+                    {"vision": page_cache.to_dict()} if isinstance(page_cache, PageCacheStats) else {}
+                ),
             )
         else:
             # Fallback to text extraction if no vision reader
@@ -323,55 +352,42 @@ class SmartExtractionRouter:
         Returns:
             ExtractionResult with OCR-extracted content
         """
-        import fitz
-        from io import BytesIO
         from core.ocr.paddle_client import get_ocr_client_for_language
+        from core.ocr.pipeline import OcrPipeline
 
         logger.info(f"  📖 Using OCR extraction (PaddleOCR, lang={source_lang})")
 
         # Get language-specific OCR client
         ocr_client = get_ocr_client_for_language(source_lang)
 
-        # Open PDF
-        doc = fitz.open(pdf_path)
-        total_pages = len(doc)
+        # 300 DPI for good OCR quality; long scans are spread over worker
+        # processes (settings.ocr_workers)
+        pipeline = OcrPipeline(ocr_client, dpi=300)
+        loop = asyncio.get_running_loop()
 
-        # Extract each page
-        page_contents = []
-        ocr_confidence_sum = 0.0
-
-        for page_num in range(total_pages):
+        def on_progress(done: int, total: int):
+            # Called from the OCR thread / pool thread
             if progress_callback:
-                progress = (page_num + 1) / total_pages
-                progress_callback(
-                    0.05 + progress * 0.90,
-                    f"OCR processing page {page_num + 1}/{total_pages}"
+                loop.call_soon_threadsafe(
+                    progress_callback,
+                    0.05 + done / total * 0.90,
+                    f"OCR processing page {done}/{total}"
                 )
 
-            try:
-                page = doc[page_num]
-
-                # Convert page to image (300 DPI for good OCR quality)
-                mat = fitz.Matrix(300 / 72, 300 / 72)  # 300 DPI
-                pixmap = page.get_pixmap(matrix=mat)
-                img_bytes = pixmap.tobytes("png")
-
-                # Run OCR
-                result = ocr_client.extract_structured(img_bytes)
-
-                page_text = result.get("text", "")
-                page_confidence = result.get("confidence", 0.0)
-
-                page_contents.append(page_text)
-                ocr_confidence_sum += page_confidence
-
-                logger.debug(f"    Page {page_num + 1}: {len(page_text)} chars, conf={page_confidence:.2f}")
-
-            except Exception as e:
-                logger.warning(f"    OCR failed for page {page_num + 1}: {e}")
-                page_contents.append("")
+        ocr_pages = await asyncio.to_thread(
+            pipeline.process_pdf, Path(pdf_path), progress_callback=on_progress
+        )
+        total_pages = len(ocr_pages)
 
-        doc.close()
+        page_contents = []
+        ocr_confidence_sum = 0.0
+        for page in ocr_pages:
+            if "error" in page.metadata:
+                logger.warning(f"    OCR failed for page {page.page_num + 1}: {page.metadata['error']}")
+            else:
+                logger.debug(f"    Page {page.page_num + 1}: {len(page.text)} chars, conf={page.confidence:.2f}")
+            page_contents.append(page.text)
+            ocr_confidence_sum += page.confidence
 
         # Calculate average confidence
         avg_confidence = ocr_confidence_sum / total_pages if total_pages > 0 else 0.0
@@ -389,6 +405,7 @@ class SmartExtractionRouter:
             pages_via_vision=0,
             pages_via_ocr=total_pages,
             ocr_confidence=avg_confidence,
+            page_cache={"ocr": PageCacheStats.of(ocr_pages).to_dict()},
         )
 
 
@@ -14,13 +14,33 @@ Best for:
 - Documents without complex tables/formulas
 """
 
+import asyncio
 import logging
 import re
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List, Optional, Callable, Dict, Any
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Awaitable, List, Optional, Callable, Dict, Any
 import fitz  # PyMuPDF
 
+from core.cache.page_cache import (
+    PageCache,
+    PageCacheStats,
+    compute_page_key,
+    default_page_cache,
+    page_fingerprint,
+)
+
+from .parallel_text import (
+    MIN_PARALLEL_PAGES,
+    extract_shard,
+    get_text_pool,
+    key_shard,
+    resolve_worker_count,
+    shard_pages,
+    shutdown_text_pool,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +52,7 @@ class ExtractedPage:
     word_count: int = 0
     has_headers: bool = False
     has_lists: bool = False
+    cached: bool = False  # Served from the page cache
 
 
 @dataclass
@@ -51,6 +72,10 @@ class ExtractedDocument:
     def total_words(self) -> int:
         return sum(page.word_count for page in self.pages)
 
+    @property
+    def page_cache(self) -> PageCacheStats:
+        return PageCacheStats.of(self.pages)
+
 
 class FastTextExtractor:
     """
@@ -61,14 +86,32 @@ class FastTextExtractor:
     - Detects headers and sections
     - Cleans up hyphenation and line breaks
     - Maintains reading order
+    - Never blocks the event loop; long documents are extracted in shards
+      on a pool of worker processes
+
+    Pages already extracted (same content, from any PDF) come from the
+    page cache.
 
     Usage:
         extractor = FastTextExtractor()
         doc = await extractor.extract("/path/to/document.pdf")
         print(doc.full_content)
+
+        # Stream pages (e.g. into a chunker) while later ones are extracted
+        async for page in extractor.iter_pages("/path/to/book.pdf"):
+            ...
     """
 
-    def __init__(self):
+    # Bump when _extract_page output changes, so cached pages are redone
+    CACHE_VERSION = 1
+
+    def __init__(self, page_cache: Optional[PageCache] = None):
+        """
+        Args:
+            page_cache: Page cache (default: the shared one, if
+                        settings.page_cache_enabled)
+        """
+        self.page_cache = page_cache
         # Patterns for structure detection
         self.header_patterns = [
             r'^(Chapter|CHAPTER)\s+\d+',
@@ -83,14 +126,18 @@ class FastTextExtractor:
         pdf_path: str,
         progress_callback: Optional[Callable[[float, str], None]] = None,
         page_range: Optional[tuple] = None,
+        workers: Optional[int] = None,
     ) -> ExtractedDocument:
         """
         Extract text from PDF.
 
+        Extraction runs off the event loop (see iter_pages).
+
         Args:
             pdf_path: Path to PDF file
             progress_callback: Optional callback(progress, stage)
             page_range: Optional (start, end) page range
+            workers: Worker processes (default: settings.text_extract_workers)
 
         Returns:
             ExtractedDocument with all extracted content
@@ -99,39 +146,30 @@ class FastTextExtractor:
         start_time = time.time()
 
         path = Path(pdf_path)
-        if not path.exists():
-            raise FileNotFoundError(f"PDF not found: {pdf_path}")
-
         logger.info(f"📖 Fast extracting: {path.name}")
 
         try:
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-
-            # Determine page range
-            start_page = page_range[0] if page_range else 0
-            end_page = page_range[1] if page_range else total_pages
+            total_pages = await asyncio.to_thread(_page_count, path)
+            start_page, end_page = page_range if page_range else (0, total_pages)
+            page_count = max(0, min(total_pages, end_page) - max(0, start_page))
 
             result = ExtractedDocument(
                 source_file=str(path),
                 total_pages=total_pages,
             )
 
-            for i, page_num in enumerate(range(start_page, end_page)):
-                # Progress callback
+            async for page in self.iter_pages(path, page_range, workers):
+                result.pages.append(page)
                 if progress_callback:
-                    progress = (i + 1) / (end_page - start_page)
-                    progress_callback(progress * 0.5, f"Extracting page {page_num + 1}/{total_pages}")
-
-                # Extract page content
-                page_content = self._extract_page(doc[page_num], page_num)
-                result.pages.append(page_content)
-
-            doc.close()
+                    progress = len(result.pages) / page_count
+                    progress_callback(progress * 0.5, f"Extracting page {page.page_number + 1}/{total_pages}")
 
             result.extraction_time = time.time() - start_time
             logger.info(f"  ✅ Extracted {len(result.pages)} pages in {result.extraction_time:.1f}s")
             logger.info(f"  📊 Total words: {result.total_words:,}")
+            stats = result.page_cache
+            if stats.hits:
+                logger.info(f"  🗂️ Page cache: {stats.hits} hits, {stats.misses} misses")
 
             return result
 
@@ -139,6 +177,124 @@ class FastTextExtractor:
             logger.error(f"Extraction failed: {e}")
             raise
 
+    async def iter_pages(
+        self,
+        pdf_path: str,
+        page_range: Optional[tuple] = None,
+        workers: Optional[int] = None,
+    ) -> AsyncIterator[ExtractedPage]:
+        """
+        Extract pages as they become ready, in page order.
+
+        Nothing runs on the event loop: pages are split into shards, and
+        each shard computes its pages' cache keys, looks them up, and
+        extracts the pages it did not find. Long documents run their shards
+        on the shared worker pool, where each process opens the PDF itself.
+        Short documents, or a pool with one worker, use a single thread.
+        Consumers (chunking) can start on the first pages while later
+        shards are still running.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_range: Optional (start, end) page range
+            workers: Worker processes (0 = one per CPU, 1 = one thread;
+                     default: settings.text_extract_workers)
+
+        Yields:
+            ExtractedPage per page
+        """
+        from config.settings import settings
+
+        path = Path(pdf_path)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        workers = resolve_worker_count(settings.text_extract_workers if workers is None else workers)
+        page_cache = self.page_cache if self.page_cache is not None else default_page_cache()
+
+        total_pages = await asyncio.to_thread(_page_count, path)
+        start_page, end_page = page_range if page_range else (0, total_pages)
+        page_numbers = list(range(max(0, start_page), min(total_pages, end_page)))
+
+        shards = shard_pages(page_numbers)
+        parallel = workers > 1 and len(page_numbers) >= MIN_PARALLEL_PAGES
+        loop = asyncio.get_running_loop()
+
+        def run(in_worker: Callable, in_thread: Callable, shard: List[int]) -> Awaitable:
+            if parallel:
+                return loop.run_in_executor(get_text_pool(workers), in_worker, str(path), shard)
+            return asyncio.to_thread(in_thread, path, shard)
+
+        async def run_shard(shard: List[int]) -> List[ExtractedPage]:
+            keys = await run(key_shard, self._page_keys, shard) if page_cache is not None else {}
+            cached = await asyncio.to_thread(page_cache.get_many, list(keys.values())) if keys else {}
+
+            pages: Dict[int, ExtractedPage] = {}
+            for page_num, key in keys.items():
+                hit = cached.get(key)
+                if hit is not None:
+                    pages[page_num] = ExtractedPage(**{**hit, "page_number": page_num, "cached": True})
+
+            missing = [n for n in shard if n not in pages]
+            if missing:
+                extracted = await run(extract_shard, self._extract_pages, missing)
+                pages.update((page.page_number, page) for page in extracted)
+                if keys:
+                    await asyncio.to_thread(page_cache.set_many, [
+                        {"key": keys[page.page_number], "value": _cache_value(page), "extractor": "fast_text"}
+                        for page in extracted
+                    ])
+            return [pages[n] for n in shard]
+
+        # Shards in flight, by shard index; completed in order
+        in_flight: Dict[int, asyncio.Future] = {}
+        next_shard = 0
+
+        def submit() -> None:
+            nonlocal next_shard
+            # One thread at a time in-process; keep every worker busy otherwise
+            limit = workers * 2 if parallel else 1
+            while next_shard < len(shards) and len(in_flight) < limit:
+                in_flight[next_shard] = asyncio.ensure_future(run_shard(shards[next_shard]))
+                next_shard += 1
+
+        try:
+            for index in range(len(shards)):
+                submit()
+                try:
+                    pages = await in_flight.pop(index)
+                except BrokenProcessPool as e:
+                    logger.warning(f"Text extraction workers failed ({e}), continuing in-process")
+                    shutdown_text_pool(wait=False)
+                    for future in in_flight.values():
+                        future.cancel()
+                    in_flight.clear()
+                    parallel = False
+                    next_shard = index
+                    submit()
+                    pages = await in_flight.pop(index)
+                submit()
+
+                for page in pages:
+                    yield page
+        finally:
+            for future in in_flight.values():
+                future.cancel()
+
+    def _page_key(self, page: fitz.Page) -> str:
+        """Page cache key of a page"""
+        return compute_page_key(page_fingerprint(page), "fast_text", version=self.CACHE_VERSION)
+
+    def _page_keys(self, path: Path, page_numbers: List[int]) -> Dict[int, str]:
+        """Cache keys of some pages, in the calling thread (opens its own document)"""
+        with fitz.open(path) as doc:
+            return {n: self._page_key(doc[n]) for n in page_numbers}
+
+    def _extract_pages(self, path: Path, page_numbers: List[int]) -> List[ExtractedPage]:
+        """Extract some pages in the calling thread (opens its own document)"""
+        with fitz.open(path) as doc:
+            return [self._extract_page(doc[n], n) for n in page_numbers]
+
     def _extract_page(self, page: fitz.Page, page_num: int) -> ExtractedPage:
         """Extract content from a single page"""
         # Get text with layout preservation
@@ -274,6 +430,20 @@ class FastTextExtractor:
         return chapters
 
 
+def _page_count(path: Path) -> int:
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    with fitz.open(path) as doc:
+        return len(doc)
+
+
+def _cache_value(page: ExtractedPage) -> Dict[str, Any]:
+    """Page cache entry: the page without its position"""
+    value = asdict(page)
+    del value["page_number"], value["cached"]
+    return value
+
+
 async def fast_extract(pdf_path: str) -> ExtractedDocument:
     """Convenience function for fast extraction"""
     extractor = FastTextExtractor()
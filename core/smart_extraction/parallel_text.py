@@ -0,0 +1,130 @@
+"""
+Parallel Text Extraction
+
+Process pool for native-text PDF extraction. Each worker process opens the
+PDF itself and extracts a shard of pages with FastTextExtractor (PyMuPDF
+text + regex cleanup); only the path and page numbers go to the worker and
+only ExtractedPage objects (or page cache keys) come back.
+
+The pool is shared by every extraction in the process and created on first
+use, so the spawn / import cost is paid once and later documents start on
+warm workers. `FastTextExtractor.iter_pages()` decides when to use it.
+
+Example:
+    pool = get_text_pool()
+    pages = await loop.run_in_executor(pool, extract_shard, "book.pdf", [0, 1, 2])
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pages per task: PyMuPDF extracts ~1-5 ms/page, so shards must be large
+# enough to amortize IPC
+DEFAULT_SHARD_PAGES = 32
+
+# Documents with fewer pages to extract are handled on one thread: the
+# worker pool only pays off on long books
+MIN_PARALLEL_PAGES = 64
+
+
+def resolve_worker_count(workers: int) -> int:
+    """Worker processes to use (0 = one per CPU)"""
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, workers)
+
+
+# -----------------------------------------------------------------------------
+# Worker process side
+# -----------------------------------------------------------------------------
+
+# Open document per worker, keyed by (path, mtime, size) so a file replaced
+# at the same path is reopened
+_worker_docs: Dict[Tuple[str, int, int], object] = {}
+_worker_extractor = None
+
+
+def _worker_doc(pdf_path: str):
+    """This worker's open document for a PDF"""
+    global _worker_extractor
+    import fitz
+    from .fast_text_extractor import FastTextExtractor
+
+    if _worker_extractor is None:
+        _worker_extractor = FastTextExtractor()
+
+    stat = os.stat(pdf_path)
+    key = (pdf_path, stat.st_mtime_ns, stat.st_size)
+    doc = _worker_docs.get(key)
+    if doc is None:
+        # Keep only the current book open
+        for old in _worker_docs.values():
+            old.close()
+        _worker_docs.clear()
+        doc = _worker_docs[key] = fitz.open(pdf_path)
+    return doc
+
+
+def extract_shard(pdf_path: str, pages: Sequence[int]) -> list:
+    """Extract the given pages of a PDF (runs in a worker process)"""
+    doc = _worker_doc(pdf_path)
+    return [_worker_extractor._extract_page(doc[page_num], page_num) for page_num in pages]
+
+
+def key_shard(pdf_path: str, pages: Sequence[int]) -> Dict[int, str]:
+    """Page cache keys of the given pages of a PDF (runs in a worker process)"""
+    doc = _worker_doc(pdf_path)
+    return {page_num: _worker_extractor._page_key(doc[page_num]) for page_num in pages}
+
+
+# -----------------------------------------------------------------------------
+# Parent process side
+# -----------------------------------------------------------------------------
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_text_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    The process-wide text extraction pool
+
+    The pool is sized when it is created and then shared as is: resizing it
+    would cancel shards other documents have queued. Callers wanting fewer
+    workers limit how many shards they keep in flight instead.
+
+    Args:
+        workers: Worker processes if the pool is not running yet
+                 (default: settings.text_extract_workers)
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if workers is None:
+                from config.settings import settings
+                workers = resolve_worker_count(settings.text_extract_workers)
+            # spawn: forking a parent that runs an event loop and threads can
+            # deadlock the child
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            logger.info(f"Started {workers} text extraction worker processes")
+        return _pool
+
+
+def shutdown_text_pool(wait: bool = True) -> None:
+    """Stop the text extraction workers (next use starts a new pool)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+            _pool = None
+
+
+def shard_pages(page_numbers: Sequence[int], size: int = DEFAULT_SHARD_PAGES) -> List[List[int]]:
+    """Split page numbers into shards of at most `size` pages"""
+    return [list(page_numbers[i:i + size]) for i in range(0, len(page_numbers), size)]
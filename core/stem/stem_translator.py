@@ -257,6 +257,9 @@ class STEMTranslator:
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             raise
+        finally:
+            # Commit TM / chunk cache writes queued by translate_chunk
+            await self.base_translator.flush_stores()
 
     def _create_stem_prompt(self, target_lang: str) -> str:
         """
@@ -11,6 +11,7 @@ Exports:
 - IncrementalDocxBuilder (memory-efficient DOCX building)
 - IncrementalPdfBuilder (memory-efficient PDF building)
 - IncrementalTxtBuilder (memory-efficient TXT building)
+- ResultSpill (committed results kept on disk)
 """
 
 from .streaming_processor import StreamingBatchProcessor
@@ -19,6 +20,7 @@ from .base_builder import BaseIncrementalBuilder
 from .incremental_builder import IncrementalDocxBuilder
 from .incremental_pdf_builder import IncrementalPdfBuilder
 from .incremental_txt_builder import IncrementalTxtBuilder
+from .result_spill import ResultSpill
 
 __all__ = [
     'StreamingBatchProcessor',
@@ -26,5 +28,6 @@ __all__ = [
     'BaseIncrementalBuilder',
     'IncrementalDocxBuilder',
     'IncrementalPdfBuilder',
-    'IncrementalTxtBuilder'
+    'IncrementalTxtBuilder',
+    'ResultSpill'
 ]
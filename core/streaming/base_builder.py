@@ -36,6 +36,10 @@ class BaseIncrementalBuilder(ABC):
         final_output = await builder.merge_all()
     """
 
+    # Batch files are standalone documents a client could open (False when
+    # they are only fragments for merge_all())
+    partial_files_readable = True
+
     def __init__(self, output_path: Path):
         """
         Initialize builder
@@ -7,11 +7,20 @@ Incremental DOCX Builder - Phase 5.3 (Updated for 5.4 + FIX-005)
 Build DOCX documents incrementally to reduce memory usage.
 Instead of building entire DOCX in RAM, write batches to temp files.
 
+Each batch is written as a fragment of WordprocessingML body XML
+(the <w:p> elements python-docx generated for it, runs and formatting
+included). merge_all() streams the fragments, in order, into the
+word/document.xml entry of the final package - no batch is parsed again.
+
 FIX-005: Smart formatting - detect headings, paragraphs, apply styles.
 """
 
+import asyncio
+import io
+import shutil
+import zipfile
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 import re
 from docx import Document
 from docx.shared import Pt
@@ -37,6 +46,33 @@ SECTION_PATTERNS = [
     r'^[IVXLCDM]+\.\s+\w',  # I. Section, II. Section
 ]
 
+_DOCUMENT_PART = 'word/document.xml'
+
+# Copy buffer when streaming batch fragments into the package
+_COPY_BUFFER = 1024 * 1024
+
+
+def _body_fragment(doc: Document) -> bytes:
+    """
+    Serialize the block content of a document body (without <w:body> and
+    the section properties) as UTF-8 XML.
+
+    The body is serialized as a whole so the namespace declarations land on
+    the stripped <w:body> tag instead of being repeated on every paragraph.
+    """
+    body = doc.element.body
+    sect_pr = body.sectPr
+    if sect_pr is not None:
+        body.remove(sect_pr)
+    if len(body) == 0:
+        return b''
+
+    from lxml import etree
+    xml = etree.tostring(body, encoding='utf-8', xml_declaration=False)
+    start = xml.index(b'>') + 1
+    end = xml.rindex(b'</w:body>')
+    return xml[start:end]
+
 
 class IncrementalDocxBuilder(BaseIncrementalBuilder):
     """
@@ -47,11 +83,11 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
       - Peak memory: ~1GB for large doc
 
     Do:
-      - Build batch 1 DOCX → Save to temp
-      - Build batch 2 DOCX → Save to temp
+      - Build batch 1 paragraphs → Save body XML to temp
+      - Build batch 2 paragraphs → Save body XML to temp
       - ...
-      - Merge all temp DOCX → Final output
-      - Peak memory: ~100MB (10x reduction)
+      - Stream all temp XML into word/document.xml → Final output
+      - Peak memory: one batch, independent of document length
 
     Usage:
         builder = IncrementalDocxBuilder(output_path)
@@ -64,6 +100,9 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
         final_file = await builder.merge_all()
     """
 
+    # Batch files are raw <w:p> body XML, not DOCX files
+    partial_files_readable = False
+
     def get_format(self) -> str:
         """Get format identifier"""
         return 'docx'
@@ -165,33 +204,48 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
                 # Single paragraph
                 doc.add_paragraph(para_text)
 
-    def _verify_docx(self, file_path: Path) -> None:
+    def _package_template(self) -> Tuple[bytes, bytes, bytes]:
         """
-        Verify DOCX file is valid and readable
-
-        Args:
-            file_path: Path to DOCX file to verify
+        Build the package everything but the body comes from.
 
-        Raises:
-            RuntimeError: If DOCX is corrupted or unreadable
+        Returns:
+            (package, head, tail): the styled empty DOCX, and its
+            word/document.xml split around the body content
         """
-        try:
-            # Try to open the DOCX
-            doc = Document(file_path)
+        doc = Document()
+        self._setup_base_styles(doc)
 
-            # Verify it has content
-            if len(doc.paragraphs) == 0:
-                raise RuntimeError(f"DOCX has no paragraphs: {file_path}")
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        package = buffer.getvalue()
 
-            # Verify paragraphs have text (at least some)
-            has_content = any(para.text.strip() for para in doc.paragraphs)
-            if not has_content:
-                raise RuntimeError(f"DOCX has no text content: {file_path}")
+        with zipfile.ZipFile(io.BytesIO(package)) as zf:
+            document_xml = zf.read(_DOCUMENT_PART)
 
-        except Exception as e:
-            if "corrupted" in str(e).lower() or "invalid" in str(e).lower():
-                raise RuntimeError(f"DOCX file is corrupted: {file_path}: {e}")
-            raise RuntimeError(f"Failed to verify DOCX: {file_path}: {e}")
+        body_start = document_xml.index(b'<w:body>') + len(b'<w:body>')
+        body_end = document_xml.index(b'<w:sectPr', body_start)
+        return package, document_xml[:body_start], document_xml[body_end:]
+
+    def _write_package(self, package: bytes, head: bytes, tail: bytes) -> None:
+        """
+        Write the final DOCX: template parts copied as-is, document.xml
+        streamed from head + batch fragments + tail.
+        """
+        with zipfile.ZipFile(io.BytesIO(package)) as template, \
+                zipfile.ZipFile(self.output_path, 'w', zipfile.ZIP_DEFLATED) as out:
+            for item in template.infolist():
+                if item.filename == _DOCUMENT_PART:
+                    with out.open(_DOCUMENT_PART, 'w', force_zip64=True) as stream:
+                        stream.write(head)
+                        for batch_idx, batch_file in enumerate(self.batch_files):
+                            if not batch_file.exists():
+                                raise RuntimeError(f"Batch file missing: {batch_file}")
+                            with open(batch_file, 'rb') as fragment:
+                                shutil.copyfileobj(fragment, stream, _COPY_BUFFER)
+                            logger.debug(f"Batch {batch_idx + 1}/{len(self.batch_files)} merged")
+                        stream.write(tail)
+                else:
+                    out.writestr(item, template.read(item.filename))
 
     async def add_batch(
         self,
@@ -199,27 +253,24 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
         batch_idx: int
     ) -> Path:
         """
-        Add a batch and save to temp DOCX file with error handling
+        Add a batch and save its body XML to a temp file with error handling
 
         Args:
             batch_results: Translation results for this batch
             batch_idx: Batch index (0-based)
 
         Returns:
-            Path to temp batch DOCX file
+            Path to temp batch XML file (<w:p> elements of the batch)
 
         Raises:
             RuntimeError: If DOCX creation fails
         """
-        batch_file = self.temp_dir / f"batch_{batch_idx:04d}.docx"
+        batch_file = self.temp_dir / f"batch_{batch_idx:04d}.xml"
 
         try:
-            # Create DOCX for this batch with smart formatting (FIX-005)
+            # Build this batch's paragraphs with smart formatting (FIX-005)
             doc = Document()
 
-            # Setup base styles for professional output
-            self._setup_base_styles(doc)
-
             for result in batch_results:
                 try:
                     # FIX-005: Add translated text with smart formatting
@@ -228,19 +279,17 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
                     logger.warning(f"Failed to add chunk {result.chunk_id}: {e}")
                     doc.add_paragraph(f"[Error: chunk {result.chunk_id} failed]")
 
-            # Save batch file
-            doc.save(str(batch_file))
+            # Verify the batch has content
+            if not any(para.text.strip() for para in doc.paragraphs):
+                raise RuntimeError(f"DOCX batch has no text content: {batch_idx}")
 
-            # Verify file created
-            if not batch_file.exists():
-                raise RuntimeError(f"DOCX batch not created: {batch_file}")
+            # Save the batch's body XML
+            with open(batch_file, 'wb') as f:
+                f.write(_body_fragment(doc))
 
             if batch_file.stat().st_size == 0:
                 raise RuntimeError(f"DOCX batch is empty: {batch_file}")
 
-            # Deep verification - check DOCX is valid
-            self._verify_docx(batch_file)
-
             self.batch_files.append(batch_file)
             return batch_file
 
@@ -261,7 +310,10 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
 
     async def merge_all(self) -> Path:
         """
-        Merge all batch DOCX files into final output with error handling
+        Merge all batch files into final output with error handling
+
+        The batch XML is copied byte for byte into the package, so the cost
+        is writing (compressing) the output, not re-parsing the document.
 
         Returns:
             Path to final merged DOCX
@@ -275,41 +327,10 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
         logger.info(f"Merging {len(self.batch_files)} DOCX batches...")
 
         try:
-            # Create final document with professional styles (FIX-005)
-            final_doc = Document()
-            self._setup_base_styles(final_doc)
-
-            # Merge each batch
-            for batch_idx, batch_file in enumerate(self.batch_files):
-                if not batch_file.exists():
-                    raise RuntimeError(f"Batch file missing: {batch_file}")
-
-                try:
-                    # Load batch document
-                    batch_doc = Document(batch_file)
-
-                    # Copy all paragraphs from batch to final doc
-                    for para in batch_doc.paragraphs:
-                        # Create new paragraph with same text and style
-                        new_para = final_doc.add_paragraph(
-                            para.text,
-                            style=para.style.name if para.style else None
-                        )
-
-                        # Copy paragraph formatting
-                        new_para.paragraph_format.alignment = para.paragraph_format.alignment
-                        new_para.paragraph_format.left_indent = para.paragraph_format.left_indent
-                        new_para.paragraph_format.right_indent = para.paragraph_format.right_indent
-                        new_para.paragraph_format.space_before = para.paragraph_format.space_before
-                        new_para.paragraph_format.space_after = para.paragraph_format.space_after
-
-                    logger.debug(f"Batch {batch_idx + 1}/{len(self.batch_files)} merged")
-
-                except Exception as e:
-                    raise RuntimeError(f"Failed to merge batch {batch_idx}: {e}")
-
-            # Save final document
-            final_doc.save(str(self.output_path))
+            # Styles, settings etc. come from a template with professional
+            # styles (FIX-005); the body is streamed from the batch files
+            package, head, tail = self._package_template()
+            await asyncio.to_thread(self._write_package, package, head, tail)
 
             # Verify output exists
             if not self.output_path.exists():
@@ -319,9 +340,6 @@ class IncrementalDocxBuilder(BaseIncrementalBuilder):
             if file_size == 0:
                 raise RuntimeError("Final DOCX is empty")
 
-            # Deep verification - check final DOCX is valid and readable
-            self._verify_docx(self.output_path)
-
             logger.info(f"Final DOCX saved: {self.output_path} ({file_size / 1024 / 1024:.1f} MB)")
 
             # Cleanup temp files
@@ -22,7 +22,7 @@ class ProgressStreamer:
     - job_started: Job begins processing
     - chunk_translated: Individual chunk completed
     - batch_completed: Batch finished
-    - batch_exported: Partial DOCX available
+    - batch_exported: Batch exported (with a partial file for TXT/PDF)
     - job_completed: Job fully complete
 
     Usage:
@@ -124,22 +124,23 @@ class ProgressStreamer:
         self,
         job_id: str,
         batch_idx: int,
-        partial_file: str
+        partial_file: Optional[str] = None
     ):
         """
-        Broadcast partial export availability
+        Broadcast that a batch was exported
 
         Args:
             job_id: Job identifier
             batch_idx: Batch index
-            partial_file: Path to partial DOCX file
+            partial_file: Path to the batch's standalone file (TXT/PDF), or
+                None when batch files are merge-only fragments (DOCX body XML)
         """
         await self._broadcast({
             "event": "batch_exported",
             "job_id": job_id,
             "batch": batch_idx,
             "partial_file": partial_file,
-            "download_available": True,
+            "download_available": partial_file is not None,
             "timestamp": time.time()
         })
 
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Result Spill - Phase 5.4
+
+Append-only on-disk store for committed translation results.
+StreamingBatchProcessor writes each result here once it has been exported,
+so the processor itself holds only the results of its in-flight window.
+"""
+
+import json
+import tempfile
+import weakref
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator, Optional
+
+from config.logging_config import get_logger
+logger = get_logger(__name__)
+
+from core.validator import TranslationResult
+
+
+def _remove(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to delete result spill {path}: {e}")
+
+
+class ResultSpill:
+    """
+    Translation results spilled to a JSON-lines file
+
+    Behaves like a read-only sequence: len() and iteration (in the order
+    results were appended, reading back from disk). The file is removed by
+    close() or when the object is garbage collected.
+
+    Usage:
+        spill = ResultSpill(directory=output_path.parent)
+        spill.append(result)
+
+        for result in spill:
+            ...
+        spill.close()
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Args:
+            directory: Where to create the spill file (system temp dir if None)
+        """
+        if directory is not None:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        handle = tempfile.NamedTemporaryFile(
+            mode='w', encoding='utf-8', suffix='.jsonl', prefix='.results_',
+            dir=directory, delete=False
+        )
+        self.path = Path(handle.name)
+        self._file = handle
+        self._count = 0
+        self._finalizer = weakref.finalize(self, _remove, self.path)
+
+    def append(self, result: TranslationResult) -> None:
+        """Write one result to the spill file"""
+        self._file.write(json.dumps(asdict(result), ensure_ascii=False))
+        self._file.write('\n')
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[TranslationResult]:
+        if not self._file.closed:
+            self._file.flush()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield TranslationResult(**json.loads(line))
+
+    @property
+    def size_bytes(self) -> int:
+        """Bytes of results held on disk instead of in memory"""
+        if not self._file.closed:
+            self._file.flush()
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def close(self) -> None:
+        """Delete the spill file"""
+        if not self._file.closed:
+            self._file.close()
+        self._finalizer()
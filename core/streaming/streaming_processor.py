@@ -10,7 +10,6 @@ Reduces memory usage by 80% for large jobs.
 """
 
 import asyncio
-import gc
 from typing import List, Optional, Any, Dict
 from pathlib import Path
 import httpx
@@ -26,6 +25,7 @@ from .base_builder import BaseIncrementalBuilder
 from .incremental_builder import IncrementalDocxBuilder
 from .incremental_pdf_builder import IncrementalPdfBuilder
 from .incremental_txt_builder import IncrementalTxtBuilder
+from .result_spill import ResultSpill
 
 
 class StreamingBatchProcessor:
@@ -33,8 +33,9 @@ class StreamingBatchProcessor:
     Memory-efficient batch processor with streaming output
 
     Features:
-    - Process chunks in configurable batches (default: 100)
-    - Stream results to disk after each batch
+    - Continuous translation with bounded concurrency (no per-batch barrier)
+    - Results committed in chunk order and exported in batches (default: 100)
+    - Committed results spilled to disk, memory bounded by the window
     - Real-time WebSocket progress broadcasting
     - Partial export for DOCX, PDF, and TXT formats
     - 80-90% memory reduction for large jobs
@@ -57,7 +58,9 @@ class StreamingBatchProcessor:
         batch_size: int = 100,
         enable_streaming: bool = True,
         enable_partial_export: bool = True,
-        websocket_manager: Optional[Any] = None
+        websocket_manager: Optional[Any] = None,
+        max_concurrency: int = 10,
+        window_size: Optional[int] = None
     ):
         """
         Initialize streaming batch processor
@@ -67,8 +70,14 @@ class StreamingBatchProcessor:
             enable_streaming: Enable WebSocket progress broadcasting
             enable_partial_export: Enable partial exports for all formats
             websocket_manager: WebSocket manager for broadcasting
+            max_concurrency: Chunks translated at the same time
+            window_size: How far ahead of the oldest unfinished chunk new
+                         chunks may start (default: 2 * batch_size); bounds
+                         the finished results waiting to be committed
         """
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.window_size = max(window_size or 2 * batch_size, max_concurrency)
         self.enable_streaming = enable_streaming
         self.enable_partial_export = enable_partial_export
         self.websocket_manager = websocket_manager
@@ -115,24 +124,36 @@ class StreamingBatchProcessor:
         http_client: httpx.AsyncClient,
         output_path: Path,
         progress_callback: Optional[callable] = None
-    ) -> tuple[List[TranslationResult], Dict[str, Any]]:
+    ) -> tuple[ResultSpill, Dict[str, Any]]:
         """
-        Process job in streaming batches with live progress
+        Process job as a continuous stream with live progress
+
+        Up to `max_concurrency` chunks are translated at a time and new
+        chunks start as soon as slots free up - there is no barrier between
+        batches. Finished results wait in a reorder buffer until every
+        earlier chunk is done; contiguous results are then committed in
+        chunk order: exported to the incremental builder in groups of
+        `batch_size` chunks and spilled to disk. Chunks are only started up
+        to `window_size` ahead of the commit pointer, which bounds the
+        results held in memory.
 
         Args:
             job: Translation job
             chunks: List of chunks to translate
-            translator: Translator engine instance
+            translator: Translator engine instance (its write-behind
+                        TM / cache writes are flushed before returning)
             http_client: HTTP client for API calls
             output_path: Path for final output
 
         Returns:
-            Tuple of (all_results, statistics)
+            Tuple of (all_results, statistics); all_results is a
+            ResultSpill that reads the results back from disk in chunk
+            order (chunks that failed after retries are omitted)
         """
         total_chunks = len(chunks)
         total_batches = (total_chunks + self.batch_size - 1) // self.batch_size
 
-        logger.info(f"Streaming mode: {total_chunks} chunks -> {total_batches} batches (batch_size={self.batch_size}, partial_export={self.enable_partial_export})")
+        logger.info(f"Streaming mode: {total_chunks} chunks -> {total_batches} batches (batch_size={self.batch_size}, concurrency={self.max_concurrency}, window={self.window_size}, partial_export={self.enable_partial_export})")
 
         # Broadcast job start
         if self.progress_streamer:
@@ -151,86 +172,86 @@ class StreamingBatchProcessor:
                 logger.warning(f"{e}. Streaming disabled for this format.")
                 builder = None
 
-        # Process batches
-        all_results = []
+        all_results = ResultSpill(directory=output_path.parent)
         batch_stats = {
             'batches_processed': 0,
             'chunks_processed': 0,
-            'memory_saved_bytes': 0,
+            'spilled_bytes': 0,
             'partial_exports': []
         }
 
-        for batch_idx in range(total_batches):
-            # Get batch chunks
-            start_idx = batch_idx * self.batch_size
-            end_idx = min(start_idx + self.batch_size, total_chunks)
-            batch_chunks = chunks[start_idx:end_idx]
+        from core.parallel import ParallelProcessor, Task, TaskStatus
 
-            logger.info(f"Processing batch {batch_idx + 1}/{total_batches}: Chunks {start_idx + 1}-{end_idx}")
+        processor = ParallelProcessor(
+            max_concurrency=self.max_concurrency,
+            max_retries=5,
+            timeout=120.0,
+            show_progress=False
+        )
 
-            # Translate batch
-            batch_results = await self._translate_batch(
-                batch_chunks=batch_chunks,
-                translator=translator,
-                http_client=http_client,
-                job_id=job.job_id,
-                batch_idx=batch_idx
+        async def translate(idx: int) -> tuple[int, Optional[TranslationResult]]:
+            task = await processor.process_task(
+                Task(id=idx, data=chunks[idx]),
+                lambda client, chunk: translator.translate_chunk(client, chunk),
+                http_client
             )
+            if task.status == TaskStatus.COMPLETED:
+                return idx, task.result
+            return idx, None
 
-            # Add to results
-            all_results.extend(batch_results)
-            batch_stats['chunks_processed'] += len(batch_results)
-
-            # Export batch if enabled
-            if builder:
-                partial_file = await builder.add_batch(
-                    batch_results=batch_results,
-                    batch_idx=batch_idx
-                )
-
-                # Broadcast partial export availability
-                if self.progress_streamer:
-                    await self.progress_streamer.broadcast_batch_exported(
-                        job_id=job.job_id,
-                        batch_idx=batch_idx,
-                        partial_file=str(partial_file)
-                    )
-
-                batch_stats['partial_exports'].append(str(partial_file))
-                logger.debug(f"Partial export saved: {partial_file.name}")
+        in_flight = set()
+        reorder: Dict[int, Optional[TranslationResult]] = {}
+        batch_results: List[TranslationResult] = []
+        next_launch = 0
+        next_commit = 0
 
-            # Broadcast batch completion
-            progress = (batch_idx + 1) / total_batches
-            if self.progress_streamer:
-                await self.progress_streamer.broadcast_batch_completed(
-                    job_id=job.job_id,
-                    batch_idx=batch_idx + 1,
-                    total_batches=total_batches,
-                    progress=progress,
-                    chunks_completed=batch_stats['chunks_processed']
-                )
-
-            # Call progress callback to update job in database
-            if progress_callback:
-                await progress_callback(
-                    completed_chunks=batch_stats['chunks_processed'],
-                    total_chunks=total_chunks,
-                    progress=progress
-                )
-
-            # Memory cleanup
-            memory_before = self._get_memory_usage()
-            del batch_results
-            gc.collect()
-            memory_after = self._get_memory_usage()
-
-            memory_freed = max(0, memory_before - memory_after)
-            batch_stats['memory_saved_bytes'] += memory_freed
-
-            if memory_freed > 0:
-                logger.debug(f"Memory freed: {memory_freed / 1024 / 1024:.1f} MB")
-
-            batch_stats['batches_processed'] += 1
+        try:
+            while next_commit < total_chunks:
+                # Keep the window full
+                while next_launch < min(total_chunks, next_commit + self.window_size):
+                    in_flight.add(asyncio.ensure_future(translate(next_launch)))
+                    next_launch += 1
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    idx, result = future.result()
+                    reorder[idx] = result
+                    if result is not None and self.progress_streamer:
+                        await self.progress_streamer.broadcast_chunk_translated(
+                            job_id=job.job_id,
+                            chunk_id=result.chunk_id,
+                            preview=result.translated[:200],  # First 200 chars
+                            quality_score=result.quality_score
+                        )
+
+                # Advance the commit pointer over contiguous finished chunks
+                while next_commit in reorder:
+                    result = reorder.pop(next_commit)
+                    next_commit += 1
+                    if result is not None:
+                        batch_results.append(result)
+                        all_results.append(result)
+
+                    if next_commit % self.batch_size == 0 or next_commit == total_chunks:
+                        await self._commit_batch(
+                            job=job,
+                            builder=builder,
+                            batch_results=batch_results,
+                            batch_stats=batch_stats,
+                            total_batches=total_batches,
+                            total_chunks=total_chunks,
+                            progress_callback=progress_callback
+                        )
+                        batch_results = []
+        finally:
+            for future in in_flight:
+                future.cancel()
+            # Commit TM / chunk cache writes queued by translate_chunk
+            flush_stores = getattr(translator, "flush_stores", None)
+            if flush_stores is not None:
+                await flush_stores()
+
+        batch_stats['spilled_bytes'] = all_results.size_bytes
 
         # Merge partial exports if created
         if builder and batch_stats['partial_exports']:
@@ -244,76 +265,74 @@ class StreamingBatchProcessor:
             await self.progress_streamer.broadcast_job_completed(
                 job_id=job.job_id,
                 total_chunks=total_chunks,
-                memory_saved_mb=batch_stats['memory_saved_bytes'] / 1024 / 1024
+                memory_saved_mb=batch_stats['spilled_bytes'] / 1024 / 1024
             )
 
         return all_results, batch_stats
 
-    async def _translate_batch(
+    async def _commit_batch(
         self,
-        batch_chunks: List[TranslationChunk],
-        translator: Any,
-        http_client: httpx.AsyncClient,
-        job_id: str,
-        batch_idx: int
-    ) -> List[TranslationResult]:
+        job: TranslationJob,
+        builder: Optional[BaseIncrementalBuilder],
+        batch_results: List[TranslationResult],
+        batch_stats: Dict[str, Any],
+        total_batches: int,
+        total_chunks: int,
+        progress_callback: Optional[callable]
+    ) -> None:
         """
-        Translate a single batch of chunks
+        Export one group of committed results and report progress
 
         Args:
-            batch_chunks: Chunks in this batch
-            translator: Translator engine
-            http_client: HTTP client
-            job_id: Job identifier
-            batch_idx: Batch index
-
-        Returns:
-            List of translation results
+            job: Translation job
+            builder: Incremental builder (None = no partial export)
+            batch_results: Committed results of this batch, in chunk order
+            batch_stats: Statistics to update
+            total_batches: Number of batches in the job
+            total_chunks: Number of chunks in the job
+            progress_callback: Optional job progress callback
         """
-        # Use parallel processor for batch
-        from core.parallel import ParallelProcessor
+        batch_idx = batch_stats['batches_processed']
+        batch_stats['chunks_processed'] += len(batch_results)
 
-        processor = ParallelProcessor(
-            max_concurrency=10,  # Parallel within batch
-            max_retries=5,
-            timeout=120.0,
-            show_progress=False
-        )
-
-        # Translate batch chunks
-        batch_results, stats = await processor.process_all(
-            batch_chunks,
-            lambda client, chunk: translator.translate_chunk(client, chunk),
-            http_client=http_client
-        )
+        # Export batch if enabled (a batch whose chunks all failed has nothing to export)
+        if builder and batch_results:
+            partial_file = await builder.add_batch(
+                batch_results=batch_results,
+                batch_idx=batch_idx
+            )
 
-        # Broadcast individual chunk completions if enabled
-        if self.progress_streamer:
-            for result in batch_results:
-                await self.progress_streamer.broadcast_chunk_translated(
-                    job_id=job_id,
-                    chunk_id=result.chunk_id,
-                    preview=result.translated[:200],  # First 200 chars
-                    quality_score=result.quality_score
+            # Broadcast partial export availability
+            if self.progress_streamer:
+                await self.progress_streamer.broadcast_batch_exported(
+                    job_id=job.job_id,
+                    batch_idx=batch_idx,
+                    partial_file=str(partial_file) if builder.partial_files_readable else None
                 )
 
-        return batch_results
+            batch_stats['partial_exports'].append(str(partial_file))
+            logger.debug(f"Partial export saved: {partial_file.name}")
 
-    def _get_memory_usage(self) -> int:
-        """
-        Get current process memory usage in bytes
+        batch_stats['batches_processed'] += 1
 
-        Returns:
-            Memory usage in bytes
-        """
-        try:
-            import psutil
-            import os
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss
-        except ImportError:
-            # psutil not available, return 0
-            return 0
+        # Broadcast batch completion
+        progress = batch_stats['batches_processed'] / total_batches
+        if self.progress_streamer:
+            await self.progress_streamer.broadcast_batch_completed(
+                job_id=job.job_id,
+                batch_idx=batch_idx + 1,
+                total_batches=total_batches,
+                progress=progress,
+                chunks_completed=batch_stats['chunks_processed']
+            )
+
+        # Call progress callback to update job in database
+        if progress_callback:
+            await progress_callback(
+                completed_chunks=batch_stats['chunks_processed'],
+                total_chunks=total_chunks,
+                progress=progress
+            )
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -324,6 +343,8 @@ class StreamingBatchProcessor:
         """
         return {
             'batch_size': self.batch_size,
+            'max_concurrency': self.max_concurrency,
+            'window_size': self.window_size,
             'streaming_enabled': self.enable_streaming,
             'partial_export_enabled': self.enable_partial_export,
             'has_websocket': self.websocket_manager is not None
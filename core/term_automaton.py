@@ -0,0 +1,244 @@
+"""
+Glossary Term Automaton
+Aho-Corasick multi-pattern matcher for glossary terms.
+
+One regex (or substring scan) per term costs O(terms x text) per chunk,
+which dominates with 5k-term domain glossaries. TermAutomaton compiles all
+terms of a glossary version into one automaton and scans the text once:
+
+- Case folding: keys and text are case-folded (``str.casefold``); match
+  offsets always refer to the original text. Case-sensitive terms share the
+  folded trie and are verified against the original slice.
+- Word boundaries (optional): a match may not continue a word on either
+  side (regex ``\\b`` for terms with word-character edges). Characters of
+  scripts written without spaces (CJK, Thai, ...) never glue, so a CJK term
+  matches inside CJK running text.
+- Overlaps: all occurrences (``find_all`` / ``present``), per-term
+  non-overlapping counts like ``str.count`` (``count``) or longest-match
+  priority across terms (``longest_matches``).
+
+Only the standard library is used, so the lightweight callers (TermLedger,
+the legacy GlossaryManager) can import it without SQLAlchemy. Owners keep
+the compiled automaton next to their terms and drop it on term edits.
+
+Example:
+    automaton = TermAutomaton(["heart", "heart failure"])
+    automaton.longest_matches("Acute heart failure")   # [(6, 19, 1)]
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+# (start, end, term index) — offsets into the original text
+Match = Tuple[int, int, int]
+
+# Scripts written without spaces between words: a term may start or end
+# anywhere inside a run of these
+_NO_SPACE_RANGES = (
+    (0x0E00, 0x0EFF),    # Thai, Lao
+    (0x1000, 0x109F),    # Myanmar
+    (0x1780, 0x17FF),    # Khmer
+    (0x3040, 0x30FF),    # Hiragana, Katakana
+    (0x3400, 0x4DBF),    # CJK Extension A
+    (0x4E00, 0x9FFF),    # CJK Unified Ideographs
+    (0xF900, 0xFAFF),    # CJK Compatibility Ideographs
+    (0x20000, 0x2FA1F),  # CJK Extensions B-F, Compatibility Supplement
+)
+
+
+def _is_no_space(ch: str) -> bool:
+    code = ord(ch)
+    return any(lo <= code <= hi for lo, hi in _NO_SPACE_RANGES)
+
+
+def _is_word(ch: str) -> bool:
+    """Regex ``\\w`` for a single character"""
+    return ch.isalnum() or ch == "_"
+
+
+def _fold(text: str) -> Tuple[str, Optional[List[int]]]:
+    """
+    Case-fold text for scanning.
+
+    Returns:
+        (folded text, folded index -> original index map); the map is None
+        when folding kept every character at its position
+    """
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded, None
+    # Some characters expand (ß -> ss): map folded positions back
+    pieces: List[str] = []
+    index: List[int] = []
+    for i, ch in enumerate(text):
+        f = ch.casefold()
+        pieces.append(f)
+        index.extend([i] * len(f))
+    return "".join(pieces), index
+
+
+class TermAutomaton:
+    """
+    Compiled Aho-Corasick automaton over a fixed list of terms.
+
+    Term indexes in results are positions in the list given to the
+    constructor. Immutable once built; rebuild when the terms change.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        case_sensitive: Optional[Sequence[bool]] = None,
+        priorities: Optional[Sequence[int]] = None,
+        word_boundary: bool = True,
+    ):
+        """
+        Args:
+            terms: Terms to match (empty/whitespace-only terms never match)
+            case_sensitive: Per-term flag (default: all case-insensitive)
+            priorities: Per-term priority for longest_matches() ties (higher wins)
+            word_boundary: Require a word boundary at both ends of a match
+        """
+        self.terms: List[str] = list(terms)
+        self.case_sensitive: List[bool] = (
+            list(case_sensitive) if case_sensitive is not None else [False] * len(self.terms)
+        )
+        self.priorities: List[int] = (
+            list(priorities) if priorities is not None else [0] * len(self.terms)
+        )
+        self.word_boundary = word_boundary
+
+        # Trie: goto[node] maps a character to the next node; out[node] lists
+        # (term index, key length) of every term ending there (incl. suffixes)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[List[Tuple[int, int]]] = [[]]
+        for idx, term in enumerate(self.terms):
+            key = term.strip().casefold()
+            if not key:
+                continue
+            node = 0
+            for ch in key:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((idx, len(key)))
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first failure links; outputs are merged along them."""
+        self._fail: List[int] = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                link = self._goto[f].get(ch, 0)
+                self._fail[child] = link if link != child else 0
+                if self._out[self._fail[child]]:
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _bounded(text: str, start: int, end: int) -> bool:
+        """A match is not glued to a neighbouring word character on either
+        side (edges that are themselves non-word, or no-space script, never
+        need a boundary)."""
+        first, last = text[start], text[end - 1]
+        if start > 0 and _is_word(first) and not _is_no_space(first):
+            before = text[start - 1]
+            if _is_word(before) and not _is_no_space(before):
+                return False
+        if end < len(text) and _is_word(last) and not _is_no_space(last):
+            after = text[end]
+            if _is_word(after) and not _is_no_space(after):
+                return False
+        return True
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """Every occurrence of every term (overlaps included), in order of end."""
+        if not text or len(self._goto) == 1:
+            return
+        folded, index = _fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for pos, ch in enumerate(folded):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            for idx, length in out[node]:
+                fstart = pos + 1 - length
+                if index is None:
+                    start, end = fstart, pos + 1
+                else:
+                    start, end = index[fstart], index[pos] + 1
+                if self.case_sensitive[idx] and text[start:end] != self.terms[idx].strip():
+                    continue
+                if self.word_boundary and not self._bounded(text, start, end):
+                    continue
+                yield start, end, idx
+
+    def find_all(self, text: str) -> List[Match]:
+        """All occurrences sorted by position (overlaps included)."""
+        return sorted(self.iter_matches(text))
+
+    def present(self, text: str) -> Set[int]:
+        """Indexes of the terms that occur in text at least once."""
+        return {idx for _, _, idx in self.iter_matches(text)}
+
+    def count(self, text: str) -> Dict[int, int]:
+        """Non-overlapping occurrences per term (like ``str.count``), for
+        the terms that occur."""
+        counts: Dict[int, int] = {}
+        next_free: Dict[int, int] = {}
+        # iter_matches yields in order of end; for a single term that is
+        # also order of start, so a greedy scan matches str.count
+        for start, end, idx in self.iter_matches(text):
+            if start >= next_free.get(idx, 0):
+                counts[idx] = counts.get(idx, 0) + 1
+                next_free[idx] = end
+        return counts
+
+    def longest_matches(self, text: str) -> List[Match]:
+        """
+        Non-overlapping matches, longest term first.
+
+        Overlapping candidates are resolved by length, then priority (higher
+        wins), then term order, then position — the same outcome as matching
+        the terms one by one from longest to shortest.
+
+        Returns:
+            Matches sorted by position
+        """
+        candidates = list(self.iter_matches(text))
+        if not candidates:
+            return []
+        candidates.sort(key=lambda m: (
+            m[0] - m[1],
+            -self.priorities[m[2]],
+            m[2],
+            m[0],
+        ))
+        taken = bytearray(len(text))
+        chosen: List[Match] = []
+        for start, end, idx in candidates:
+            if taken.find(1, start, end) != -1:
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            chosen.append((start, end, idx))
+        chosen.sort()
+        return chosen
@@ -7,10 +7,12 @@ Key components:
 - TMRepository: Database operations
 - Segmenter: Split text into segments
 - Matcher: Find similar segments
+- TMFuzzyIndex: Bigram candidate index for fuzzy lookup
 """
 
 from .service import TMService, get_tm_service
 from .matcher import TMMatcher
+from .index import TMFuzzyIndex, get_fuzzy_index
 from .segmenter import Segmenter
 from .models import TranslationMemory, TMSegment
 
@@ -18,6 +20,8 @@ __all__ = [
     "TMService",
     "get_tm_service",
     "TMMatcher",
+    "TMFuzzyIndex",
+    "get_fuzzy_index",
     "Segmenter",
     "TranslationMemory",
     "TMSegment",
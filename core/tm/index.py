@@ -0,0 +1,278 @@
+"""
+TM Fuzzy Index
+Bounded candidate selection for fuzzy lookup.
+
+TMMatcher scores with SequenceMatcher.ratio() = 2M / T, where M is the
+number of matched characters and T the combined length of both normalized
+texts. Two bounds select candidates without dropping any segment that can
+still reach the threshold t:
+
+- Length: M <= min(n1, n2), so n2 must lie in [n1*t/(2-t), n1*(2-t)/t].
+- Bigrams: consecutive matching blocks are separated by at least one
+  unmatched character, so there are at most T - 2M + 1 blocks and the texts
+  share O >= 3M - T - 1 character bigrams, i.e. ratio <= 2(O + T + 1) / 3T.
+
+Bigram postings live in tm_segment_grams (see models.TMSegmentGram) and are
+kept in sync by mapper events. The bigram bound only prunes for t > 2/3;
+below that, and for very short texts, lookup falls back to a length scan.
+
+search() tightens each candidate's bound with the longest common
+subsequence (TMMatcher.lcs_bound) before loading it, scores best-bound-first
+and stops once no remaining bound can beat the current k-th result. Top-k
+results are exactly those of a full scan.
+"""
+import json
+import logging
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, text
+
+from .matcher import MatchResult, TMMatcher
+from .models import TMSegmentGram, compute_bigrams, normalize_text, segment_gram_rows
+from .repository import TMRepository, get_repository
+
+logger = logging.getLogger(__name__)
+
+# Slack for float rounding at the bound edges (only ever widens the set)
+_EPSILON = 1e-9
+
+# Candidates bound-checked and scored per round in search()
+_SCORE_BATCH = 256
+
+_OVERLAP_SQL = text("""
+    SELECT g.segment_id, MAX(g.norm_length), SUM(MIN(g.count, q.value))
+    FROM json_each(:grams) AS q
+    CROSS JOIN tm_segment_grams AS g
+    WHERE g.tm_id IN :tm_ids
+      AND g.gram = q.key
+      AND g.norm_length BETWEEN :min_length AND :max_length
+      AND g.word_count BETWEEN :min_words AND :max_words
+    GROUP BY g.segment_id
+    HAVING SUM(MIN(g.count, q.value)) >= (:length + MAX(g.norm_length)) * :factor - 1 - :epsilon
+""").bindparams(bindparam("tm_ids", expanding=True))
+
+_LENGTH_SCAN_SQL = text("""
+    SELECT id, length(source_normalized) FROM tm_segments
+    WHERE tm_id IN :tm_ids
+      AND length(source_normalized) BETWEEN :min_length AND :max_length
+      AND source_length BETWEEN :min_words AND :max_words
+""").bindparams(bindparam("tm_ids", expanding=True))
+
+_NORMALIZED_SQL = text("""
+    SELECT id, source_normalized FROM tm_segments WHERE id IN :ids
+""").bindparams(bindparam("ids", expanding=True))
+
+_UNINDEXED_SQL = text("""
+    SELECT s.id, s.tm_id, s.source_text FROM tm_segments AS s
+    WHERE s.tm_id = :tm_id
+      AND NOT EXISTS (SELECT 1 FROM tm_segment_grams AS g WHERE g.segment_id = s.id)
+""")
+
+
+def _length_bound(n1: int, n2: int) -> float:
+    """Upper bound of ratio() from lengths alone (M <= min(n1, n2))."""
+    total = n1 + n2
+    return 2 * min(n1, n2) / total if total else 1.0
+
+
+def _bigram_bound(n1: int, n2: int, overlap: int) -> float:
+    """Upper bound of ratio() from the shared bigram count."""
+    total = n1 + n2
+    if not total:
+        return 1.0
+    return min(_length_bound(n1, n2), 2 * (overlap + total + 1) / (3 * total))
+
+
+class TMFuzzyIndex:
+    """
+    Candidate index for fuzzy TM lookup.
+
+    Finds the segments that can still score >= threshold against the query,
+    with an upper bound of each one's score, so TMMatcher only has to score
+    a small, bounded set.
+    """
+
+    def __init__(self, repository: Optional[TMRepository] = None):
+        """Initialize index on top of a repository."""
+        self.repository = repository or get_repository()
+        self._synced: Set[str] = set()
+
+    def ensure_indexed(self, tm_ids: List[str]) -> int:
+        """
+        Backfill postings for segments stored before the index existed.
+
+        Runs once per TM per process; later writes are indexed by the
+        TMSegment mapper events.
+
+        Returns:
+            Number of segments indexed
+        """
+        indexed = 0
+        table = TMSegmentGram.__table__
+
+        for tm_id in tm_ids:
+            if tm_id in self._synced:
+                continue
+
+            with self.repository.engine.begin() as conn:
+                pending = conn.execute(_UNINDEXED_SQL, {"tm_id": tm_id}).fetchall()
+                rows = []
+                for segment_id, seg_tm_id, source_text in pending:
+                    rows.extend(segment_gram_rows(segment_id, seg_tm_id, source_text))
+                if rows:
+                    conn.execute(table.insert(), rows)
+                indexed += len(pending)
+
+            self._synced.add(tm_id)
+
+        if indexed:
+            logger.info(f"Fuzzy index backfilled {indexed} segments")
+        return indexed
+
+    def candidates(
+        self,
+        tm_ids: List[str],
+        source_text: str,
+        min_similarity: float,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find segments that may match with >= min_similarity.
+
+        Args:
+            tm_ids: TMs to search
+            source_text: Text to match
+            min_similarity: Similarity threshold (TMMatcher scale)
+
+        Returns:
+            (segment_id, score upper bound) pairs, best bound first
+        """
+        if not tm_ids:
+            return []
+
+        self.ensure_indexed(tm_ids)
+
+        normalized = normalize_text(source_text)
+        length = len(normalized)
+        words = len(source_text.split())
+        t = min_similarity
+
+        # Mirrors TMMatcher.find_fuzzy's word-count filter (|a-b|/max <= 0.5)
+        params = {
+            "tm_ids": list(tm_ids),
+            "min_words": math.ceil(words / 2),
+            "max_words": words * 2,
+            "min_length": 0,
+            "max_length": length,
+        }
+        if t > 0:
+            params["min_length"] = math.ceil(length * t / (2 - t) - _EPSILON)
+            params["max_length"] = math.floor(length * (2 - t) / t + _EPSILON)
+
+        factor = 1.5 * t - 1
+        bounds: Dict[str, float] = {}
+
+        with self.repository.engine.connect() as conn:
+            if factor <= 0:
+                # Bigram bound is vacuous: scan by length only
+                for segment_id, seg_length in conn.execute(_LENGTH_SCAN_SQL, params):
+                    bounds[segment_id] = _length_bound(length, seg_length)
+            else:
+                grams = compute_bigrams(normalized)
+                if grams:
+                    overlap_params = dict(
+                        params,
+                        grams=json.dumps(grams),
+                        length=length,
+                        factor=factor,
+                        epsilon=_EPSILON,
+                    )
+                    for segment_id, seg_length, overlap in conn.execute(_OVERLAP_SQL, overlap_params):
+                        bounds[segment_id] = _bigram_bound(length, seg_length, overlap)
+
+                # Candidates so short that the bound needs no shared bigram
+                short_max = math.floor(1 / factor + _EPSILON) - length
+                if short_max >= params["min_length"]:
+                    short_params = dict(
+                        params, max_length=min(params["max_length"], short_max)
+                    )
+                    for segment_id, seg_length in conn.execute(_LENGTH_SCAN_SQL, short_params):
+                        bounds.setdefault(segment_id, _length_bound(length, seg_length))
+
+        return sorted(bounds.items(), key=lambda item: item[1], reverse=True)
+
+    def search(
+        self,
+        tm_ids: List[str],
+        source_text: str,
+        matcher: TMMatcher,
+        min_similarity: Optional[float] = None,
+        max_results: int = 5,
+    ) -> List[MatchResult]:
+        """
+        Find the top fuzzy matches across TMs.
+
+        Same results as matcher.find_fuzzy over every segment of the TMs,
+        but only candidates whose LCS bound reaches the threshold are loaded
+        and scored, best-bound-first, until no remaining bound can reach the
+        k-th best match.
+
+        Args:
+            tm_ids: TMs to search (earlier TMs win ties)
+            source_text: Text to match
+            matcher: Scorer
+            min_similarity: Minimum similarity (matcher default if None/0)
+            max_results: Maximum matches to return
+
+        Returns:
+            List of matches sorted by similarity (descending)
+        """
+        threshold = min_similarity or matcher.fuzzy_threshold
+        ranked = self.candidates(tm_ids, source_text, threshold)
+        source_norm = normalize_text(source_text)
+        tm_order = {tm_id: i for i, tm_id in enumerate(tm_ids)}
+
+        matches: List[MatchResult] = []
+        floor = threshold
+        scored = 0
+
+        for start in range(0, len(ranked), _SCORE_BATCH):
+            batch = [seg_id for seg_id, bound in ranked[start:start + _SCORE_BATCH] if bound >= floor - _EPSILON]
+            if not batch:
+                break
+
+            with self.repository.engine.connect() as conn:
+                texts = conn.execute(_NORMALIZED_SQL, {"ids": batch}).fetchall()
+            batch = [
+                seg_id for seg_id, seg_norm in texts
+                if matcher.lcs_bound(source_norm, seg_norm) >= floor - _EPSILON
+            ]
+            if not batch:
+                continue
+
+            scored += len(batch)
+            segments = self.repository.get_segments_by_ids(batch)
+            segments.sort(key=lambda s: (tm_order.get(s.tm_id, len(tm_order)), -s.quality_score))
+            matches.extend(matcher.find_fuzzy(
+                source_text, segments, min_similarity=floor, max_results=len(segments)
+            ))
+
+            matches.sort(key=lambda m: (m.similarity, m.segment.quality_score), reverse=True)
+            del matches[max_results:]
+            if len(matches) == max_results:
+                floor = max(floor, matches[-1].similarity)
+
+        logger.debug(f"Fuzzy search scored {scored}/{len(ranked)} candidates")
+        return matches
+
+
+# Global instance
+_index: Optional[TMFuzzyIndex] = None
+
+
+def get_fuzzy_index() -> TMFuzzyIndex:
+    """Get or create the global fuzzy index instance."""
+    global _index
+    if _index is None:
+        _index = TMFuzzyIndex()
+    return _index
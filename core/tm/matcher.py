@@ -15,6 +15,29 @@ from .schemas import MatchType
 logger = logging.getLogger(__name__)
 
 
+def lcs_length(text1: str, text2: str) -> int:
+    """
+    Length of the longest common subsequence (bit-parallel, Hyyro 2004).
+
+    SequenceMatcher's matched characters are a common subsequence, so
+    2 * lcs_length / total length is an upper bound of ratio().
+    """
+    if not text1 or not text2:
+        return 0
+
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(text1):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+
+    full = (1 << len(text1)) - 1
+    row = full
+    for ch in text2:
+        matches = row & masks.get(ch, 0)
+        row = ((row + matches) | (row - matches)) & full
+
+    return len(text1) - bin(row).count("1")
+
+
 @dataclass
 class MatchResult:
     """Result of a TM match."""
@@ -119,7 +142,7 @@ class TMMatcher:
 
             # Compute similarity
             seg_norm = self._normalize(segment.source_text)
-            similarity = self._compute_similarity(source_norm, seg_norm)
+            similarity = self._compute_similarity(source_norm, seg_norm, min_similarity)
 
             if similarity >= min_similarity:
                 match_type = self._get_match_type(similarity)
@@ -224,13 +247,31 @@ class TMMatcher:
 
         return normalized
 
-    def _compute_similarity(self, text1: str, text2: str) -> float:
+    def _compute_similarity(
+        self,
+        text1: str,
+        text2: str,
+        min_similarity: float = 0.0,
+    ) -> float:
         """
         Compute similarity between two normalized texts.
 
         Uses SequenceMatcher which is based on Ratcliff/Obershelp algorithm.
+        Pairs whose cheap upper bounds already fall below min_similarity
+        return 0.0 without running the full comparison.
         """
-        return SequenceMatcher(None, text1, text2).ratio()
+        sm = SequenceMatcher(None, text1, text2)
+        if sm.real_quick_ratio() < min_similarity or sm.quick_ratio() < min_similarity:
+            return 0.0
+        if min_similarity > 0 and self.lcs_bound(text1, text2) < min_similarity:
+            return 0.0
+        return sm.ratio()
+
+    @staticmethod
+    def lcs_bound(text1: str, text2: str) -> float:
+        """Upper bound of ratio() from the longest common subsequence."""
+        total = len(text1) + len(text2)
+        return 2 * lcs_length(text1, text2) / total if total else 1.0
 
     def _get_match_type(self, similarity: float) -> MatchType:
         """Determine match type from similarity score."""
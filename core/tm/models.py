@@ -2,11 +2,12 @@
 Translation Memory Database Models
 SQLAlchemy models for TM and segments.
 """
+from collections import Counter
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 from sqlalchemy import (
     String, Text, Integer, Float, Boolean, DateTime,
-    ForeignKey, Index, event, create_engine
+    ForeignKey, Index, event, create_engine, inspect
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column, declarative_base
 import uuid
@@ -35,6 +36,11 @@ def normalize_text(text: str) -> str:
     return text
 
 
+def compute_bigrams(normalized: str) -> Dict[str, int]:
+    """Character bigram counts of normalized text (fuzzy index postings)."""
+    return dict(Counter(normalized[i:i + 2] for i in range(len(normalized) - 1)))
+
+
 class TranslationMemory(Base):
     """
     Translation Memory - a collection of translated segments.
@@ -204,6 +210,54 @@ class TMSegment(Base):
         }
 
 
+class TMSegmentGram(Base):
+    """
+    Fuzzy index posting - one character bigram of a segment.
+
+    Length and word count are denormalized so candidate lookups can be
+    answered from the covering index alone (see core.tm.index).
+    """
+
+    __tablename__ = "tm_segment_grams"
+
+    segment_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("tm_segments.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    gram: Mapped[str] = mapped_column(String(2), primary_key=True)
+    tm_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, default=1)
+    norm_length: Mapped[int] = mapped_column(Integer, default=0)  # chars
+    word_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index(
+            "idx_gram_lookup",
+            "tm_id", "gram", "norm_length", "word_count", "segment_id", "count",
+        ),
+    )
+
+    def __repr__(self):
+        return f"<Gram {self.gram!r} x{self.count}>"
+
+
+def segment_gram_rows(segment_id: str, tm_id: str, source_text: str) -> List[dict]:
+    """Build fuzzy index rows for a segment's source text."""
+    normalized = normalize_text(source_text)
+    word_count = len(source_text.split())
+    return [
+        {
+            "segment_id": segment_id,
+            "gram": gram,
+            "tm_id": tm_id,
+            "count": count,
+            "norm_length": len(normalized),
+            "word_count": word_count,
+        }
+        for gram, count in compute_bigrams(normalized).items()
+    ]
+
+
 # ==================== EVENT LISTENERS ====================
 
 @event.listens_for(TMSegment, "before_insert")
@@ -224,6 +278,33 @@ def compute_segment_fields_on_update(mapper, connection, target):
         target.source_length = len(target.source_text.split())
 
 
+@event.listens_for(TMSegment, "after_insert")
+def index_segment_on_insert(mapper, connection, target):
+    """Keep the fuzzy index in sync with new segments."""
+    rows = segment_gram_rows(target.id, target.tm_id, target.source_text or "")
+    if rows:
+        connection.execute(TMSegmentGram.__table__.insert(), rows)
+
+
+@event.listens_for(TMSegment, "after_update")
+def index_segment_on_update(mapper, connection, target):
+    """Re-index a segment whose source text changed."""
+    if not inspect(target).attrs.source_text.history.has_changes():
+        return
+    table = TMSegmentGram.__table__
+    connection.execute(table.delete().where(table.c.segment_id == target.id))
+    rows = segment_gram_rows(target.id, target.tm_id, target.source_text or "")
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+@event.listens_for(TMSegment, "after_delete")
+def unindex_segment_on_delete(mapper, connection, target):
+    """Drop fuzzy index postings of a deleted segment."""
+    table = TMSegmentGram.__table__
+    connection.execute(table.delete().where(table.c.segment_id == target.id))
+
+
 # ==================== DATABASE SETUP ====================
 
 def get_engine(db_path: str = "data/tm.db"):
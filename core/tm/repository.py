@@ -394,6 +394,16 @@ class TMRepository:
                 TMSegment.quality_score.desc()
             ).all()
 
+    def get_segments_by_ids(self, segment_ids: List[str]) -> List[TMSegment]:
+        """Get segments by ID (fuzzy index candidates)."""
+        segments: List[TMSegment] = []
+        with self.get_session() as session:
+            for start in range(0, len(segment_ids), 500):
+                segments.extend(session.query(TMSegment).filter(
+                    TMSegment.id.in_(segment_ids[start:start + 500])
+                ).all())
+        return segments
+
     def get_segments_by_hash(
         self,
         tm_ids: List[str],
@@ -6,7 +6,7 @@ import logging
 from typing import Optional, List, Tuple
 from datetime import datetime
 
-from .models import TranslationMemory, TMSegment
+from .models import TranslationMemory, TMSegment, compute_hash
 from .schemas import (
     TMCreate, TMUpdate, TMResponse, TMListResponse,
     SegmentCreate, SegmentUpdate, SegmentResponse, SegmentListResponse,
@@ -16,6 +16,7 @@ from .schemas import (
 )
 from .repository import TMRepository, get_repository
 from .matcher import TMMatcher, get_matcher, MatchResult
+from .index import TMFuzzyIndex, get_fuzzy_index
 from .segmenter import Segmenter, get_segmenter, SegmentType
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ class TMService:
         """Initialize service."""
         self.repository = get_repository()
         self.matcher = get_matcher()
+        self.index = get_fuzzy_index()
 
     # ==================== TM OPERATIONS ====================
 
@@ -223,24 +225,15 @@ class TMService:
 
         Returns matching segments sorted by similarity.
         """
-        # Get all segments from specified TMs
-        all_segments = []
-        tm_names = {}
-
-        for tm_id in request.tm_ids:
-            tm = self.repository.get_tm(tm_id)
-            if tm:
-                tm_names[tm_id] = tm.name
-                segments = self.repository.get_all_segments(tm_id)
-                all_segments.extend(segments)
-
-        if not all_segments:
+        tm_names = self._active_tm_names(request.tm_ids)
+        if not tm_names:
             return LookupResponse(matches=[], best_match=None, match_count=0)
 
-        # Find matches
-        matches = self.matcher.find_fuzzy(
+        # Score only the candidates the fuzzy index can't rule out
+        matches = self.index.search(
+            list(tm_names),
             request.source_text,
-            all_segments,
+            self.matcher,
             min_similarity=request.min_similarity,
             max_results=request.max_results,
         )
@@ -275,16 +268,7 @@ class TMService:
         # Segment the text
         text_segments = segmenter.segment(request.source_text)
 
-        # Get all TM segments
-        all_tm_segments = []
-        tm_names = {}
-
-        for tm_id in request.tm_ids:
-            tm = self.repository.get_tm(tm_id)
-            if tm:
-                tm_names[tm_id] = tm.name
-                segments = self.repository.get_all_segments(tm_id)
-                all_tm_segments.extend(segments)
+        tm_names = self._active_tm_names(request.tm_ids)
 
         # Match each segment
         processed = []
@@ -292,11 +276,7 @@ class TMService:
         total_cost_factor = 0.0
 
         for seg in text_segments:
-            match = self.matcher.find_best(
-                seg.text,
-                all_tm_segments,
-                min_similarity=request.min_similarity,
-            )
+            match = self._find_best(seg.text, list(tm_names), request.min_similarity)
 
             cost_factor = self.matcher.estimate_cost_factor(match)
             total_cost_factor += cost_factor
@@ -331,6 +311,35 @@ class TMService:
             estimated_savings=estimated_savings,
         )
 
+    def _active_tm_names(self, tm_ids: List[str]) -> dict:
+        """Map active TM IDs to names, preserving request order."""
+        tm_names = {}
+        for tm_id in tm_ids:
+            tm = self.repository.get_tm(tm_id)
+            if tm:
+                tm_names[tm_id] = tm.name
+        return tm_names
+
+    def _find_best(
+        self,
+        source_text: str,
+        tm_ids: List[str],
+        min_similarity: Optional[float],
+    ) -> Optional[MatchResult]:
+        """Best match across TMs: exact hash hit first, then indexed fuzzy."""
+        if not tm_ids:
+            return None
+
+        exact = self.repository.get_segments_by_hash(tm_ids, compute_hash(source_text))
+        if exact:
+            exact.sort(key=lambda s: tm_ids.index(s.tm_id))
+            return MatchResult(segment=exact[0], similarity=1.0, match_type=MatchType.EXACT)
+
+        fuzzy = self.index.search(
+            tm_ids, source_text, self.matcher, min_similarity=min_similarity, max_results=1
+        )
+        return fuzzy[0] if fuzzy else None
+
     def _match_to_response(self, match: MatchResult, tm_name: str) -> TMMatch:
         """Convert MatchResult to TMMatch schema."""
         return TMMatch(
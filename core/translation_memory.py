@@ -5,6 +5,7 @@
 Translation Memory - SQLite-based TM system with fuzzy matching
 """
 
+import json
 import sqlite3
 import hashlib
 import time
@@ -63,6 +64,131 @@ class TMMatch:
         return f"TMMatch(similarity={self.similarity:.2%}, type={self.match_type})"
 
 
+def bounded_levenshtein(s1: str, s2: str, max_distance: int) -> Optional[int]:
+    """
+    Levenshtein distance if it is <= max_distance, else None
+
+    Ukkonen cut-off: only the diagonal band |i - j| <= max_distance is
+    computed, and the scan stops as soon as a whole row exceeds the bound.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    n, m = len(s1), len(s2)
+    if n - m > max_distance:
+        return None
+    if m == 0:
+        return n
+
+    over = max_distance + 1
+    previous = [j if j <= max_distance else over for j in range(m + 1)]
+    for i in range(1, n + 1):
+        current = [over] * (m + 1)
+        if i <= max_distance:
+            current[0] = i
+        c1 = s1[i - 1]
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(m, i + max_distance) + 1):
+            cost = previous[j - 1] + (c1 != s2[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if cost > over:
+                cost = over
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    return previous[m] if previous[m] <= max_distance else None
+
+
+class SimilarityScorer:
+    """
+    Threshold-aware TM similarity for one query against many candidates
+
+    Same score as TranslationMemory._calculate_similarity (40% Levenshtein,
+    30% bigram Jaccard, 30% word Jaccard), but:
+    - query normalization, bigrams and words are computed once
+    - candidates whose length/bigram/word upper bound is below the
+      threshold are rejected before any edit distance is computed
+    - the edit distance is banded and gives up once the threshold is out
+      of reach
+
+    Scores >= threshold are identical to the full computation; rejected
+    candidates get an upper bound that is below the threshold.
+    """
+
+    # Slack for float rounding when deriving the edit-distance budget
+    EPSILON = 1e-9
+
+    def __init__(self, query: str, threshold: float = 0.0):
+        self.query = query
+        self.threshold = threshold
+        self.normalized = query.lower().strip()
+        self.bigrams = _bigrams(self.normalized)
+        self.words = _words(self.normalized)
+
+    def score(self, candidate: str) -> float:
+        """Similarity of candidate to the query (0.0-1.0)"""
+        if candidate == self.query:
+            return 1.0
+
+        s1 = self.normalized
+        s2 = candidate.lower().strip()
+        if not s1 or not s2:
+            return 0.0
+
+        longest = max(len(s1), len(s2))
+        lev_bound = 1.0 - (abs(len(s1) - len(s2)) / longest)
+
+        char_similarity = _jaccard(self.bigrams, _bigrams(s2))
+        if lev_bound * 0.4 + char_similarity * 0.3 + 0.3 < self.threshold:
+            return lev_bound * 0.4 + char_similarity * 0.3
+
+        word_similarity = _jaccard(self.words, _words(s2))
+        rest = char_similarity * 0.3 + word_similarity * 0.3
+        upper = lev_bound * 0.4 + rest
+        if upper < self.threshold:
+            return upper
+
+        # Largest edit distance that can still reach the threshold
+        if self.threshold > 0:
+            needed = (self.threshold - rest) / 0.4
+            budget = int((1.0 - needed) * longest + self.EPSILON)
+        else:
+            budget = longest
+        distance = bounded_levenshtein(s1, s2, min(budget, longest))
+        if distance is None:
+            return min(upper, self.threshold - self.EPSILON)
+
+        lev_similarity = 1.0 - (distance / longest)
+        return (
+            lev_similarity * 0.4 +
+            char_similarity * 0.3 +
+            word_similarity * 0.3
+        )
+
+
+def _bigrams(s: str) -> set:
+    """Character bigram set"""
+    return set(s[i:i+2] for i in range(len(s) - 1))
+
+
+def _words(s: str) -> set:
+    """Lowercased word set"""
+    return set(re.findall(r'\b\w+\b', s.lower()))
+
+
+def _jaccard(a: set, b: set) -> float:
+    """Jaccard similarity, 0.0 when either side is empty"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
 class TranslationMemory:
     """SQLite-based Translation Memory with fuzzy matching"""
 
@@ -174,6 +300,16 @@ class TranslationMemory:
 
         self.conn.commit()
 
+    def reopen(self) -> "TranslationMemory":
+        """
+        Open another TranslationMemory on the same database
+
+        sqlite3 connections must not be shared between threads; use this to
+        give a worker thread its own connection (WAL lets readers run while
+        another connection writes).
+        """
+        return TranslationMemory(self.db_path)
+
     def add_segment(self, segment: TMSegment) -> int:
         """
         Add or update a segment in TM
@@ -184,7 +320,33 @@ class TranslationMemory:
         Returns:
             Segment ID
         """
+        segment_id = self._write_segment(self.conn.cursor(), segment)
+        self.conn.commit()
+        return segment_id
+
+    def add_segments(self, segments: List[TMSegment]) -> List[int]:
+        """
+        Add or update many segments in one transaction
+
+        Same per-segment semantics as add_segment(), one commit in total.
+
+        Args:
+            segments: TMSegments to add (later duplicates update earlier ones)
+
+        Returns:
+            Segment IDs, in input order
+        """
         cursor = self.conn.cursor()
+        try:
+            ids = [self._write_segment(cursor, segment) for segment in segments]
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return ids
+
+    def _write_segment(self, cursor: sqlite3.Cursor, segment: TMSegment) -> int:
+        """Insert or update one segment without committing"""
         source_hash = segment.get_hash()
 
         # Check if segment exists
@@ -251,7 +413,6 @@ class TranslationMemory:
             ))
             segment_id = cursor.lastrowid
 
-        self.conn.commit()
         return segment_id
 
     def get_exact_match(
@@ -361,10 +522,11 @@ class TranslationMemory:
         rows = cursor.fetchall()
 
         # Calculate similarity for each candidate
+        scorer = SimilarityScorer(source, threshold)
         matches = []
         for row in rows:
             segment = self._row_to_segment(row)
-            similarity = self._calculate_similarity(source, segment.source)
+            similarity = scorer.score(segment.source)
 
             if similarity >= threshold:
                 matches.append(TMMatch(
@@ -377,6 +539,144 @@ class TranslationMemory:
         matches.sort(key=lambda m: m.similarity, reverse=True)
         return matches[:max_results]
 
+    def lookup_many(
+        self,
+        sentences: List[str],
+        source_lang: str = "en",
+        target_lang: str = "vi",
+        threshold: float = 0.7,
+        domain: Optional[str] = None,
+        fuzzy: bool = True
+    ) -> List[Optional[TMMatch]]:
+        """
+        Best TM match for each of many sentences in a handful of queries
+
+        Batched equivalent of calling get_exact_match() and then
+        get_fuzzy_matches(max_results=1) per sentence:
+        - all exact hashes resolved with one IN (...) query per 500 sentences
+        - FTS candidates for every remaining sentence fetched in one pass
+        - use_count increments for exact hits applied in one transaction
+
+        Args:
+            sentences: Source texts (duplicates allowed)
+            source_lang: Source language
+            target_lang: Target language
+            threshold: Minimum fuzzy similarity (0.0-1.0)
+            domain: Optional domain filter for fuzzy matches
+            fuzzy: Also look up fuzzy matches for sentences without exact hit
+
+        Returns:
+            One TMMatch (or None) per input sentence, in input order
+        """
+        unique = list(dict.fromkeys(sentences))
+        hashes = {
+            hashlib.sha256(f"{source_lang}:{target_lang}:{s}".encode()).hexdigest(): s
+            for s in unique
+        }
+
+        # 1. Exact matches
+        exact: Dict[str, TMMatch] = {}
+        hash_list = list(hashes)
+        for start in range(0, len(hash_list), 500):
+            batch = hash_list[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(f"""
+                SELECT * FROM segments
+                WHERE source_hash IN ({placeholders})
+                AND source_lang = ? AND target_lang = ?
+            """, (*batch, source_lang, target_lang)).fetchall()
+            for row in rows:
+                exact[hashes[row['source_hash']]] = TMMatch(
+                    segment=self._row_to_segment(row),
+                    similarity=1.0,
+                    match_type="exact"
+                )
+
+        # 2. Fuzzy matches for the rest
+        fuzzy_best: Dict[str, TMMatch] = {}
+        if fuzzy:
+            pending = [s for s in unique if s not in exact]
+            candidates = self._fts_candidates_many(pending, source_lang, target_lang, domain)
+            for sentence, rows in candidates.items():
+                scorer = SimilarityScorer(sentence, threshold)
+                best = None
+                for row in rows:
+                    similarity = scorer.score(row['source'])
+                    if similarity >= threshold and (best is None or similarity > best.similarity):
+                        best = TMMatch(
+                            segment=self._row_to_segment(row),
+                            similarity=similarity,
+                            match_type="fuzzy"
+                        )
+                if best:
+                    fuzzy_best[sentence] = best
+
+        # 3. Deferred use_count updates (one per exact-matched occurrence)
+        uses: Dict[int, int] = {}
+        for sentence in sentences:
+            if sentence in exact:
+                segment_id = exact[sentence].segment.id
+                uses[segment_id] = uses.get(segment_id, 0) + 1
+        if uses:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE segments SET use_count = use_count + ? WHERE id = ?",
+                    [(count, segment_id) for segment_id, count in uses.items()]
+                )
+
+        return [exact.get(s) or fuzzy_best.get(s) for s in sentences]
+
+    def _fts_candidates_many(
+        self,
+        sentences: List[str],
+        source_lang: str,
+        target_lang: str,
+        domain: Optional[str] = None,
+        per_sentence: int = 3
+    ) -> Dict[str, List[sqlite3.Row]]:
+        """
+        FTS candidates for many sentences in one query
+
+        Same candidates as get_fuzzy_matches(max_results=1): top-5 keyword OR
+        query, best quality_score/use_count first, 3 per sentence.
+        """
+        expressions = []
+        for sentence in sentences:
+            keywords = self._extract_keywords(sentence)
+            if keywords:
+                expressions.append((sentence, " OR ".join(keywords[:5])))
+
+        if not expressions:
+            return {}
+
+        query = """
+            WITH q(idx, expr) AS (
+                SELECT CAST(key AS INTEGER), value FROM json_each(?)
+            )
+            SELECT * FROM (
+                SELECT q.idx AS query_idx, s.*,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY q.idx
+                           ORDER BY s.quality_score DESC, s.use_count DESC
+                       ) AS rank_in_query
+                FROM q
+                JOIN segments_fts ON segments_fts MATCH q.expr
+                JOIN segments s ON s.id = segments_fts.rowid
+                WHERE s.source_lang = ? AND s.target_lang = ?
+        """
+        params: List[Any] = [json.dumps([expr for _, expr in expressions]), source_lang, target_lang]
+        if domain:
+            query += " AND s.domain = ?"
+            params.append(domain)
+        query += ") WHERE rank_in_query <= ?"
+        params.append(per_sentence)
+
+        candidates: Dict[str, List[sqlite3.Row]] = {}
+        for row in self.conn.execute(query, params):
+            sentence = expressions[row['query_idx']][0]
+            candidates.setdefault(sentence, []).append(row)
+        return candidates
+
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords for FTS search"""
         # Remove punctuation and split
@@ -388,7 +688,7 @@ class TranslationMemory:
 
         return keywords
 
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
+    def _calculate_similarity(self, str1: str, str2: str, threshold: float = 0.0) -> float:
         """
         Calculate similarity between two strings using multiple methods
 
@@ -396,34 +696,11 @@ class TranslationMemory:
         - Levenshtein distance (edit distance)
         - Character-based similarity
         - Word overlap
-        """
-        if str1 == str2:
-            return 1.0
-
-        # Normalize
-        s1 = str1.lower().strip()
-        s2 = str2.lower().strip()
 
-        if not s1 or not s2:
-            return 0.0
-
-        # 1. Levenshtein distance (40% weight)
-        lev_similarity = 1.0 - (self._levenshtein_distance(s1, s2) / max(len(s1), len(s2)))
-
-        # 2. Character bigram similarity (30% weight)
-        char_similarity = self._bigram_similarity(s1, s2)
-
-        # 3. Word overlap (30% weight)
-        word_similarity = self._word_overlap_similarity(s1, s2)
-
-        # Weighted average
-        similarity = (
-            lev_similarity * 0.4 +
-            char_similarity * 0.3 +
-            word_similarity * 0.3
-        )
-
-        return similarity
+        With a threshold, pairs that cannot reach it exit early with a
+        score below the threshold (see SimilarityScorer).
+        """
+        return SimilarityScorer(str1, threshold).score(str2)
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance (edit distance)"""
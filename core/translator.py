@@ -38,22 +38,40 @@ Dependencies:
 """
 
 import asyncio
-from typing import Optional, List, Any
+import dataclasses
+import hashlib
+from typing import Optional, List, Any, Dict
 from collections.abc import Callable
 import httpx
 
+from ai_providers.batch import BatchRequest, get_batch_client
+from ai_providers.concurrency import estimate_tokens, get_limiter
+
 from .chunker import TranslationChunk
 from .validator import TranslationResult, QualityValidator
 from .glossary_legacy import GlossaryManager
 from .cache import TranslationCache
+from .cache.single_flight import SingleFlightStats, get_single_flight
 from .parallel import ParallelProcessor, BatchProcessor, ProcessingStats
-from .translation_memory import TranslationMemory, TMSegment
+from .translation_memory import TranslationMemory, TMSegment, TMMatch
+from .async_store import AsyncTranslationMemory, AsyncChunkCache, StoreWriteError
 from .language import LanguagePair, get_language_pair, get_language_name, LanguageValidator
 
 from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _write_behind_options() -> Dict[str, Any]:
+    """Write-behind batch size / interval for the TM and chunk cache facades."""
+    try:
+        from config.settings import settings
+        return {
+            "max_batch": settings.store_write_batch_size,
+            "max_delay": settings.store_write_interval_ms / 1000,
+        }
+    except Exception:
+        return {}
+
 
 class TranslatorEngine:
     """
@@ -161,6 +179,20 @@ class TranslatorEngine:
         self.tm_fuzzy_matches = 0
         self.tm_no_matches = 0
 
+        # LLM calls saved by waiting on identical in-flight chunks
+        self.flight_stats = SingleFlightStats()
+
+        # Translations returned by the provider batch API for the current
+        # job, by chunk id (see translate_batch)
+        self._batch_translations: Dict[Any, str] = {}
+
+        # Batched TM results for the current job (see prefetch_tm)
+        self._tm_prefetched: Dict[str, Optional[TMMatch]] = {}
+
+        # Off-loop TM / chunk cache access (created on first use)
+        self._tm_async: Optional[AsyncTranslationMemory] = None
+        self._chunk_cache_async: Optional[AsyncChunkCache] = None
+
     def build_prompt(self, chunk: TranslationChunk) -> str:
         """
         Build translation prompt for LLM with context and glossary.
@@ -261,38 +293,25 @@ class TranslatorEngine:
             Low quality translations (score < 0.5) trigger automatic retry.
             Failed translations return fallback text with quality_score=0.
         """
-        # 1. Check Translation Memory first (exact match)
+        # 1. Check Translation Memory first (exact, then fuzzy)
         if self.tm:
-            exact_match = self.tm.get_exact_match(
-                chunk.text,
-                self.source_lang,
-                self.target_lang
-            )
-            if exact_match:
+            match_type, match = await self._lookup_tm(chunk.text)
+            if match_type == "exact":
                 self.tm_exact_matches += 1
                 # FIX-002: Copy overlap_char_count
                 overlap_count = getattr(chunk, 'overlap_char_count', 0)
                 result = TranslationResult(
                     chunk_id=chunk.id,
                     source=chunk.text,
-                    translated=exact_match.segment.target,
-                    quality_score=exact_match.segment.quality_score,
+                    translated=match.segment.target,
+                    quality_score=match.segment.quality_score,
                     overlap_char_count=overlap_count
                 )
                 result.warnings.append(f"✓ TM exact match (100%)")
                 return result
 
-            # Check fuzzy matches
-            fuzzy_matches = self.tm.get_fuzzy_matches(
-                chunk.text,
-                self.source_lang,
-                self.target_lang,
-                threshold=self.tm_fuzzy_threshold,
-                max_results=1
-            )
-            if fuzzy_matches and fuzzy_matches[0].similarity >= self.tm_fuzzy_threshold:
+            if match_type == "fuzzy":
                 self.tm_fuzzy_matches += 1
-                match = fuzzy_matches[0]
                 # FIX-002: Copy overlap_char_count
                 overlap_count = getattr(chunk, 'overlap_char_count', 0)
                 result = TranslationResult(
@@ -317,7 +336,7 @@ class TranslatorEngine:
                 mode=self.mode,
                 domain=self.domain
             )
-            cached_translation = self.chunk_cache.get(cache_key)
+            cached_translation = await self._async_chunk_cache().get(cache_key)
             if cached_translation:
                 # FIX-002: Copy overlap_char_count
                 overlap_count = getattr(chunk, 'overlap_char_count', 0)
@@ -345,16 +364,94 @@ class TranslatorEngine:
 
         prompt = self.build_prompt(chunk)
 
+        # 3. Identical chunks already in flight share that call's result
+        try:
+            result, _tokens = await get_single_flight().do(
+                self._flight_key(chunk, prompt),
+                lambda: self._translate_uncached(client, chunk, prompt),
+                stats=self.flight_stats,
+                tokens_of=lambda value: value[1],
+            )
+        except Exception as e:
+            # Return với fallback
+            # FIX-002: Copy overlap_char_count
+            overlap_count = getattr(chunk, 'overlap_char_count', 0)
+            return TranslationResult(
+                chunk_id=chunk.id,
+                source=chunk.text,
+                translated=f"[TRANSLATION FAILED: {str(e)}]\n{chunk.text}",
+                quality_score=0.0,
+                warnings=[f"Translation failed after {self.max_retries} attempts: {str(e)}"],
+                overlap_char_count=overlap_count
+            )
+
+        if result.chunk_id != chunk.id:
+            # Result of an identical chunk translated by another caller
+            result = dataclasses.replace(
+                result,
+                chunk_id=chunk.id,
+                source=chunk.text,
+                warnings=list(result.warnings),
+                overlap_char_count=getattr(chunk, 'overlap_char_count', 0)
+            )
+        return result
+
+    def _flight_key(self, chunk: TranslationChunk, prompt: str) -> str:
+        """
+        Identity of a chunk's LLM call for single-flight coalescing.
+
+        The chunk cache key when a chunk cache is configured (so coalescing
+        matches what the cache would serve), otherwise a hash of the full
+        prompt, text and model.
+        """
+        model = f"{self.provider}/{self.model}"
+        if self.chunk_cache:
+            from .cache.chunk_cache import compute_chunk_key
+            return f"engine:{model}:" + compute_chunk_key(
+                source_text=chunk.text,
+                source_lang=self.source_lang,
+                target_lang=self.target_lang,
+                mode=self.mode,
+                domain=self.domain
+            )
+        digest = hashlib.sha256(
+            "\x00".join((model, prompt, chunk.text)).encode("utf-8")
+        ).hexdigest()
+        return f"engine-prompt:{digest}"
+
+    async def _translate_uncached(
+        self,
+        client: httpx.AsyncClient,
+        chunk: TranslationChunk,
+        prompt: str
+    ) -> tuple[TranslationResult, int]:
+        """
+        Translate a chunk with the LLM (retries, validation, cache/TM store).
+
+        Returns:
+            Tuple of (result, estimated tokens of all attempts).
+
+        Raises:
+            Exception: The last error once retries are exhausted.
+        """
+        tokens = 0
+        # Batch mode: the first attempt uses the batch API's answer
+        batched = self._batch_translations.pop(chunk.id, None)
         for attempt in range(1, self.max_retries + 1):
             try:
                 # Call API
-                if self.provider == "openai":
+                if batched is not None:
+                    translated, batched = batched, None
+                elif self.provider == "openai":
                     translated = await self._call_openai(client, prompt, chunk.text)
                 elif self.provider == "anthropic":
                     translated = await self._call_anthropic(client, prompt, chunk.text)
                 else:
                     raise ValueError(f"Unsupported provider: {self.provider}")
 
+                # ~4 chars per token (the raw API calls return no usage)
+                tokens += (len(prompt) + len(chunk.text) + len(translated)) // 4
+
                 if not translated.strip():
                     raise ValueError("Empty translation")
 
@@ -394,7 +491,7 @@ class TranslatorEngine:
                         mode=self.mode,
                         domain=self.domain
                     )
-                    self.chunk_cache.set(
+                    await self._async_chunk_cache().set(
                         key=cache_key,
                         value=translated,
                         source_lang=self.source_lang,
@@ -419,25 +516,157 @@ class TranslatorEngine:
                         context_after=chunk.context_after,
                         created_by=f"{self.provider}/{self.model}"
                     )
-                    self.tm.add_segment(tm_segment)
+                    await self._async_tm().add_segment(tm_segment)
 
-                return result
+                return result, tokens
 
-            except Exception as e:
+            except Exception:
                 if attempt < self.max_retries:
                     await asyncio.sleep(self.retry_delay * attempt)
                 else:
-                    # Return với fallback
-                    # FIX-002: Copy overlap_char_count
-                    overlap_count = getattr(chunk, 'overlap_char_count', 0)
-                    return TranslationResult(
-                        chunk_id=chunk.id,
-                        source=chunk.text,
-                        translated=f"[TRANSLATION FAILED: {str(e)}]\n{chunk.text}",
-                        quality_score=0.0,
-                        warnings=[f"Translation failed after {self.max_retries} attempts: {str(e)}"],
-                        overlap_char_count=overlap_count
-                    )
+                    raise
+
+    def prefetch_tm(self, chunks: List[TranslationChunk]) -> None:
+        """
+        Resolve TM matches for a whole job with one batched lookup.
+
+        Uses TranslationMemory.lookup_many so a long document costs a handful
+        of SQLite queries instead of 1-2 per chunk. translate_chunk reads the
+        prefetched result; chunks not covered fall back to per-chunk lookup.
+        Failures are logged and leave the per-chunk path in place.
+        """
+        if not self.tm or not chunks:
+            return
+
+        texts = [chunk.text for chunk in chunks]
+        try:
+            matches = self.tm.lookup_many(
+                texts,
+                self.source_lang,
+                self.target_lang,
+                threshold=self.tm_fuzzy_threshold
+            )
+            self._tm_prefetched = dict(zip(texts, matches))
+        except Exception as e:
+            logger.warning(f"TM prefetch failed, using per-chunk lookup: {e}")
+            self._tm_prefetched = {}
+
+    async def prefetch_tm_async(self, chunks: List[TranslationChunk]) -> None:
+        """prefetch_tm with the batched lookup run on a TM reader thread."""
+        if not self.tm or not chunks:
+            return
+
+        texts = [chunk.text for chunk in chunks]
+        try:
+            matches = await self._async_tm().lookup_many(
+                texts,
+                self.source_lang,
+                self.target_lang,
+                threshold=self.tm_fuzzy_threshold
+            )
+            self._tm_prefetched = dict(zip(texts, matches))
+        except Exception as e:
+            logger.warning(f"TM prefetch failed, using per-chunk lookup: {e}")
+            self._tm_prefetched = {}
+
+    def _async_tm(self) -> AsyncTranslationMemory:
+        """Off-loop facade over self.tm (rebuilt if self.tm was replaced)."""
+        if self._tm_async is None or self._tm_async.tm is not self.tm:
+            if self._tm_async is not None:
+                self._tm_async.close()
+            self._tm_async = AsyncTranslationMemory(self.tm, **_write_behind_options())
+        return self._tm_async
+
+    def _async_chunk_cache(self) -> AsyncChunkCache:
+        """Off-loop facade over self.chunk_cache (rebuilt if replaced)."""
+        if self._chunk_cache_async is None or self._chunk_cache_async.cache is not self.chunk_cache:
+            if self._chunk_cache_async is not None:
+                self._chunk_cache_async.close()
+            self._chunk_cache_async = AsyncChunkCache(self.chunk_cache, **_write_behind_options())
+        return self._chunk_cache_async
+
+    async def flush_stores(self) -> None:
+        """
+        Commit queued TM / chunk cache writes and release their threads.
+
+        Called when a job finishes; the facades are recreated on next use.
+
+        Raises:
+            StoreWriteError: If queued writes could not be committed (after
+                both stores were closed)
+        """
+        stores = [self._tm_async, self._chunk_cache_async]
+        self._tm_async = self._chunk_cache_async = None
+        error: Optional[StoreWriteError] = None
+        for store in stores:
+            if store is None:
+                continue
+            try:
+                await asyncio.to_thread(store.close)
+            except StoreWriteError as e:
+                logger.error(f"Flushing TM/cache writes failed: {e}")
+                error = error or e
+            except Exception as e:
+                logger.warning(f"Closing TM/cache store failed: {e}")
+        if error is not None:
+            raise error
+
+    def flush_stores_blocking(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until queued TM / chunk cache writes are committed.
+
+        For shutdown paths that cannot await (BatchProcessor.stop); the
+        facades stay usable afterwards.
+
+        Returns:
+            False if a store did not finish within the timeout
+
+        Raises:
+            StoreWriteError: If queued writes could not be committed
+        """
+        flushed = True
+        for store in (self._tm_async, self._chunk_cache_async):
+            if store is not None:
+                flushed = store.flush_blocking(timeout) and flushed
+        return flushed
+
+    async def _lookup_tm(self, text: str) -> tuple:
+        """
+        Find the TM match for a chunk.
+
+        Returns:
+            ("exact" | "fuzzy", match) or (None, None)
+        """
+        if text in self._tm_prefetched:
+            match = self._tm_prefetched[text]
+            if match is None:
+                return None, None
+            if match.match_type == "exact":
+                return "exact", match
+            if match.similarity >= self.tm_fuzzy_threshold:
+                return "fuzzy", match
+            return None, None
+
+        tm = self._async_tm()
+        exact_match = await tm.get_exact_match(
+            text,
+            self.source_lang,
+            self.target_lang
+        )
+        if exact_match:
+            return "exact", exact_match
+
+        fuzzy_matches = await tm.get_fuzzy_matches(
+            text,
+            self.source_lang,
+            self.target_lang,
+            threshold=self.tm_fuzzy_threshold,
+            max_results=1
+        )
+        if fuzzy_matches and fuzzy_matches[0].similarity >= self.tm_fuzzy_threshold:
+            return "fuzzy", fuzzy_matches[0]
+
+        return None, None
 
     async def translate_parallel(
         self,
@@ -484,16 +713,25 @@ class TranslatorEngine:
             cancellation_token=cancellation_token
         )
 
+        # Resolve TM hits for all chunks up front (one batched lookup)
+        await self.prefetch_tm_async(chunks)
+
         # Use self.translate_chunk as the processing function
-        results, stats = await processor.process_all(
-            chunks,
-            self.translate_chunk
-        )
+        try:
+            results, stats = await processor.process_all(
+                chunks,
+                self.translate_chunk
+            )
+        finally:
+            self._tm_prefetched = {}
+            await self.flush_stores()
 
         # Update cache stats if available
         if self.cache:
             stats.cache_hits = self.cache.hits
             stats.cache_misses = self.cache.misses
+        stats.coalesced_calls = self.flight_stats.calls_saved
+        stats.coalesced_tokens = self.flight_stats.tokens_saved
 
         return results, stats
 
@@ -534,18 +772,179 @@ class TranslatorEngine:
             max_concurrency=max_concurrency
         )
 
-        results, stats = await batch_processor.process_in_batches(
-            chunks,
-            self.translate_chunk
-        )
+        await self.prefetch_tm_async(chunks)
+        try:
+            results, stats = await batch_processor.process_in_batches(
+                chunks,
+                self.translate_chunk
+            )
+        finally:
+            self._tm_prefetched = {}
+            await self.flush_stores()
 
         # Update cache stats
         if self.cache:
             stats.cache_hits = self.cache.hits
             stats.cache_misses = self.cache.misses
+        stats.coalesced_calls = self.flight_stats.calls_saved
+        stats.coalesced_tokens = self.flight_stats.tokens_saved
 
         return results, stats
 
+    async def translate_batch(
+        self,
+        chunks: List[TranslationChunk],
+        max_concurrency: int = 10,
+        show_progress: bool = True,
+        progress_callback: Optional[Callable] = None,
+        cancellation_token: Optional[Any] = None,
+        **batch_options
+    ) -> tuple[List[TranslationResult], ProcessingStats]:
+        """
+        Translate chunks through the provider's batch API (overnight jobs).
+
+        Chunks not answered by TM or the chunk cache are submitted as one
+        OpenAI / Anthropic batch (about half price, separate rate limits,
+        results within 24h). The answers then go through translate_parallel
+        as each chunk's first attempt, so validation, retries and cache/TM
+        stores are unchanged; chunks the batch did not answer - or all of
+        them if the batch cannot be run - are translated interactively.
+
+        Args:
+            chunks: List of TranslationChunks to translate.
+            max_concurrency: Concurrent calls of the interactive pass.
+            show_progress: Display progress bar in terminal.
+            progress_callback: See translate_parallel.
+            cancellation_token: See translate_parallel.
+            **batch_options: Passed to the BatchClient (base_url, poll_interval, ...)
+
+        Returns:
+            Tuple of (results, stats) like translate_parallel; stats.batched
+            counts the chunks translated by the batch.
+        """
+        batched = await self.prefill_batch(chunks, **batch_options)
+        try:
+            results, stats = await self.translate_parallel(
+                chunks,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                progress_callback=progress_callback,
+                cancellation_token=cancellation_token
+            )
+            stats.batched = batched - len(self._batch_translations)
+        finally:
+            self._batch_translations = {}
+
+        return results, stats
+
+    async def prefill_batch(
+        self,
+        chunks: List[TranslationChunk],
+        batch_id: Optional[str] = None,
+        on_submitted: Optional[Callable[[str], None]] = None,
+        **batch_options
+    ) -> int:
+        """
+        Answer the cache-miss chunks through the provider's batch API.
+
+        The answers are kept as each chunk's first attempt in translate_chunk
+        (see translate_batch). Never raises: if the batch cannot be run, the
+        chunks are simply translated interactively later.
+
+        Args:
+            chunks: Chunks about to be translated.
+            batch_id: Batch submitted for these chunks by an earlier run of
+                the job (e.g. before a restart); polled instead of paying twice.
+            on_submitted: Called with the id of a newly submitted batch, so
+                the caller can persist it with the job.
+            **batch_options: Passed to the BatchClient (base_url, poll_interval, ...)
+
+        Returns:
+            Number of chunks with a batch answer waiting.
+        """
+        await self.prefetch_tm_async(chunks)
+
+        # One request per distinct prompt (identical chunks share it)
+        requests: Dict[str, BatchRequest] = {}
+        members: Dict[str, List[TranslationChunk]] = {}
+        for chunk in chunks:
+            if not await self._needs_llm(chunk):
+                continue
+            prompt = self.build_prompt(chunk)
+            key = self._flight_key(chunk, prompt)
+            if key not in requests:
+                # Keyed by chunk id: stable when a resumed batch is collected
+                requests[key] = BatchRequest(
+                    custom_id=f"chunk-{chunk.id}",
+                    body=self._request_payload(prompt, chunk.text)
+                )
+                members[key] = []
+            members[key].append(chunk)
+
+        if requests:
+            try:
+                batch_client = get_batch_client(self.provider, self.api_key, self.model, **batch_options)
+                answers = await batch_client.run(
+                    list(requests.values()), batch_id=batch_id, on_submitted=on_submitted
+                )
+            except Exception as e:
+                logger.warning(f" Batch API unavailable, translating interactively: {e}")
+                answers = {}
+            for key, request in requests.items():
+                answer = answers.get(request.custom_id)
+                if answer is None or not answer.ok or answer.truncated or not answer.content.strip():
+                    continue
+                for chunk in members[key]:
+                    self._batch_translations[chunk.id] = answer.content.strip()
+
+        return len(self._batch_translations)
+
+    async def _needs_llm(self, chunk: TranslationChunk) -> bool:
+        """Whether translate_chunk would call the LLM (no TM or chunk cache hit)."""
+        if self.tm:
+            match_type, _ = await self._lookup_tm(chunk.text)
+            if match_type:
+                return False
+        if self.chunk_cache:
+            from .cache.chunk_cache import compute_chunk_key
+            cache_key = compute_chunk_key(
+                source_text=chunk.text,
+                source_lang=self.source_lang,
+                target_lang=self.target_lang,
+                mode=self.mode,
+                domain=self.domain
+            )
+            if await self._async_chunk_cache().get(cache_key):
+                return False
+        return True
+
+    def _request_payload(self, prompt: str, text: str) -> Dict[str, Any]:
+        """
+        Request body for the current provider.
+
+        Shared by the interactive calls and the batch API, so both send the
+        same model parameters.
+        """
+        if self.provider == "anthropic":
+            return {
+                "model": self.model,
+                "max_tokens": 4096,
+                "temperature": 0.3,
+                "system": prompt,
+                "messages": [{"role": "user", "content": text}]
+            }
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": text}
+            ],
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "frequency_penalty": 0.1,
+            "presence_penalty": 0.1
+        }
+
     async def _call_openai(self, client: httpx.AsyncClient, prompt: str, text: str) -> str:
         """
         Call OpenAI Chat Completions API.
@@ -572,26 +971,21 @@ class TranslatorEngine:
         logger.info(f" Calling OpenAI API: model={self.model}, text_length={len(text)} chars")
 
         headers = {"Authorization": f"Bearer {self.api_key}"}
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": text}
-            ],
-            "temperature": 0.3,
-            "top_p": 0.9,
-            "frequency_penalty": 0.1,
-            "presence_penalty": 0.1
-        }
+        payload = self._request_payload(prompt, text)
 
+        # Shared with every other OpenAI caller in the process; the output
+        # is about as long as the input
+        limiter = get_limiter("openai", self.model)
         try:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=120
-            )
-            response.raise_for_status()
+            async with limiter.slot(estimate_tokens(payload["messages"], len(text) // 4)) as slot:
+                response = await client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    headers=headers,
+                    json=payload,
+                    timeout=120
+                )
+                slot.observe(response.headers)
+                response.raise_for_status()
 
             data = response.json()
             result = data["choices"][0]["message"]["content"].strip()
@@ -642,22 +1036,19 @@ class TranslatorEngine:
             "content-type": "application/json"
         }
 
-        payload = {
-            "model": self.model,
-            "max_tokens": 4096,
-            "temperature": 0.3,
-            "system": prompt,
-            "messages": [{"role": "user", "content": text}]
-        }
+        payload = self._request_payload(prompt, text)
 
+        limiter = get_limiter("anthropic", self.model)
         try:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers=headers,
-                json=payload,
-                timeout=180
-            )
-            response.raise_for_status()
+            async with limiter.slot(estimate_tokens(payload["messages"], payload["max_tokens"])) as slot:
+                response = await client.post(
+                    "https://api.anthropic.com/v1/messages",
+                    headers=headers,
+                    json=payload,
+                    timeout=180
+                )
+                slot.observe(response.headers)
+                response.raise_for_status()
 
             data = response.json()
             content = []
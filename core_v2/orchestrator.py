@@ -37,9 +37,17 @@ except Exception:  # pragma: no cover
 
 try:
     from core.cache.chunk_cache import ChunkCache, compute_chunk_key
+    from core.cache.tiered_cache import TieredChunkCache, get_chunk_cache
+    from core.cache.page_cache import PageCacheStats
+    from core.cache.single_flight import SingleFlightStats, get_single_flight
 except Exception:  # pragma: no cover
     ChunkCache = None
     compute_chunk_key = None
+    TieredChunkCache = None
+    get_chunk_cache = None
+    PageCacheStats = None
+    SingleFlightStats = None
+    get_single_flight = None
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +80,8 @@ class PublishingJob:
     source_lang: str
     target_lang: str
     profile_id: str
+    # "interactive" (chat call per chunk) or "batch" (provider batch API)
+    execution_mode: str = "interactive"
 
     # Status
     status: JobStatus = JobStatus.PENDING
@@ -86,6 +96,16 @@ class PublishingJob:
     assembled_content: str = ""
     output_path: Optional[Path] = None
     verification: Optional[VerificationResult] = None
+    # Page cache hits/misses of PDF reading, e.g. {"vision": {"hits": 3, ...}}
+    page_cache: Dict[str, Any] = field(default_factory=dict)
+    # LLM calls saved by waiting on an identical in-flight chunk
+    # ({"calls_saved": n, "tokens_saved": t})
+    coalesced: Dict[str, int] = field(default_factory=dict)
+    # Batch mode: chunks submitted / answered by the batch / translated
+    # interactively instead ({"submitted": n, "translated": t, "fallback": f})
+    batch: Dict[str, int] = field(default_factory=dict)
+    # Provider batch id (batch mode); callers persist it to resume the batch
+    batch_id: Optional[str] = None
 
     # Timing
     created_at: datetime = field(default_factory=datetime.now)
@@ -288,25 +308,25 @@ def _extract_pdf_text_sync(pdf_path: Path) -> str:
     """
     try:
         import fitz  # PyMuPDF
-        doc = fitz.open(str(pdf_path))
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
+        with fitz.open(str(pdf_path)) as doc:
+            text = "".join(page.get_text() for page in doc)
         logger.info(f"Legacy PDF extraction: {len(text)} chars")
         return text
     except ImportError:
         try:
             import pdfplumber
             with pdfplumber.open(str(pdf_path)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-                return text
+                return "".join(page.extract_text() or "" for page in pdf.pages)
         except ImportError:
             raise RuntimeError("PyMuPDF or pdfplumber required for PDF extraction")
 
 
+def _pdf_page_count(pdf_path: Path) -> int:
+    import fitz  # PyMuPDF
+    with fitz.open(str(pdf_path)) as doc:
+        return len(doc)
+
+
 class UniversalPublisher:
     """
     The main orchestrator for Claude-native publishing.
@@ -359,6 +379,8 @@ class UniversalPublisher:
         self.max_retries: int = int(_cfg("translation_max_retries", 4))
         self.backoff_base: float = float(_cfg("translation_backoff_base", 2.0))
         self.backoff_cap: float = float(_cfg("translation_backoff_cap", 60.0))
+        self.hedging_enabled: bool = bool(_cfg("translation_hedging_enabled", False))
+        self.execution_mode: str = str(_cfg("translation_execution_mode", "interactive"))
 
         # --- Terminology ledger (auto-glossary + explicit glossaries) ---
         # Built once per job in publish() and injected into the cached system
@@ -379,9 +401,10 @@ class UniversalPublisher:
         # --- Chunk cache (persistent translation memoization) ---
         self.chunk_cache = None
         cache_on = bool(_cfg("chunk_cache_enabled", True)) and bool(_cfg("cache_enabled", True))
-        if cache_on and ChunkCache is not None and compute_chunk_key is not None:
+        if cache_on and get_chunk_cache is not None and compute_chunk_key is not None:
             try:
-                self.chunk_cache = ChunkCache()  # defaults to settings.cache_dir/chunks.db
+                # Process-wide tiered cache (memory LRU -> Redis -> settings.cache_dir/chunks.db)
+                self.chunk_cache = get_chunk_cache()
                 logger.info("ChunkCache enabled for core_v2 translation path")
             except Exception as e:  # pragma: no cover - cache is best-effort
                 logger.warning(f"ChunkCache unavailable, continuing without cache: {e}")
@@ -428,6 +451,28 @@ class UniversalPublisher:
             glossary_name=ledger_fingerprint or "noterms",
         )
 
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Chunk cache lookup that never blocks the event loop.
+
+        A TieredChunkCache answers memory hits on the loop and goes to Redis /
+        SQLite itself; any other cache (plain ChunkCache, test fakes) is sync
+        sqlite and runs in a worker thread.
+        """
+        if TieredChunkCache is not None and isinstance(self.chunk_cache, TieredChunkCache):
+            return await self.chunk_cache.get_async(key)
+        return await run_blocking(self.chunk_cache.get, key)
+
+    async def _cache_put(self, key: str, value: str, source_lang: str,
+                         target_lang: str, profile_id: str) -> None:
+        """Chunk cache store; see _cache_get."""
+        if TieredChunkCache is not None and isinstance(self.chunk_cache, TieredChunkCache):
+            await self.chunk_cache.set_async(key, value, source_lang, target_lang, mode=profile_id)
+            return
+        await run_blocking(
+            self.chunk_cache.set,
+            key, value, source_lang, target_lang, mode=profile_id,
+        )
+
     async def publish(
         self,
         source_text: str,
@@ -442,6 +487,9 @@ class UniversalPublisher:
         title_fallback: str = "",  # Fallback title (e.g. source filename without extension)
         cover_template: Optional[str] = None,  # NEW: pre-built cover template id (see cover_templates)
         cover_image: Optional[str] = None,  # NEW: path to a user-supplied cover image (wins over template)
+        execution_mode: Optional[str] = None,  # "interactive" / "batch" (default: settings)
+        batch_id: Optional[str] = None,  # Batch submitted by an earlier run of this job
+        on_batch_submitted: Optional[Callable[[str], None]] = None,
     ) -> PublishingJob:
         """
         Main publishing pipeline.
@@ -456,6 +504,13 @@ class UniversalPublisher:
             use_vision: Use Claude Vision for PDF reading (recommended)
             docx_template: DOCX template ('ebook', 'academic', 'business', 'auto')
             pdf_template: PDF template ('ebook', 'academic', 'business', 'auto')
+            execution_mode: 'batch' sends cache-miss chunks through the provider
+                batch API (cheaper, results within hours) before translating the
+                rest interactively; 'interactive' makes one chat call per chunk
+            batch_id: Provider batch submitted by an earlier run of the same job
+                (e.g. before a restart); it is polled again instead of resubmitted
+            on_batch_submitted: Called with the id of a newly submitted batch so
+                the caller can persist it and pass it back as ``batch_id``
 
         Returns:
             PublishingJob with results
@@ -469,8 +524,15 @@ class UniversalPublisher:
             source_lang=source_lang,
             target_lang=target_lang,
             profile_id=profile_id,
+            execution_mode=execution_mode or getattr(self, "execution_mode", "interactive"),
+            batch_id=batch_id,
         )
 
+        def remember_batch(new_batch_id: str):
+            job.batch_id = new_batch_id
+            if on_batch_submitted:
+                on_batch_submitted(new_batch_id)
+
         def update_progress(progress: float, stage: str):
             job.progress = progress
             job.current_stage = stage
@@ -492,12 +554,18 @@ class UniversalPublisher:
                         content_path,
                         lambda p, s: update_progress(p * 0.50, s),  # Vision = 0-50%
                         profile_id=profile_id,  # Pass profile for optimized reading
+                        job=job,
                     )
                     job.source_text = source_text
                     logger.info(f"[{job.job_id}] Vision read complete: {len(source_text)} chars")
                 else:
-                    # Fallback to traditional extraction
-                    source_text = await self._extract_pdf_text_legacy(content_path)
+                    # Native text extraction, streamed page by page
+                    update_progress(0.01, "Extracting PDF text...")
+                    source_text = await self._extract_pdf_text(
+                        content_path,
+                        lambda p, s: update_progress(p * 0.50, s),
+                        job=job,
+                    )
                     job.source_text = source_text
 
             # Strip running headers/footers ("page furniture") captured during
@@ -579,6 +647,7 @@ class UniversalPublisher:
             job.status = JobStatus.TRANSLATING
             # actual_source_lang resolved above (DNA-detected when 'auto').
             logger.info(f"Translation: {actual_source_lang} → {target_lang} (requested: {source_lang}, detected: {job.dna.language})")
+            flight_stats = SingleFlightStats() if SingleFlightStats is not None else None
             job.translated_chunks = await self._translate_chunks(
                 job.chunks,
                 job.dna,
@@ -586,7 +655,16 @@ class UniversalPublisher:
                 actual_source_lang,
                 target_lang,
                 lambda p: update_progress(0.55 + p * 0.35, f"Translating chunk {int(p * len(job.chunks))}/{len(job.chunks)}"),
+                flight_stats=flight_stats,
+                execution_mode=job.execution_mode,
+                batch_stats=job.batch,
+                batch_id=job.batch_id,
+                on_batch_submitted=remember_batch,
             )
+            if flight_stats is not None:
+                job.coalesced = flight_stats.to_dict()
+                if flight_stats.calls_saved:
+                    logger.info(f"[{job.job_id}] Duplicate chunks: {flight_stats.calls_saved} LLM call(s) saved")
 
             # Stage 3.5: Bounded repair pass — re-translate only the chunks the
             # deterministic quality gate flags as suspect (empty / truncated /
@@ -686,8 +764,21 @@ class UniversalPublisher:
         source_lang: str,
         target_lang: str,
         progress_callback: Optional[Callable[[float], None]] = None,
+        flight_stats=None,
+        execution_mode: str = "interactive",
+        batch_stats: Optional[Dict[str, int]] = None,
+        batch_id: Optional[str] = None,
+        on_batch_submitted: Optional[Callable[[str], None]] = None,
     ) -> List[str]:
-        """Translate chunks with controlled concurrency."""
+        """Translate chunks with controlled concurrency.
+
+        Identical chunks in flight at the same time share one LLM call;
+        ``flight_stats`` (a SingleFlightStats) counts the calls saved.
+
+        With ``execution_mode="batch"`` the cache-miss chunks first go through
+        the provider batch API (see _batch_translate_chunks); only chunks the
+        batch did not translate acceptably make interactive calls.
+        """
         profile = get_profile(profile_id) or PROFILES.get("essay")
 
         # Track progress
@@ -698,12 +789,26 @@ class UniversalPublisher:
         # through so every chunk shares the same (cached) glossary block.
         active_ledger = getattr(self, "_active_ledger", None)
 
+        batched: Dict[int, str] = {}
+        if execution_mode == "batch":
+            batched = await self._batch_translate_chunks(
+                chunks, dna, profile, source_lang, target_lang, profile_id,
+                ledger=active_ledger, batch_stats=batch_stats,
+                batch_id=batch_id, on_batch_submitted=on_batch_submitted,
+            )
+
         async def translate_with_semaphore(chunk: SemanticChunk) -> tuple[int, str]:
             """Translate single chunk with semaphore control."""
+            if chunk.index in batched:
+                completed[0] += 1
+                if progress_callback:
+                    progress_callback(completed[0] / total)
+                return (chunk.index, batched[chunk.index])
             async with self._semaphore:
                 result = await self._translate_chunk(
                     chunk, dna, profile, source_lang, target_lang,
                     profile_id=profile_id, ledger=active_ledger,
+                    flight_stats=flight_stats,
                 )
                 completed[0] += 1
                 if progress_callback:
@@ -801,6 +906,7 @@ class UniversalPublisher:
         max_retries: Optional[int] = None,
         ledger=None,
         force_refresh: bool = False,
+        flight_stats=None,
     ) -> str:
         """Translate a single chunk.
 
@@ -811,6 +917,9 @@ class UniversalPublisher:
         - Exponential backoff + jitter on transient errors, and a raised
           ``ChunkTranslationError`` on permanent failure — so the job fails
           loudly instead of silently shipping a ``[TRANSLATION ERROR]`` hole.
+        - Cache misses for identical content already being translated wait
+          for that call instead of making their own (single flight, keyed by
+          the chunk cache key; credited to ``flight_stats``).
         """
         max_retries = self.max_retries if max_retries is None else max_retries
 
@@ -833,9 +942,7 @@ class UniversalPublisher:
                     ledger_fingerprint=ledger_fp,
                 )
                 if cache_key:
-                    # Off-loop: ChunkCache is sync sqlite (thread-local conns + WAL),
-                    # so run it in a worker thread to keep the event loop free.
-                    cached = await run_blocking(self.chunk_cache.get, cache_key)
+                    cached = await self._cache_get(cache_key)
                     if cached is not None:
                         logger.debug(f"[Chunk {chunk.index}] cache hit")
                         return cached
@@ -843,7 +950,43 @@ class UniversalPublisher:
                 logger.debug(f"[Chunk {chunk.index}] cache lookup skipped: {e}")
                 cache_key = None
 
-        # 2) Build system (static/cacheable) + user (dynamic) prompts
+        async def _upstream():
+            return await self._translate_chunk_upstream(
+                chunk, dna, profile, source_lang, target_lang, profile_id,
+                max_retries, glossary_block, cache_key, force_refresh,
+            )
+
+        if get_single_flight is None:
+            return (await _upstream())[0]
+        # Same identity as the cache entry the call will fill (a forced
+        # refresh never joins a regular translation)
+        flight_key = cache_key
+        if not flight_key:
+            try:
+                flight_key = self._chunk_cache_key(
+                    chunk.content, source_lang, target_lang, profile_id,
+                    ledger_fingerprint=ledger_fp,
+                )
+            except Exception:  # pragma: no cover
+                flight_key = None
+        if not flight_key:
+            return (await _upstream())[0]
+        flight_key = ("v2-refresh:" if force_refresh else "v2:") + flight_key
+        translated, _tokens = await get_single_flight().do(
+            flight_key, _upstream, stats=flight_stats, tokens_of=lambda value: value[1],
+        )
+        return translated
+
+    async def _chunk_prompts(
+        self,
+        chunk: SemanticChunk,
+        dna: DocumentDNA,
+        profile: PublishingProfile,
+        source_lang: str,
+        target_lang: str,
+        glossary_block: str,
+    ) -> tuple[str, str]:
+        """System (static/cacheable) and user (dynamic) prompt of a chunk."""
         system_prompt = TRANSLATION_SYSTEM.format(
             dna_context=dna.to_context_prompt(),
             profile_prompt=profile.to_prompt(),
@@ -868,25 +1011,170 @@ class UniversalPublisher:
         # Prepend approved Translation-Memory hints to the DYNAMIC user message
         # (never the cached system prefix / template, so no KeyError and no cache
         # thrash). TM state is deliberately NOT in the chunk-cache key, so a cache
-        # HIT legitimately returns above before hints are ever computed. Guarded via
+        # HIT legitimately returns before hints are ever computed. Guarded via
         # getattr so publishers built without __init__ (tests) are unaffected; an
         # inactive/None gateway yields "" and leaves user_prompt byte-for-byte
         # identical to the prior prompt.
         gw = getattr(self, "tm_gateway", None)
         if gw is not None:
             try:
-                _hints = gw.lookup_hints(chunk.content, source_lang, target_lang)
+                # Off-loop: TM lookups run on the gateway's reader threads.
+                _hints = await gw.lookup_hints_async(chunk.content, source_lang, target_lang)
                 _tm_block = gw.render_hints_block(_hints)
                 if _tm_block:
                     user_prompt = _tm_block + "\n\n" + user_prompt
             except Exception:
                 pass
 
+        return system_prompt, user_prompt
+
+    async def _batch_translate_chunks(
+        self,
+        chunks: List[SemanticChunk],
+        dna: DocumentDNA,
+        profile: PublishingProfile,
+        source_lang: str,
+        target_lang: str,
+        profile_id: str,
+        ledger=None,
+        batch_stats: Optional[Dict[str, int]] = None,
+        batch_id: Optional[str] = None,
+        on_batch_submitted: Optional[Callable[[str], None]] = None,
+    ) -> Dict[int, str]:
+        """Translate the cache-miss chunks through the provider batch API.
+
+        ``batch_id`` resumes a batch an earlier run of the job submitted
+        (request ids are chunk indexes, so they match again);
+        ``on_batch_submitted`` receives the id of a new one. Chunks with
+        identical content (same cache key) are submitted once. A
+        translation is accepted under the same rules as the interactive path
+        (LaTeX preserved, right language, not truncated) and stored in the
+        chunk cache. Never raises: if the client has no batch API or the batch
+        fails, every chunk is left to the interactive path.
+
+        Returns:
+            Translations by chunk index (only the chunks the batch answered)
+        """
+        batch_stats = batch_stats if batch_stats is not None else {}
+        chat_batch = getattr(self.llm_client, "chat_batch", None)
+        if chat_batch is None:
+            logger.warning("LLM client has no batch API; translating interactively")
+            return {}
+
+        glossary_block = ledger.to_prompt_block(getattr(self, "glossary_max_terms", 80)) if ledger else ""
+        ledger_fp = ledger.fingerprint() if ledger else "noterms"
+
+        requests: Dict[str, List[Dict[str, str]]] = {}
+        members: Dict[str, List[SemanticChunk]] = {}  # request id -> chunks it answers
+        cache_keys: Dict[str, Optional[str]] = {}
+        by_key: Dict[str, str] = {}
+        for chunk in chunks:
+            cache_key: Optional[str] = None
+            if self.chunk_cache is not None:
+                try:
+                    cache_key = self._chunk_cache_key(
+                        chunk.content, source_lang, target_lang, profile_id,
+                        ledger_fingerprint=ledger_fp,
+                    )
+                    if cache_key and await self._cache_get(cache_key) is not None:
+                        continue  # the interactive pass serves it from cache
+                except Exception as e:  # pragma: no cover
+                    logger.debug(f"[Chunk {chunk.index}] cache lookup skipped: {e}")
+                    cache_key = None
+            if cache_key and cache_key in by_key:
+                members[by_key[cache_key]].append(chunk)
+                continue
+
+            custom_id = f"chunk-{chunk.index}"
+            system_prompt, user_prompt = await self._chunk_prompts(
+                chunk, dna, profile, source_lang, target_lang, glossary_block,
+            )
+            requests[custom_id] = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+            members[custom_id] = [chunk]
+            cache_keys[custom_id] = cache_key
+            if cache_key:
+                by_key[cache_key] = custom_id
+
+        submitted = sum(len(group) for group in members.values())
+        batch_stats.update(submitted=submitted, translated=0, fallback=submitted)
+        if not requests:
+            return {}
+
+        logger.info(f"Batch mode: submitting {len(requests)} request(s) for {submitted} chunk(s)")
+        try:
+            results = await chat_batch(
+                requests, temperature=self.translation_temperature,
+                batch_id=batch_id, on_submitted=on_batch_submitted,
+            )
+        except Exception as e:
+            logger.warning(f"Batch translation failed, translating {submitted} chunk(s) interactively: {e}")
+            return {}
+
+        translated: Dict[int, str] = {}
+        for custom_id, group in members.items():
+            result = results.get(custom_id)
+            if result is None or not result.ok or result.truncated:
+                continue
+            text = result.content.strip()
+            if dna.has_formulas:
+                text = self._verify_latex_preservation(group[0].content, text, group[0].index)
+            if not text or self._detect_language(text) not in (target_lang, "unknown"):
+                continue
+            for chunk in group:
+                translated[chunk.index] = text
+            cache_key = cache_keys[custom_id]
+            if cache_key:
+                try:
+                    await self._cache_put(cache_key, text, source_lang, target_lang, profile_id)
+                except Exception as e:  # pragma: no cover
+                    logger.debug(f"[Chunk {group[0].index}] cache store skipped: {e}")
+
+        batch_stats.update(translated=len(translated), fallback=submitted - len(translated))
+        logger.info(
+            f"Batch mode: {len(translated)}/{submitted} chunk(s) translated by the batch, "
+            f"{submitted - len(translated)} left to the interactive path"
+        )
+        return translated
+
+    async def _translate_chunk_upstream(
+        self,
+        chunk: SemanticChunk,
+        dna: DocumentDNA,
+        profile: PublishingProfile,
+        source_lang: str,
+        target_lang: str,
+        profile_id: str,
+        max_retries: int,
+        glossary_block: str,
+        cache_key: Optional[str],
+        force_refresh: bool,
+    ) -> tuple[str, int]:
+        """LLM part of _translate_chunk (prompts, retries, cache store).
+
+        Returns:
+            (translation, tokens used by the calls)
+        """
+        # 2) Build system (static/cacheable) + user (dynamic) prompts
+        system_prompt, user_prompt = await self._chunk_prompts(
+            chunk, dna, profile, source_lang, target_lang, glossary_block,
+        )
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
 
+        def _tokens(response) -> int:
+            usage = getattr(response, "usage", None)
+            total = getattr(usage, "total_tokens", None)
+            if isinstance(total, int):
+                return total
+            # ~4 chars per token when the client reports no usage
+            return (sum(len(m["content"]) for m in messages) + len(response.content or "")) // 4
+
+        tokens = 0
         last_error: Optional[Exception] = None
         for attempt in range(max_retries):
             try:
@@ -894,7 +1182,10 @@ class UniversalPublisher:
                     messages=messages,
                     temperature=self.translation_temperature,
                     cache_system=self.prompt_cache_enabled,
+                    # Passed only when enabled: the client must then accept `hedge`
+                    **({"hedge": True} if getattr(self, "hedging_enabled", False) else {}),
                 )
+                tokens += _tokens(response)
                 translated = response.content.strip()
                 truncated = bool(getattr(response, "truncated", False))
 
@@ -923,6 +1214,7 @@ class UniversalPublisher:
                         temperature=self.translation_temperature,
                         cache_system=self.prompt_cache_enabled,
                     )
+                    tokens += _tokens(retry_response)
                     retranslated = retry_response.content.strip()
                     truncated = bool(getattr(retry_response, "truncated", False))
                     detected2 = self._detect_language(retranslated)
@@ -938,14 +1230,13 @@ class UniversalPublisher:
                 lang_ok = detected in (target_lang, "unknown")
                 if self.chunk_cache is not None and cache_key and lang_ok and not truncated and not force_refresh:
                     try:
-                        await run_blocking(
-                            self.chunk_cache.set,
-                            cache_key, translated, source_lang, target_lang, mode=profile_id,
+                        await self._cache_put(
+                            cache_key, translated, source_lang, target_lang, profile_id,
                         )
                     except Exception as e:  # pragma: no cover
                         logger.debug(f"[Chunk {chunk.index}] cache store skipped: {e}")
 
-                return translated
+                return translated, tokens
 
             except ChunkTranslationError:
                 raise
@@ -1098,10 +1389,7 @@ class UniversalPublisher:
                             ledger_fingerprint=fp,
                         )
                         if key:
-                            await run_blocking(
-                                self.chunk_cache.set,
-                                key, new, source_lang, target_lang, mode=profile_id,
-                            )
+                            await self._cache_put(key, new, source_lang, target_lang, profile_id)
                     except Exception:
                         pass
 
@@ -1338,6 +1626,7 @@ class UniversalPublisher:
         pdf_path: Path,
         progress_callback: Optional[Callable] = None,
         profile_id: str = "academic_paper",
+        job: Optional[PublishingJob] = None,
     ) -> str:
         """
         Read PDF using Claude Vision with document-type optimization.
@@ -1348,6 +1637,7 @@ class UniversalPublisher:
             pdf_path: Path to PDF file
             progress_callback: Called with (progress, stage)
             profile_id: Publishing profile for optimized reading
+            job: Job to record page cache hits on
 
         Returns:
             Markdown+LaTeX content from Vision reading
@@ -1394,6 +1684,10 @@ class UniversalPublisher:
         # Store table info for later use
         has_tables = any(p.has_tables for p in vision_doc.pages)
 
+        page_cache = getattr(vision_doc, "page_cache", None)
+        if job is not None and PageCacheStats is not None and isinstance(page_cache, PageCacheStats):
+            job.page_cache["vision"] = page_cache.to_dict()
+
         logger.info(
             f"Vision read complete: {len(content)} chars, "
             f"{vision_doc.total_pages} pages, has_formulas={vision_doc.has_formulas}, "
@@ -1402,6 +1696,39 @@ class UniversalPublisher:
 
         return content
 
+    async def _extract_pdf_text(
+        self,
+        pdf_path: Path,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        job: Optional[PublishingJob] = None,
+    ) -> str:
+        """
+        Native-text PDF extraction (no Vision).
+
+        Consumes FastTextExtractor.iter_pages, so pages from the page cache
+        and from finished worker shards are taken as soon as they are ready
+        instead of after the whole book. Falls back to the legacy extraction
+        when PyMuPDF is not installed.
+        """
+        try:
+            from core.smart_extraction.fast_text_extractor import FastTextExtractor
+        except ImportError:
+            return await self._extract_pdf_text_legacy(pdf_path)
+
+        total_pages = await run_blocking(_pdf_page_count, pdf_path)
+        pages = []
+        async for page in FastTextExtractor().iter_pages(pdf_path):
+            pages.append(page)
+            if progress_callback and total_pages:
+                progress_callback(len(pages) / total_pages, f"Extracting page {len(pages)}/{total_pages}")
+
+        if job is not None and PageCacheStats is not None:
+            job.page_cache["fast_text"] = PageCacheStats.of(pages).to_dict()
+
+        text = "\n\n".join(page.content for page in pages)
+        logger.info(f"PDF text extraction: {len(pages)} pages, {len(text)} chars")
+        return text
+
     async def _extract_pdf_text_legacy(self, pdf_path: Path) -> str:
         """
         Legacy PDF text extraction (not recommended).
@@ -0,0 +1,109 @@
+"""
+Token-bucket rate limiting for provider API calls.
+
+Providers enforce requests-per-minute (RPM) and tokens-per-minute (TPM)
+budgets. Instead of sleeping a fixed interval between calls, callers
+``await limiter.acquire(tokens)`` and are delayed only as much as the budget
+requires, so many concurrent calls run at the provider's allowed rate.
+
+- ``TokenBucket`` — continuous refill; callers *reserve* capacity and sleep
+  off any deficit, so waiters are served in arrival order and no lock is
+  held across an ``await`` (safe to share between event loops / threads).
+- ``ProviderRateLimiter`` — an RPM bucket plus a TPM bucket.
+- ``get_vision_limiter(provider)`` — one shared limiter per provider for
+  vision calls, budgets from settings (``<provider>_vision_rpm`` / ``_tpm``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+# Burst allowance: a bucket holds this many seconds' worth of budget
+BURST_SECONDS = 10.0
+
+# Budgets for providers without settings entries
+DEFAULT_RPM = 50
+DEFAULT_TPM = 40_000
+
+
+class TokenBucket:
+    """Bucket refilled at ``rate`` units/second, holding at most ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` units now; return seconds to wait before using them.
+
+        Requests larger than the capacity are clamped so they can ever pass.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= min(amount, self.capacity)
+            return max(0.0, -self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket so new reservations wait at least ``seconds``."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        delay = self.reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ProviderRateLimiter:
+    """Requests-per-minute and tokens-per-minute budgets of one provider."""
+
+    def __init__(self, rpm: int, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = TokenBucket(rpm / 60.0, rpm / 60.0 * BURST_SECONDS) if rpm > 0 else None
+        self._tokens = TokenBucket(tpm / 60.0, tpm / 60.0 * BURST_SECONDS) if tpm > 0 else None
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request carrying ``tokens`` input tokens is allowed."""
+        delay = 0.0
+        if self._requests is not None:
+            delay = self._requests.reserve(1)
+        if self._tokens is not None and tokens > 0:
+            delay = max(delay, self._tokens.reserve(tokens))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold back all callers after the provider reported a rate limit."""
+        for bucket in (self._requests, self._tokens):
+            if bucket is not None:
+                bucket.pause(seconds)
+
+
+_vision_limiters: Dict[str, ProviderRateLimiter] = {}
+_vision_lock = threading.Lock()
+
+
+def get_vision_limiter(provider: Optional[str]) -> ProviderRateLimiter:
+    """Process-wide vision limiter for ``provider`` (shared by all jobs)."""
+    provider = provider or "default"
+    with _vision_lock:
+        limiter = _vision_limiters.get(provider)
+        if limiter is None:
+            from config.settings import settings
+            rpm = getattr(settings, f"{provider}_vision_rpm", DEFAULT_RPM)
+            tpm = getattr(settings, f"{provider}_vision_tpm", DEFAULT_TPM)
+            limiter = _vision_limiters[provider] = ProviderRateLimiter(rpm, tpm)
+        return limiter
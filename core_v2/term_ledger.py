@@ -54,6 +54,10 @@ class TermLedger:
 
     def __init__(self) -> None:
         self._entries: Dict[str, TermEntry] = {}
+        # Compiled sources for relevant_for() (core.term_automaton) and the
+        # entries in its term order; dropped whenever an entry changes
+        self._automaton = None
+        self._automaton_entries: List[TermEntry] = []
 
     def add(
         self,
@@ -79,6 +83,7 @@ class TermLedger:
             # Incumbent already outranks (or ties) the newcomer — keep it.
             return
 
+        self._automaton = None
         self._entries[key] = TermEntry(
             source=source.strip(),
             target=target.strip(),
@@ -118,15 +123,22 @@ class TermLedger:
         Matching is a plain case-insensitive substring test so it stays
         diacritic/CJK-safe. Regex word boundaries (``\\b``) are deliberately NOT
         used: they break for Vietnamese multi-syllable terms and for scripts
-        (such as CJK) that have no word boundaries.
+        (such as CJK) that have no word boundaries. All sources are found in
+        one scan of ``text`` by an automaton compiled once per ledger version.
         """
         out = TermLedger()
         if not text:
             return out
-        haystack = text.casefold()
-        for entry in self.items():
-            if entry.source.casefold() in haystack:
-                out.add(entry.source, entry.target, entry.priority, entry.provenance)
+        if self._automaton is None:
+            from core.term_automaton import TermAutomaton
+
+            self._automaton_entries = self.items()
+            self._automaton = TermAutomaton(
+                [entry.source for entry in self._automaton_entries], word_boundary=False
+            )
+        for idx in sorted(self._automaton.present(text)):
+            entry = self._automaton_entries[idx]
+            out.add(entry.source, entry.target, entry.priority, entry.provenance)
         return out
 
     def to_prompt_block(self, max_terms: int = 80) -> str:
@@ -70,6 +70,7 @@ class TMGateway:
         self.tm = tm
         self.enabled = bool(enabled)
         self._active = False
+        self._tm_async = None
 
         # Lazily build a TM only when one is wanted but not supplied. Any failure
         # (missing settings, unreadable db, import error) disables the gateway
@@ -119,7 +120,8 @@ class TMGateway:
         Returns ``[]`` immediately (no cost) when the gateway is inactive or
         ``text`` is blank. Otherwise each sentence is looked up: an exact match
         wins (similarity ``1.0``, type ``"exact"``); failing that, the best fuzzy
-        match at or above :attr:`threshold` is used (type ``"fuzzy"``). Hints are
+        match at or above :attr:`threshold` is used (type ``"fuzzy"``). TMs that
+        offer ``lookup_many`` resolve all sentences in one batch. Hints are
         deduped by source (highest similarity kept), sorted by similarity
         descending, and capped to :attr:`max_hints`.
 
@@ -131,40 +133,96 @@ class TMGateway:
 
         hints: List[TMHint] = []
         try:
-            from core_v2.context_builder import split_sentences
-
-            # Segment the chunk and dedupe sentences, preserving first-seen order,
-            # then cap the number of DB lookups per chunk.
-            seen: set = set()
-            sentences: List[str] = []
-            for sentence in split_sentences(text):
-                if sentence not in seen:
-                    seen.add(sentence)
-                    sentences.append(sentence)
-            sentences = sentences[: self.max_sentences]
-
-            for sentence in sentences:
-                match = self.tm.get_exact_match(sentence, source_lang, target_lang)
-                if match is not None:
-                    hints.append(TMHint(sentence, match.segment.target, 1.0, "exact"))
-                    continue
-
-                fuzzy = self.tm.get_fuzzy_matches(
-                    sentence,
-                    source_lang,
-                    target_lang,
-                    threshold=self.threshold,
-                    max_results=1,
-                    domain=self.domain,
-                )
-                if fuzzy and fuzzy[0].similarity >= self.threshold:
-                    hints.append(
-                        TMHint(sentence, fuzzy[0].segment.target, fuzzy[0].similarity, "fuzzy")
-                    )
+            self._collect_hints(self.tm, self._sentences(text), source_lang, target_lang, hints)
+        except Exception as e:
+            logger.warning("TM lookup failed, returning partial hints: %s", e)
+        return self._rank_hints(hints)
+
+    async def lookup_hints_async(self, text: str, source_lang: str, target_lang: str) -> List[TMHint]:
+        """Same as :meth:`lookup_hints`, with the TM queries off the event loop.
+
+        The lookups run on a TM reader thread (see
+        :class:`core.async_store.AsyncTranslationMemory`), so a slow fuzzy scan
+        never stalls other coroutines. Never raises.
+        """
+        if not self._active or not text or not text.strip():
+            return []
+
+        hints: List[TMHint] = []
+        try:
+            sentences = self._sentences(text)
+            await self._async_tm().run(
+                self._collect_hints, sentences, source_lang, target_lang, hints
+            )
         except Exception as e:
             logger.warning("TM lookup failed, returning partial hints: %s", e)
+        return self._rank_hints(hints)
+
+    def _async_tm(self):
+        """Lazily built off-loop facade over :attr:`tm`."""
+        if self._tm_async is None:
+            from core.async_store import AsyncTranslationMemory
+
+            self._tm_async = AsyncTranslationMemory(self.tm, readers=2)
+        return self._tm_async
+
+    def _sentences(self, text: str) -> List[str]:
+        """Deduped sentences of ``text`` (first-seen order), capped to :attr:`max_sentences`."""
+        from core_v2.context_builder import split_sentences
+
+        seen: set = set()
+        sentences: List[str] = []
+        for sentence in split_sentences(text):
+            if sentence not in seen:
+                seen.add(sentence)
+                sentences.append(sentence)
+        return sentences[: self.max_sentences]
+
+    def _collect_hints(
+        self, tm, sentences: List[str], source_lang: str, target_lang: str, hints: List[TMHint]
+    ) -> None:
+        """Append a hint to ``hints`` for every sentence ``tm`` matches.
+
+        Appends as it goes, so on error the caller keeps the partial result.
+        """
+        lookup_many = getattr(tm, "lookup_many", None)
+        if lookup_many is not None:
+            # One batched round-trip for the whole chunk.
+            matches = lookup_many(
+                sentences,
+                source_lang,
+                target_lang,
+                threshold=self.threshold,
+                domain=self.domain,
+            )
+            for sentence, match in zip(sentences, matches):
+                if match is not None and match.similarity >= self.threshold:
+                    hints.append(
+                        TMHint(sentence, match.segment.target, match.similarity, match.match_type)
+                    )
+            return
+
+        for sentence in sentences:
+            match = tm.get_exact_match(sentence, source_lang, target_lang)
+            if match is not None:
+                hints.append(TMHint(sentence, match.segment.target, 1.0, "exact"))
+                continue
+
+            fuzzy = tm.get_fuzzy_matches(
+                sentence,
+                source_lang,
+                target_lang,
+                threshold=self.threshold,
+                max_results=1,
+                domain=self.domain,
+            )
+            if fuzzy and fuzzy[0].similarity >= self.threshold:
+                hints.append(
+                    TMHint(sentence, fuzzy[0].segment.target, fuzzy[0].similarity, "fuzzy")
+                )
 
-        # Dedupe by source keeping the highest-similarity hint, then rank + cap.
+    def _rank_hints(self, hints: List[TMHint]) -> List[TMHint]:
+        """Dedupe by source keeping the highest-similarity hint, then rank + cap."""
         best: dict = {}
         for hint in hints:
             prev: Optional[TMHint] = best.get(hint.source)
@@ -226,6 +284,9 @@ class TMGateway:
     def close(self) -> None:
         """Best-effort close of the underlying TM. Never raises."""
         try:
+            if self._tm_async is not None:
+                self._tm_async.close()
+                self._tm_async = None
             if self.tm is not None:
                 self.tm.close()
         except Exception:
@@ -11,14 +11,31 @@ Philosophy: "Let Claude BE the solution, not use tools FOR Claude"
 
 import asyncio
 import base64
+import hashlib
 import logging
 import io
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
-from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Callable, Awaitable, Tuple
+from dataclasses import asdict, dataclass, field
+
+from core.cache.page_cache import (
+    PageCache,
+    PageCacheStats,
+    compute_page_key,
+    default_page_cache,
+    page_fingerprint,
+)
+
+from .aio_utils import run_blocking
+from .rate_limiter import get_vision_limiter
+from .reliability import backoff_delay, is_transient_error
 
 logger = logging.getLogger(__name__)
 
+# Input tokens a provider charges for one page image (Claude: w*h/750,
+# images are downscaled to ~1.15 MP) - used for the TPM budget
+IMAGE_TOKENS_MAX = 1600
+
 
 @dataclass
 class PageContent:
@@ -29,6 +46,7 @@ class PageContent:
     has_tables: bool = False
     has_figures: bool = False
     confidence: float = 1.0
+    cached: bool = False  # Served from the page cache
 
 
 @dataclass
@@ -47,6 +65,10 @@ class VisionDocument:
     def has_formulas(self) -> bool:
         return any(page.has_formulas for page in self.pages)
 
+    @property
+    def page_cache(self) -> PageCacheStats:
+        return PageCacheStats.of(self.pages)
+
 
 # =============================================================================
 # VISION PROMPTS - CLAUDE READS LIKE A HUMAN
@@ -166,6 +188,16 @@ OUTPUT: Single coherent Markdown document with all LaTeX preserved.
 Do not add any explanations - just the assembled document."""
 
 
+def _image_tokens(img_bytes: bytes) -> int:
+    """Approximate input tokens of an image (header-only size probe)"""
+    try:
+        from PIL import Image
+        width, height = Image.open(io.BytesIO(img_bytes)).size
+    except Exception:
+        return IMAGE_TOKENS_MAX
+    return min(IMAGE_TOKENS_MAX, width * height // 750)
+
+
 class VisionReader:
     """
     Claude Vision-based Document Reader
@@ -173,16 +205,59 @@ class VisionReader:
     TRUE Claude-native: Claude SEES the document, no extraction tools.
     """
 
-    def __init__(self, llm_client):
+    def __init__(
+        self,
+        llm_client,
+        concurrency: Optional[int] = None,
+        provider: Optional[str] = None,
+        page_cache: Optional[PageCache] = None,
+    ):
         """
         Initialize Vision Reader
 
         Args:
             llm_client: LLM client with async chat method (supports vision)
+            concurrency: Pages in flight at once (default: settings.vision_concurrency)
+            provider: Provider whose rate budget applies (default: the
+                      client's current provider)
+            page_cache: Cache of pages already read (default: the shared
+                        one, if settings.page_cache_enabled)
         """
+        from config.settings import settings
+
         self.llm_client = llm_client
         self.max_tokens = 8192
         self._current_prompt = None  # Override prompt for specialized reading
+        self.concurrency = max(1, concurrency or settings.vision_concurrency)
+        self.max_retries = settings.vision_page_retries
+        self.provider = provider
+        self.page_cache = page_cache if page_cache is not None else default_page_cache()
+
+    def _provider(self) -> Optional[str]:
+        provider = self.provider
+        # Looked up on the class so mocks don't report a provider
+        if provider is None and callable(getattr(type(self.llm_client), "get_current_provider", None)):
+            current = self.llm_client.get_current_provider()
+            provider = current if isinstance(current, str) else None
+        return provider
+
+    def _limiter(self):
+        return get_vision_limiter(self._provider())
+
+    def _cache_key_fields(self, dpi: int) -> Dict[str, Any]:
+        """What a cached page read depends on besides the page itself"""
+        provider = self._provider()
+        config = getattr(self.llm_client, "PROVIDER_CONFIG", None)
+        if provider and isinstance(config, dict):
+            model = f"{provider}/{config.get(provider, {}).get('vision_model')}"
+        else:
+            model = provider or type(self.llm_client).__qualname__
+        prompt = self._current_prompt or PAGE_READING_PROMPT
+        return {
+            "dpi": dpi,
+            "model": model,
+            "prompt": hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16],
+        }
 
     async def read_pdf(
         self,
@@ -197,11 +272,14 @@ class VisionReader:
         Claude sees each page as an image and extracts content
         with perfect formula reconstruction.
 
+        Pages are read concurrently (up to `concurrency`, paced by the
+        provider's rate budget) and returned in page order.
+
         Args:
             pdf_path: Path to PDF file
             dpi: Resolution for rendering (higher = better formula clarity)
             max_pages: Limit pages to process (None = all)
-            progress_callback: Called with (current_page, total_pages)
+            progress_callback: Called with (pages_done, total_pages)
 
         Returns:
             VisionDocument with all content as Markdown+LaTeX
@@ -214,49 +292,147 @@ class VisionReader:
         pdf_path = Path(pdf_path)
         logger.info(f"[Vision] Reading PDF: {pdf_path.name}")
 
-        # Open PDF
-        doc = fitz.open(str(pdf_path))
-        total_pages = len(doc)
+        with fitz.open(str(pdf_path)) as doc:
+            total_pages = len(doc)
 
         if max_pages:
             total_pages = min(total_pages, max_pages)
 
-        logger.info(f"[Vision] Processing {total_pages} pages at {dpi} DPI")
+        logger.info(f"[Vision] Processing {total_pages} pages at {dpi} DPI ({self.concurrency} concurrent)")
 
-        # Process each page with Vision
-        pages = []
-        for page_num in range(total_pages):
-            if progress_callback:
-                progress_callback(page_num + 1, total_pages)
+        pages = await self.read_pages(pdf_path, list(range(total_pages)), dpi, progress_callback)
 
-            page = doc[page_num]
+        return VisionDocument(
+            source_file=pdf_path.name,
+            total_pages=total_pages,
+            pages=pages,
+        )
 
-            # Render page to image
-            mat = fitz.Matrix(dpi / 72, dpi / 72)  # Scale matrix
-            pix = page.get_pixmap(matrix=mat)
-            img_bytes = pix.tobytes("png")
+    async def read_pages(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        dpi: int = 150,
+        progress_callback: Optional[Callable] = None,
+    ) -> List[PageContent]:
+        """
+        Read selected PDF pages (0-indexed) with Vision, concurrently
 
-            # Claude reads the page
-            page_content = await self._read_page_image(
-                img_bytes,
-                page_num + 1,
-                total_pages
-            )
+        Pages read before (same content, DPI, model and prompt - from any
+        PDF) come from the page cache; only the others are sent to the model.
 
-            pages.append(page_content)
-            logger.info(f"[Vision] Page {page_num + 1}/{total_pages} complete ({len(page_content.content)} chars)")
+        Returns:
+            PageContent per requested page, in the order given
+        """
+        import fitz
 
-            # Small delay to avoid rate limits
-            if page_num < total_pages - 1:
-                await asyncio.sleep(1)
+        doc = fitz.open(str(pdf_path))
+        total_pages = len(doc)
+        results: List[Optional[PageContent]] = [None] * len(page_numbers)
+        keys: List[str] = []
+        cached: Dict[str, Any] = {}
 
-        doc.close()
+        def render(page_num: int) -> bytes:
+            # Pages are rendered one at a time on the render task, so the
+            # document is never used from two threads at once
+            return doc[page_num].get_pixmap(dpi=dpi).tobytes("png")
 
-        return VisionDocument(
-            source_file=pdf_path.name,
-            total_pages=total_pages,
-            pages=pages,
-        )
+        def page_keys() -> List[str]:
+            fields = self._cache_key_fields(dpi)
+            return [compute_page_key(page_fingerprint(doc[n]), "vision", **fields) for n in page_numbers]
+
+        try:
+            if self.page_cache is not None:
+                keys = await run_blocking(page_keys)
+                cached = await run_blocking(self.page_cache.get_many, keys)
+
+            pending = []
+            for index, page_num in enumerate(page_numbers):
+                hit = cached.get(keys[index]) if keys else None
+                if hit is not None:
+                    results[index] = PageContent(**{**hit, "page_number": page_num + 1, "cached": True})
+                else:
+                    pending.append(index)
+
+            hits = len(page_numbers) - len(pending)
+            if hits:
+                logger.info(f"[Vision] {hits}/{len(page_numbers)} pages from page cache")
+
+            async def load(i: int) -> Tuple[bytes, str, int, int]:
+                page_num = page_numbers[pending[i]]
+                return await run_blocking(render, page_num), "image/png", page_num + 1, total_pages
+
+            def on_progress(done: int, _total: int) -> None:
+                progress_callback(hits + done, len(page_numbers))
+
+            if pending:
+                pages = await self._read_concurrently(
+                    len(pending), load, on_progress if progress_callback else None
+                )
+            else:
+                pages = []
+                if progress_callback:
+                    progress_callback(len(page_numbers), len(page_numbers))
+        finally:
+            doc.close()
+
+        new_entries = []
+        for index, page in zip(pending, pages):
+            results[index] = page
+            # Failed pages are retried next time, not cached
+            if keys and not page.content.startswith("[VISION ERROR"):
+                value = asdict(page)
+                del value["page_number"], value["cached"]
+                new_entries.append({"key": keys[index], "value": value, "extractor": "vision"})
+        if new_entries:
+            await run_blocking(self.page_cache.set_many, new_entries)
+
+        return results
+
+    async def read_page(self, pdf_path: Path, page_num: int, dpi: int = 150) -> str:
+        """Read one PDF page (0-indexed) and return its content"""
+        pages = await self.read_pages(Path(pdf_path), [page_num], dpi)
+        return pages[0].content
+
+    async def _read_concurrently(
+        self,
+        count: int,
+        load: Callable[[int], Awaitable[Tuple[bytes, str, int, int]]],
+        progress_callback: Optional[Callable] = None,
+    ) -> List[PageContent]:
+        """
+        Read `count` images: one task loads (renders) them in order, staying
+        up to `concurrency` images ahead, while `concurrency` readers send
+        them to the model. Results come back in load order.
+        """
+        results: List[Optional[PageContent]] = [None] * count
+        ready: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        done = 0
+
+        async def produce():
+            for index in range(count):
+                await ready.put((index, await load(index)))
+            for _ in range(self.concurrency):
+                await ready.put(None)
+
+        async def consume():
+            nonlocal done
+            while (item := await ready.get()) is not None:
+                index, (img_bytes, media_type, page_num, total_pages) = item
+                results[index] = await self._read_page_image(img_bytes, page_num, total_pages, media_type)
+                done += 1
+                logger.info(f"[Vision] Page {page_num}/{total_pages} complete ({len(results[index].content)} chars)")
+                if progress_callback:
+                    progress_callback(done, count)
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks += [asyncio.ensure_future(consume()) for _ in range(min(self.concurrency, count))]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return results
 
     async def read_image(
         self,
@@ -299,25 +475,29 @@ class VisionReader:
 
         Args:
             image_paths: List of image file paths
-            progress_callback: Called with (current, total)
+            progress_callback: Called with (images_done, total)
 
         Returns:
             VisionDocument with all pages
         """
         total = len(image_paths)
-        pages = []
-
-        for i, img_path in enumerate(image_paths):
-            if progress_callback:
-                progress_callback(i + 1, total)
+        media_types = {
+            '.png': 'image/png',
+            '.jpg': 'image/jpeg',
+            '.jpeg': 'image/jpeg',
+            '.gif': 'image/gif',
+            '.webp': 'image/webp',
+        }
 
-            page_content = await self.read_image(img_path)
-            page_content.page_number = i + 1
-            pages.append(page_content)
+        async def load(index: int) -> Tuple[bytes, str, int, int]:
+            img_path = Path(image_paths[index])
+            media_type = media_types.get(img_path.suffix.lower(), 'image/png')
+            # Each image is read as a single page, like read_image()
+            return await run_blocking(img_path.read_bytes), media_type, 1, 1
 
-            # Small delay to avoid rate limits
-            if i < total - 1:
-                await asyncio.sleep(1)
+        pages = await self._read_concurrently(total, load, progress_callback)
+        for i, page in enumerate(pages):
+            page.page_number = i + 1
 
         return VisionDocument(
             source_file=image_paths[0].name if image_paths else "images",
@@ -417,34 +597,52 @@ class VisionReader:
         if total_pages > 1:
             prompt += f"\n\nThis is page {page_num} of {total_pages}."
 
-        # Call Claude Vision
-        try:
-            response = await self.llm_client.chat(
-                messages=[{
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": img_base64,
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": prompt,
-                        }
-                    ]
-                }],
-                max_tokens=self.max_tokens,
-            )
-
-            content = response.content.strip()
-
-        except Exception as e:
-            logger.error(f"[Vision] Page {page_num} failed: {e}")
-            content = f"[VISION ERROR: Page {page_num}]"
+        messages = [{
+            "role": "user",
+            "content": [
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": media_type,
+                        "data": img_base64,
+                    }
+                },
+                {
+                    "type": "text",
+                    "text": prompt,
+                }
+            ]
+        }]
+        limiter = self._limiter()
+        input_tokens = _image_tokens(img_bytes) + len(prompt) // 4
+
+        # Call Claude Vision (retry transient failures of this page only)
+        attempt = 0
+        while True:
+            await limiter.acquire(input_tokens)
+            try:
+                response = await self.llm_client.chat(
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                )
+                content = response.content.strip()
+                break
+
+            except Exception as e:
+                if attempt < self.max_retries and is_transient_error(e):
+                    delay = backoff_delay(attempt)
+                    attempt += 1
+                    logger.warning(f"[Vision] Page {page_num} failed ({e}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                    if "rate" in str(e).lower() or "429" in str(e):
+                        # Slow every page down, not just this one (acquire waits)
+                        limiter.penalize(delay)
+                    else:
+                        await asyncio.sleep(delay)
+                    continue
+                logger.error(f"[Vision] Page {page_num} failed: {e}")
+                content = f"[VISION ERROR: Page {page_num}]"
+                break
 
         # Detect content features
         has_formulas = '$' in content or '\\' in content
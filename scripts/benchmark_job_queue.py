@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+JobQueue Throughput Benchmark
+
+Measures JobQueue operations/sec under concurrent API and worker load:
+- api threads: get_job / list_jobs / get_queue_stats (status polling)
+- worker threads: get_next_job + progress update_job calls + completion
+
+once with a connection per call (sqlite_pool_size=0, the previous
+behaviour) and once with the pooled backend (writer + reader pool).
+
+Usage:
+    python scripts/benchmark_job_queue.py --api-threads 8 --workers 4 --seconds 3
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from core.job_queue import JobQueue
+
+
+def run_mode(pool_size: int, jobs: int, api_threads: int, workers: int, seconds: float) -> dict:
+    settings.sqlite_pool_size = pool_size
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(Path(tmp) / "jobs.db")
+        job_ids = [queue.create_job(f"job {i}", f"in{i}.txt", f"out{i}.txt").job_id for i in range(jobs)]
+
+        counts = {"api": 0, "worker": 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def api(seed: int):
+            rng = random.Random(seed)
+            done = 0
+            while not stop.is_set():
+                op = rng.random()
+                if op < 0.6:
+                    queue.get_job(rng.choice(job_ids))
+                elif op < 0.9:
+                    queue.list_jobs(limit=20)
+                else:
+                    queue.get_queue_stats()
+                done += 1
+            with lock:
+                counts["api"] += done
+
+        def worker():
+            done = 0
+            while not stop.is_set():
+                job = queue.get_next_job()
+                done += 1
+                if job is None:
+                    break
+                job.mark_started()
+                for step in range(1, 4):
+                    job.update_progress(step, 3)
+                    queue.update_job(job)
+                job.mark_completed()
+                queue.update_job(job)
+                done += 4
+            with lock:
+                counts["worker"] += done
+
+        threads = [threading.Thread(target=api, args=(i,)) for i in range(api_threads)]
+        threads += [threading.Thread(target=worker) for _ in range(workers)]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        queue.close()
+
+    return {name: count / elapsed for name, count in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JobQueue throughput under concurrent load")
+    parser.add_argument("--jobs", type=int, default=2000, help="Jobs in the queue")
+    parser.add_argument("--api-threads", type=int, default=8, help="Threads polling job status")
+    parser.add_argument("--workers", type=int, default=4, help="Threads claiming and updating jobs")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration per mode")
+    parser.add_argument("--pool-size", type=int, default=4, help="Reader connections in pooled mode")
+    args = parser.parse_args()
+
+    results = {}
+    for label, pool_size in (("per-call", 0), ("pooled", args.pool_size)):
+        results[label] = run_mode(pool_size, args.jobs, args.api_threads, args.workers, args.seconds)
+
+    print(f"{args.api_threads} api threads, {args.workers} workers, {args.seconds:.0f}s per mode")
+    print(f"{'mode':>9} {'api ops/s':>10} {'worker ops/s':>13}")
+    for label, ops in results.items():
+        print(f"{label:>9} {ops['api']:>10.0f} {ops['worker']:>13.0f}")
+    base, pooled = results["per-call"], results["pooled"]
+    print(f"speedup: api {pooled['api'] / base['api']:.1f}x, worker {pooled['worker'] / base['worker']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Parallel OCR Benchmark
+
+Builds a synthetic scanned PDF (every page is a raster image of text) and
+measures OcrPipeline.process_pdf pages/sec for several worker counts.
+
+By default a CPU-bound stand-in OCR engine is used so the benchmark runs
+without PaddleOCR; pass --engine paddle to measure the real engine.
+Speedup is bounded by the number of CPU cores (printed first).
+
+Usage:
+    python scripts/benchmark_ocr_parallel.py --pages 48 --workers 1 2 4
+    python scripts/benchmark_ocr_parallel.py --engine paddle --lang en
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fitz
+
+from core.ocr.pipeline import OcrPipeline
+
+
+class SyntheticOcrClient:
+    """Burns a fixed amount of CPU per page, like a local OCR model"""
+
+    def __init__(self, work: int = 200_000):
+        self.work = work
+
+    def extract_structured(self, image_bytes, mode="document", language=None):
+        digest = image_bytes
+        for _ in range(self.work // 1000):
+            digest = hashlib.sha256(digest * 8).digest()
+        return {"text": digest.hex(), "confidence": 1.0, "blocks": [], "metadata": {}}
+
+
+def build_scanned_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        # Render a text page to a bitmap and place it as the only page content
+        text_page = fitz.open()
+        src = text_page.new_page()
+        src.insert_textbox(src.rect + (50, 50, -50, -50), f"Page {i + 1}\n" + "Lorem ipsum dolor sit amet. " * 60)
+        pix = src.get_pixmap(matrix=fitz.Matrix(150 / 72, 150 / 72))
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=pix.tobytes("png"))
+        text_page.close()
+    doc.save(path)
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page-parallel OCR")
+    parser.add_argument("--pages", type=int, default=48, help="Pages in the synthetic PDF")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare")
+    parser.add_argument("--dpi", type=int, default=150, help="Render DPI")
+    parser.add_argument("--engine", choices=["synthetic", "paddle"], default="synthetic")
+    parser.add_argument("--lang", default="en", help="PaddleOCR language (with --engine paddle)")
+    parser.add_argument("--work", type=int, default=200_000, help="Synthetic engine CPU work per page")
+    args = parser.parse_args()
+
+    if args.engine == "paddle":
+        from core.ocr.paddle_client import PaddleOcrClient
+        factory = partial(PaddleOcrClient, lang=args.lang)
+    else:
+        factory = partial(SyntheticOcrClient, work=args.work)
+
+    print(f"{os.cpu_count()} CPU cores, {args.pages} pages at {args.dpi} DPI, engine={args.engine}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "scan.pdf"
+        build_scanned_pdf(pdf_path, args.pages)
+        client = factory()
+
+        results = {}
+        for workers in args.workers:
+            with OcrPipeline(client, dpi=args.dpi, workers=workers, memory_limit_mb=0,
+                             client_factory=factory) as pipeline:
+                if workers > 1:
+                    # Start workers and load models outside the timed run
+                    pipeline.process_pdf(pdf_path, page_range=(0, pipeline.MIN_PARALLEL_PAGES))
+                started = time.perf_counter()
+                pages = pipeline.process_pdf(pdf_path)
+                results[workers] = len(pages) / (time.perf_counter() - started)
+
+    print(f"{'workers':>8} {'pages/s':>9} {'speedup':>8}")
+    for workers, rate in results.items():
+        print(f"{workers:>8} {rate:>9.2f} {rate / results[args.workers[0]]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
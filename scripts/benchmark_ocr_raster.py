@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+OCR Rasterization Benchmark
+
+Compares the per-page cost of turning a scanned PDF page into OCR engine
+input (an RGB pixel array, as PaddleOCR consumes it):
+
+- png:      get_pixmap -> PNG bytes -> PIL decode -> np.array (previous path)
+- raw:      rasterize -> pixmap_array (zero-copy view of the samples)
+- adaptive: raw at the per-page DPI chosen from the text size
+
+Each mode runs in a fresh process so its peak RSS can be reported.
+
+Usage:
+    python scripts/benchmark_ocr_raster.py --pages 20 --dpi 300
+"""
+
+import argparse
+import io
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def build_scanned_pdf(path: Path, pages: int) -> None:
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        text_page = fitz.open()
+        src = text_page.new_page()
+        src.insert_textbox(src.rect + (50, 50, -50, -50), f"Page {i + 1}\n" + "Lorem ipsum dolor sit amet. " * 60,
+                           fontsize=11)
+        pix = src.get_pixmap(dpi=200)
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=pix)
+        text_page.close()
+    doc.save(path)
+    doc.close()
+
+
+def run_mode(mode: str, pdf_path: str, dpi: int, result_queue) -> None:
+    import fitz
+    import numpy as np
+    from PIL import Image
+    from core.ocr.raster import adaptive_dpi, pixmap_array, rasterize
+
+    checksum = 0
+    doc = fitz.open(pdf_path)
+    cpu_started = time.process_time()
+    for page in doc:
+        if mode == "png":
+            png = page.get_pixmap(matrix=fitz.Matrix(dpi / 72, dpi / 72)).tobytes("png")
+            pixels = np.array(Image.open(io.BytesIO(png)).convert("RGB"))
+        else:
+            page_dpi = adaptive_dpi(page, max_dpi=dpi) if mode == "adaptive" else dpi
+            pix = rasterize(page, page_dpi)
+            pixels = pixmap_array(pix)
+        checksum += int(pixels[::97, ::97].sum())
+    cpu = time.process_time() - cpu_started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result_queue.put((cpu / doc.page_count * 1000, peak_mb))
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page rasterization for OCR")
+    parser.add_argument("--pages", type=int, default=20, help="Pages in the synthetic scanned PDF")
+    parser.add_argument("--dpi", type=int, default=300, help="Render DPI (upper bound for adaptive)")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = str(Path(tmp) / "scan.pdf")
+        build_scanned_pdf(Path(pdf_path), args.pages)
+
+        print(f"{args.pages} scanned pages at {args.dpi} DPI")
+        print(f"{'mode':>9} {'CPU ms/page':>12} {'peak RSS MB':>12}")
+        for mode in ("png", "raw", "adaptive"):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=run_mode, args=(mode, pdf_path, args.dpi, queue))
+            proc.start()
+            ms, peak = queue.get()
+            proc.join()
+            print(f"{mode:>9} {ms:>12.1f} {peak:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
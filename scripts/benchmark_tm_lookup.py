@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+TM Fuzzy Lookup Benchmark
+
+Measures p50/p99 latency of TM fuzzy lookup at several TM sizes:
+- indexed: TMFuzzyIndex candidates + TMMatcher scoring (TMService path)
+- scan: previous TMService path - load every segment, SequenceMatcher each
+
+Usage:
+    python scripts/benchmark_tm_lookup.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.tm.index import TMFuzzyIndex
+from core.tm.matcher import TMMatcher
+from core.tm.models import TMSegment, TMSegmentGram, compute_hash, generate_uuid, normalize_text, segment_gram_rows
+from core.tm.repository import TMRepository
+
+ROOT = Path(__file__).parent.parent
+
+
+def load_vocabulary() -> (List[str], List[int]):
+    """English words and frequencies from the repo's docs (realistic bigrams)."""
+    counts = Counter()
+    for path in [ROOT / "README.md", *sorted((ROOT / "docs").glob("**/*.md"))]:
+        counts.update(w.lower() for w in re.findall(r"[A-Za-z']+", path.read_text(errors="ignore")))
+    words, weights = zip(*counts.most_common())
+    return list(words), list(weights)
+
+
+VOCABULARY, WEIGHTS = load_vocabulary()
+
+
+def make_sentence(rng: random.Random) -> str:
+    """Random sentence of 6-30 words."""
+    words = rng.choices(VOCABULARY, weights=WEIGHTS, k=rng.randint(6, 30))
+    return " ".join(words).capitalize() + "."
+
+
+def mutate(rng: random.Random, sentence: str) -> str:
+    """Change a few words so the query is a fuzzy (not exact) hit."""
+    words = sentence.split()
+    for _ in range(rng.randint(1, 3)):
+        words[rng.randrange(len(words))] = rng.choices(VOCABULARY, weights=WEIGHTS)[0]
+    return " ".join(words)
+
+
+def seed_tm(repo: TMRepository, size: int, rng: random.Random) -> (str, List[str]):
+    """Insert `size` synthetic segments with raw executemany (fast seeding)."""
+    tm = repo.create_tm(name=f"bench-{size}")
+    segments_table = TMSegment.__table__
+    grams_table = TMSegmentGram.__table__
+    samples: List[str] = []
+
+    batch = 5000
+    for start in range(0, size, batch):
+        seg_rows, gram_rows = [], []
+        for _ in range(min(batch, size - start)):
+            source = make_sentence(rng)
+            segment_id = generate_uuid()
+            seg_rows.append({
+                "id": segment_id,
+                "tm_id": tm.id,
+                "source_text": source,
+                "target_text": source.upper(),
+                "source_hash": compute_hash(f"{source} {segment_id}"),
+                "source_normalized": normalize_text(source),
+                "source_length": len(source.split()),
+                "quality_score": 0.8,
+                "source_type": "ai",
+                "usage_count": 0,
+            })
+            gram_rows.extend(segment_gram_rows(segment_id, tm.id, source))
+            if len(samples) < 1000:
+                samples.append(source)
+        with repo.engine.begin() as conn:
+            conn.execute(segments_table.insert(), seg_rows)
+            conn.execute(grams_table.insert(), gram_rows)
+
+    return tm.id, samples
+
+
+def scan_lookup(repo: TMRepository, tm_id: str, query: str, threshold: float) -> list:
+    """Previous lookup: all segments through the ORM, ratio() on each."""
+    query_norm = normalize_text(query)
+    query_words = len(query.split())
+    matches = []
+    for segment in repo.get_all_segments(tm_id):
+        if abs(segment.source_length - query_words) / max(segment.source_length, query_words) > 0.5:
+            continue
+        similarity = SequenceMatcher(None, query_norm, normalize_text(segment.source_text)).ratio()
+        if similarity >= threshold:
+            matches.append((similarity, segment.id))
+    return sorted(matches, reverse=True)[:5]
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    """p50/p99 in milliseconds."""
+    ordered = sorted(latencies)
+    p99_index = min(len(ordered) - 1, int(len(ordered) * 0.99))
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p99_ms": round(ordered[p99_index] * 1000, 2),
+    }
+
+
+def run(sizes: List[int], queries: int, threshold: float, scan_max: int) -> None:
+    rng = random.Random(42)
+    matcher = TMMatcher()
+
+    print(f"{'segments':>10} {'mode':>8} {'p50 ms':>10} {'p99 ms':>10} {'avg cand':>10}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = TMRepository(db_path=str(Path(tmp) / "tm.db"))
+            tm_id, samples = seed_tm(repo, size, rng)
+            index = TMFuzzyIndex(repo)
+            index.ensure_indexed([tm_id])
+            query_texts = [mutate(rng, rng.choice(samples)) for _ in range(queries)]
+
+            latencies, candidate_counts = [], []
+            for query in query_texts:
+                started = time.perf_counter()
+                index.search([tm_id], query, matcher, threshold)
+                latencies.append(time.perf_counter() - started)
+                candidate_counts.append(len(index.candidates([tm_id], query, threshold)))
+            stats = percentiles(latencies)
+            print(f"{size:>10} {'indexed':>8} {stats['p50_ms']:>10} {stats['p99_ms']:>10} "
+                  f"{statistics.mean(candidate_counts):>10.1f}")
+
+            if size <= scan_max:
+                latencies = []
+                for query in query_texts[:max(1, queries // 10)]:
+                    started = time.perf_counter()
+                    scan_lookup(repo, tm_id, query, threshold)
+                    latencies.append(time.perf_counter() - started)
+                stats = percentiles(latencies)
+                print(f"{size:>10} {'scan':>8} {stats['p50_ms']:>10} {stats['p99_ms']:>10} "
+                      f"{size:>10}")
+
+            repo.engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TM fuzzy lookup latency")
+    parser.add_argument("--sizes", default="10000,100000,1000000",
+                        help="Comma-separated TM sizes (segments)")
+    parser.add_argument("--queries", type=int, default=200, help="Lookups per size")
+    parser.add_argument("--threshold", type=float, default=0.75, help="Fuzzy threshold")
+    parser.add_argument("--scan-max", type=int, default=100000,
+                        help="Largest size to also time the full-scan baseline on")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    run(sizes, args.queries, args.threshold, args.scan_max)
+
+
+if __name__ == "__main__":
+    main()
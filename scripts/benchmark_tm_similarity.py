@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+TM Similarity Scoring Benchmark
+
+Measures candidates/sec of TranslationMemory fuzzy scoring on long chunks:
+- legacy: full O(n*m) Levenshtein + bigram + word overlap per candidate
+- bounded: SimilarityScorer (precomputed query, upper bounds, banded
+  Levenshtein with early exit)
+
+Usage:
+    python scripts/benchmark_tm_similarity.py --length 2500 --candidates 50
+"""
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.translation_memory import SimilarityScorer, TranslationMemory
+
+ROOT = Path(__file__).parent.parent
+
+
+def load_vocabulary() -> (List[str], List[int]):
+    """English words and frequencies from the repo's docs."""
+    counts = Counter()
+    for path in [ROOT / "README.md", *sorted((ROOT / "docs").glob("**/*.md"))]:
+        counts.update(w.lower() for w in re.findall(r"[A-Za-z']+", path.read_text(errors="ignore")))
+    words, weights = zip(*counts.most_common())
+    return list(words), list(weights)
+
+
+VOCABULARY, WEIGHTS = load_vocabulary()
+
+
+def make_chunk(rng: random.Random, length: int) -> str:
+    """Random text of roughly `length` characters."""
+    words: List[str] = []
+    size = 0
+    while size < length:
+        word = rng.choices(VOCABULARY, weights=WEIGHTS)[0]
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def mutate(rng: random.Random, chunk: str, rate: float) -> str:
+    """Replace about `rate` of the words."""
+    words = chunk.split()
+    for _ in range(max(1, int(len(words) * rate))):
+        words[rng.randrange(len(words))] = rng.choices(VOCABULARY, weights=WEIGHTS)[0]
+    return " ".join(words)
+
+
+def legacy_similarity(tm: TranslationMemory, str1: str, str2: str) -> float:
+    """Previous _calculate_similarity: always the full computation."""
+    if str1 == str2:
+        return 1.0
+    s1, s2 = str1.lower().strip(), str2.lower().strip()
+    if not s1 or not s2:
+        return 0.0
+    lev_similarity = 1.0 - (tm._levenshtein_distance(s1, s2) / max(len(s1), len(s2)))
+    return (
+        lev_similarity * 0.4 +
+        tm._bigram_similarity(s1, s2) * 0.3 +
+        tm._word_overlap_similarity(s1, s2) * 0.3
+    )
+
+
+def run(length: int, candidates: int, threshold: float) -> None:
+    rng = random.Random(42)
+    query = make_chunk(rng, length)
+    # FTS-style candidate mix: a few near hits, mostly keyword-only overlaps
+    pool = []
+    for i in range(candidates):
+        if i % 10 == 0:
+            pool.append(mutate(rng, query, 0.05))
+        elif i % 10 == 1:
+            pool.append(mutate(rng, query, 0.4))
+        else:
+            pool.append(make_chunk(rng, int(length * rng.uniform(0.6, 1.4))))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tm = TranslationMemory(Path(tmp) / "tm.db")
+
+        started = time.perf_counter()
+        legacy = [legacy_similarity(tm, query, c) for c in pool]
+        legacy_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scorer = SimilarityScorer(query, threshold)
+        bounded = [scorer.score(c) for c in pool]
+        bounded_elapsed = time.perf_counter() - started
+
+        tm.close()
+
+    kept = [l for l in legacy if l >= threshold]
+    assert kept == [b for b in bounded if b >= threshold], "bounded scorer disagrees"
+
+    print(f"query length {len(query)} chars, {candidates} candidates, threshold {threshold}")
+    print(f"{'mode':>8} {'seconds':>10} {'cand/sec':>10}")
+    print(f"{'legacy':>8} {legacy_elapsed:>10.3f} {candidates / legacy_elapsed:>10.1f}")
+    print(f"{'bounded':>8} {bounded_elapsed:>10.3f} {candidates / bounded_elapsed:>10.1f}")
+    print(f"matches >= threshold: {len(kept)}, speedup {legacy_elapsed / bounded_elapsed:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TM similarity scoring throughput")
+    parser.add_argument("--length", type=int, default=2500, help="Chunk length (characters)")
+    parser.add_argument("--candidates", type=int, default=50, help="Candidates to score")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Fuzzy threshold")
+    args = parser.parse_args()
+
+    run(args.length, args.candidates, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
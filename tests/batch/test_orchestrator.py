@@ -104,6 +104,7 @@ class TestBatchOrchestrator:
     def mock_translator(self):
         """Create mock translator."""
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -156,6 +157,13 @@ class TestBatchOrchestrator:
         assert result.chunk_count >= 1
         assert result.job_id is not None
 
+    @pytest.mark.asyncio
+    async def test_write_behind_stores_flushed(self, orchestrator, mock_translator):
+        """Queued TM / chunk cache writes are committed when chunks finish."""
+        await orchestrator.process(input_text="Hello world.", source_lang="en", target_lang="vi")
+
+        mock_translator.flush_stores.assert_awaited()
+
     @pytest.mark.asyncio
     async def test_process_with_progress_callback(self, orchestrator):
         """Test progress callback is called."""
@@ -235,6 +243,7 @@ class TestOrchestratorFileLoading:
     def orchestrator(self):
         """Create orchestrator with mocks."""
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -290,6 +299,7 @@ class TestOrchestratorExport:
     def orchestrator(self):
         """Create orchestrator with mocks."""
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -348,6 +358,7 @@ class TestOrchestratorErrorHandling:
     async def test_translator_exception(self):
         """Test handling of translator exception."""
         failing_translator = Mock()
+        failing_translator.flush_stores = AsyncMock()
         failing_translator.translate_chunk = AsyncMock(
             side_effect=Exception("API Error")
         )
@@ -376,6 +387,7 @@ class TestOrchestratorErrorHandling:
     async def test_result_contains_duration(self):
         """Test that result contains duration."""
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -409,6 +421,7 @@ class TestOrchestratorChunking:
     def orchestrator(self):
         """Create orchestrator with small chunk size."""
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -475,6 +488,7 @@ class TestOrchestratorWithCustomChunker:
         ])
 
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -511,6 +525,7 @@ class TestOrchestratorWithValidator:
     async def test_validator_called_when_enabled(self):
         """Test that validator is called when enabled."""
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -556,6 +571,7 @@ class TestOrchestratorIntegration:
         output_file = tmp_path / "output.txt"
 
         translator = Mock()
+        translator.flush_stores = AsyncMock()
         translator.translate_chunk = AsyncMock(
             side_effect=lambda client, chunk: MockTranslationResult(
                 chunk_id=chunk.id,
@@ -125,6 +125,19 @@ class TestChunkCache:
             result = temp_cache.get(key)
             assert result == expected_value, f"Key {key} must return correct value"
 
+    def test_cache_set_many(self, temp_cache):
+        """set_many stores every entry in one transaction"""
+        temp_cache.set("key1", "Old value")
+
+        temp_cache.set_many([
+            {"key": "key1", "value": "Value 1", "source_lang": "en", "target_lang": "vi"},
+            {"key": "key2", "value": "Value 2", "mode": "simple"},
+        ])
+
+        assert temp_cache.get("key1") == "Value 1"
+        assert temp_cache.get("key2") == "Value 2"
+        assert temp_cache.stats()["total_entries"] == 2
+
     def test_cache_unicode_support(self, temp_cache):
         """Test that cache handles Unicode text correctly"""
         key = "unicode_test"
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit Tests for the per-page PDF extraction cache
+
+Tests cover:
+- Page fingerprints (position independent, content sensitive)
+- Key generation
+- PageCache operations, statistics and LRU eviction
+- Extractors re-extracting only changed pages (fast text, analysis,
+  Vision, OCR)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from core.cache.page_cache import PageCache, PageCacheStats, compute_page_key, page_fingerprint
+from core.ocr.pipeline import OcrPipeline
+from core.smart_extraction.document_analyzer import DocumentAnalyzer
+from core.smart_extraction.fast_text_extractor import FastTextExtractor
+from core_v2 import vision_reader
+from core_v2.rate_limiter import ProviderRateLimiter
+from core_v2.vision_reader import VisionReader
+
+
+def _write_pdf(path, texts):
+    doc = fitz.open()
+    for text in texts:
+        doc.new_page(width=300, height=300).insert_text((30, 60), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = PageCache(tmp_path / "pages.db")
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    return _write_pdf(tmp_path / "book.pdf", [f"Page {i} text." for i in range(4)])
+
+
+@pytest.fixture
+def edited_pdf_path(tmp_path):
+    """book.pdf with page 2 changed and a new page inserted at the front"""
+    return _write_pdf(
+        tmp_path / "edited.pdf",
+        ["Preface."] + [f"Page {i} text." if i != 2 else "Page 2 rewritten." for i in range(4)],
+    )
+
+
+class TestPageFingerprint:
+
+    def test_independent_of_position_and_file(self, pdf_path, edited_pdf_path):
+        with fitz.open(pdf_path) as a, fitz.open(edited_pdf_path) as b:
+            assert page_fingerprint(a[0]) == page_fingerprint(b[1])
+            assert page_fingerprint(a[3]) == page_fingerprint(b[4])
+            assert page_fingerprint(a[2]) != page_fingerprint(b[3])
+
+    def test_image_change_detected(self):
+        doc = fitz.open()
+        for value in (0, 255):
+            pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 8, 8), False)
+            pix.clear_with(value)
+            doc.new_page().insert_image(fitz.Rect(0, 0, 100, 100), pixmap=pix)
+
+        assert page_fingerprint(doc[0]) != page_fingerprint(doc[1])
+
+    def test_rotation_detected(self):
+        doc = fitz.open()
+        doc.new_page()
+        before = page_fingerprint(doc[0])
+        doc[0].set_rotation(90)
+
+        assert page_fingerprint(doc[0]) != before
+
+
+class TestComputePageKey:
+
+    def test_stable(self):
+        assert compute_page_key("ab", "ocr", dpi=300) == compute_page_key("ab", "ocr", dpi=300)
+
+    def test_configuration_changes_key(self):
+        base = compute_page_key("ab", "vision", dpi=150, model="openai/gpt-4o")
+
+        assert base != compute_page_key("ab", "vision", dpi=200, model="openai/gpt-4o")
+        assert base != compute_page_key("ab", "vision", dpi=150, model="anthropic/claude")
+        assert base != compute_page_key("ab", "ocr", dpi=150, model="openai/gpt-4o")
+        assert base != compute_page_key("ab", "vision", dpi=150, model="openai/gpt-4o", prompt="x")
+
+    def test_none_flags_ignored(self):
+        assert compute_page_key("ab", "ocr", mode=None) == compute_page_key("ab", "ocr")
+
+
+class TestPageCache:
+
+    def test_set_get(self, cache):
+        cache.set("k1", {"content": "text", "words": 1}, extractor="fast_text")
+
+        assert cache.get("k1") == {"content": "text", "words": 1}
+        assert cache.get("missing") is None
+
+    def test_get_many(self, cache):
+        cache.set_many([{"key": f"k{i}", "value": i} for i in range(3)])
+
+        assert cache.get_many(["k0", "k2", "k9", "k0"]) == {"k0": 0, "k2": 2}
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_numpy_values(self, cache):
+        np = pytest.importorskip("numpy")
+        cache.set("k", {"bbox": np.array([0.5, 1.0]), "score": np.float32(0.5)})
+
+        assert cache.get("k") == {"bbox": [0.5, 1.0], "score": 0.5}
+
+    def test_persistent(self, tmp_path):
+        PageCache(tmp_path / "p.db").set("k", "v")
+
+        assert PageCache(tmp_path / "p.db").get("k") == "v"
+
+    def test_stats_by_extractor_and_clear(self, cache):
+        cache.set("a", 1, extractor="ocr")
+        cache.set("b", 2, extractor="vision")
+
+        assert cache.stats()["entries_by_extractor"] == {"ocr": 1, "vision": 1}
+
+        cache.clear()
+        assert cache.stats()["total_entries"] == 0
+
+    def test_evicts_least_recently_used(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set(key, "x" * 100)
+        cache.get("a")
+
+        # Room for two values: "b" is the least recently used
+        assert cache.evict(max_bytes=250) == 1
+        assert cache.get_many(["a", "b", "c"]) == {"a": "x" * 100, "c": "x" * 100}
+
+    def test_writes_stay_under_budget(self, tmp_path):
+        cache = PageCache(tmp_path / "p.db", max_mb=0.001)
+
+        cache.set_many([{"key": f"k{i}", "value": "x" * 100} for i in range(20)])
+
+        assert 0 < cache.stats()["total_entries"] < 20
+
+    def test_unbounded(self, tmp_path):
+        cache = PageCache(tmp_path / "p.db", max_mb=0)
+
+        cache.set_many([{"key": f"k{i}", "value": "x" * 100} for i in range(20)])
+
+        assert cache.evict() == 0
+        assert cache.stats()["total_entries"] == 20
+
+    def test_stats_of_pages(self):
+        pages = [SimpleNamespace(cached=True), SimpleNamespace(cached=False), SimpleNamespace(cached=True)]
+
+        assert PageCacheStats.of(pages).to_dict() == {"hits": 2, "misses": 1, "hit_rate": 0.6667}
+
+
+class TestFastTextExtractor:
+
+    def test_only_changed_pages_extracted(self, cache, pdf_path, edited_pdf_path):
+        extractor = FastTextExtractor(page_cache=cache)
+
+        first = asyncio.run(extractor.extract(str(pdf_path)))
+        second = asyncio.run(extractor.extract(str(edited_pdf_path)))
+
+        assert first.page_cache.hits == 0
+        assert [p.cached for p in second.pages] == [False, True, True, False, True]
+        assert [p.page_number for p in second.pages] == list(range(5))
+        assert second.pages[3].content == "Page 2 rewritten."
+        assert second.full_content == asyncio.run(FastTextExtractor().extract(str(edited_pdf_path))).full_content
+
+
+class TestDocumentAnalyzer:
+
+    def test_analysis_reused(self, cache, pdf_path):
+        first = DocumentAnalyzer(page_cache=cache).analyze(str(pdf_path))
+        second = DocumentAnalyzer(page_cache=cache).analyze(str(pdf_path))
+
+        assert first.page_cache.hits == 0
+        assert second.page_cache.hit_rate == 1.0
+        assert second.strategy == first.strategy
+        assert [p.char_count for p in second.pages] == [p.char_count for p in first.pages]
+
+
+class _CountingVisionClient:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def chat(self, messages, max_tokens=4096, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise ValueError("bad request")
+        return SimpleNamespace(content=f"vision text {self.calls}")
+
+
+class TestVisionReader:
+
+    @pytest.fixture(autouse=True)
+    def unlimited(self, monkeypatch):
+        monkeypatch.setattr(vision_reader, "get_vision_limiter", lambda provider: ProviderRateLimiter(0))
+
+    def test_cached_pages_not_sent(self, cache, pdf_path, edited_pdf_path):
+        client = _CountingVisionClient()
+        reader = VisionReader(client, concurrency=2, page_cache=cache)
+        progress = []
+
+        first = asyncio.run(reader.read_pdf(pdf_path, dpi=50))
+        second = asyncio.run(reader.read_pdf(edited_pdf_path, dpi=50,
+                                             progress_callback=lambda d, t: progress.append((d, t))))
+
+        assert client.calls == 4 + 2
+        assert second.page_cache.to_dict()["hits"] == 3
+        assert second.pages[1].content == first.pages[0].content
+        assert [p.page_number for p in second.pages] == [1, 2, 3, 4, 5]
+        assert progress[-1] == (5, 5)
+
+    def test_dpi_and_prompt_are_part_of_key(self, cache, pdf_path):
+        client = _CountingVisionClient()
+        reader = VisionReader(client, page_cache=cache)
+
+        asyncio.run(reader.read_pages(pdf_path, [0], dpi=50))
+        asyncio.run(reader.read_pages(pdf_path, [0], dpi=72))
+        asyncio.run(reader.read_pdf_novel(pdf_path, dpi=50, max_pages=1))
+
+        assert client.calls == 3
+
+    def test_failed_pages_not_cached(self, cache, pdf_path):
+        reader = VisionReader(_CountingVisionClient(fail=True), page_cache=cache)
+        asyncio.run(reader.read_pages(pdf_path, [0], dpi=50))
+
+        client = _CountingVisionClient()
+        page = asyncio.run(VisionReader(client, page_cache=cache).read_page(pdf_path, 0, dpi=50))
+
+        assert page == "vision text 1"
+        assert client.calls == 1
+
+
+class _PixelOcrClient:
+    def __init__(self):
+        self.calls = 0
+
+    def extract_structured(self, image_bytes, mode="document", language=None):
+        raise AssertionError("pixel path expected")
+
+    def extract_structured_pixels(self, pixels, mode="document", language=None):
+        import numpy as np
+        self.calls += 1
+        return {"text": f"ocr {self.calls}", "confidence": 0.9,
+                "blocks": [{"bbox": (np.float32(0.25), 0.5, 1, 1)}], "metadata": {}}
+
+
+class TestOcrPipeline:
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        # The pixel path hands the OCR client a NumPy array
+        pytest.importorskip("numpy")
+
+    def test_only_changed_pages_ocred(self, cache, pdf_path, edited_pdf_path):
+        client = _PixelOcrClient()
+        pipeline = OcrPipeline(client, dpi=72, workers=1, adaptive=False, page_cache=cache)
+
+        first = pipeline.process_pdf(pdf_path)
+        progress = []
+        second = pipeline.process_pdf(edited_pdf_path, progress_callback=lambda d, t: progress.append((d, t)))
+
+        assert client.calls == 4 + 2
+        assert [p.cached for p in second] == [False, True, True, False, True]
+        assert [p.page_num for p in second] == list(range(5))
+        assert second[1].text == first[0].text
+        assert second[1].blocks == [{"bbox": [0.25, 0.5, 1, 1]}]
+        assert progress[-1] == (5, 5)
+
+    def test_engine_settings_are_part_of_key(self, cache, pdf_path):
+        client = _PixelOcrClient()
+
+        OcrPipeline(client, dpi=72, workers=1, adaptive=False, page_cache=cache).process_pdf(pdf_path)
+        OcrPipeline(client, dpi=72, workers=1, adaptive=False, page_cache=cache).process_pdf(
+            pdf_path, mode="handwriting"
+        )
+
+        assert client.calls == 8
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit Tests for the tiered chunk cache
+
+Tests cover:
+- Memory tier hits (no SQLite read)
+- Cross-instance invalidation through the SQLite invalidation log
+- Per-tier statistics
+- Shared (Redis) tier cleared together with SQLite
+- Byte-bounded LRU eviction
+- Process-wide instances from get_chunk_cache
+"""
+
+import pytest
+from unittest.mock import patch
+
+from core.cache.chunk_cache import ChunkCache
+from core.cache.memory_cache import LRUCache
+from core.cache.tiered_cache import TieredChunkCache, get_chunk_cache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "chunks.db"
+
+
+class TestMemoryTier:
+    """Hot keys are served from process memory"""
+
+    def test_hit_skips_sqlite(self, db_path):
+        cache = TieredChunkCache(db_path)
+        cache.set("k", "Xin chào")
+
+        with patch.object(ChunkCache, "get", side_effect=AssertionError("SQLite read")):
+            assert cache.get("k") == "Xin chào"
+
+    def test_sqlite_hit_is_promoted(self, db_path):
+        ChunkCache(db_path).set("k", "v")
+        cache = TieredChunkCache(db_path)
+
+        assert cache.get("k") == "v"
+        assert cache.get("k") == "v"
+
+        tiers = cache.stats()["tiers"]
+        assert tiers["sqlite"]["hits"] == 1
+        assert tiers["memory"]["hits"] == 1
+        assert tiers["memory"]["misses"] == 1
+
+    def test_miss_is_not_cached(self, db_path):
+        cache = TieredChunkCache(db_path)
+
+        assert cache.get("missing") is None
+        cache.set("missing", "now here")
+        assert cache.get("missing") == "now here"
+
+    def test_stats_keep_chunk_cache_keys(self, db_path):
+        cache = TieredChunkCache(db_path, memory_bytes=1024)
+        cache.set("k", "v")
+        cache.get("k")
+
+        stats = cache.stats()
+        assert stats["total_entries"] == 1
+        assert stats["tiers"]["memory"]["size_bytes"] == 1
+        assert stats["tiers"]["memory"]["max_bytes"] == 1024
+        assert stats["tiers"]["shared"]["enabled"] is False
+
+    def test_memory_tier_can_be_disabled(self, db_path):
+        cache = TieredChunkCache(db_path, memory_bytes=0)
+        cache.set("k", "v")
+
+        assert cache.get("k") == "v"
+        assert cache.stats()["tiers"]["sqlite"]["hits"] == 1
+
+
+class TestInvalidation:
+    """Writes by another process reach this process's memory tier"""
+
+    def test_overwrite_elsewhere_is_picked_up(self, db_path):
+        worker_a = TieredChunkCache(db_path, invalidation_interval=0)
+        worker_b = TieredChunkCache(db_path, invalidation_interval=0)
+        worker_a.set("k", "old")
+        assert worker_a.get("k") == "old"
+
+        worker_b.set("k", "new")
+
+        assert worker_a.get("k") == "new"
+
+    def test_clear_elsewhere_is_picked_up(self, db_path):
+        worker_a = TieredChunkCache(db_path, invalidation_interval=0)
+        worker_b = TieredChunkCache(db_path, invalidation_interval=0)
+        worker_a.set("k", "v")
+        assert worker_a.get("k") == "v"
+
+        worker_b.clear()
+
+        assert worker_a.get("k") is None
+
+    def test_same_value_is_not_logged(self, db_path):
+        cache = ChunkCache(db_path)
+        cache.set("k", "v")
+        seq = cache.invalidation_seq()
+
+        cache.set("k", "v")
+        cache.get("k")
+
+        assert cache.invalidations_since(seq) == (seq, [])
+
+    def test_log_reports_overwritten_keys(self, db_path):
+        cache = ChunkCache(db_path)
+        cache.set("a", "1")
+        cache.set("b", "1")
+
+        cache.set_many([{"key": "a", "value": "2"}, {"key": "b", "value": "2"}])
+
+        seq, keys = cache.invalidations_since(0)
+        assert keys == ["a", "b"]
+        assert seq == cache.invalidation_seq()
+
+    def test_log_is_pruned_by_age(self, db_path):
+        cache = ChunkCache(db_path)
+        cache.set("a", "1")
+        cache.set("a", "2")
+        reader_seq = 0
+        seq = cache.invalidation_seq()
+
+        assert cache.prune_invalidations(max_age=3600) == 0
+        assert cache.prune_invalidations(max_age=-1) == 1
+        assert cache.invalidation_seq() == seq
+
+        # A reader behind the pruned entries is told to drop everything
+        assert cache.invalidations_since(reader_seq) == (seq, [None])
+        assert cache.invalidations_since(seq) == (seq, [])
+
+        cache.set("a", "3")
+        assert cache.invalidations_since(seq) == (seq + 1, ["a"])
+
+    def test_lagging_worker_clears_memory_after_prune(self, db_path):
+        worker_a = TieredChunkCache(db_path, invalidation_interval=0)
+        worker_b = TieredChunkCache(db_path, invalidation_interval=0)
+        worker_b.set("k", "old")
+        worker_a.get("k")
+
+        worker_b.set("k", "new")
+        worker_b.prune_invalidations(max_age=-1)
+
+        assert worker_a.get("k") == "new"
+
+
+class TestAsyncAPI:
+    """get_async / set_async without a shared tier"""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, db_path):
+        cache = TieredChunkCache(db_path)
+        await cache.set_async("k", "v", "en", "vi", mode="essay")
+
+        assert await cache.get_async("k") == "v"
+        assert ChunkCache(db_path).get("k") == "v"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_disables_shared_tier(self, db_path):
+        cache = TieredChunkCache(db_path, shared_url="redis://127.0.0.1:1/0")
+        await cache.set_async("k", "v")
+
+        assert await cache.get_async("k") == "v"
+        assert cache.stats()["tiers"]["shared"]["enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_retried_after_backoff(self, db_path, monkeypatch):
+        from core.cache import redis_client
+
+        attempts = []
+        real_create = redis_client.RedisClient.create
+
+        async def create(url=None):
+            attempts.append(url)
+            return await real_create(url)
+
+        monkeypatch.setattr(redis_client.RedisClient, "create", create)
+        cache = TieredChunkCache(db_path, shared_url="redis://127.0.0.1:1/0")
+
+        await cache.get_async("k")
+        await cache.get_async("k")
+        assert len(attempts) == 1  # backing off
+
+        cache._shared_retry_at = 0.0  # backoff expired
+        await cache.get_async("k")
+        assert len(attempts) == 2
+
+
+class TestSharedTier:
+    """Redis tier (an in-memory backend standing in for one Redis server)"""
+
+    @pytest.fixture
+    def shared_redis(self, monkeypatch):
+        from core.cache import redis_client
+
+        backend = redis_client.InMemoryBackend()
+
+        async def create(url=None):
+            return redis_client.RedisClient(backend, is_real=True)
+
+        monkeypatch.setattr(redis_client.RedisClient, "create", create)
+        return backend
+
+    @pytest.mark.asyncio
+    async def test_clear_retires_shared_entries(self, db_path, shared_redis):
+        worker_a = TieredChunkCache(db_path, shared_url="redis://fake", invalidation_interval=0)
+        worker_b = TieredChunkCache(db_path, shared_url="redis://fake", invalidation_interval=0)
+        await worker_a.set_async("k", "bad translation")
+        assert await worker_b.get_async("k") == "bad translation"
+        worker_b.memory.clear()  # next read goes to Redis
+
+        worker_a.clear()
+
+        # Neither the clearing process nor another one brings it back from Redis
+        assert await worker_a.get_async("k") is None
+        assert await worker_b.get_async("k") is None
+
+        await worker_b.set_async("k", "good translation")
+        worker_a.memory.clear()
+        assert await worker_a.get_async("k") == "good translation"
+
+    def test_module_docstring(self):
+        from core.cache import tiered_cache
+
+        assert tiered_cache.__doc__ and "Tiered Chunk Cache" in tiered_cache.__doc__
+
+
+class TestByteBoundedLRU:
+    """LRUCache max_bytes budget"""
+
+    def test_evicts_by_bytes(self):
+        lru = LRUCache(max_size=100, max_bytes=10)
+        lru.set("a", "aaaa")
+        lru.set("b", "bbbb")
+        lru.set("c", "cccc")
+
+        assert lru.get("a") is None
+        assert lru.get("b") == "bbbb"
+        assert lru.stats().size_bytes == 8
+
+    def test_rejects_oversized_value(self):
+        lru = LRUCache(max_size=100, max_bytes=10)
+        lru.set("a", "aaaa")
+
+        assert lru.set("big", "x" * 11) is False
+        assert lru.get("a") == "aaaa"
+
+    def test_counts_utf8_bytes(self):
+        lru = LRUCache(max_size=100, max_bytes=100)
+        lru.set("a", "ệ")
+
+        assert lru.stats().size_bytes == 3
+
+
+def test_get_chunk_cache_is_process_wide(db_path):
+    assert get_chunk_cache(db_path) is get_chunk_cache(str(db_path))
+    assert isinstance(get_chunk_cache(db_path), ChunkCache)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit Tests for the legacy TranslationCache (SQLite backend)
+
+Tests cover:
+- get/set roundtrip and hit/miss counters
+- Persistence across instances
+- One-time migration from translation_cache.json
+- Disabled cache
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from core.cache.legacy_cache import TranslationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+class TestTranslationCache:
+    """Test get/set behaviour"""
+
+    def test_set_get_roundtrip(self, cache):
+        cache.set("Hello", "Xin chào", "gpt-4", 0.9)
+
+        assert cache.get("Hello", "gpt-4") == "Xin chào"
+        assert cache.get("Hello", "claude") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_overwrite(self, cache):
+        cache.set("Hello", "Chào", "gpt-4")
+        cache.set("Hello", "Xin chào", "gpt-4")
+
+        assert cache.get("Hello", "gpt-4") == "Xin chào"
+        assert len(cache) == 1
+
+    def test_persists_after_save(self, tmp_path):
+        first = TranslationCache(tmp_path)
+        first.set("Hello", "Xin chào", "gpt-4")
+        first.save()
+        first.close()
+
+        second = TranslationCache(tmp_path)
+        try:
+            assert second.get("Hello", "gpt-4") == "Xin chào"
+        finally:
+            second.close()
+
+    def test_compact_keeps_entries(self, cache):
+        for i in range(25):
+            cache.set(f"text {i}", f"bản dịch {i}", "gpt-4")
+
+        cache.compact()
+
+        assert len(cache) == 25
+        assert cache.get("text 7", "gpt-4") == "bản dịch 7"
+
+    def test_disabled_cache_is_inert(self, tmp_path):
+        cache = TranslationCache(tmp_path, enabled=False)
+        cache.set("Hello", "Xin chào", "gpt-4")
+
+        assert cache.get("Hello", "gpt-4") is None
+        assert not (tmp_path / "translation_cache.db").exists()
+
+
+class TestJsonMigration:
+    """Test one-time import of translation_cache.json"""
+
+    def test_migrates_legacy_json_once(self, tmp_path):
+        key = hashlib.sha256("gpt-4:Hello".encode()).hexdigest()
+        (tmp_path / "translation_cache.json").write_text(json.dumps({
+            key: {
+                "translation": "Xin chào",
+                "model": "gpt-4",
+                "quality_score": 0.9,
+                "timestamp": "2025-01-01T00:00:00",
+            }
+        }), encoding="utf-8")
+
+        cache = TranslationCache(tmp_path)
+        try:
+            assert cache.get("Hello", "gpt-4") == "Xin chào"
+        finally:
+            cache.close()
+
+        assert not (tmp_path / "translation_cache.json").exists()
+        assert (tmp_path / "translation_cache.json.migrated").exists()
+
+    def test_corrupt_json_is_left_in_place(self, tmp_path):
+        (tmp_path / "translation_cache.json").write_text("{not json", encoding="utf-8")
+
+        cache = TranslationCache(tmp_path)
+        try:
+            assert cache.get("Hello", "gpt-4") is None
+        finally:
+            cache.close()
+
+        assert (tmp_path / "translation_cache.json").exists()
+
+    def test_malformed_entries_are_skipped(self, tmp_path):
+        key = hashlib.sha256("gpt-4:Hello".encode()).hexdigest()
+        (tmp_path / "translation_cache.json").write_text(json.dumps({
+            "no-translation": {"model": "gpt-4"},
+            "not-a-dict": "Xin chào",
+            key: {"translation": "Xin chào", "model": "gpt-4"},
+        }), encoding="utf-8")
+
+        cache = TranslationCache(tmp_path)
+        try:
+            assert cache.get("Hello", "gpt-4") == "Xin chào"
+            assert cache.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 1
+        finally:
+            cache.close()
+
+        assert (tmp_path / "translation_cache.json.migrated").exists()
@@ -58,6 +58,23 @@ def temp_tm_db(temp_dir: Path) -> Path:
     return db_path
 
 
+@pytest.fixture(autouse=True)
+def no_shared_page_cache(monkeypatch):
+    """Keep extractors off the shared page cache (data/cache/pages.db).
+
+    Tests that exercise caching pass a PageCache explicitly.
+    """
+    from config.settings import settings
+    monkeypatch.setattr(settings, "page_cache_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def no_shared_omml_cache(monkeypatch):
+    """Keep equation conversion off the shared OMML cache (data/cache/omml.db)."""
+    from config.settings import settings
+    monkeypatch.setattr(settings, "omml_cache_enabled", False)
+
+
 # ============================================================================
 # Fixtures: Sample Data
 # ============================================================================
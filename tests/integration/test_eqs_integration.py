@@ -8,9 +8,10 @@ import time
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from api.aps_v2_service import APSV2Service
+from core.cache.page_cache import PageCacheStats
 
 
 # ---------------------------------------------------------------------------
@@ -26,6 +27,7 @@ class _FakeAnalysis:
     strategy_reason: str = "text-heavy"
     estimated_cost_vision: float = 1.50
     complex_page_numbers: list = None
+    page_cache: PageCacheStats = field(default_factory=PageCacheStats)
 
     def __post_init__(self):
         if self.complex_page_numbers is None:
@@ -33,12 +35,22 @@ class _FakeAnalysis:
 
 
 @dataclass
-class _FakeExtractResult:
+class _FakeExtractedDocument:
+    """fast_extract() result"""
     full_content: str = ""
+    total_pages: int = 5
+    extraction_time: float = 0.3
+    page_cache: PageCacheStats = field(default_factory=PageCacheStats)
+
+
+@dataclass
+class _FakeExtractResult:
+    """smart_extract() result"""
     content: str = ""
     total_pages: int = 5
     extraction_time: float = 0.3
     ocr_confidence: float = 0.92
+    page_cache: dict = field(default_factory=dict)
 
 
 class _FakeStrategy:
@@ -80,8 +92,11 @@ def _build_import_mock(strategy_value, text_content, total_pages=5):
         total_pages=total_pages,
         strategy=fake_strat,
     )
-    result = _FakeExtractResult(
+    result = _FakeExtractedDocument(
         full_content=text_content,
+        total_pages=total_pages,
+    )
+    smart_result = _FakeExtractResult(
         content=text_content,
         total_pages=total_pages,
     )
@@ -91,10 +106,11 @@ def _build_import_mock(strategy_value, text_content, total_pages=5):
         "ExtractionStrategy": _FakeStrategy,
         "analyze_document": MagicMock(return_value=analysis),
         "fast_extract": AsyncMock(return_value=result),
-        "smart_extract": AsyncMock(return_value=result),
+        "smart_extract": AsyncMock(return_value=smart_result),
         "SmartExtractionRouter": MagicMock(),
         "analysis": analysis,
         "result": result,
+        "smart_result": smart_result,
     }
 
 
@@ -397,3 +413,33 @@ class TestPipelineRegression:
         assert result == str(pdf_file)
         # No EQS scoring for Vision pass-through
         assert service._last_eqs_report is None
+
+
+# ---------------------------------------------------------------------------
+# Test page cache stats are returned per call, not kept on the service
+# ---------------------------------------------------------------------------
+
+class TestPageCacheStats:
+    @pytest.mark.asyncio
+    async def test_stats_written_to_caller_dict(self, tmp_path):
+        """Concurrent uploads must not see each other's page cache stats."""
+        service = _make_service(tmp_path)
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4 fake")
+
+        mocks = _build_import_mock("fast_text", "Some text.\n" * 50)
+        mocks["result"].page_cache = PageCacheStats(hits=3, misses=2)
+
+        stats = {}
+        with patch.dict("sys.modules", {"core.smart_extraction": MagicMock(**{
+            "SmartExtractionRouter": mocks["SmartExtractionRouter"],
+            "ExtractionStrategy": mocks["ExtractionStrategy"],
+            "analyze_document": mocks["analyze_document"],
+            "smart_extract": mocks["smart_extract"],
+            "fast_extract": mocks["fast_extract"],
+        })}):
+            await service._smart_extract_pdf(pdf_file, use_vision=False, page_cache=stats)
+
+        assert stats["analysis"] == {"hits": 0, "misses": 0, "hit_rate": 0.0}
+        assert stats["fast_text"] == {"hits": 3, "misses": 2, "hit_rate": 0.6}
+        assert not hasattr(service, "_last_page_cache")
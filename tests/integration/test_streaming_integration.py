@@ -40,6 +40,7 @@ class TestStreamingIntegration:
             )
 
         translator.translate_chunk = AsyncMock(side_effect=translate_chunk)
+        translator.flush_stores = AsyncMock()
         return translator
 
     @pytest.fixture
@@ -163,6 +163,53 @@ class TestIncrementalDocxBuilder:
         # Verify cleanup happened despite exception
         assert not batch_file.exists(), "Batch file should be cleaned up"
 
+    @pytest.mark.asyncio
+    async def test_merge_preserves_formatting(self, temp_output):
+        """Test headings, styles and run formatting survive the merge"""
+        from docx import Document
+
+        builder = IncrementalDocxBuilder(temp_output)
+        await builder.add_batch([
+            TranslationResult(chunk_id=0, source="s", translated="Chương 1: Khởi đầu\n\nĐoạn văn đầu tiên.", quality_score=0.9),
+        ], 0)
+        await builder.add_batch([
+            TranslationResult(chunk_id=1, source="s", translated="TIÊU ĐỀ\n\nĐoạn & <cuối>.", quality_score=0.9),
+        ], 1)
+
+        await builder.merge_all()
+
+        doc = Document(temp_output)
+        paragraphs = [(p.style.name, p.text) for p in doc.paragraphs]
+        assert paragraphs == [
+            ("Heading 1", "Chương 1: Khởi đầu"),
+            ("Normal", "Đoạn văn đầu tiên."),
+            ("Normal", "TIÊU ĐỀ"),
+            ("Normal", "Đoạn & <cuối>."),
+        ]
+        assert doc.paragraphs[2].runs[0].bold is True
+        assert doc.styles['Normal'].font.name == 'Times New Roman'
+        assert doc.sections[0].page_width is not None
+
+    @pytest.mark.asyncio
+    async def test_merge_does_not_reparse_batches(self, temp_output, monkeypatch):
+        """Test merge streams batch XML instead of loading batch documents"""
+        from core.streaming import incremental_builder
+
+        builder = IncrementalDocxBuilder(temp_output)
+        for batch_idx in range(3):
+            await builder.add_batch([
+                TranslationResult(chunk_id=batch_idx, source="s", translated=f"Text {batch_idx}", quality_score=0.9)
+            ], batch_idx)
+
+        opened = []
+        original = incremental_builder.Document
+        monkeypatch.setattr(incremental_builder, "Document", lambda *args: opened.append(args) or original(*args))
+
+        await builder.merge_all()
+
+        # Only the empty styled template is built
+        assert opened == [()]
+
 
 class TestIncrementalPdfBuilder:
     """Test Incremental PDF Builder"""
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the sliding-window scheduler of StreamingBatchProcessor
+
+Tests cover:
+- Ordered commit / export despite out-of-order completion
+- Slow chunks not stalling the rest of the job
+- Concurrency and window bounds
+- Failed chunks and the on-disk result spill
+"""
+
+import asyncio
+import random
+
+import httpx
+import pytest
+
+from core import parallel
+from core.chunker import TranslationChunk
+from core.job_queue import JobStatus, TranslationJob
+from core.streaming import ResultSpill, StreamingBatchProcessor
+from core.validator import TranslationResult
+
+
+def _job(output_format="txt"):
+    return TranslationJob(
+        job_id="window_job",
+        job_name="Window Job",
+        input_file="/tmp/in.txt",
+        output_file="/tmp/out.txt",
+        status=JobStatus.RUNNING,
+        output_format=output_format
+    )
+
+
+def _chunks(n):
+    return [TranslationChunk(id=i, text=f"Source {i}", context_before="", context_after="") for i in range(n)]
+
+
+class _Translator:
+    """Fake translator recording scheduling order"""
+
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.running = set()
+        self.max_running = 0
+        self.launch_violations = []
+        self.window = None
+        self.flushes = 0
+
+    async def flush_stores(self):
+        self.flushes += 1
+
+    async def translate_chunk(self, client, chunk):
+        if self.window is not None and self.running and chunk.id >= min(self.running) + self.window:
+            self.launch_violations.append(chunk.id)
+        self.running.add(chunk.id)
+        self.max_running = max(self.max_running, len(self.running))
+        try:
+            await asyncio.sleep(self.delays.get(chunk.id, random.uniform(0, 0.005)))
+            if chunk.id in self.fail:
+                raise ValueError("bad chunk")
+            return TranslationResult(chunk_id=chunk.id, source=chunk.text, translated=f"T{chunk.id}", quality_score=0.9)
+        finally:
+            self.running.discard(chunk.id)
+
+
+async def _run(processor, translator, chunks, output_path, output_format="txt", progress_callback=None):
+    async with httpx.AsyncClient() as client:
+        return await processor.process_streaming(
+            job=_job(output_format),
+            chunks=chunks,
+            translator=translator,
+            http_client=client,
+            output_path=output_path,
+            progress_callback=progress_callback
+        )
+
+
+class TestSlidingWindow:
+
+    @pytest.mark.asyncio
+    async def test_results_committed_in_order(self, tmp_path):
+        translator = _Translator()
+        processor = StreamingBatchProcessor(batch_size=10, max_concurrency=8)
+        output_path = tmp_path / "out.txt"
+
+        results, stats = await _run(processor, translator, _chunks(45), output_path)
+
+        assert [r.chunk_id for r in results] == list(range(45))
+        assert stats['batches_processed'] == 5
+        assert stats['chunks_processed'] == 45
+        assert len(stats['partial_exports']) == 5
+        assert output_path.read_text(encoding='utf-8').split() == [f"T{i}" for i in range(45)]
+        assert translator.flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_chunk_does_not_stall_job(self, tmp_path):
+        translator = _Translator(delays={0: 0.3})
+        translator.window = 40
+        processor = StreamingBatchProcessor(batch_size=10, max_concurrency=4, window_size=40)
+        started = []
+
+        original = translator.translate_chunk
+
+        async def translate_chunk(client, chunk):
+            started.append(chunk.id)
+            return await original(client, chunk)
+
+        translator.translate_chunk = translate_chunk
+
+        results, _ = await _run(processor, translator, _chunks(100), tmp_path / "out.txt")
+
+        # While chunk 0 was in flight the rest of the window kept moving
+        assert max(started[:40]) == 39
+        assert translator.max_running == 4
+        assert translator.launch_violations == []
+        assert len(results) == 100
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_per_batch(self, tmp_path):
+        processor = StreamingBatchProcessor(batch_size=10, max_concurrency=4)
+        calls = []
+
+        async def progress(completed_chunks, total_chunks, progress):
+            calls.append((completed_chunks, total_chunks, progress))
+
+        await _run(processor, _Translator(), _chunks(25), tmp_path / "out.txt", progress_callback=progress)
+
+        assert calls == [(10, 25, 1 / 3), (20, 25, 2 / 3), (25, 25, 1.0)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output_format, announces_file", [("txt", True), ("docx", False)])
+    async def test_batch_exported_announces_only_openable_files(self, tmp_path, output_format, announces_file):
+        class _WebSocket:
+            def __init__(self):
+                self.messages = []
+
+            async def broadcast(self, message):
+                self.messages.append(message)
+
+        ws = _WebSocket()
+        processor = StreamingBatchProcessor(batch_size=10, max_concurrency=4, websocket_manager=ws)
+
+        await _run(processor, _Translator(), _chunks(15), tmp_path / f"out.{output_format}", output_format)
+
+        exported = [m for m in ws.messages if m["event"] == "batch_exported"]
+        assert len(exported) == 2
+        # DOCX batch files are body XML fragments, not documents to download
+        assert all((m["partial_file"] is not None) == announces_file for m in exported)
+        assert all(m["download_available"] == announces_file for m in exported)
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_skipped(self, tmp_path, monkeypatch):
+        class NoRetryProcessor(parallel.ParallelProcessor):
+            def __init__(self, **kwargs):
+                kwargs['max_retries'] = 0
+                super().__init__(**kwargs)
+
+        monkeypatch.setattr(parallel, "ParallelProcessor", NoRetryProcessor)
+        processor = StreamingBatchProcessor(batch_size=5, max_concurrency=4)
+
+        results, stats = await _run(processor, _Translator(fail={3, 5, 6, 7, 8, 9}), _chunks(12), tmp_path / "out.txt")
+
+        assert [r.chunk_id for r in results] == [0, 1, 2, 4, 10, 11]
+        # The second batch (5-9) failed entirely: processed, nothing exported
+        assert stats['batches_processed'] == 3
+        assert len(stats['partial_exports']) == 2
+
+    @pytest.mark.asyncio
+    async def test_results_spilled_to_disk(self, tmp_path):
+        processor = StreamingBatchProcessor(batch_size=10)
+
+        results, stats = await _run(processor, _Translator(), _chunks(20), tmp_path / "out.txt")
+
+        assert isinstance(results, ResultSpill)
+        assert stats['spilled_bytes'] == results.size_bytes > 0
+        spill_path = results.path
+        assert spill_path.exists()
+
+        results.close()
+        assert not spill_path.exists()
+
+
+class TestResultSpill:
+
+    def test_round_trip(self, tmp_path):
+        spill = ResultSpill(directory=tmp_path)
+        spill.append(TranslationResult(chunk_id=1, source="a", translated="á", warnings=["w"], domain_scores={"x": 0.5}))
+        spill.append(TranslationResult(chunk_id=2, source="b", translated="b"))
+
+        assert len(spill) == 2
+        restored = list(spill)
+        assert restored[0] == TranslationResult(chunk_id=1, source="a", translated="á", warnings=["w"], domain_scores={"x": 0.5})
+        assert restored[1].chunk_id == 2
+        spill.close()
+
+    def test_removed_when_collected(self, tmp_path):
+        spill = ResultSpill(directory=tmp_path)
+        path = spill.path
+        del spill
+
+        assert not path.exists()
@@ -0,0 +1,251 @@
+"""
+Unit tests for core/async_store.py - off-loop TranslationMemory / ChunkCache access
+"""
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.async_store import AsyncChunkCache, AsyncTranslationMemory, BackgroundWriter, StoreWriteError
+from core.cache.chunk_cache import ChunkCache
+from core.translation_memory import TranslationMemory, TMSegment
+
+
+@pytest.fixture
+def tm(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.db")
+    yield memory
+    memory.close()
+
+
+async def _max_loop_gap(coro, ticks: int = 8, interval: float = 0.02):
+    """Run coro next to a ticker; return (coro result, largest tick gap)."""
+    stamps = []
+
+    async def ticker():
+        for _ in range(ticks):
+            stamps.append(time.monotonic())
+            await asyncio.sleep(interval)
+
+    result, _ = await asyncio.gather(coro, ticker())
+    return result, max(b - a for a, b in zip(stamps, stamps[1:]))
+
+
+class TestAsyncTranslationMemory:
+    """Reads on reader threads, writes through the single writer."""
+
+    @pytest.mark.asyncio
+    async def test_reads_match_sync_api(self, tm):
+        tm.add_segment(TMSegment(source="The cat sat on the mat.", target="Con mèo ngồi trên thảm."))
+        atm = AsyncTranslationMemory(tm)
+        try:
+            exact = await atm.get_exact_match("The cat sat on the mat.")
+            fuzzy = await atm.get_fuzzy_matches("The cat sat on the mat!", threshold=0.7)
+            many = await atm.lookup_many(["The cat sat on the mat.", "Nothing here."])
+        finally:
+            atm.close()
+
+        assert exact.segment.target == "Con mèo ngồi trên thảm."
+        assert fuzzy[0].segment.target == "Con mèo ngồi trên thảm."
+        assert many[0].match_type == "exact" and many[1] is None
+
+    @pytest.mark.asyncio
+    async def test_slow_lookup_does_not_block_loop(self, tm):
+        atm = AsyncTranslationMemory(tm)
+
+        def slow_lookup(reader_tm):
+            time.sleep(0.2)
+            return reader_tm.get_exact_match("missing")
+
+        try:
+            result, gap = await _max_loop_gap(atm.run(slow_lookup))
+        finally:
+            atm.close()
+
+        assert result is None
+        assert gap < 0.15, f"event loop was blocked for {gap:.3f}s"
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched_and_flushed(self, tm):
+        atm = AsyncTranslationMemory(tm)
+        with patch.object(TranslationMemory, "add_segments", autospec=True,
+                          side_effect=TranslationMemory.add_segments) as add_segments:
+            for i in range(50):
+                await atm.add_segment(TMSegment(source=f"Sentence {i}.", target=f"Câu {i}."))
+            await atm.flush()
+            atm.close()
+
+        assert tm.get_statistics()["total_segments"] == 50
+        assert add_segments.call_count < 50
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_segments(self, tm):
+        atm = AsyncTranslationMemory(tm)
+        await atm.add_segment(TMSegment(source="Pending", target="Đang chờ"))
+
+        atm.close()
+
+        assert tm.get_exact_match("Pending").segment.target == "Đang chờ"
+
+    @pytest.mark.asyncio
+    async def test_wraps_non_sqlite_tm_as_is(self):
+        class DictTM:
+            def __init__(self):
+                self.segments = {}
+
+            def add_segment(self, segment):
+                self.segments[segment.source] = segment.target
+
+            def get_exact_match(self, source, *args):
+                return self.segments.get(source)
+
+        dict_tm = DictTM()
+        atm = AsyncTranslationMemory(dict_tm)
+        await atm.add_segment(TMSegment(source="a", target="b"))
+        await atm.flush()
+
+        assert await atm.get_exact_match("a") == "b"
+        atm.close()
+
+
+class TestAsyncChunkCache:
+    """ChunkCache facade."""
+
+    @pytest.mark.asyncio
+    async def test_set_flush_get(self, tmp_path):
+        cache = ChunkCache(tmp_path / "chunks.db")
+        acache = AsyncChunkCache(cache)
+        try:
+            for i in range(20):
+                await acache.set(f"k{i}", f"v{i}", "en", "vi", mode="essay")
+            await acache.flush()
+            values = await asyncio.gather(*[acache.get(f"k{i}") for i in range(20)])
+        finally:
+            acache.close()
+
+        assert values == [f"v{i}" for i in range(20)]
+        assert cache.stats()["total_entries"] == 20
+
+
+class TestBackgroundWriter:
+    """Writer thread semantics."""
+
+    def test_failed_batch_does_not_stop_writer(self):
+        applied = []
+
+        def apply(batch):
+            if "bad" in batch:
+                raise ValueError("boom")
+            applied.extend(batch)
+
+        writer = BackgroundWriter(apply, retry_delay=0)
+        writer.submit("bad")
+        with pytest.raises(StoreWriteError):
+            writer.barrier().result(timeout=5)
+        writer.submit("good")
+        writer.close()
+
+        assert applied == ["good"]
+
+    def test_transient_failure_loses_nothing(self):
+        applied = []
+        calls = []
+
+        def apply(batch):
+            calls.append(list(batch))
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            applied.extend(batch)
+
+        writer = BackgroundWriter(apply, max_batch=10, max_delay=10.0, retry_delay=0)
+        for i in range(5):
+            writer.submit(i)
+
+        assert writer.flush(timeout=5) is True
+        assert applied == [0, 1, 2, 3, 4]
+        writer.close()
+
+    def test_bad_item_does_not_sink_its_batch(self):
+        applied = []
+
+        def apply(batch):
+            if "bad" in batch:
+                raise ValueError("boom")
+            applied.extend(batch)
+
+        writer = BackgroundWriter(apply, max_batch=10, max_delay=10.0, retries=2, retry_delay=0)
+        for item in ("a", "bad", "b"):
+            writer.submit(item)
+
+        with pytest.raises(StoreWriteError) as excinfo:
+            writer.flush(timeout=5)
+        assert excinfo.value.failed == 1
+        assert applied == ["a", "b"]
+        # Reported once; later flushes start clean
+        assert writer.flush(timeout=5) is True
+
+        writer.submit("bad")
+        with pytest.raises(StoreWriteError):
+            writer.close()
+
+    def test_groups_writes_within_delay(self):
+        batches = []
+        writer = BackgroundWriter(batches.append, max_batch=100, max_delay=0.3)
+
+        for i in range(5):
+            writer.submit(i)
+            time.sleep(0.01)
+        time.sleep(0.5)
+        writer.close()
+
+        assert batches == [[0, 1, 2, 3, 4]]
+
+    def test_batch_size_cuts_batches(self):
+        batches = []
+        writer = BackgroundWriter(batches.append, max_batch=3, max_delay=10.0)
+
+        for i in range(6):
+            writer.submit(i)
+        writer.close()
+
+        assert [len(b) for b in batches] == [3, 3]
+
+    def test_flush_does_not_wait_for_delay(self):
+        batches = []
+        writer = BackgroundWriter(batches.append, max_batch=100, max_delay=10.0)
+        writer.submit("a")
+
+        started = time.monotonic()
+        assert writer.flush(timeout=5) is True
+
+        assert time.monotonic() - started < 1.0
+        assert batches == [["a"]]
+        writer.close()
+
+    def test_submit_after_close_raises(self):
+        writer = BackgroundWriter(lambda batch: None)
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.submit("late")
+
+
+class TestBatchProcessorStop:
+    """BatchProcessor.stop() commits queued writes of running jobs."""
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_active_translators(self, tm):
+        from core.batch_processor import BatchProcessor
+        from core.translator import TranslatorEngine
+
+        engine = TranslatorEngine(provider="openai", model="gpt-4", api_key="test-key", tm=tm)
+        engine._tm_async = AsyncTranslationMemory(tm, max_delay=30.0)
+        await engine._tm_async.add_segment(TMSegment(source="Queued", target="Đã xếp hàng"))
+        processor = BatchProcessor(queue=MagicMock())
+        processor._active_translators.add(engine)
+
+        processor.stop()
+
+        assert tm.get_exact_match("Queued").segment.target == "Đã xếp hàng"
+        await engine.flush_stores()
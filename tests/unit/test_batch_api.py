@@ -0,0 +1,389 @@
+"""
+Unit tests for provider batch execution (ai_providers/batch.py) against a
+local stub server that mimics the OpenAI and Anthropic batch endpoints,
+plus the batch modes of TranslatorEngine and UniversalPublisher.
+"""
+import asyncio
+import json
+import threading
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+import core_v2.orchestrator as orch
+from ai_providers.batch import (
+    AnthropicBatchClient,
+    BatchError,
+    BatchRequest,
+    BatchResult,
+    OpenAIBatchClient,
+    get_batch_client,
+)
+from ai_providers.unified_client import UnifiedLLMClient
+from core.chunker import TranslationChunk
+from core.translator import TranslatorEngine
+
+_VI = "Đây là bản dịch tiếng Việt của đoạn số {}."
+
+
+def _answer(text):
+    """Stub translation: requests containing FAIL error out."""
+    return None if "FAIL" in text else _VI.format(text.split()[-1])
+
+
+class _StubState:
+    def __init__(self, polls_until_done=2, openai_status="completed"):
+        self.polls_until_done = polls_until_done
+        self.openai_status = openai_status
+        self.files = {}
+        self.batches = {}
+        self.polls = 0
+        self.cancelled = []
+        self.headers = []
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    state: _StubState = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload, status=200, content_type="application/json"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):
+        state = self.state
+        state.headers.append(dict(self.headers))
+        if self.path == "/v1/files":
+            raw = self._body()
+            message = BytesParser().parsebytes(
+                f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + raw)
+            jsonl = next(part.get_payload(decode=True) for part in message.get_payload()
+                         if part.get_param("name", header="content-disposition") == "file")
+            file_id = f"file-{len(state.files)}"
+            state.files[file_id] = jsonl.decode()
+            return self._send({"id": file_id})
+        if self.path == "/v1/batches":
+            batch_id = f"batch_{len(state.batches)}"
+            state.batches[batch_id] = {"kind": "openai", "input": json.loads(self._body())["input_file_id"]}
+            return self._send({"id": batch_id, "status": "validating"})
+        if self.path == "/v1/messages/batches":
+            batch_id = f"msgbatch_{len(state.batches)}"
+            state.batches[batch_id] = {"kind": "anthropic", "requests": json.loads(self._body())["requests"]}
+            return self._send({"id": batch_id, "processing_status": "in_progress"})
+        if self.path.endswith("/cancel"):
+            state.cancelled.append(self.path.split("/")[-2])
+            return self._send({})
+        self._send({"error": {"message": "not found"}}, status=404)
+
+    def do_GET(self):
+        state = self.state
+        parts = self.path.strip("/").split("/")
+        if parts[:2] == ["v1", "batches"]:
+            state.polls += 1
+            done = state.polls >= state.polls_until_done
+            status = state.openai_status if done else "in_progress"
+            batch = {"id": parts[2], "status": status}
+            if status == "completed":
+                batch["output_file_id"] = f"out-{parts[2]}"
+            return self._send(batch)
+        if parts[:2] == ["v1", "files"] and parts[2].startswith("out-"):
+            batch = state.batches[parts[2][len("out-"):]]
+            lines = []
+            for line in state.files[batch["input"]].splitlines():
+                request = json.loads(line)
+                text = _answer(request["body"]["messages"][-1]["content"])
+                if text is None:
+                    response = {"status_code": 400, "body": {"error": {"message": "bad request"}}}
+                else:
+                    response = {"status_code": 200, "body": {
+                        "choices": [{"message": {"content": text}, "finish_reason": "stop"}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+                    }}
+                lines.append(json.dumps({"custom_id": request["custom_id"], "response": response}))
+            return self._send("\n".join(lines).encode(), content_type="application/jsonl")
+        if parts[:3] == ["v1", "messages", "batches"]:
+            batch_id = parts[3]
+            if len(parts) == 5 and parts[4] == "results":
+                lines = []
+                for request in state.batches[batch_id]["requests"]:
+                    text = _answer(request["params"]["messages"][-1]["content"])
+                    if text is None:
+                        result = {"type": "errored", "error": {"type": "error", "error": {"message": "invalid"}}}
+                    else:
+                        result = {"type": "succeeded", "message": {
+                            "content": [{"type": "text", "text": text}],
+                            "stop_reason": "end_turn",
+                            "usage": {"input_tokens": 10, "output_tokens": 5},
+                        }}
+                    lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}))
+                return self._send("\n".join(lines).encode(), content_type="application/jsonl")
+            state.polls += 1
+            done = state.polls >= state.polls_until_done
+            return self._send({
+                "id": batch_id,
+                "processing_status": "ended" if done else "in_progress",
+                "results_url": f"http://{self.headers['Host']}/v1/messages/batches/{batch_id}/results",
+            })
+        self._send({"error": {"message": "not found"}}, status=404)
+
+
+@pytest.fixture
+def stub():
+    state = _StubState()
+    handler = type("Handler", (_StubHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+_FAST = {"poll_interval": 0.01, "max_poll_interval": 0.02}
+
+
+def _requests(*texts):
+    return [
+        BatchRequest(f"chunk-{i}", [{"role": "system", "content": "Translate"},
+                                    {"role": "user", "content": text}])
+        for i, text in enumerate(texts)
+    ]
+
+
+class TestBatchClients:
+    def test_openai_roundtrip(self, stub):
+        client = OpenAIBatchClient("sk-test", "gpt-4o-mini", base_url=stub.url + "/v1", **_FAST)
+
+        results = asyncio.run(client.run(_requests("hello 0", "FAIL 1")))
+
+        assert results["chunk-0"].content == _VI.format("0")
+        assert results["chunk-0"].input_tokens == 10
+        assert not results["chunk-1"].ok
+        assert stub.polls == 2
+        assert stub.headers[0]["Authorization"] == "Bearer sk-test"
+
+    def test_anthropic_roundtrip(self, stub):
+        client = AnthropicBatchClient("sk-ant-test", "claude-test", base_url=stub.url, **_FAST)
+
+        results = asyncio.run(client.run(_requests("hello 0", "FAIL 1")))
+
+        assert results["chunk-0"].content == _VI.format("0")
+        assert results["chunk-1"].error == "invalid"
+        request = stub.batches["msgbatch_0"]["requests"][0]
+        assert request["params"]["system"] == "Translate"
+        assert [m["role"] for m in request["params"]["messages"]] == ["user"]
+        assert stub.headers[0]["x-api-key"] == "sk-ant-test"
+
+    def test_resumed_batch_is_polled_not_resubmitted(self, stub):
+        client = OpenAIBatchClient("sk-test", "gpt-4o-mini", base_url=stub.url + "/v1", **_FAST)
+        submitted = []
+        first = asyncio.run(client.run(_requests("hello 0"), on_submitted=submitted.append))
+
+        again = asyncio.run(client.run(_requests("hello 0"), batch_id=submitted[0],
+                                       on_submitted=submitted.append))
+
+        assert submitted == ["batch_0"]
+        assert list(stub.batches) == ["batch_0"]
+        assert again == first
+
+    def test_failed_batch_raises(self, stub):
+        stub.openai_status = "failed"
+        client = OpenAIBatchClient("sk-test", "gpt-4o-mini", base_url=stub.url + "/v1", **_FAST)
+
+        with pytest.raises(BatchError):
+            asyncio.run(client.run(_requests("hello 0")))
+
+    def test_timeout_cancels_the_batch(self, stub):
+        stub.polls_until_done = 10 ** 6
+        client = OpenAIBatchClient("sk-test", "gpt-4o-mini", base_url=stub.url + "/v1",
+                                   max_wait=0.05, **_FAST)
+
+        with pytest.raises(BatchError):
+            asyncio.run(client.run(_requests("hello 0")))
+        assert stub.cancelled == ["batch_0"]
+
+    def test_unified_client_counts_batched_usage(self, stub, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        client = UnifiedLLMClient()
+        client._current_provider = "openai"
+        client._validated = True
+        requests = {r.custom_id: r.messages for r in _requests("hello 0", "FAIL 1")}
+
+        results = asyncio.run(client.chat_batch(requests, base_url=stub.url + "/v1", **_FAST))
+
+        stats = client.get_usage_stats()
+        assert results["chunk-0"].ok and not results["chunk-1"].ok
+        assert (stats.batched_calls, stats.total_calls, stats.total_tokens) == (1, 1, 15)
+
+    def test_providers_without_batch_api(self):
+        with pytest.raises(ValueError):
+            get_batch_client("deepseek", "key", "deepseek-chat")
+
+
+class _AcceptAll:
+    def validate(self, source, translated, glossary, **kwargs):
+        return SimpleNamespace(quality_score=1.0, warnings=[])
+
+
+class TestEngineBatchMode:
+    def test_batch_answers_and_interactive_fallback(self, stub):
+        engine = TranslatorEngine("openai", "gpt-4o-mini", "sk-test", validator=_AcceptAll(),
+                                  retry_delay=0)
+        interactive = []
+
+        async def call_openai(client, prompt, text):
+            interactive.append(text)
+            return "Bản dịch tương tác."
+
+        engine._call_openai = call_openai
+        chunks = [TranslationChunk(id=1, text="hello 1"), TranslationChunk(id=2, text="FAIL 2")]
+
+        results, stats = asyncio.run(engine.translate_batch(
+            chunks, show_progress=False, base_url=stub.url + "/v1", **_FAST))
+
+        assert [r.translated for r in results] == [_VI.format("1"), "Bản dịch tương tác."]
+        assert interactive == ["FAIL 2"]
+        assert stats.batched == 1
+        # Same model parameters as the interactive call
+        submitted = json.loads(stub.files["file-0"].splitlines()[0])["body"]
+        prompt = submitted["messages"][0]["content"]
+        assert submitted == engine._request_payload(prompt, "hello 1")
+        assert submitted["top_p"] == 0.9 and "presence_penalty" in submitted
+
+    def test_batch_failure_falls_back_to_interactive(self, stub):
+        stub.openai_status = "failed"
+        engine = TranslatorEngine("openai", "gpt-4o-mini", "sk-test", validator=_AcceptAll(),
+                                  retry_delay=0)
+        interactive = []
+
+        async def call_openai(client, prompt, text):
+            interactive.append(text)
+            return "Bản dịch tương tác."
+
+        engine._call_openai = call_openai
+        chunks = [TranslationChunk(id=1, text="hello 1")]
+
+        results, stats = asyncio.run(engine.translate_batch(
+            chunks, show_progress=False, base_url=stub.url + "/v1", **_FAST))
+
+        assert results[0].translated == "Bản dịch tương tác."
+        assert interactive == ["hello 1"]
+        assert stats.batched == 0
+
+
+class _Chunk:
+    def __init__(self, content, index):
+        self.content = content
+        self.index = index
+        self.total_chunks = 3
+        self.previous_summary = ""
+        self.next_preview = ""
+
+
+class _DNA:
+    has_formulas = False
+
+    def to_context_prompt(self):
+        return "DNA-CONTEXT"
+
+
+class _BatchingClient:
+    """chat_batch answers with the stub's rules; chat records interactive calls."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+        self.calls = []
+
+    async def chat_batch(self, requests, temperature=None, batch_id=None, on_submitted=None):
+        self.batches.append(requests)
+        self.resumed = batch_id
+        if self.fail:
+            raise BatchError("batch failed")
+        if batch_id is None and on_submitted is not None:
+            on_submitted("batch-1")
+        results = {}
+        for custom_id, messages in requests.items():
+            text = _answer(messages[-1]["content"].split("\n")[-1])
+            results[custom_id] = BatchResult(custom_id, content=text, error=None if text else "invalid")
+        return results
+
+    async def chat(self, messages, temperature=None, cache_system=False, **kw):
+        self.calls.append(messages)
+        return SimpleNamespace(content="Bản dịch tương tác của đoạn văn.", truncated=False, usage=None)
+
+
+def _make_publisher(client):
+    p = object.__new__(orch.UniversalPublisher)
+    p.llm_client = client
+    p.chunk_cache = None
+    p.translation_temperature = 0.3
+    p.prompt_cache_enabled = True
+    p.prompt_version = "v2"
+    p.max_retries = 2
+    p.backoff_base = 0.0
+    p.backoff_cap = 0.0
+    p._provider_sig = "openai"
+    p._model_sig = "gpt-4o-mini"
+    p._active_ledger = None
+    p.glossary_max_terms = 80
+    p._semaphore = asyncio.Semaphore(4)
+    return p
+
+
+class TestPublisherBatchMode:
+    def test_unanswered_chunks_go_interactive(self, monkeypatch):
+        monkeypatch.setattr(orch, "TRANSLATION_USER", "{source_text}")
+        client = _BatchingClient()
+        pub = _make_publisher(client)
+        chunks = [_Chunk("one 0", 0), _Chunk("FAIL 1", 1), _Chunk("one 0", 2)]
+        stats = {}
+
+        translated = asyncio.run(pub._translate_chunks(
+            chunks, _DNA(), "essay", "en", "vi", execution_mode="batch", batch_stats=stats))
+
+        assert translated == [_VI.format("0"), "Bản dịch tương tác của đoạn văn.", _VI.format("0")]
+        assert len(client.batches[0]) == 3  # no cache: identical chunks are not merged
+        assert len(client.calls) == 1
+        assert stats == {"submitted": 3, "translated": 2, "fallback": 1}
+
+    def test_batch_id_is_reported_and_resumed(self, monkeypatch):
+        monkeypatch.setattr(orch, "TRANSLATION_USER", "{source_text}")
+        client = _BatchingClient()
+        pub = _make_publisher(client)
+        chunks = [_Chunk("one 0", 0)]
+        submitted = []
+
+        asyncio.run(pub._translate_chunks(
+            chunks, _DNA(), "essay", "en", "vi", execution_mode="batch",
+            on_batch_submitted=submitted.append))
+        asyncio.run(pub._translate_chunks(
+            chunks, _DNA(), "essay", "en", "vi", execution_mode="batch",
+            batch_id=submitted[0], on_batch_submitted=submitted.append))
+
+        assert submitted == ["batch-1"]
+        assert client.resumed == "batch-1"
+
+    def test_batch_failure_translates_everything_interactively(self, monkeypatch):
+        monkeypatch.setattr(orch, "TRANSLATION_USER", "{source_text}")
+        client = _BatchingClient(fail=True)
+        pub = _make_publisher(client)
+        chunks = [_Chunk("one 0", 0), _Chunk("two 1", 1)]
+
+        translated = asyncio.run(pub._translate_chunks(
+            chunks, _DNA(), "essay", "en", "vi", execution_mode="batch"))
+
+        assert translated == ["Bản dịch tương tác của đoạn văn."] * 2
+        assert len(client.calls) == 2
@@ -169,3 +169,99 @@ class TestSQLiteBackendPersistent:
         with persistent_db.connection() as conn:
             row = conn.execute("SELECT COUNT(*) FROM t").fetchone()
             assert row[0] == 40
+
+
+class TestSQLiteBackendPooled:
+    """Tests for pooled mode (writer connection + reader pool)."""
+
+    @pytest.fixture
+    def pooled_db(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "pooled.db", pool_size=2)
+        with backend.connection() as conn:
+            conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT)")
+            conn.execute("INSERT INTO t (val) VALUES ('a')")
+        yield backend
+        backend.close()
+
+    def test_connections_are_reused(self, pooled_db):
+        with pooled_db.connection(readonly=True) as conn:
+            first = conn._conn
+        with pooled_db.connection(readonly=True) as conn:
+            assert conn._conn is first
+        with pooled_db.connection() as conn:
+            writer = conn._conn
+        with pooled_db.connection() as conn:
+            assert conn._conn is writer
+
+    def test_readers_reject_writes(self, pooled_db):
+        import sqlite3
+
+        with pytest.raises(sqlite3.OperationalError):
+            with pooled_db.connection(readonly=True) as conn:
+                conn.execute("INSERT INTO t (val) VALUES ('b')")
+
+    def test_readers_run_concurrently(self, pooled_db):
+        import threading
+
+        both_inside = threading.Barrier(2, timeout=5)
+        errors = []
+
+        def read():
+            try:
+                with pooled_db.connection(readonly=True) as conn:
+                    conn.execute("SELECT COUNT(*) FROM t").fetchone()
+                    both_inside.wait()  # fails unless two readers are out at once
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+
+    def test_reader_sees_committed_writes(self, pooled_db):
+        with pooled_db.connection(readonly=True) as conn:
+            conn.execute("SELECT * FROM t").fetchall()
+        with pooled_db.connection() as conn:
+            conn.execute("INSERT INTO t (val) VALUES ('b')")
+
+        with pooled_db.connection(readonly=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+
+    def test_pool_size_bounds_connections(self, pooled_db):
+        import threading
+
+        seen = set()
+        lock = threading.Lock()
+
+        def read():
+            for _ in range(20):
+                with pooled_db.connection(readonly=True) as conn:
+                    with lock:
+                        seen.add(id(conn._conn))
+                    conn.execute("SELECT * FROM t").fetchall()
+
+        threads = [threading.Thread(target=read) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(seen) <= 2
+
+    def test_pragmas_applied(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "tuned.db", pool_size=1,
+                                cache_size_kib=4096, mmap_size=1 << 20)
+        with backend.connection(readonly=True) as conn:
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4096
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 20
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        backend.close()
+
+    def test_close_then_reuse(self, pooled_db):
+        pooled_db.close()
+        with pooled_db.connection(readonly=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
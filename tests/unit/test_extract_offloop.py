@@ -51,3 +51,34 @@ async def test_extract_pdf_text_legacy_delegates_to_sync(monkeypatch, tmp_path):
     result = await publisher._extract_pdf_text_legacy(pdf_path)
     assert result == "FAKE TEXT"
     assert called["path"] == pdf_path
+
+
+@pytest.mark.asyncio
+async def test_extract_pdf_text_streams_pages(tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    _make_pdf(pdf_path)
+    publisher = object.__new__(UniversalPublisher)
+    progress = []
+
+    text = await publisher._extract_pdf_text(pdf_path, lambda p, s: progress.append(p))
+
+    assert "Aurora" in text
+    assert progress == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_extract_pdf_text_without_pymupdf_uses_legacy(monkeypatch, tmp_path):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_fast_text(name, *args, **kwargs):
+        if name == "core.smart_extraction.fast_text_extractor":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_fast_text)
+    monkeypatch.setattr("core_v2.orchestrator._extract_pdf_text_sync", lambda p: "LEGACY TEXT")
+    publisher = object.__new__(UniversalPublisher)
+
+    assert await publisher._extract_pdf_text(tmp_path / "x.pdf") == "LEGACY TEXT"
@@ -0,0 +1,170 @@
+"""
+Unit tests for off-loop / sharded native-text extraction
+(core/smart_extraction/fast_text_extractor.py, parallel_text.py)
+"""
+import asyncio
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz
+import pytest
+
+from core.cache.page_cache import PageCache
+from core.smart_extraction import fast_text_extractor, parallel_text
+from core.smart_extraction.fast_text_extractor import FastTextExtractor
+
+
+@pytest.fixture(scope="module")
+def pdf_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("pdf") / "book.pdf"
+    doc = fitz.open()
+    for i in range(40):
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((30, 40), f"Chapter {i + 1}")
+        page.insert_textbox(fitz.Rect(30, 60, 270, 380), f"Text of page {i}. " * 30, fontsize=9)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    monkeypatch.setattr(fast_text_extractor, "MIN_PARALLEL_PAGES", 8)
+    monkeypatch.setattr(fast_text_extractor, "shard_pages", lambda pages: parallel_text.shard_pages(pages, 5))
+
+
+async def _collect(pdf_path, **kwargs):
+    return [page async for page in FastTextExtractor().iter_pages(pdf_path, **kwargs)]
+
+
+class TestIterPages:
+
+    @pytest.mark.asyncio
+    async def test_pages_in_order(self, pdf_path, small_shards):
+        pages = await _collect(pdf_path, workers=1)
+
+        assert [p.page_number for p in pages] == list(range(40))
+        assert pages[3].content.startswith("Chapter 4")
+        assert pages[3].has_headers
+
+    @pytest.mark.asyncio
+    async def test_page_range(self, pdf_path):
+        pages = await _collect(pdf_path, page_range=(10, 13), workers=1)
+
+        assert [p.page_number for p in pages] == [10, 11, 12]
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, pdf_path, small_shards):
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        await _collect(pdf_path, workers=1)
+        done = True
+        await task
+
+        # The loop kept running while shards were extracted on a thread
+        assert ticks > 8
+
+    @pytest.mark.asyncio
+    async def test_worker_processes_match_in_process(self, pdf_path, small_shards):
+        try:
+            parallel = await _collect(pdf_path, workers=2)
+        finally:
+            parallel_text.shutdown_text_pool()
+        sequential = await _collect(pdf_path, workers=1)
+
+        assert parallel == sequential
+
+    def test_pool_not_resized_by_other_callers(self):
+        try:
+            pool = parallel_text.get_text_pool(2)
+            future = pool.submit(sum, [1, 2])
+
+            # A second document asking for another size shares the running pool
+            assert parallel_text.get_text_pool(3) is pool
+            assert future.result(timeout=60) == 3
+        finally:
+            parallel_text.shutdown_text_pool()
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_in_process(self, pdf_path, small_shards, monkeypatch):
+        class BrokenExecutor(Executor):
+            def submit(self, fn, *args, **kwargs):
+                future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+        monkeypatch.setattr(fast_text_extractor, "get_text_pool", lambda workers: BrokenExecutor())
+
+        pages = await _collect(pdf_path, workers=2)
+
+        assert [p.page_number for p in pages] == list(range(40))
+
+    @pytest.mark.asyncio
+    async def test_consumer_can_stop_early(self, pdf_path, small_shards):
+        pages = FastTextExtractor().iter_pages(pdf_path, workers=1)
+        first = await pages.__anext__()
+        await pages.aclose()
+
+        assert first.page_number == 0
+
+
+class TestPageCache:
+
+    @pytest.mark.asyncio
+    async def test_second_pass_served_from_cache(self, pdf_path, small_shards, tmp_path):
+        cache = PageCache(tmp_path / "pages.db")
+        extractor = FastTextExtractor(page_cache=cache)
+
+        first = [page async for page in extractor.iter_pages(pdf_path, workers=1)]
+        second = [page async for page in extractor.iter_pages(pdf_path, workers=1)]
+
+        assert not any(p.cached for p in first)
+        assert all(p.cached for p in second)
+        assert [p.content for p in second] == [p.content for p in first]
+        assert [p.page_number for p in second] == list(range(40))
+
+    @pytest.mark.asyncio
+    async def test_keys_computed_per_shard(self, pdf_path, small_shards, tmp_path, monkeypatch):
+        shards = []
+        page_keys = FastTextExtractor._page_keys
+
+        def recording(self, path, page_numbers):
+            shards.append(list(page_numbers))
+            return page_keys(self, path, page_numbers)
+
+        monkeypatch.setattr(FastTextExtractor, "_page_keys", recording)
+        extractor = FastTextExtractor(page_cache=PageCache(tmp_path / "pages.db"))
+
+        pages = extractor.iter_pages(pdf_path, workers=1)
+        await pages.__anext__()
+        await pages.aclose()
+
+        # The first page arrives before the later shards are fingerprinted
+        assert shards[0] == [0, 1, 2, 3, 4]
+        assert len(shards) < 8
+
+
+class TestExtract:
+
+    @pytest.mark.asyncio
+    async def test_extract_collects_pages(self, pdf_path):
+        progress = []
+
+        doc = await FastTextExtractor().extract(str(pdf_path), progress_callback=lambda p, s: progress.append(p))
+
+        assert doc.total_pages == 40
+        assert len(doc.pages) == 40
+        assert progress[-1] == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            await FastTextExtractor().extract(str(tmp_path / "missing.pdf"))
@@ -0,0 +1,145 @@
+"""
+Unit tests for core/job_queue.py - atomic lease-based job claiming
+"""
+import threading
+import time
+
+import pytest
+
+from core.job_queue import JobQueue, JobStatus, LeaseLostError
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "jobs.db"
+
+
+def _fill(queue, n):
+    return [queue.create_job(f"job {i}", f"in{i}.txt", f"out{i}.txt") for i in range(n)]
+
+
+class TestClaim:
+    """get_next_job hands every job to exactly one worker."""
+
+    def test_claim_records_worker_and_lease(self, db_path):
+        queue = JobQueue(db_path, worker_id="w1", lease_seconds=30)
+        _fill(queue, 1)
+
+        job = queue.get_next_job()
+
+        assert job.status == JobStatus.QUEUED
+        assert job.worker_id == "w1"
+        assert job.lease_expires_at == pytest.approx(time.time() + 30, abs=5)
+        assert job.lease_token
+        assert queue.get_next_job() is None
+
+    def test_priority_then_fifo(self, db_path):
+        queue = JobQueue(db_path)
+        low = queue.create_job("low", "a", "b", priority=1)
+        high = queue.create_job("high", "a", "b", priority=10)
+
+        assert queue.get_next_job().job_id == high.job_id
+        assert queue.get_next_job().job_id == low.job_id
+
+    def test_concurrent_workers_never_share_a_job(self, db_path):
+        _fill(JobQueue(db_path), 40)
+        claims = []
+        lock = threading.Lock()
+
+        def worker(n):
+            queue = JobQueue(db_path, worker_id=f"w{n}")
+            while (job := queue.get_next_job()) is not None:
+                with lock:
+                    claims.append((job.job_id, job.worker_id))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        job_ids = [job_id for job_id, _ in claims]
+        assert len(job_ids) == 40
+        assert len(set(job_ids)) == 40
+
+    def test_update_keeps_lease(self, db_path):
+        queue = JobQueue(db_path, worker_id="w1")
+        _fill(queue, 1)
+        job = queue.get_next_job()
+
+        job.mark_started()
+        queue.update_job(job)
+
+        stored = queue.get_job(job.job_id)
+        assert stored.status == JobStatus.RUNNING
+        assert stored.worker_id == "w1"
+        assert stored.lease_expires_at == job.lease_expires_at
+
+
+class TestLeases:
+    """Heartbeats and reclaiming jobs of dead workers."""
+
+    def test_heartbeat_extends_own_lease_only(self, db_path):
+        queue = JobQueue(db_path, worker_id="w1", lease_seconds=10)
+        _fill(queue, 1)
+        job = queue.get_next_job()
+
+        assert queue.heartbeat(job.job_id, job.lease_token, lease_seconds=100) is True
+        assert queue.get_job(job.job_id).lease_expires_at > job.lease_expires_at
+        assert queue.heartbeat(job.job_id, "someone-else") is False
+
+    def test_expired_lease_is_reclaimed(self, db_path):
+        dead = JobQueue(db_path, worker_id="dead", lease_seconds=0.01)
+        alive = JobQueue(db_path, worker_id="alive")
+        _fill(dead, 1)
+        job = dead.get_next_job()
+        time.sleep(0.05)
+
+        reclaimed = alive.get_next_job()
+
+        assert reclaimed.job_id == job.job_id
+        assert reclaimed.worker_id == "alive"
+        assert reclaimed.retry_count == 1
+        assert dead.heartbeat(job.job_id, job.lease_token) is False
+
+    def test_stale_claim_of_same_worker_is_fenced(self, db_path):
+        queue = JobQueue(db_path, worker_id="w1", lease_seconds=0.01)
+        _fill(queue, 1)
+        stale = queue.get_next_job()
+        time.sleep(0.05)
+
+        current = queue.get_next_job(lease_seconds=30)
+
+        assert current.job_id == stale.job_id
+        assert current.worker_id == stale.worker_id
+        assert current.lease_token != stale.lease_token
+        assert queue.heartbeat(stale.job_id, stale.lease_token) is False
+        stale.progress = 99.0
+        with pytest.raises(LeaseLostError):
+            queue.update_job(stale)
+        current.mark_started()
+        queue.update_job(current)
+        stored = queue.get_job(current.job_id)
+        assert stored.status == JobStatus.RUNNING
+        assert stored.progress == 0.0
+
+    def test_out_of_retries_fails_instead_of_requeue(self, db_path):
+        queue = JobQueue(db_path, worker_id="w1", lease_seconds=0.01)
+        queue.create_job("poison", "a", "b", max_retries=0)
+        job = queue.get_next_job()
+        time.sleep(0.05)
+
+        assert queue.reclaim_expired_jobs() == 1
+        assert queue.get_next_job() is None
+        stored = queue.get_job(job.job_id)
+        assert stored.status == JobStatus.FAILED
+        assert "w1" in stored.error_message
+
+    def test_jobs_without_lease_are_not_reclaimed(self, db_path):
+        queue = JobQueue(db_path)
+        job = _fill(queue, 1)[0]
+        job.status = JobStatus.RUNNING
+        queue.update_job(job)
+
+        assert queue.reclaim_expired_jobs() == 0
+        assert queue.get_job(job.job_id).status == JobStatus.RUNNING
@@ -0,0 +1,149 @@
+"""
+Unit tests for core/job_signal.py - waking idle job workers
+"""
+import asyncio
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from core.job_queue import JobQueue
+from core.job_signal import JobSignal
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestJobSignal:
+    """In-process and cross-process wakeups."""
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_notify(self, tmp_path):
+        wakeup = JobSignal(tmp_path / "jobs.db").subscribe()
+        try:
+            assert await wakeup.wait(timeout=0.05) is False
+        finally:
+            wakeup.close()
+
+    @pytest.mark.asyncio
+    async def test_notify_from_thread_wakes_subscriber(self, tmp_path):
+        signal = JobSignal(tmp_path / "jobs.db")
+        wakeup = signal.subscribe()
+        try:
+            await asyncio.to_thread(signal.notify)
+            assert await wakeup.wait(timeout=5) is True
+        finally:
+            wakeup.close()
+
+    @pytest.mark.asyncio
+    async def test_other_instance_on_same_db_wakes_subscriber(self, tmp_path):
+        wakeup = JobSignal(tmp_path / "jobs.db").subscribe()
+        try:
+            JobSignal(tmp_path / "jobs.db").notify()
+            assert await wakeup.wait(timeout=5) is True
+        finally:
+            wakeup.close()
+
+    @pytest.mark.asyncio
+    async def test_notify_from_other_process(self, tmp_path):
+        db_path = tmp_path / "jobs.db"
+        wakeup = JobSignal(db_path).subscribe()
+        if not wakeup.cross_process:
+            wakeup.close()
+            pytest.skip("AF_UNIX datagram sockets unavailable")
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-c",
+                f"from core.job_signal import JobSignal; JobSignal({str(db_path)!r}).notify()",
+                cwd=str(REPO_ROOT),
+            )
+            assert await proc.wait() == 0
+            assert await wakeup.wait(timeout=5) is True
+        finally:
+            wakeup.close()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX unavailable")
+    def test_stale_socket_is_removed(self, tmp_path):
+        signal = JobSignal(tmp_path / "jobs.db")
+        signal.socket_dir.mkdir()
+        stale = signal.socket_dir / "999999-dead.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(stale))
+        sock.close()  # bound path left behind, nobody listening
+
+        signal.notify()
+
+        assert not stale.exists()
+
+    @pytest.mark.asyncio
+    async def test_close_removes_socket(self, tmp_path):
+        signal = JobSignal(tmp_path / "jobs.db")
+        wakeup = signal.subscribe()
+        wakeup.close()
+
+        assert list(signal.socket_dir.glob("*.sock")) == []
+
+
+class TestBatchProcessorDispatch:
+    """BatchProcessor.start() reacts to new jobs without polling."""
+
+    @pytest.mark.asyncio
+    async def test_new_job_dispatched_immediately(self, tmp_path):
+        from core.batch_processor import BatchProcessor
+
+        queue = JobQueue(tmp_path / "jobs.db")
+        processor = BatchProcessor(queue=queue)
+        started = {}
+
+        async def fake_process(job):
+            started[job.job_id] = time.monotonic()
+
+        processor._process_job = fake_process
+        runner = asyncio.create_task(processor.start(continuous=True))
+        try:
+            await asyncio.sleep(0.2)  # processor is idle now
+            submitted = time.monotonic()
+            job = await asyncio.to_thread(queue.create_job, "j", "in.txt", "out.txt")
+            for _ in range(100):
+                if job.job_id in started:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            processor.stop()
+            await asyncio.wait_for(runner, 5)
+
+        assert started[job.job_id] - submitted < 0.5
+
+    @pytest.mark.asyncio
+    async def test_finished_job_frees_slot_immediately(self, tmp_path):
+        from core.batch_processor import BatchProcessor
+
+        queue = JobQueue(tmp_path / "jobs.db")
+        for i in range(2):
+            queue.create_job(f"j{i}", "in.txt", "out.txt")
+        processor = BatchProcessor(queue=queue, max_concurrent_jobs=1)
+        release = asyncio.Event()
+        started = []
+
+        async def fake_process(job):
+            started.append(time.monotonic())
+            if len(started) == 1:
+                await release.wait()
+
+        processor._process_job = fake_process
+        runner = asyncio.create_task(processor.start(continuous=True))
+        try:
+            await asyncio.sleep(0.2)
+            assert len(started) == 1  # at capacity
+            released = time.monotonic()
+            release.set()
+            for _ in range(100):
+                if len(started) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            processor.stop()
+            await asyncio.wait_for(runner, 5)
+
+        assert started[1] - released < 0.5
@@ -0,0 +1,101 @@
+"""
+Unit tests for core/ocr/model_registry.py - shared warm OCR models
+"""
+import threading
+import time
+
+import pytest
+
+from core.ocr.model_registry import OcrModelRegistry
+
+
+class FakeEngine:
+    def __init__(self, lang):
+        self.lang = lang
+        self.calls = 0
+
+    def predict(self, image):
+        self.calls += 1
+        return [{"rec_texts": [self.lang]}]
+
+
+@pytest.fixture
+def loads():
+    return []
+
+
+@pytest.fixture
+def registry(loads):
+    def loader(lang):
+        loads.append(lang)
+        return FakeEngine(lang)
+    return OcrModelRegistry(max_models=2, idle_timeout=0, loader=loader)
+
+
+class TestOcrModelRegistry:
+
+    def test_same_language_loads_once(self, registry, loads):
+        first = registry.get("japan")
+        second = registry.get("japan")
+
+        assert loads == ["japan"]
+        assert first.predict(None) == [{"rec_texts": ["japan"]}]
+        assert second.predict(None) == [{"rec_texts": ["japan"]}]
+        stats = registry.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["models"][0]["hits"] == 1
+
+    def test_lru_eviction(self, registry, loads):
+        registry.get("japan")
+        registry.get("ch")
+        registry.get("japan")   # ch is now least recently used
+        registry.get("korean")
+
+        assert [m["lang"] for m in registry.stats()["models"]] == ["japan", "korean"]
+        registry.get("ch")
+        assert loads == ["japan", "ch", "korean", "ch"]
+
+    def test_idle_models_are_dropped(self, loads):
+        registry = OcrModelRegistry(idle_timeout=0.05, loader=lambda lang: loads.append(lang) or FakeEngine(lang))
+        registry.get("japan")
+        time.sleep(0.1)
+
+        registry.evict_idle()
+
+        assert registry.stats()["models"] == []
+        assert registry.stats()["evictions"] == 1
+
+    def test_idle_models_are_dropped_without_further_access(self, loads):
+        registry = OcrModelRegistry(idle_timeout=0.05, loader=lambda lang: loads.append(lang) or FakeEngine(lang))
+        registry.get("japan")
+
+        deadline = time.monotonic() + 2
+        while registry.stats()["models"] and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert registry.stats()["models"] == []
+        assert registry._idle_timer is None
+
+    def test_concurrent_first_requests_load_once(self, loads):
+        def slow_loader(lang):
+            loads.append(lang)
+            time.sleep(0.1)
+            return FakeEngine(lang)
+
+        registry = OcrModelRegistry(loader=slow_loader)
+        threads = [threading.Thread(target=registry.get, args=("japan",)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loads == ["japan"]
+
+    def test_prewarm_logs_failures(self, registry, loads):
+        def broken(lang):
+            raise ImportError("no paddle")
+        registry._loader = broken
+
+        registry.prewarm(["japan"])
+
+        assert registry.stats()["models"] == []
@@ -0,0 +1,140 @@
+"""
+Unit tests for core/ocr/parallel.py - page-parallel OCR on worker processes
+"""
+import hashlib
+from functools import partial
+
+import fitz
+import pytest
+
+from core.ocr.base import OcrClient, OcrError
+from core.ocr.parallel import (
+    ParallelOcrRunner, WORKER_MEMORY_MB, get_ocr_runner, resolve_worker_count, shutdown_ocr_runners,
+)
+from core.ocr.pipeline import OcrPipeline
+
+
+class FakeOcrClient(OcrClient):
+    """Deterministic client; module level so spawned workers can import it."""
+
+    def __init__(self, fail: bool = False, crash: bool = False):
+        self.fail = fail
+        self.crash = crash
+
+    def extract(self, image_bytes, mode="document", language=None):
+        return self.extract_structured(image_bytes, mode, language)["text"]
+
+    def extract_structured(self, image_bytes, mode="document", language=None):
+        if self.fail:
+            raise OcrError("engine down")
+        if self.crash:
+            raise RuntimeError("bad image")
+        return {
+            "text": hashlib.md5(image_bytes).hexdigest(),
+            "confidence": 0.9,
+            "blocks": [],
+            "metadata": {"mode": mode},
+        }
+
+    def get_supported_languages(self):
+        return ["en"]
+
+    def is_available(self):
+        return True
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    for i in range(10):
+        page = doc.new_page(width=200, height=200)
+        page.insert_text((20, 100), f"Page {i}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestResolveWorkerCount:
+
+    def test_explicit(self):
+        assert resolve_worker_count(3) == 3
+
+    def test_zero_means_cpu_count(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 6)
+        assert resolve_worker_count(0) == 6
+
+    def test_memory_limit_caps_workers(self):
+        assert resolve_worker_count(8, memory_limit_mb=WORKER_MEMORY_MB * 2) == 2
+        assert resolve_worker_count(8, memory_limit_mb=1) == 1
+
+
+class TestOcrPipelineParallel:
+
+    def test_parallel_matches_sequential(self, pdf_path):
+        sequential = OcrPipeline(FakeOcrClient(), dpi=50, workers=1).process_pdf(pdf_path)
+        pipeline = OcrPipeline(FakeOcrClient(), dpi=50, workers=2, memory_limit_mb=0,
+                               client_factory=FakeOcrClient)
+        progress = []
+
+        parallel = pipeline.process_pdf(pdf_path, progress_callback=lambda d, t: progress.append((d, t)))
+
+        assert [p.page_num for p in parallel] == list(range(10))
+        assert parallel == sequential
+        assert progress[-1] == (10, 10)
+        assert pipeline._runner is None  # workers stopped after the call
+
+    def test_page_range(self, pdf_path):
+        with ParallelOcrRunner(FakeOcrClient, workers=2, shard_pages=3) as runner:
+            pages = list(runner.iter_pdf(pdf_path, page_range=(2, 9), dpi=50))
+
+        assert [p.page_num for p in pages] == list(range(2, 9))
+
+    def test_ocr_errors_become_empty_pages(self, pdf_path):
+        with ParallelOcrRunner(partial(FakeOcrClient, fail=True), workers=2) as runner:
+            pages = list(runner.iter_pdf(pdf_path, page_range=(0, 3), dpi=50))
+
+        assert [p.text for p in pages] == ["", "", ""]
+        assert all(p.metadata["error"] == "engine down" for p in pages)
+
+    def test_client_without_factory_stays_in_process(self, pdf_path):
+        pipeline = OcrPipeline(FakeOcrClient(), dpi=50, workers=4, memory_limit_mb=0)
+
+        assert pipeline.workers == 1
+        assert len(pipeline.process_pdf(pdf_path)) == 10
+
+    def test_other_engine_errors_become_empty_pages(self, pdf_path):
+        pages = OcrPipeline(FakeOcrClient(crash=True), dpi=50, workers=1).process_pdf(pdf_path)
+
+        assert len(pages) == 10
+        assert all(p.text == "" and p.metadata["error"] == "bad image" for p in pages)
+
+
+class TestSharedRunner:
+    """Pipelines without an explicit worker count share warm workers."""
+
+    @pytest.fixture(autouse=True)
+    def shared_settings(self, monkeypatch):
+        from config.settings import settings
+        monkeypatch.setattr(settings, "ocr_workers", 2)
+        monkeypatch.setattr(settings, "ocr_memory_limit_mb", 0)
+        shutdown_ocr_runners()
+        yield
+        shutdown_ocr_runners()
+
+    def test_same_engine_reuses_one_runner(self):
+        runner = get_ocr_runner(partial(FakeOcrClient, fail=False))
+
+        assert get_ocr_runner(partial(FakeOcrClient, fail=False)) is runner
+        assert runner.workers == 2
+        assert get_ocr_runner(partial(FakeOcrClient, fail=True)) is not runner
+
+    def test_pipelines_keep_shared_workers_running(self, pdf_path):
+        first = OcrPipeline(FakeOcrClient(), dpi=50, client_factory=FakeOcrClient)
+        pages = first.process_pdf(pdf_path)
+        runner = get_ocr_runner(FakeOcrClient)
+        executor = runner._executor
+
+        second = OcrPipeline(FakeOcrClient(), dpi=50, client_factory=FakeOcrClient)
+        assert second.process_pdf(pdf_path) == pages
+        assert executor is not None and runner._executor is executor
@@ -0,0 +1,101 @@
+"""
+Unit tests for core/ocr/raster.py - pixel path and adaptive DPI
+"""
+import io
+
+import fitz
+import pytest
+from PIL import Image
+
+np = pytest.importorskip("numpy")
+
+from core.ocr.pipeline import ocr_page
+from core.ocr.raster import adaptive_dpi, encode_pixmap, pixmap_array, rasterize
+
+
+def _text_page(doc, fontsize):
+    page = doc.new_page(width=400, height=400)
+    for i in range(8):
+        page.insert_text((30, 40 + i * fontsize * 1.5), "The quick brown fox jumps", fontsize=fontsize)
+    return page
+
+
+@pytest.fixture
+def doc():
+    d = fitz.open()
+    yield d
+    d.close()
+
+
+class TestPixmapArray:
+
+    def test_matches_decoded_png(self, doc):
+        pix = rasterize(_text_page(doc, 12), 100)
+
+        pixels = pixmap_array(pix)
+        decoded = np.array(Image.open(io.BytesIO(encode_pixmap(pix))).convert("RGB"))
+
+        assert pixels.shape == (pix.height, pix.width, 3)
+        assert pixels.dtype == np.uint8
+        assert np.array_equal(pixels, decoded)
+
+    def test_no_copy(self, doc):
+        pix = rasterize(_text_page(doc, 12), 100)
+
+        assert not pixmap_array(pix).flags.owndata
+
+
+class TestAdaptiveDpi:
+
+    def test_large_text_renders_lower(self, doc):
+        small = adaptive_dpi(_text_page(doc, 10), max_dpi=300)
+        large = adaptive_dpi(_text_page(doc, 24), max_dpi=300)
+
+        assert small == 288
+        assert large == 120
+
+    def test_bounds(self, doc):
+        assert adaptive_dpi(_text_page(doc, 6), max_dpi=300) == 300
+        assert adaptive_dpi(_text_page(doc, 72), max_dpi=300, min_dpi=100) == 100
+
+    def test_blank_page_keeps_max(self, doc):
+        assert adaptive_dpi(doc.new_page(), max_dpi=200) == 200
+
+    def test_scanned_page_measured_from_pixels(self, doc):
+        image = rasterize(_text_page(doc, 24), 150)
+        scan = doc.new_page(width=400, height=400)
+        scan.insert_image(scan.rect, pixmap=image)
+
+        assert 90 <= adaptive_dpi(scan, max_dpi=300, min_dpi=50) <= 160
+
+
+class _BytesClient:
+    def extract_structured(self, image_bytes, mode="document", language=None):
+        return {"text": image_bytes[:4].decode("latin-1"), "confidence": 1.0}
+
+
+class _PixelClient(_BytesClient):
+    def extract_structured_pixels(self, pixels, mode="document", language=None):
+        return {"text": "pixels", "confidence": 1.0, "metadata": {"shape": pixels.shape}}
+
+
+class TestOcrPage:
+
+    def test_pixel_client_skips_encoding(self, doc):
+        page = _text_page(doc, 12)
+
+        result = ocr_page(_PixelClient(), page, dpi=72)
+
+        assert result.text == "pixels"
+        assert result.metadata["shape"] == (400, 400, 3)
+        assert result.metadata["dpi"] == 72
+
+    def test_bytes_client_gets_png(self, doc):
+        result = ocr_page(_BytesClient(), _text_page(doc, 12), dpi=72)
+
+        assert result.text == "\x89PNG"
+
+    def test_adaptive_dpi_recorded(self, doc):
+        result = ocr_page(_PixelClient(), _text_page(doc, 24), dpi=300, min_dpi=100)
+
+        assert result.metadata["dpi"] == 120
@@ -0,0 +1,208 @@
+"""
+Unit tests for batched, cached LaTeX → OMML conversion
+(core/rendering/omml_converter.py, core/cache/omml_cache.py)
+
+pandoc is replaced by a small script on PATH that mimics its LaTeX → DOCX
+output (marker paragraphs and <m:oMath> paragraphs), so batching, splitting
+and caching can be tested without pandoc installed.
+"""
+import shutil
+import sys
+import textwrap
+
+import pytest
+
+from core.cache.omml_cache import OmmlCache, compute_omml_key
+from core.rendering import omml_converter
+
+FAKE_PANDOC = textwrap.dedent('''\
+    #!{python}
+    import sys, zipfile
+    from pathlib import Path
+
+    if sys.argv[1] == "--version":
+        print("pandoc 9.9-fake")
+        sys.exit(0)
+
+    tex_path, out_path = sys.argv[5], sys.argv[7]
+    with open(Path(__file__).with_name("calls.log"), "a") as log:
+        log.write("run\\n")
+
+    tex = Path(tex_path).read_text(encoding="utf-8")
+    if "\\\\crash" in tex:
+        sys.exit(1)
+
+    paragraphs = []
+    for block in tex.split("\\n\\n"):
+        if block.startswith("$$") and block.endswith("$$"):
+            latex = block[2:-2]
+            if "\\\\invalid" in latex:
+                paragraphs.append('<w:p><w:r><w:t>' + latex + '</w:t></w:r></w:p>')
+            else:
+                paragraphs.append(
+                    '<w:p><m:oMathPara><m:oMath><m:r><m:t>' + latex.replace("&", "&amp;").replace("<", "&lt;")
+                    + '</m:t></m:r></m:oMath></m:oMathPara></w:p>'
+                )
+        elif "\\\\swallow" not in block:
+            paragraphs.append('<w:p><w:r><w:t>' + block + '</w:t></w:r></w:p>')
+
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+        'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math"><w:body>'
+        + "".join(paragraphs) + '</w:body></w:document>'
+    )
+    with zipfile.ZipFile(out_path, "w") as docx:
+        docx.writestr("word/document.xml", document)
+''')
+
+
+@pytest.fixture
+def fake_pandoc(tmp_path, monkeypatch):
+    """Put the fake pandoc first on PATH; returns a conversion run counter"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "pandoc"
+    script.write_text(FAKE_PANDOC.format(python=sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:/usr/bin:/bin")
+    _reset_converter_state(monkeypatch)
+
+    def calls():
+        log = bin_dir / "calls.log"
+        return len(log.read_text().splitlines()) if log.exists() else 0
+
+    return calls
+
+
+def _reset_converter_state(monkeypatch):
+    monkeypatch.setattr(omml_converter, "_PANDOC_AVAILABLE", None)
+    monkeypatch.setattr(omml_converter, "_PANDOC_VERSION", None)
+    monkeypatch.setattr(omml_converter, "_memo", type(omml_converter._memo)())
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = OmmlCache(tmp_path / "omml.db")
+    yield c
+    c.close()
+
+
+class TestBatchConversion:
+
+    def test_one_pandoc_run_per_batch(self, fake_pandoc):
+        equations = [f"$x_{i}^2$" for i in range(25)]
+
+        results = omml_converter.latex_to_omml_batch(equations, batch_size=10, workers=2)
+
+        assert fake_pandoc() == 3
+        assert all(r.startswith("<m:oMath") for r in results)
+        assert "x_7^2" in results[7]
+
+    def test_duplicates_and_empty(self, fake_pandoc):
+        results = omml_converter.latex_to_omml_batch(["$a$", "", "$$a$$", "b"])
+
+        assert results[0] == results[2]
+        assert results[1] is None
+        assert "b" in results[3]
+
+    def test_unconvertible_equation_isolated(self, fake_pandoc):
+        results = omml_converter.latex_to_omml_batch(["a", "\\invalid{x}", "c"])
+
+        assert results[1] is None
+        assert "a" in results[0] and "c" in results[2]
+
+    def test_failed_run_is_bisected(self, fake_pandoc):
+        equations = ["a", "b", "\\crash", "d"]
+
+        results = omml_converter.latex_to_omml_batch(equations, workers=1)
+
+        assert results[2] is None
+        assert [r is not None for r in results] == [True, True, False, True]
+
+    def test_lost_marker_is_bisected(self, fake_pandoc):
+        results = omml_converter.latex_to_omml_batch(["a", "b", "c \\swallow"], workers=1)
+
+        # "c" loses its marker paragraph in the full batch; alone it converts
+        assert [r is not None for r in results] == [True, True, True]
+
+    def test_single_equation_api_uses_memo(self, fake_pandoc):
+        omml_converter.latex_to_omml_batch(["$x^2$", "$y^2$"])
+        runs = fake_pandoc()
+
+        assert "y^2" in omml_converter.latex_to_omml("$$y^2$$")
+        assert fake_pandoc() == runs
+
+    def test_failures_memoized_per_pandoc_version(self, fake_pandoc, monkeypatch):
+        assert omml_converter.latex_to_omml("\\invalid{x}") is None
+        runs = fake_pandoc()
+
+        assert omml_converter.latex_to_omml("\\invalid{x}") is None
+        assert fake_pandoc() == runs
+
+        # A different pandoc gets to try again
+        monkeypatch.setattr(omml_converter, "_PANDOC_VERSION", "pandoc 10.0-fake")
+        assert omml_converter.latex_to_omml("\\invalid{x}") is None
+        assert fake_pandoc() == runs + 1
+
+    def test_prefetch_without_pandoc(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PATH", str(tmp_path))
+        _reset_converter_state(monkeypatch)
+
+        assert omml_converter.prefetch_omml(["x"]) == 0
+        assert omml_converter.latex_to_omml("x") is None
+
+
+class TestPersistentCache:
+
+    def test_shared_across_processes_runs(self, fake_pandoc, cache, monkeypatch):
+        first = omml_converter.latex_to_omml_batch(["a", "b"], cache=cache)
+        runs = fake_pandoc()
+
+        # New process: empty memo, same database
+        monkeypatch.setattr(omml_converter, "_memo", type(omml_converter._memo)())
+        second = omml_converter.latex_to_omml_batch(["b", "a"], cache=cache)
+
+        assert second == [first[1], first[0]]
+        assert fake_pandoc() == runs
+        assert cache.stats()["hits"] == 2
+
+    def test_failures_not_cached(self, fake_pandoc, cache):
+        omml_converter.latex_to_omml_batch(["\\invalid{x}"], cache=cache)
+
+        assert cache.stats()["total_entries"] == 0
+
+    def test_key_depends_on_pandoc_version(self):
+        assert compute_omml_key("x", "pandoc 3.1") != compute_omml_key("x", "pandoc 3.2")
+
+
+class TestDocxAdapter:
+
+    def test_equations_converted_in_one_run(self, fake_pandoc, tmp_path):
+        from docx import Document
+        from core.rendering.docx_adapter import render_docx_from_ast
+        from core.rendering.document_ast import (
+            DocumentAST, DocumentMetadata, Equation, EquationMode, create_book_stylesheet,
+        )
+
+        ast = DocumentAST(
+            metadata=DocumentMetadata(title="Math"),
+            styles=create_book_stylesheet(),
+            blocks=[Equation(latex=f"x^{i}", mode=EquationMode.DISPLAY) for i in range(12)],
+        )
+        output = tmp_path / "math.docx"
+
+        render_docx_from_ast(ast, output)
+
+        assert fake_pandoc() == 1
+        omath = "{http://schemas.openxmlformats.org/officeDocument/2006/math}oMath"
+        paragraphs = Document(output).paragraphs
+        assert sum(1 for p in paragraphs if p._element.findall(f".//{omath}")) == 12
+
+
+@pytest.mark.skipif(shutil.which("pandoc") is None, reason="pandoc not installed")
+def test_real_pandoc_batch(monkeypatch):
+    _reset_converter_state(monkeypatch)
+
+    results = omml_converter.latex_to_omml_batch(["x^2", "\\frac{a}{b}", "E=mc^2"])
+
+    assert all(r and "<m:oMath" in r for r in results)
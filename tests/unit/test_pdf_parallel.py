@@ -0,0 +1,157 @@
+"""Chapter-parallel PDF rendering (core/rendering/pdf_parallel.py).
+
+Chapters are laid out in worker processes, the TOC is numbered from the
+chapter page counts and the pieces are merged with pypdf; the page numbers in
+the TOC and footers must match where the headings actually land.
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+
+import pypdf
+import pytest
+
+from core.rendering import pdf_parallel
+from core.rendering.document_ast import (
+    DocumentAST,
+    DocumentMetadata,
+    Heading,
+    HeadingLevel,
+    Paragraph,
+    StyleSheet,
+)
+from core.rendering.pdf_adapter import render_pdf_from_ast
+
+LOREM = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 12
+
+
+def _book(chapters=4, paragraphs=25):
+    ast = DocumentAST(
+        metadata=DocumentMetadata(title="Book", author="Writer", language="en"),
+        styles=StyleSheet(),
+    )
+    ast.add_block(Paragraph(text="Preface text."))
+    for c in range(chapters):
+        ast.add_block(Heading(level=HeadingLevel.H1, text=f"Chapter {c}"))
+        for i in range(paragraphs):
+            if i == paragraphs // 2:
+                ast.add_block(Heading(level=HeadingLevel.H2, text=f"Section {c}.1"))
+            ast.add_block(Paragraph(text=LOREM))
+    return ast
+
+
+def _pages(path):
+    return [(pg.extract_text() or "") for pg in pypdf.PdfReader(str(path)).pages]
+
+
+@pytest.fixture
+def toc_entries(monkeypatch):
+    """The numbered entries of the last front-matter pass"""
+    captured = {}
+    render_front = pdf_parallel._render_front
+
+    def _render_front(*args):
+        captured["entries"] = {text: page for _, text, page in args[-1] or []}
+        return render_front(*args)
+
+    monkeypatch.setattr(pdf_parallel, "_render_front", _render_front)
+    return captured
+
+
+def _heading_page(pages, heading, after):
+    return next(i for i, text in enumerate(pages, start=1) if i > after and heading in text)
+
+
+@pytest.fixture(autouse=True)
+def _stop_pool():
+    yield
+    pdf_parallel.shutdown_pdf_pool()
+
+
+class _BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+
+def test_split_chapters():
+    ast = _book(chapters=3, paragraphs=2)
+
+    chapters = pdf_parallel.split_chapters(ast.blocks)
+
+    assert len(chapters) == 4  # preface + 3 chapters
+    assert [c[0].text for c in chapters[1:]] == ["Chapter 0", "Chapter 1", "Chapter 2"]
+    assert sum(len(c) for c in chapters) == len(ast.blocks)
+
+
+def test_chapter_workers_thresholds():
+    short = _book(chapters=3, paragraphs=2)
+
+    assert pdf_parallel.chapter_workers(short, None) == 1  # too short for the pool
+    assert pdf_parallel.chapter_workers(short, 1) == 1
+    assert pdf_parallel.chapter_workers(short, 8) == 4  # one per chapter at most
+
+    single = DocumentAST(metadata=DocumentMetadata(), styles=StyleSheet())
+    single.add_block(Heading(level=HeadingLevel.H1, text="Only"))
+    assert pdf_parallel.chapter_workers(single, 4) == 1
+
+
+def test_parallel_toc_and_footers_match_layout(tmp_path, toc_entries):
+    out = tmp_path / "book.pdf"
+
+    render_pdf_from_ast(_book(), out, title="Book", title_page=True, toc=True, header_footer=True, workers=2)
+
+    pages = _pages(out)
+    assert "Book" in pages[0] and "Contents" in pages[1]
+    assert "Section 3.1" in pages[1]
+    for heading in ("Chapter 0", "Chapter 2", "Section 3.1"):
+        page = _heading_page(pages, heading, after=2)
+        assert toc_entries["entries"][heading] == page
+        # footer number == physical page (the cover counts, unnumbered)
+        assert pages[page - 1].split()[-1] == str(page)
+    assert pages[0].split()[-1] != "1"
+
+
+def test_chapters_start_on_new_pages(tmp_path):
+    out = tmp_path / "book.pdf"
+
+    render_pdf_from_ast(_book(chapters=3, paragraphs=2), out, workers=2)
+
+    pages = _pages(out)
+    assert len(pages) == 4
+    assert [p.split("\n")[0] for p in pages[1:]] == ["Chapter 0", "Chapter 1", "Chapter 2"]
+
+
+def test_pool_not_resized_by_other_exports(tmp_path):
+    pool = pdf_parallel.get_pdf_pool(2)
+    future = pool.submit(sum, [1, 2])
+
+    render_pdf_from_ast(_book(chapters=3, paragraphs=2), tmp_path / "book.pdf", workers=3)
+
+    assert pdf_parallel.get_pdf_pool(4) is pool
+    assert future.result(timeout=60) == 3
+
+
+def test_broken_pool_renders_in_process(tmp_path, monkeypatch, toc_entries):
+    monkeypatch.setattr(pdf_parallel, "get_pdf_pool", lambda workers: _BrokenPool())
+    out = tmp_path / "book.pdf"
+
+    render_pdf_from_ast(_book(), out, toc=True, workers=2)
+
+    pages = _pages(out)
+    assert toc_entries["entries"]["Chapter 1"] == _heading_page(pages, "Chapter 1", after=1)
+
+
+def test_cover_template_merged_once(tmp_path, monkeypatch):
+    from core.rendering import cover_templates
+
+    monkeypatch.setattr(pdf_parallel, "get_pdf_pool", lambda workers: _BrokenPool())
+    template = cover_templates.list_templates()[0]["id"]
+    out = tmp_path / "book.pdf"
+
+    render_pdf_from_ast(_book(chapters=2, paragraphs=2), out, cover_template=template,
+                        header_footer=True, workers=2)
+
+    pages = _pages(out)
+    assert len(pages) == 1 + 3  # cover + preface + 2 chapters
+    # numbering starts after the cover, as in the single-pass cover path
+    assert pages[1].split()[-1] == "1"
+    assert pages[3].split()[-1] == "3"
@@ -0,0 +1,168 @@
+"""
+Unit tests for the process-wide adaptive provider limiter
+(ai_providers/concurrency.py) and its use in UnifiedLLMClient.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from ai_providers import concurrency
+from ai_providers.concurrency import AdaptiveLimiter, get_limiter, is_rate_limit_error, parse_rate_limit_headers
+from ai_providers.unified_client import UnifiedLLMClient
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers=None):
+        super().__init__("Error code: 429 - rate limit")
+        self.response = SimpleNamespace(status_code=429, headers=headers or {})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters():
+    concurrency.reset_limiters()
+    yield
+    concurrency.reset_limiters()
+
+
+class TestHeaders:
+    def test_openai_headers(self):
+        info = parse_rate_limit_headers({
+            "x-ratelimit-remaining-requests": "12",
+            "x-ratelimit-remaining-tokens": "3000",
+            "x-ratelimit-reset-requests": "6m0s",
+            "x-ratelimit-reset-tokens": "20ms",
+        })
+        assert (info.remaining_requests, info.remaining_tokens) == (12, 3000)
+        assert info.reset_requests == 360.0
+        assert info.reset_tokens == pytest.approx(0.02)
+
+    def test_anthropic_headers_and_retry_after(self):
+        info = parse_rate_limit_headers({
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": "2000-01-01T00:00:00Z",
+            "Retry-After": "7",
+        })
+        assert info.remaining_requests == 0
+        assert info.reset_requests == 0.0  # already past
+        assert info.retry_after == 7.0
+
+
+class TestAIMD:
+    def test_success_grows_limit_and_429_halves_once_per_window(self):
+        async def scenario():
+            limiter = AdaptiveLimiter("p", initial=4, maximum=8)
+            for _ in range(8):
+                started = await limiter.acquire()
+                limiter.release(0, started)
+            grown = limiter.limit
+            # Two requests of the same window hit 429: one decrease
+            a = await limiter.acquire()
+            b = await limiter.acquire()
+            limiter.release(0, a, ok=False, rate_limited=True)
+            limiter.release(0, b, ok=False, rate_limited=True)
+            return grown, limiter.limit
+
+        grown, after = asyncio.run(scenario())
+        assert grown > 5
+        assert after == pytest.approx(grown / 2)
+
+    def test_limit_caps_in_flight_across_callers(self):
+        limiter = AdaptiveLimiter("p", initial=3, maximum=3)
+        peak = {"now": 0, "max": 0}
+
+        async def call():
+            async with limiter.slot():
+                peak["now"] += 1
+                peak["max"] = max(peak["max"], peak["now"])
+                await asyncio.sleep(0.01)
+                peak["now"] -= 1
+
+        async def scenario():
+            await asyncio.gather(*(call() for _ in range(12)))
+
+        asyncio.run(scenario())
+        assert peak["max"] == 3
+        assert limiter.in_flight == 0
+
+    def test_token_budget_from_headers_holds_back_requests(self):
+        async def scenario():
+            limiter = AdaptiveLimiter("p", initial=10)
+            limiter.observe({"x-ratelimit-remaining-tokens": "1000", "x-ratelimit-reset-tokens": "0.2s"})
+            first = await limiter.acquire(800)
+            second = asyncio.ensure_future(limiter.acquire(800))
+            await asyncio.sleep(0.05)
+            blocked = not second.done()
+            await second  # admitted once the budget window resets
+            return blocked, first
+
+        blocked, _ = asyncio.run(scenario())
+        assert blocked
+
+    def test_slot_classifies_rate_limit_errors(self):
+        async def scenario():
+            limiter = AdaptiveLimiter("p", initial=8)
+            with pytest.raises(RateLimitError):
+                async with limiter.slot():
+                    raise RateLimitError({"retry-after": "0.1"})
+            return limiter
+
+        limiter = asyncio.run(scenario())
+        assert limiter.limit == 4
+        assert limiter.rate_limited == 1
+        assert limiter.in_flight == 0
+
+    def test_rate_limit_classified_by_status_and_type_only(self):
+        class SdkRateLimit(RuntimeError):
+            pass
+        SdkRateLimit.__name__ = "RateLimitError"
+
+        assert is_rate_limit_error(RateLimitError())
+        assert is_rate_limit_error(SdkRateLimit("slow down"))
+        assert not is_rate_limit_error(ValueError("chunk 429 of 1200 failed"))
+        assert not is_rate_limit_error(RuntimeError("Error code: 500 - rate limit service down"))
+
+    def test_waiter_on_closed_loop_is_skipped(self):
+        limiter = AdaptiveLimiter("p")
+        loop = asyncio.new_event_loop()
+        waiter = loop.create_future()
+        loop.close()
+        limiter._waiters.append((loop, waiter))
+
+        limiter.observe({"retry-after": "0"})
+
+        assert limiter._waiters == []
+
+
+class TestUnifiedClient:
+    def test_call_provider_uses_shared_limiter_and_headers(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        calls = []
+
+        class Raw:
+            headers = {"x-ratelimit-remaining-requests": "99", "x-ratelimit-reset-requests": "1s"}
+
+            def parse(self):
+                return SimpleNamespace(
+                    choices=[SimpleNamespace(message=SimpleNamespace(content="ok"), finish_reason="stop")],
+                    usage=SimpleNamespace(prompt_tokens=3, completion_tokens=1, total_tokens=4),
+                )
+
+        class RawEndpoint:
+            async def create(self, **kwargs):
+                calls.append(kwargs)
+                return Raw()
+
+        fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(with_raw_response=RawEndpoint())))
+        client = UnifiedLLMClient()
+        client._clients["openai"] = fake
+        client._current_provider = "openai"
+
+        response = asyncio.run(client._call_provider([{"role": "user", "content": "hi"}], 16, None, False))
+
+        assert response.content == "ok"
+        limiter = get_limiter("openai", client.PROVIDER_CONFIG["openai"]["text_model"])
+        assert limiter.requests == 1 and limiter.in_flight == 0
+        assert limiter._request_budget[0] == 99
@@ -0,0 +1,125 @@
+"""
+Unit tests for latency histograms (ai_providers/latency.py) and hedged
+requests in UnifiedLLMClient.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from ai_providers import latency
+from ai_providers.latency import LatencyHistogram, get_latency_tracker
+from ai_providers.unified_client import UnifiedLLMClient, UsageStats
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tracker():
+    latency.reset_latency_tracker()
+    yield
+    latency.reset_latency_tracker()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    for key in ("DEEPSEEK_API_KEY", "GOOGLE_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    c = UnifiedLLMClient()
+    c._current_provider = "openai"
+    c._validated = True
+    return c
+
+
+def _warm(provider, seconds, n=30):
+    tracker = get_latency_tracker()
+    for _ in range(n):
+        tracker.record(provider, seconds)
+
+
+def _fake_calls(client, latencies, cancelled, queued=None):
+    """Replace _call_provider with per-provider sleeps (queued = limiter wait)."""
+    async def call(messages, max_tokens, response_format, has_vision, provider=None, admitted=None, **kwargs):
+        provider = provider or client._current_provider
+        try:
+            await asyncio.sleep((queued or {}).get(provider, 0))
+            if admitted is not None:
+                admitted.set()
+            await asyncio.sleep(latencies[provider])
+        except asyncio.CancelledError:
+            cancelled.append(provider)
+            raise
+        usage = UsageStats(input_tokens=10, output_tokens=5, total_tokens=15, provider=provider)
+        return SimpleNamespace(content=f"from {provider}", usage=usage)
+
+    client._call_provider = call
+
+
+class TestLatencyHistogram:
+    def test_rolling_window_percentiles(self):
+        h = LatencyHistogram(window=100)
+        for i in range(1, 201):
+            h.add(float(i))
+        assert len(h) == 100
+        assert h.percentile(0.5) == 150.0
+        assert h.percentile(0.95) == 195.0
+
+    def test_tracker_needs_min_samples(self):
+        tracker = get_latency_tracker()
+        tracker.record("openai", 1.0)
+        assert tracker.percentile("openai", 0.95) is None
+        _warm("openai", 1.0)
+        assert tracker.percentile("openai", 0.95) == 1.0
+
+
+class TestHedging:
+    def test_slow_primary_is_hedged_and_backup_wins(self, client):
+        _warm("openai", 0.02)
+        cancelled = []
+        _fake_calls(client, {"openai": 5.0, "anthropic": 0.01}, cancelled)
+
+        response = asyncio.run(client.chat([{"role": "user", "content": "x" * 400}], hedge=True))
+
+        stats = client.get_usage_stats()
+        assert response.content == "from anthropic"
+        assert cancelled == ["openai"]
+        assert (stats.hedged_calls, stats.hedge_wins) == (1, 1)
+        assert stats.hedge_extra_tokens == 100  # estimated input of the cancelled call
+
+    def test_fast_primary_is_not_hedged(self, client):
+        _warm("openai", 1.0)
+        cancelled = []
+        _fake_calls(client, {"openai": 0.01, "anthropic": 0.01}, cancelled)
+
+        response = asyncio.run(client.chat([{"role": "user", "content": "hi"}], hedge=True))
+
+        assert response.content == "from openai"
+        assert client.get_usage_stats().hedged_calls == 0
+
+    def test_time_waiting_for_a_limiter_slot_does_not_hedge(self, client):
+        _warm("openai", 0.05)
+        cancelled = []
+        _fake_calls(client, {"openai": 0.01, "anthropic": 0.01}, cancelled, queued={"openai": 0.2})
+
+        response = asyncio.run(client.chat([{"role": "user", "content": "hi"}], hedge=True))
+
+        assert response.content == "from openai"
+        assert client.get_usage_stats().hedged_calls == 0
+
+    def test_no_samples_means_plain_call(self, client):
+        cancelled = []
+        _fake_calls(client, {"openai": 0.05, "anthropic": 0.01}, cancelled)
+
+        response = asyncio.run(client.chat([{"role": "user", "content": "hi"}], hedge=True))
+
+        assert response.content == "from openai"
+        assert client.get_usage_stats().hedged_calls == 0
+
+
+class TestRouting:
+    def test_fallback_prefers_lower_p95_once_all_are_measured(self, client):
+        assert client._healthy_providers() == ["openai", "anthropic"]
+        _warm("openai", 9.0)
+        _warm("anthropic", 2.0)
+        assert client._healthy_providers() == ["anthropic", "openai"]
+        assert client._healthy_providers(exclude=("anthropic",)) == ["openai"]
@@ -0,0 +1,80 @@
+"""
+Unit tests for in-flight call coalescing (core/cache/single_flight.py).
+"""
+import asyncio
+
+from core.cache.single_flight import SingleFlight, SingleFlightStats
+
+
+def _counting_call(calls, result="ok", fail=False, delay=0.02):
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if fail and len(calls) == 1:
+            raise RuntimeError("upstream down")
+        return (result, 120)
+    return call
+
+
+class TestSingleFlight:
+    def test_identical_concurrent_calls_share_one_upstream_call(self):
+        flight = SingleFlight()
+        stats = SingleFlightStats()
+        calls = []
+
+        async def run():
+            return await asyncio.gather(*[
+                flight.do("k", _counting_call(calls), stats=stats, tokens_of=lambda v: v[1])
+                for _ in range(5)
+            ])
+
+        results = asyncio.run(run())
+
+        assert results == [("ok", 120)] * 5
+        assert len(calls) == 1
+        assert stats.to_dict() == {"calls_saved": 4, "tokens_saved": 480}
+        assert len(flight) == 0
+
+    def test_different_keys_are_not_coalesced(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def run():
+            await asyncio.gather(
+                flight.do("a", _counting_call(calls)),
+                flight.do("b", _counting_call(calls)),
+            )
+
+        asyncio.run(run())
+        assert len(calls) == 2
+
+    def test_failed_leader_lets_waiters_call_themselves(self):
+        flight = SingleFlight()
+        stats = SingleFlightStats()
+        calls = []
+        call = _counting_call(calls, fail=True)
+
+        async def run():
+            return await asyncio.gather(
+                flight.do("k", call, stats=stats),
+                flight.do("k", call, stats=stats),
+                return_exceptions=True,
+            )
+
+        leader, waiter = asyncio.run(run())
+
+        assert isinstance(leader, RuntimeError)
+        assert waiter == ("ok", 120)
+        assert len(calls) == 2
+        assert stats.calls_saved == 0
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def run():
+            await flight.do("k", _counting_call(calls))
+            await flight.do("k", _counting_call(calls))
+
+        asyncio.run(run())
+        assert len(calls) == 2
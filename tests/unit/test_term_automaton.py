@@ -0,0 +1,78 @@
+"""Glossary term automaton (core/term_automaton.py).
+
+One Aho-Corasick scan must find the same terms the per-term regex/substring
+scans did: whole-word, case-folded, longest match first, CJK-safe.
+"""
+import re
+
+from core.term_automaton import TermAutomaton
+
+
+def test_longest_match_wins_overlaps():
+    automaton = TermAutomaton(["heart", "heart failure", "failure"])
+
+    matches = automaton.longest_matches("Acute heart failure; the heart.")
+
+    assert matches == [(6, 19, 1), (25, 30, 0)]
+
+
+def test_priority_breaks_length_ties():
+    automaton = TermAutomaton(["ab c", "c de"], priorities=[1, 9])
+
+    assert automaton.longest_matches("ab c de") == [(3, 7, 1)]
+
+
+def test_word_boundaries_match_regex():
+    terms = ["cell", "C++", "he"]
+    text = "The cells, a cell; he used C++ and xC++."
+    automaton = TermAutomaton(terms)
+
+    found = {(s, e) for s, e, _ in automaton.find_all(text)}
+
+    assert (text.index("a cell") + 2, text.index("a cell") + 6) in found
+    assert not any(text[s:e] == "cell" and text[e] == "s" for s, e in found)
+    assert len([1 for s, e in found if text[s:e] == "he"]) == len(re.findall(r"\bhe\b", text))
+    assert [text[s:e] for s, e in found if text[s:e] == "C++"] == ["C++"]
+
+
+def test_case_folding_and_case_sensitive_terms():
+    automaton = TermAutomaton(["Straße", "API"], case_sensitive=[False, True])
+    text = "STRASSE api API"
+
+    matches = automaton.find_all(text)
+
+    assert [(text[s:e], idx) for s, e, idx in matches] == [("STRASSE", 0), ("API", 1)]
+
+
+def test_cjk_terms_match_inside_running_text():
+    automaton = TermAutomaton(["心脏", "人工智能"])
+
+    assert automaton.present("我的心脏病和人工智能研究") == {0, 1}
+
+
+def test_count_matches_str_count_without_boundaries():
+    terms = ["aa", "cell"]
+    text = "aaaaa Cells cell"
+    automaton = TermAutomaton(terms, word_boundary=False)
+
+    counts = automaton.count(text)
+
+    assert counts == {i: text.lower().count(t) for i, t in enumerate(terms)}
+
+
+def test_empty_terms_and_text():
+    assert TermAutomaton([" ", ""]).find_all("anything") == []
+    assert TermAutomaton(["x"]).longest_matches("") == []
+
+
+def test_glossary_edits_of_same_size_rebuild_the_automaton(tmp_path):
+    from core.glossary_legacy import GlossaryManager
+
+    manager = GlossaryManager(tmp_path)
+    manager.terms["heart"] = "tim"
+    assert manager.validate_translation("the heart", "x")[1] == ["Missing term: heart → tim"]
+
+    # Direct edit of the public dict, same number of terms
+    manager.terms.clear()
+    manager.terms["lung"] = "phổi"
+    assert manager.validate_translation("the lung", "x")[1] == ["Missing term: lung → phổi"]
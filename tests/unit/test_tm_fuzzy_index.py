@@ -0,0 +1,162 @@
+"""
+Unit tests for core/tm/index.py - bigram candidate index for fuzzy TM lookup
+"""
+import random
+
+import pytest
+from sqlalchemy import text
+
+from core.tm.index import TMFuzzyIndex
+from core.tm.matcher import TMMatcher
+from core.tm.models import TMSegmentGram
+from core.tm.repository import TMRepository
+from core.tm.schemas import LookupRequest, ProcessRequest
+from core.tm.service import TMService
+
+
+WORDS = (
+    "the patient was given a dose of medicine after the surgery and "
+    "recovered quickly while doctors monitored heart rate blood pressure "
+    "during the night shift in the intensive care unit of hospital"
+).split()
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + "."
+
+
+def _mutate(rng: random.Random, sentence: str) -> str:
+    words = sentence.split()
+    for _ in range(rng.randint(0, 3)):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return TMRepository(db_path=str(tmp_path / "tm.db"))
+
+
+@pytest.fixture
+def service(repo):
+    svc = TMService()
+    svc.repository = repo
+    svc.matcher = TMMatcher()
+    svc.index = TMFuzzyIndex(repo)
+    return svc
+
+
+@pytest.fixture
+def corpus(repo):
+    rng = random.Random(7)
+    tm = repo.create_tm(name="Medical")
+    sources = [_sentence(rng, rng.randint(3, 14)) for _ in range(300)]
+    repo.add_segments_bulk(
+        tm.id,
+        [{"source_text": s, "target_text": s.upper()} for s in sources],
+    )
+    return tm, sources
+
+
+class TestCandidateIndex:
+    """Index must never drop a segment that scores above the threshold."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.75, 0.9])
+    def test_candidates_cover_brute_force_matches(self, repo, corpus, threshold):
+        tm, sources = corpus
+        index = TMFuzzyIndex(repo)
+        matcher = TMMatcher()
+        all_segments = repo.get_all_segments(tm.id)
+        rng = random.Random(threshold)
+
+        for _ in range(40):
+            query = _mutate(rng, rng.choice(sources))
+            expected = matcher.find_fuzzy(query, all_segments, threshold, max_results=1000)
+            actual = index.search([tm.id], query, matcher, threshold, max_results=1000)
+
+            # Same matches and scores (ties may come back in another order)
+            assert sorted((m.similarity, m.segment.id) for m in actual) == \
+                sorted((m.similarity, m.segment.id) for m in expected)
+
+    def test_top_k_matches_full_scan(self, repo, corpus):
+        tm, sources = corpus
+        index = TMFuzzyIndex(repo)
+        matcher = TMMatcher()
+        all_segments = repo.get_all_segments(tm.id)
+        rng = random.Random(3)
+
+        for _ in range(40):
+            query = _mutate(rng, rng.choice(sources))
+            expected = matcher.find_fuzzy(query, all_segments, 0.75, max_results=5)
+            actual = index.search([tm.id], query, matcher, 0.75, max_results=5)
+
+            assert [m.similarity for m in actual] == [m.similarity for m in expected]
+
+    def test_candidate_set_is_bounded(self, repo, corpus):
+        tm, sources = corpus
+        index = TMFuzzyIndex(repo)
+
+        ranked = index.candidates([tm.id], sources[0], 0.9)
+
+        assert 0 < len(ranked) < len(sources) / 2
+        assert ranked == sorted(ranked, key=lambda item: item[1], reverse=True)
+
+    def test_short_query_uses_length_scan(self, repo):
+        tm = repo.create_tm(name="Short")
+        repo.add_segment(tm.id, "ab", "AB")
+        repo.add_segment(tm.id, "b", "B")
+        index = TMFuzzyIndex(repo)
+
+        ranked = index.candidates([tm.id], "a", 0.75)
+
+        assert len(ranked) <= 2
+
+    def test_backfill_indexes_existing_segments(self, repo):
+        tm = repo.create_tm(name="Legacy")
+        repo.add_segment(tm.id, "Hello world again", "Xin chao")
+        with repo.engine.begin() as conn:
+            conn.execute(text("DELETE FROM tm_segment_grams"))
+
+        index = TMFuzzyIndex(repo)
+        assert index.ensure_indexed([tm.id]) == 1
+        assert index.candidates([tm.id], "Hello world again!", 0.75)
+
+    def test_delete_removes_postings(self, repo):
+        tm = repo.create_tm(name="Delete")
+        segment = repo.add_segment(tm.id, "Remove me please", "Xoa")
+
+        repo.delete_segment(tm.id, segment.id)
+
+        with repo.get_session() as session:
+            assert session.query(TMSegmentGram).filter(
+                TMSegmentGram.segment_id == segment.id
+            ).count() == 0
+
+
+class TestServiceLookup:
+    """TMService lookup/process go through the index."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_matches_fuzzy(self, service, repo):
+        tm = repo.create_tm(name="Lookup")
+        repo.add_segment(tm.id, "The patient recovered quickly.", "Benh nhan hoi phuc nhanh.")
+        repo.add_segment(tm.id, "Completely unrelated sentence here.", "Khac.")
+
+        response = await service.lookup(LookupRequest(
+            tm_ids=[tm.id], source_text="The patient recovered quickly!",
+        ))
+
+        assert response.match_count == 1
+        assert response.best_match.target_text == "Benh nhan hoi phuc nhanh."
+
+    @pytest.mark.asyncio
+    async def test_process_prefers_exact_hash(self, service, repo):
+        tm = repo.create_tm(name="Process")
+        repo.add_segment(tm.id, "Take one tablet daily.", "Uong mot vien moi ngay.")
+
+        response = await service.process(ProcessRequest(
+            tm_ids=[tm.id], source_text="Take one tablet daily.",
+        ))
+
+        assert response.matched_segments == 1
+        assert response.segments[0].match.similarity == 1.0
@@ -5,6 +5,7 @@ dummy object for the guard case), so the gateway is exercised end-to-end without
 mocking the TM internals.
 """
 
+import asyncio
 import os
 import tempfile
 from pathlib import Path
@@ -169,3 +170,36 @@ def test_close_is_safe(tm_factory):
     g = TMGateway(tm=tm)
     g.close()
     g.close()  # second close must not raise
+
+
+def test_lookup_uses_batched_lookup_many(tm_factory):
+    # A TM with lookup_many answers the whole chunk in one call.
+    tm = tm_factory()
+    tm.add_segment(TMSegment(source="Hello world.", target="Xin chào thế giới.", source_lang="en", target_lang="vi"))
+    calls = []
+    original = tm.lookup_many
+
+    def spy(sentences, *args, **kwargs):
+        calls.append(list(sentences))
+        return original(sentences, *args, **kwargs)
+
+    tm.lookup_many = spy
+    g = TMGateway(tm=tm)
+    hints = g.lookup_hints("Hello world. Something else.", "en", "vi")
+
+    assert len(calls) == 1
+    assert [h.target for h in hints] == ["Xin chào thế giới."]
+
+
+def test_async_lookup_matches_sync_lookup(tm_factory):
+    # lookup_hints_async runs on a reader thread but returns the same hints.
+    tm = tm_factory()
+    tm.add_segment(TMSegment(source="Hello world.", target="Xin chào thế giới.", source_lang="en", target_lang="vi"))
+    g = TMGateway(tm=tm)
+
+    text = "Hello world. Something else."
+    hints = asyncio.run(g.lookup_hints_async(text, "en", "vi"))
+
+    assert hints == g.lookup_hints(text, "en", "vi")
+    assert [h.target for h in hints] == ["Xin chào thế giới."]
+    g.close()
@@ -2,9 +2,12 @@
 Unit tests for core/translation_memory.py - TranslationMemory component
 """
 import pytest
+import random
 import tempfile
 from pathlib import Path
-from core.translation_memory import TranslationMemory, TMSegment, TMMatch
+from core.translation_memory import (
+    TranslationMemory, TMSegment, TMMatch, SimilarityScorer, bounded_levenshtein
+)
 
 
 class TestTMSegment:
@@ -505,3 +508,151 @@ class TestTranslationMemory:
         hash_val = segment.get_hash()
         assert len(hash_val) == expected_hash_length
         assert isinstance(hash_val, str)
+
+
+class TestLookupMany:
+    """Test batched lookup_many()."""
+
+    @pytest.fixture
+    def tm(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.db")
+        yield memory
+        memory.close()
+
+    def test_matches_per_sentence_lookups(self, tm):
+        """lookup_many returns what get_exact_match/get_fuzzy_matches would."""
+        tm.add_segment(TMSegment(source="The cat sat on the mat.", target="Con mèo ngồi trên thảm."))
+        tm.add_segment(TMSegment(source="Machine learning improves translation quality.", target="Học máy cải thiện chất lượng dịch."))
+        sentences = [
+            "The cat sat on the mat.",
+            "Machine learning improves translation quality!",
+            "Completely unrelated words here.",
+        ]
+
+        expected = []
+        for sentence in sentences:
+            exact = tm.get_exact_match(sentence)
+            fuzzy = tm.get_fuzzy_matches(sentence, threshold=0.7, max_results=1)
+            expected.append(exact or (fuzzy[0] if fuzzy else None))
+
+        results = tm.lookup_many(sentences, threshold=0.7)
+
+        assert [r and (r.match_type, r.segment.target, round(r.similarity, 6)) for r in results] == \
+            [e and (e.match_type, e.segment.target, round(e.similarity, 6)) for e in expected]
+
+    def test_use_count_incremented_once_per_occurrence(self, tm):
+        """Exact hits bump use_count in one deferred write."""
+        tm.add_segment(TMSegment(source="Hello", target="Xin chào"))
+
+        results = tm.lookup_many(["Hello", "Hello", "Unknown"])
+
+        assert results[0].match_type == "exact"
+        assert results[2] is None
+        row = tm.conn.execute("SELECT use_count FROM segments").fetchone()
+        assert row["use_count"] == 2
+
+    def test_empty_input(self, tm):
+        """No sentences -> no matches."""
+        assert tm.lookup_many([]) == []
+
+
+class TestSimilarityScorer:
+    """Test bounded, early-exit similarity scoring."""
+
+    WORDS = "the cat sat on a mat while dog ran far away quickly and slowly".split()
+
+    @pytest.fixture
+    def tm(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.db")
+        yield memory
+        memory.close()
+
+    def _full_similarity(self, tm, str1, str2):
+        """Unbounded reference: full Levenshtein + bigram + word overlap."""
+        if str1 == str2:
+            return 1.0
+        s1, s2 = str1.lower().strip(), str2.lower().strip()
+        if not s1 or not s2:
+            return 0.0
+        lev = 1.0 - tm._levenshtein_distance(s1, s2) / max(len(s1), len(s2))
+        return (
+            lev * 0.4 +
+            tm._bigram_similarity(s1, s2) * 0.3 +
+            tm._word_overlap_similarity(s1, s2) * 0.3
+        )
+
+    def _pair(self, rng):
+        words = [rng.choice(self.WORDS) for _ in range(rng.randint(1, 15))]
+        other = list(words)
+        for _ in range(rng.randint(0, 4)):
+            other[rng.randrange(len(other))] = rng.choice(self.WORDS)
+        if rng.random() < 0.3:
+            other = [rng.choice(self.WORDS) for _ in range(rng.randint(1, 15))]
+        return " ".join(words), " ".join(other)
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.5, 0.7, 0.85, 0.95])
+    def test_matches_full_computation(self, tm, threshold):
+        """Scores >= threshold are exact; rejected pairs stay below threshold."""
+        rng = random.Random(threshold)
+        for _ in range(300):
+            query, candidate = self._pair(rng)
+            expected = self._full_similarity(tm, query, candidate)
+
+            score = SimilarityScorer(query, threshold).score(candidate)
+
+            if expected >= threshold:
+                assert score == expected
+            else:
+                assert score < threshold
+
+    def test_calculate_similarity_with_threshold(self, tm):
+        """_calculate_similarity passes the threshold through."""
+        assert tm._calculate_similarity("hello world", "hello world!", 0.7) == \
+            tm._calculate_similarity("hello world", "hello world!")
+        assert tm._calculate_similarity("hello world", "xyz", 0.7) < 0.7
+
+    def test_bounded_levenshtein(self, tm):
+        """Distance within the bound is exact, beyond it is None."""
+        rng = random.Random(1)
+        for _ in range(300):
+            s1, s2 = self._pair(rng)
+            distance = tm._levenshtein_distance(s1, s2)
+            bound = rng.randint(0, 20)
+
+            result = bounded_levenshtein(s1, s2, bound)
+
+            assert result == (distance if distance <= bound else None)
+
+
+class TestAddSegments:
+    """Test add_segments() bulk write."""
+
+    @pytest.fixture
+    def tm(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.db")
+        yield memory
+        memory.close()
+
+    def test_same_result_as_add_segment(self, tm):
+        """Bulk insert/update matches one-by-one add_segment."""
+        tm.add_segment(TMSegment(source="Hello", target="Xin chào"))
+
+        ids = tm.add_segments([
+            TMSegment(source="Hello", target="Chào bạn"),
+            TMSegment(source="World", target="Thế giới"),
+        ])
+
+        assert len(set(ids)) == 2
+        assert tm.get_exact_match("Hello").segment.target == "Chào bạn"
+        assert tm.get_exact_match("World").segment.target == "Thế giới"
+        assert tm.get_statistics()["total_segments"] == 2
+
+    def test_reopen_shares_database(self, tm):
+        """reopen() gives a second connection to the same TM."""
+        tm.add_segment(TMSegment(source="Hello", target="Xin chào"))
+
+        other = tm.reopen()
+        try:
+            assert other.get_exact_match("Hello").segment.target == "Xin chào"
+        finally:
+            other.close()
@@ -393,6 +393,24 @@ class TestTranslateParallel:
         # Stats object may have different attributes
         assert stats is not None
 
+    @pytest.mark.asyncio
+    async def test_prefetched_tm_skips_per_chunk_lookups(self, chunks, tmp_path):
+        """prefetch_tm resolves the whole job; translate_chunk reuses it."""
+        from core.translation_memory import TranslationMemory, TMSegment
+
+        tm = TranslationMemory(tmp_path / "tm.db")
+        tm.add_segment(TMSegment(source="First sentence.", target="Câu thứ nhất."))
+        engine = TranslatorEngine(provider="openai", model="gpt-4", api_key="test-key", tm=tm)
+
+        engine.prefetch_tm(chunks[:1])
+        with patch.object(tm, "get_exact_match") as exact:
+            result = await engine.translate_chunk(AsyncMock(), chunks[0])
+
+        exact.assert_not_called()
+        assert result.translated == "Câu thứ nhất."
+        assert engine.tm_exact_matches == 1
+        tm.close()
+
 
 class TestTranslateInBatches:
     """Tests for batch translation."""
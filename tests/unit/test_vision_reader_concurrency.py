@@ -0,0 +1,126 @@
+"""
+Unit tests for concurrent, rate-limited Vision page reading
+(core_v2/vision_reader.py, core_v2/rate_limiter.py)
+"""
+import asyncio
+import re
+import time
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from core_v2 import vision_reader
+from core_v2.rate_limiter import ProviderRateLimiter, TokenBucket
+from core_v2.vision_reader import VisionReader
+
+
+class FakeVisionClient:
+    """Answers with the page number from the prompt after `latency` seconds."""
+
+    def __init__(self, latency=0.1, fail_first=()):
+        self.latency = latency
+        self.fail_first = set(fail_first)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def chat(self, messages, max_tokens=4096, **kwargs):
+        self.calls += 1
+        prompt = messages[0]["content"][1]["text"]
+        page = int(re.search(r"page (\d+) of", prompt).group(1))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if page in self.fail_first:
+                self.fail_first.discard(page)
+                raise RuntimeError("Connection reset by peer")
+            return SimpleNamespace(content=f"content of page {page}")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "doc.pdf"
+    doc = fitz.open()
+    for i in range(8):
+        doc.new_page(width=200, height=200).insert_text((20, 100), f"Page {i}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def unlimited(monkeypatch):
+    monkeypatch.setattr(vision_reader, "get_vision_limiter", lambda provider: ProviderRateLimiter(0))
+
+
+class TestTokenBucket:
+
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.reserve(1) == 0
+        assert bucket.reserve(1) == 0
+        assert bucket.reserve(1) == pytest.approx(0.1, abs=0.02)
+
+    def test_oversized_request_is_clamped(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.reserve(100) == 0
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        bucket.pause(1.0)
+
+        assert bucket.reserve(1) == pytest.approx(1.1, abs=0.02)
+
+    @pytest.mark.asyncio
+    async def test_limiter_paces_requests(self):
+        limiter = ProviderRateLimiter(rpm=600)  # 10/s, burst of 100
+        limiter._requests = TokenBucket(rate=10, capacity=1)
+
+        started = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+
+        assert time.monotonic() - started == pytest.approx(0.3, abs=0.1)
+
+
+class TestVisionReaderConcurrency:
+
+    @pytest.mark.asyncio
+    async def test_pages_read_concurrently_in_order(self, pdf_path, unlimited):
+        client = FakeVisionClient(latency=0.2)
+        reader = VisionReader(client, concurrency=4)
+        progress = []
+
+        started = time.monotonic()
+        doc = await reader.read_pdf(pdf_path, dpi=50, progress_callback=lambda d, t: progress.append((d, t)))
+        elapsed = time.monotonic() - started
+
+        assert [p.content for p in doc.pages] == [f"content of page {i}" for i in range(1, 9)]
+        assert client.max_in_flight == 4
+        assert elapsed < 8 * 0.2 / 2
+        assert progress[-1] == (8, 8)
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_retried_per_page(self, pdf_path, unlimited, monkeypatch):
+        monkeypatch.setattr(vision_reader, "backoff_delay", lambda attempt: 0)
+        client = FakeVisionClient(latency=0, fail_first={3})
+
+        doc = await VisionReader(client, concurrency=2).read_pdf(pdf_path, dpi=50)
+
+        assert doc.pages[2].content == "content of page 3"
+        assert client.calls == 9
+
+    @pytest.mark.asyncio
+    async def test_read_pages_subset(self, pdf_path, unlimited):
+        reader = VisionReader(FakeVisionClient(latency=0), concurrency=3)
+
+        pages = await reader.read_pages(pdf_path, [5, 1])
+
+        assert [p.page_number for p in pages] == [6, 2]
+        assert await reader.read_page(pdf_path, 0) == "content of page 1"